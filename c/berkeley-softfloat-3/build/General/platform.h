@@ -50,3 +50,13 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 *----------------------------------------------------------------------------*/
 #include "opts-GCC.h"
 
+/*----------------------------------------------------------------------------
+| The rounding mode, the tininess detection mode, and the exception flags are
+| held per thread, so that SoftFloat can be used from multiple threads.
+*----------------------------------------------------------------------------*/
+#if defined(_MSC_VER)
+#define THREAD_LOCAL __declspec(thread)
+#else
+#define THREAD_LOCAL _Thread_local
+#endif
+
@@ -30,7 +30,12 @@ from libc.stdint cimport (
 )
 
 
-cdef extern from "softfloat.h":
+cdef extern from "platform.h":
+    # The platform definitions such as THREAD_LOCAL must precede softfloat.h.
+    pass
+
+
+cdef extern from "softfloat.h" nogil:
 
     ctypedef struct bfloat16_t:
         uint16_t v
@@ -24,6 +24,7 @@ __all__ = [
     "TininessMode",
     "RoundingMode",
     "ExceptionFlag",
+    "SummationMethod",
     "UInt32",
     "UInt64",
     "Int32",
@@ -33,6 +34,11 @@ __all__ = [
     "Float32",
     "Float64",
     "Float128",
+    "BFloat16Array",
+    "Float16Array",
+    "Float32Array",
+    "Float64Array",
+    "Float128Array",
     "set_tininess_mode",
     "get_tininess_mode",
     "set_rounding_mode",
@@ -40,6 +46,13 @@ __all__ = [
     "set_exception_flags",
     "get_exception_flags",
     "test_exception_flags",
+    "FloatContext",
+    "set_num_threads",
+    "get_num_threads",
+    "set_interning",
+    "get_interning",
+    "set_hardware_acceleration",
+    "get_hardware_acceleration",
     "ui32_to_f16",
     "ui32_to_f32",
     "ui32_to_f64",
@@ -81,6 +94,21 @@ __all__ = [
     "f16_is_signaling_nan",
     "bf16_to_f32",
     "f32_to_bf16",
+    "bf16_round_to_int",
+    "bf16_neg",
+    "bf16_add",
+    "bf16_sub",
+    "bf16_mul",
+    "bf16_mul_add",
+    "bf16_div",
+    "bf16_rem",
+    "bf16_sqrt",
+    "bf16_eq",
+    "bf16_le",
+    "bf16_lt",
+    "bf16_eq_signaling",
+    "bf16_le_quiet",
+    "bf16_lt_quiet",
     "bf16_is_signaling_nan",
     "f32_to_ui32",
     "f32_to_ui64",
@@ -150,7 +178,121 @@ __all__ = [
     "f128_eq_signaling",
     "f128_le_quiet",
     "f128_lt_quiet",
-    "f128_is_signaling_nan"
+    "f128_is_signaling_nan",
+    "bf16_round_to_int_array",
+    "bf16_add_array",
+    "bf16_sub_array",
+    "bf16_mul_array",
+    "bf16_mul_add_array",
+    "bf16_div_array",
+    "bf16_rem_array",
+    "bf16_sqrt_array",
+    "bf16_eq_array",
+    "bf16_le_array",
+    "bf16_lt_array",
+    "bf16_eq_signaling_array",
+    "bf16_le_quiet_array",
+    "bf16_lt_quiet_array",
+    "f16_round_to_int_array",
+    "f16_add_array",
+    "f16_sub_array",
+    "f16_mul_array",
+    "f16_mul_add_array",
+    "f16_div_array",
+    "f16_rem_array",
+    "f16_sqrt_array",
+    "f16_eq_array",
+    "f16_le_array",
+    "f16_lt_array",
+    "f16_eq_signaling_array",
+    "f16_le_quiet_array",
+    "f16_lt_quiet_array",
+    "f32_round_to_int_array",
+    "f32_add_array",
+    "f32_sub_array",
+    "f32_mul_array",
+    "f32_mul_add_array",
+    "f32_div_array",
+    "f32_rem_array",
+    "f32_sqrt_array",
+    "f32_eq_array",
+    "f32_le_array",
+    "f32_lt_array",
+    "f32_eq_signaling_array",
+    "f32_le_quiet_array",
+    "f32_lt_quiet_array",
+    "f64_round_to_int_array",
+    "f64_add_array",
+    "f64_sub_array",
+    "f64_mul_array",
+    "f64_mul_add_array",
+    "f64_div_array",
+    "f64_rem_array",
+    "f64_sqrt_array",
+    "f64_eq_array",
+    "f64_le_array",
+    "f64_lt_array",
+    "f64_eq_signaling_array",
+    "f64_le_quiet_array",
+    "f64_lt_quiet_array",
+    "f128_round_to_int_array",
+    "f128_add_array",
+    "f128_sub_array",
+    "f128_mul_array",
+    "f128_mul_add_array",
+    "f128_div_array",
+    "f128_rem_array",
+    "f128_sqrt_array",
+    "f128_eq_array",
+    "f128_le_array",
+    "f128_lt_array",
+    "f128_eq_signaling_array",
+    "f128_le_quiet_array",
+    "f128_lt_quiet_array",
+    "bf16_to_f32_array",
+    "f16_to_f32_array",
+    "f16_to_f64_array",
+    "f16_to_f128_array",
+    "f32_to_bf16_array",
+    "f32_to_f16_array",
+    "f32_to_f64_array",
+    "f32_to_f128_array",
+    "f64_to_f16_array",
+    "f64_to_f32_array",
+    "f64_to_f128_array",
+    "f128_to_f16_array",
+    "f128_to_f32_array",
+    "f128_to_f64_array",
+    "bf16_sum",
+    "bf16_dot",
+    "bf16_prod",
+    "bf16_min",
+    "bf16_max",
+    "f16_sum",
+    "f16_dot",
+    "f16_prod",
+    "f16_min",
+    "f16_max",
+    "f32_sum",
+    "f32_dot",
+    "f32_prod",
+    "f32_min",
+    "f32_max",
+    "f64_sum",
+    "f64_dot",
+    "f64_prod",
+    "f64_min",
+    "f64_max",
+    "f128_sum",
+    "f128_dot",
+    "f128_prod",
+    "f128_min",
+    "f128_max",
+    "bf16_matmul",
+    "f16_matmul",
+    "f32_matmul",
+    "f64_matmul",
+    "f128_matmul"
 ]
 
 from ._version import __version__  # noqa:F401
@@ -159,6 +301,7 @@ from ._core import (
     TininessMode,
     RoundingMode,
     ExceptionFlag,
+    SummationMethod,
     UInt32,
     UInt64,
     Int32,
@@ -168,6 +311,11 @@ from ._core import (
     Float32,
     Float64,
     Float128,
+    BFloat16Array,
+    Float16Array,
+    Float32Array,
+    Float64Array,
+    Float128Array,
     set_tininess_mode,
     get_tininess_mode,
     set_rounding_mode,
@@ -175,6 +323,13 @@ from ._core import (
     set_exception_flags,
     get_exception_flags,
     test_exception_flags,
+    FloatContext,
+    set_num_threads,
+    get_num_threads,
+    set_interning,
+    get_interning,
+    set_hardware_acceleration,
+    get_hardware_acceleration,
     ui32_to_f16,
     ui32_to_f32,
     ui32_to_f64,
@@ -216,6 +371,21 @@ from ._core import (
     f16_is_signaling_nan,
     bf16_to_f32,
     f32_to_bf16,
+    bf16_round_to_int,
+    bf16_neg,
+    bf16_add,
+    bf16_sub,
+    bf16_mul,
+    bf16_mul_add,
+    bf16_div,
+    bf16_rem,
+    bf16_sqrt,
+    bf16_eq,
+    bf16_le,
+    bf16_lt,
+    bf16_eq_signaling,
+    bf16_le_quiet,
+    bf16_lt_quiet,
     bf16_is_signaling_nan,
     f32_to_ui32,
     f32_to_ui64,
@@ -285,5 +455,119 @@ from ._core import (
     f128_eq_signaling,
     f128_le_quiet,
     f128_lt_quiet,
-    f128_is_signaling_nan
+    f128_is_signaling_nan,
+    bf16_round_to_int_array,
+    bf16_add_array,
+    bf16_sub_array,
+    bf16_mul_array,
+    bf16_mul_add_array,
+    bf16_div_array,
+    bf16_rem_array,
+    bf16_sqrt_array,
+    bf16_eq_array,
+    bf16_le_array,
+    bf16_lt_array,
+    bf16_eq_signaling_array,
+    bf16_le_quiet_array,
+    bf16_lt_quiet_array,
+    f16_round_to_int_array,
+    f16_add_array,
+    f16_sub_array,
+    f16_mul_array,
+    f16_mul_add_array,
+    f16_div_array,
+    f16_rem_array,
+    f16_sqrt_array,
+    f16_eq_array,
+    f16_le_array,
+    f16_lt_array,
+    f16_eq_signaling_array,
+    f16_le_quiet_array,
+    f16_lt_quiet_array,
+    f32_round_to_int_array,
+    f32_add_array,
+    f32_sub_array,
+    f32_mul_array,
+    f32_mul_add_array,
+    f32_div_array,
+    f32_rem_array,
+    f32_sqrt_array,
+    f32_eq_array,
+    f32_le_array,
+    f32_lt_array,
+    f32_eq_signaling_array,
+    f32_le_quiet_array,
+    f32_lt_quiet_array,
+    f64_round_to_int_array,
+    f64_add_array,
+    f64_sub_array,
+    f64_mul_array,
+    f64_mul_add_array,
+    f64_div_array,
+    f64_rem_array,
+    f64_sqrt_array,
+    f64_eq_array,
+    f64_le_array,
+    f64_lt_array,
+    f64_eq_signaling_array,
+    f64_le_quiet_array,
+    f64_lt_quiet_array,
+    f128_round_to_int_array,
+    f128_add_array,
+    f128_sub_array,
+    f128_mul_array,
+    f128_mul_add_array,
+    f128_div_array,
+    f128_rem_array,
+    f128_sqrt_array,
+    f128_eq_array,
+    f128_le_array,
+    f128_lt_array,
+    f128_eq_signaling_array,
+    f128_le_quiet_array,
+    f128_lt_quiet_array,
+    bf16_to_f32_array,
+    f16_to_f32_array,
+    f16_to_f64_array,
+    f16_to_f128_array,
+    f32_to_bf16_array,
+    f32_to_f16_array,
+    f32_to_f64_array,
+    f32_to_f128_array,
+    f64_to_f16_array,
+    f64_to_f32_array,
+    f64_to_f128_array,
+    f128_to_f16_array,
+    f128_to_f32_array,
+    f128_to_f64_array,
+    bf16_sum,
+    bf16_dot,
+    bf16_prod,
+    bf16_min,
+    bf16_max,
+    f16_sum,
+    f16_dot,
+    f16_prod,
+    f16_min,
+    f16_max,
+    f32_sum,
+    f32_dot,
+    f32_prod,
+    f32_min,
+    f32_max,
+    f64_sum,
+    f64_dot,
+    f64_prod,
+    f64_min,
+    f64_max,
+    f128_sum,
+    f128_dot,
+    f128_prod,
+    f128_min,
+    f128_max,
+    bf16_matmul,
+    f16_matmul,
+    f32_matmul,
+    f64_matmul,
+    f128_matmul
 )
@@ -20,9 +20,16 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Self
+import os
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+from typing import Any, Self, SupportsIndex, TypeVar, overload
+
+from typing_extensions import Buffer
 from enum import IntEnum, IntFlag
 
+_BufferT = TypeVar('_BufferT', bound=Buffer)
+
 
 class TininessMode(IntEnum):
     """The tininess detection modes.
@@ -69,6 +76,24 @@ class ExceptionFlag(IntFlag):
     INVALID = ...
 
 
+class SummationMethod(IntEnum):
+    """The summation methods of the reductions.
+
+    - ``SEQUENTIAL``: Adding the elements one by one from the first to the last.
+    - ``PAIRWISE``: Adding the sums of the two halves, each of which is summed recursively,
+      or sequentially if it has 8 or fewer elements.
+    - ``COMPENSATED``: Adding the elements sequentially while accumulating the rounding errors separately.
+    - ``EXACT``: Adding the elements, or the products of the dot product, exactly and rounding the result
+      only once. The result does not depend on the order of the elements, and the elements are added
+      in parallel by the threads set by :func:`set_num_threads()`.
+
+    """
+    SEQUENTIAL = ...
+    PAIRWISE = ...
+    COMPENSATED = ...
+    EXACT = ...
+
+
 class UInt32:
     """A 32-bit unsigned integer.
 
@@ -924,99 +949,8 @@ class BFloat16:
 
     The object is immutable.
 
-    No operators are supported.
-
-    """
-
-    @classmethod
-    def size(cls) -> int:
-        """Returns the native data size in bits.
-
-        Returns:
-            The native data size in bits, i.e. 16.
-
-        """
-        ...
-
-    @classmethod
-    def from_bytes(cls, src: bytes) -> Self:
-        """Creates a new instance from the specified byte sequence.
-
-        Args:
-            src: The byte sequence representing the native data with big endian.
-                 The length must be 2.
-
-        Returns:
-            A new instance created from the specified byte sequence.
-
-        Raises:
-            ValueError: If the length of bytes is not 2.
-
-        """
-        ...
-
-    def to_bytes(self) -> bytes:
-        """Returns the native data as a byte sequence.
-
-        Returns:
-            A byte sequence representing the native data with big endian.
-            The length is 2.
-
-        """
-        ...
-
-    @classmethod
-    def from_float(cls, src: float) -> Self:
-        """Creates a new instance from the specified floating point.
-
-        Args:
-            src: The floating point from which a new instance is created.
-
-        Returns:
-            A new instance created from the specified floating point.
-
-        """
-        ...
-
-    def to_float(self) -> float:
-        """Returns the native data as a floating point.
-
-        Returns:
-            A floating point that represents the native data.
-
-        """
-        ...
-
-    def to_f32(self) -> Float32:
-        """Converts the 16-bit brain floating point to an IEEE 754 binary32 floating point.
-
-        The result is the same as that of :func:`bf16_to_f32()`.
-
-        Returns:
-            The IEEE 754 binary32 floating point.
-
-        """
-        ...
-
-    def is_signaling_nan(self) -> bool:
-        """Tests if the 16-bit brain floating point is a signaling NaN.
-
-        The result is the same as that of :func:`bf16_is_signaling_nan()`.
-
-        Returns:
-            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
-
-        """
-        ...
-
-    def __str__(self) -> str:
-        ...
-
-
-class Float16:
-    """An IEEE 754 binary16 floating point.
-
-    The object is immutable.
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
 
     The following operators are supported:
 
@@ -1092,82 +1026,10 @@ class Float16:
         """
         ...
 
-    def to_ui32(
-        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-    ) -> UInt32:
-        """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
-
-        The result is the same as that of :func:`f16_to_ui32()`.
-
-        Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
-
-        Returns:
-            The 32-bit unsigned integer.
-
-        """
-        ...
-
-    def to_ui64(
-        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-    ) -> UInt64:
-        """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
-
-        The result is the same as that of :func:`f16_to_ui64()`.
-
-        Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
-
-        Returns:
-            The 64-bit unsigned integer.
-
-        """
-        ...
-
-    def to_i32(
-        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-    ) -> Int32:
-        """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
-
-        The result is the same as that of :func:`f16_to_i32()`.
-
-        Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
-
-        Returns:
-            The 32-bit signed integer.
-
-        """
-        ...
-
-    def to_i64(
-        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-    ) -> Int64:
-        """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
-
-        The result is the same as that of :func:`f16_to_i64()`.
-
-        Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
-
-        Returns:
-            The 64-bit signed integer.
-
-        """
-        ...
-
     def to_f32(self) -> Float32:
-        """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
+        """Converts the 16-bit brain floating point to an IEEE 754 binary32 floating point.
 
-        The result is the same as that of :func:`f16_to_f32()`.
+        The result is the same as that of :func:`bf16_to_f32()`.
 
         Returns:
             The IEEE 754 binary32 floating point.
@@ -1175,34 +1037,12 @@ class Float16:
         """
         ...
 
-    def to_f64(self) -> Float64:
-        """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
-
-        The result is the same as that of :func:`f16_to_f64()`.
-
-        Returns:
-            The IEEE 754 binary64 floating point.
-
-        """
-        ...
-
-    def to_f128(self) -> Float128:
-        """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
-
-        The result is the same as that of :func:`f16_to_f128()`.
-
-        Returns:
-            The IEEE 754 binary128 floating point.
-
-        """
-        ...
-
     def round_to_int(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> Self:
         """Rounds the number.
 
-        The result is the same as that of :func:`f16_round_to_int()`.
+        The result is the same as that of :func:`bf16_round_to_int()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1216,9 +1056,9 @@ class Float16:
         ...
 
     def neg(self) -> Self:
-        """Negates the IEEE 754 binary16 floating point.
+        """Negates the 16-bit brain floating point.
 
-        The result is the same as that of :func:`f16_neg()`.
+        The result is the same as that of :func:`bf16_neg()`.
 
         Returns:
             The resulted number (``-x``).
@@ -1228,9 +1068,9 @@ class Float16:
 
     @classmethod
     def add(cls, x: Self, y: Self) -> Self:
-        """Adds the IEEE 754 binary16 floating points.
+        """Adds the 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_add()`.
+        The result is the same as that of :func:`bf16_add()`.
 
         Args:
             x: The floating point to be added.
@@ -1244,9 +1084,9 @@ class Float16:
 
     @classmethod
     def sub(cls, x: Self, y: Self) -> Self:
-        """Subtracts the IEEE 754 binary16 floating points.
+        """Subtracts the 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_sub()`.
+        The result is the same as that of :func:`bf16_sub()`.
 
         Args:
             x: The floating point to be subtracted.
@@ -1260,9 +1100,9 @@ class Float16:
 
     @classmethod
     def mul(cls, x: Self, y: Self) -> Self:
-        """Multiplies the IEEE 754 binary16 floating points.
+        """Multiplies the 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_mul()`.
+        The result is the same as that of :func:`bf16_mul()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -1276,9 +1116,9 @@ class Float16:
 
     @classmethod
     def mul_add(cls, x: Self, y: Self, z: Self) -> Self:
-        """Multiplies and Adds the IEEE 754 binary16 floating points.
+        """Multiplies and Adds the 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_mul_add()`.
+        The result is the same as that of :func:`bf16_mul_add()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -1293,9 +1133,9 @@ class Float16:
 
     @classmethod
     def div(cls, x: Self, y: Self) -> Self:
-        """Divides the IEEE 754 binary16 floating points.
+        """Divides the 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_div()`.
+        The result is the same as that of :func:`bf16_div()`.
 
         Args:
             x: The floating point to be divided.
@@ -1309,9 +1149,9 @@ class Float16:
 
     @classmethod
     def rem(cls, x: Self, y: Self) -> Self:
-        """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
+        """Calculates a remainder by dividing the 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_rem()`.
+        The result is the same as that of :func:`bf16_rem()`.
 
         Args:
             x: The floating point to be divided.
@@ -1325,9 +1165,9 @@ class Float16:
 
     @classmethod
     def sqrt(cls, x: Self) -> Self:
-        """Calculates a square root of the IEEE 754 binary16 floating point.
+        """Calculates a square root of the 16-bit brain floating point.
 
-        The result is the same as that of :func:`f16_sqrt()`.
+        The result is the same as that of :func:`bf16_sqrt()`.
 
         Args:
             x: The floating point whose square root is to be calculated.
@@ -1340,9 +1180,9 @@ class Float16:
 
     @classmethod
     def eq(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+        """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_eq()`.
+        The result is the same as that of :func:`bf16_eq()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1356,9 +1196,9 @@ class Float16:
 
     @classmethod
     def le(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_le()`.
+        The result is the same as that of :func:`bf16_le()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1372,9 +1212,9 @@ class Float16:
 
     @classmethod
     def lt(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+        """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_lt()`.
+        The result is the same as that of :func:`bf16_lt()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1388,11 +1228,11 @@ class Float16:
 
     @classmethod
     def eq_signaling(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+        """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
 
         The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-        The result is the same as that of :func:`f16_eq_signaling()`.
+        The result is the same as that of :func:`bf16_eq_signaling()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1406,11 +1246,11 @@ class Float16:
 
     @classmethod
     def le_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f16_le_quiet()`.
+        The result is the same as that of :func:`bf16_le_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1424,11 +1264,11 @@ class Float16:
 
     @classmethod
     def lt_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+        """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f16_lt_quiet()`.
+        The result is the same as that of :func:`bf16_lt_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1441,9 +1281,9 @@ class Float16:
         ...
 
     def is_signaling_nan(self) -> bool:
-        """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
+        """Tests if the 16-bit brain floating point is a signaling NaN.
 
-        The result is the same as that of :func:`f16_is_signaling_nan()`.
+        The result is the same as that of :func:`bf16_is_signaling_nan()`.
 
         Returns:
             ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
@@ -1515,11 +1355,14 @@ class Float16:
         ...
 
 
-class Float32:
-    """An IEEE 754 binary32 floating point.
+class Float16:
+    """An IEEE 754 binary16 floating point.
 
     The object is immutable.
 
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
     The following operators are supported:
 
     - unary operators: ``+``, ``-``.
@@ -1540,7 +1383,7 @@ class Float32:
         """Returns the native data size in bits.
 
         Returns:
-            The native data size in bits, i.e. 32.
+            The native data size in bits, i.e. 16.
 
         """
         ...
@@ -1551,13 +1394,13 @@ class Float32:
 
         Args:
             src: The byte sequence representing the native data with big endian.
-                 The length must be 4.
+                 The length must be 2.
 
         Returns:
             A new instance created from the specified byte sequence.
 
         Raises:
-            ValueError: If the length of bytes is not 4.
+            ValueError: If the length of bytes is not 2.
 
         """
         ...
@@ -1567,7 +1410,7 @@ class Float32:
 
         Returns:
             A byte sequence representing the native data with big endian.
-            The length is 4.
+            The length is 2.
 
         """
         ...
@@ -1594,23 +1437,12 @@ class Float32:
         """
         ...
 
-    def to_bf16(self) -> BFloat16:
-        """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
-
-        The result is the same as that of :func:`f32_to_bf16()`.
-
-        Returns:
-            The 16-bit brain floating point.
-
-        """
-        ...
-
     def to_ui32(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> UInt32:
-        """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
+        """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
 
-        The result is the same as that of :func:`f32_to_ui32()`.
+        The result is the same as that of :func:`f16_to_ui32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1626,9 +1458,9 @@ class Float32:
     def to_ui64(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> UInt64:
-        """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
+        """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
 
-        The result is the same as that of :func:`f32_to_ui64()`.
+        The result is the same as that of :func:`f16_to_ui64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1644,9 +1476,9 @@ class Float32:
     def to_i32(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> Int32:
-        """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
+        """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
 
-        The result is the same as that of :func:`f32_to_i32()`.
+        The result is the same as that of :func:`f16_to_i32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1662,9 +1494,9 @@ class Float32:
     def to_i64(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> Int64:
-        """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
+        """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
 
-        The result is the same as that of :func:`f32_to_i64()`.
+        The result is the same as that of :func:`f16_to_i64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1677,21 +1509,21 @@ class Float32:
         """
         ...
 
-    def to_f16(self) -> Float16:
-        """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
+    def to_f32(self) -> Float32:
+        """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
 
-        The result is the same as that of :func:`f32_to_f16()`.
+        The result is the same as that of :func:`f16_to_f32()`.
 
         Returns:
-            The IEEE 754 binary16 floating point.
+            The IEEE 754 binary32 floating point.
 
         """
         ...
 
     def to_f64(self) -> Float64:
-        """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
+        """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
 
-        The result is the same as that of :func:`f32_to_f64()`.
+        The result is the same as that of :func:`f16_to_f64()`.
 
         Returns:
             The IEEE 754 binary64 floating point.
@@ -1700,9 +1532,9 @@ class Float32:
         ...
 
     def to_f128(self) -> Float128:
-        """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
+        """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
 
-        The result is the same as that of :func:`f32_to_f128()`.
+        The result is the same as that of :func:`f16_to_f128()`.
 
         Returns:
             The IEEE 754 binary128 floating point.
@@ -1715,7 +1547,7 @@ class Float32:
     ) -> Self:
         """Rounds the number.
 
-        The result is the same as that of :func:`f32_round_to_int()`.
+        The result is the same as that of :func:`f16_round_to_int()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1729,9 +1561,9 @@ class Float32:
         ...
 
     def neg(self) -> Self:
-        """Negates the IEEE 754 binary32 floating point.
+        """Negates the IEEE 754 binary16 floating point.
 
-        The result is the same as that of :func:`f32_neg()`.
+        The result is the same as that of :func:`f16_neg()`.
 
         Returns:
             The resulted number (``-x``).
@@ -1741,9 +1573,9 @@ class Float32:
 
     @classmethod
     def add(cls, x: Self, y: Self) -> Self:
-        """Adds the IEEE 754 binary32 floating points.
+        """Adds the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_add()`.
+        The result is the same as that of :func:`f16_add()`.
 
         Args:
             x: The floating point to be added.
@@ -1757,9 +1589,9 @@ class Float32:
 
     @classmethod
     def sub(cls, x: Self, y: Self) -> Self:
-        """Subtracts the IEEE 754 binary32 floating points.
+        """Subtracts the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_sub()`.
+        The result is the same as that of :func:`f16_sub()`.
 
         Args:
             x: The floating point to be subtracted.
@@ -1773,9 +1605,9 @@ class Float32:
 
     @classmethod
     def mul(cls, x: Self, y: Self) -> Self:
-        """Multiplies the IEEE 754 binary32 floating points.
+        """Multiplies the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_mul()`.
+        The result is the same as that of :func:`f16_mul()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -1789,9 +1621,9 @@ class Float32:
 
     @classmethod
     def mul_add(cls, x: Self, y: Self, z: Self) -> Self:
-        """Multiplies and Adds the IEEE 754 binary32 floating points.
+        """Multiplies and Adds the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_mul_add()`.
+        The result is the same as that of :func:`f16_mul_add()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -1806,9 +1638,9 @@ class Float32:
 
     @classmethod
     def div(cls, x: Self, y: Self) -> Self:
-        """Divides the IEEE 754 binary32 floating points.
+        """Divides the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_div()`.
+        The result is the same as that of :func:`f16_div()`.
 
         Args:
             x: The floating point to be divided.
@@ -1822,9 +1654,9 @@ class Float32:
 
     @classmethod
     def rem(cls, x: Self, y: Self) -> Self:
-        """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
+        """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_rem()`.
+        The result is the same as that of :func:`f16_rem()`.
 
         Args:
             x: The floating point to be divided.
@@ -1838,9 +1670,9 @@ class Float32:
 
     @classmethod
     def sqrt(cls, x: Self) -> Self:
-        """Calculates a square root of the IEEE 754 binary32 floating point.
+        """Calculates a square root of the IEEE 754 binary16 floating point.
 
-        The result is the same as that of :func:`f32_sqrt()`.
+        The result is the same as that of :func:`f16_sqrt()`.
 
         Args:
             x: The floating point whose square root is to be calculated.
@@ -1853,9 +1685,9 @@ class Float32:
 
     @classmethod
     def eq(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_eq()`.
+        The result is the same as that of :func:`f16_eq()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1869,9 +1701,9 @@ class Float32:
 
     @classmethod
     def le(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_le()`.
+        The result is the same as that of :func:`f16_le()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1885,9 +1717,9 @@ class Float32:
 
     @classmethod
     def lt(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_lt()`.
+        The result is the same as that of :func:`f16_lt()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1901,11 +1733,11 @@ class Float32:
 
     @classmethod
     def eq_signaling(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
 
         The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-        The result is the same as that of :func:`f32_eq_signaling()`.
+        The result is the same as that of :func:`f16_eq_signaling()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1919,11 +1751,11 @@ class Float32:
 
     @classmethod
     def le_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f32_le_quiet()`.
+        The result is the same as that of :func:`f16_le_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1937,11 +1769,11 @@ class Float32:
 
     @classmethod
     def lt_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f32_lt_quiet()`.
+        The result is the same as that of :func:`f16_lt_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -1954,9 +1786,9 @@ class Float32:
         ...
 
     def is_signaling_nan(self) -> bool:
-        """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
+        """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
 
-        The result is the same as that of :func:`f32_is_signaling_nan()`.
+        The result is the same as that of :func:`f16_is_signaling_nan()`.
 
         Returns:
             ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
@@ -2028,11 +1860,14 @@ class Float32:
         ...
 
 
-class Float64:
-    """An IEEE 754 binary64 floating point.
+class Float32:
+    """An IEEE 754 binary32 floating point.
 
     The object is immutable.
 
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
     The following operators are supported:
 
     - unary operators: ``+``, ``-``.
@@ -2053,7 +1888,7 @@ class Float64:
         """Returns the native data size in bits.
 
         Returns:
-            The native data size in bits, i.e. 64.
+            The native data size in bits, i.e. 32.
 
         """
         ...
@@ -2064,13 +1899,13 @@ class Float64:
 
         Args:
             src: The byte sequence representing the native data with big endian.
-                 The length must be 8.
+                 The length must be 4.
 
         Returns:
             A new instance created from the specified byte sequence.
 
         Raises:
-            ValueError: If the length of bytes is not 8.
+            ValueError: If the length of bytes is not 4.
 
         """
         ...
@@ -2080,7 +1915,7 @@ class Float64:
 
         Returns:
             A byte sequence representing the native data with big endian.
-            The length is 8.
+            The length is 4.
 
         """
         ...
@@ -2107,12 +1942,23 @@ class Float64:
         """
         ...
 
+    def to_bf16(self) -> BFloat16:
+        """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
+
+        The result is the same as that of :func:`f32_to_bf16()`.
+
+        Returns:
+            The 16-bit brain floating point.
+
+        """
+        ...
+
     def to_ui32(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> UInt32:
-        """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
+        """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
 
-        The result is the same as that of :func:`f64_to_ui32()`.
+        The result is the same as that of :func:`f32_to_ui32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2128,9 +1974,9 @@ class Float64:
     def to_ui64(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> UInt64:
-        """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
+        """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
 
-        The result is the same as that of :func:`f64_to_ui64()`.
+        The result is the same as that of :func:`f32_to_ui64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2146,9 +1992,9 @@ class Float64:
     def to_i32(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> Int32:
-        """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
+        """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
 
-        The result is the same as that of :func:`f64_to_i32()`.
+        The result is the same as that of :func:`f32_to_i32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2164,9 +2010,9 @@ class Float64:
     def to_i64(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> Int64:
-        """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
+        """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
 
-        The result is the same as that of :func:`f64_to_i64()`.
+        The result is the same as that of :func:`f32_to_i64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2180,9 +2026,9 @@ class Float64:
         ...
 
     def to_f16(self) -> Float16:
-        """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
+        """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
 
-        The result is the same as that of :func:`f64_to_f16()`.
+        The result is the same as that of :func:`f32_to_f16()`.
 
         Returns:
             The IEEE 754 binary16 floating point.
@@ -2190,21 +2036,21 @@ class Float64:
         """
         ...
 
-    def to_f32(self) -> Float32:
-        """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
+    def to_f64(self) -> Float64:
+        """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
 
-        The result is the same as that of :func:`f64_to_f32()`.
+        The result is the same as that of :func:`f32_to_f64()`.
 
         Returns:
-            The IEEE 754 binary32 floating point.
+            The IEEE 754 binary64 floating point.
 
         """
         ...
 
     def to_f128(self) -> Float128:
-        """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
+        """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
 
-        The result is the same as that of :func:`f64_to_f128()`.
+        The result is the same as that of :func:`f32_to_f128()`.
 
         Returns:
             The IEEE 754 binary128 floating point.
@@ -2217,7 +2063,7 @@ class Float64:
     ) -> Self:
         """Rounds the number.
 
-        The result is the same as that of :func:`f64_round_to_int()`.
+        The result is the same as that of :func:`f32_round_to_int()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2231,9 +2077,9 @@ class Float64:
         ...
 
     def neg(self) -> Self:
-        """Negates the IEEE 754 binary64 floating point.
+        """Negates the IEEE 754 binary32 floating point.
 
-        The result is the same as that of :func:`f64_neg()`.
+        The result is the same as that of :func:`f32_neg()`.
 
         Returns:
             The resulted number (``-x``).
@@ -2243,9 +2089,9 @@ class Float64:
 
     @classmethod
     def add(cls, x: Self, y: Self) -> Self:
-        """Adds the IEEE 754 binary64 floating points.
+        """Adds the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_add()`.
+        The result is the same as that of :func:`f32_add()`.
 
         Args:
             x: The floating point to be added.
@@ -2259,9 +2105,9 @@ class Float64:
 
     @classmethod
     def sub(cls, x: Self, y: Self) -> Self:
-        """Subtracts the IEEE 754 binary64 floating points.
+        """Subtracts the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_sub()`.
+        The result is the same as that of :func:`f32_sub()`.
 
         Args:
             x: The floating point to be subtracted.
@@ -2275,9 +2121,9 @@ class Float64:
 
     @classmethod
     def mul(cls, x: Self, y: Self) -> Self:
-        """Multiplies the IEEE 754 binary64 floating points.
+        """Multiplies the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_mul()`.
+        The result is the same as that of :func:`f32_mul()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2291,9 +2137,9 @@ class Float64:
 
     @classmethod
     def mul_add(cls, x: Self, y: Self, z: Self) -> Self:
-        """Multiplies and Adds the IEEE 754 binary64 floating points.
+        """Multiplies and Adds the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_mul_add()`.
+        The result is the same as that of :func:`f32_mul_add()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2308,9 +2154,9 @@ class Float64:
 
     @classmethod
     def div(cls, x: Self, y: Self) -> Self:
-        """Divides the IEEE 754 binary64 floating points.
+        """Divides the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_div()`.
+        The result is the same as that of :func:`f32_div()`.
 
         Args:
             x: The floating point to be divided.
@@ -2324,9 +2170,9 @@ class Float64:
 
     @classmethod
     def rem(cls, x: Self, y: Self) -> Self:
-        """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
+        """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_rem()`.
+        The result is the same as that of :func:`f32_rem()`.
 
         Args:
             x: The floating point to be divided.
@@ -2340,9 +2186,9 @@ class Float64:
 
     @classmethod
     def sqrt(cls, x: Self) -> Self:
-        """Calculates a square root of the IEEE 754 binary64 floating point.
+        """Calculates a square root of the IEEE 754 binary32 floating point.
 
-        The result is the same as that of :func:`f64_sqrt()`.
+        The result is the same as that of :func:`f32_sqrt()`.
 
         Args:
             x: The floating point whose square root is to be calculated.
@@ -2355,9 +2201,9 @@ class Float64:
 
     @classmethod
     def eq(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_eq()`.
+        The result is the same as that of :func:`f32_eq()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2371,9 +2217,9 @@ class Float64:
 
     @classmethod
     def le(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_le()`.
+        The result is the same as that of :func:`f32_le()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2387,9 +2233,9 @@ class Float64:
 
     @classmethod
     def lt(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_lt()`.
+        The result is the same as that of :func:`f32_lt()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2403,11 +2249,11 @@ class Float64:
 
     @classmethod
     def eq_signaling(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
 
         The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-        The result is the same as that of :func:`f64_eq_signaling()`.
+        The result is the same as that of :func:`f32_eq_signaling()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2421,11 +2267,11 @@ class Float64:
 
     @classmethod
     def le_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f64_le_quiet()`.
+        The result is the same as that of :func:`f32_le_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2439,11 +2285,11 @@ class Float64:
 
     @classmethod
     def lt_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f64_lt_quiet()`.
+        The result is the same as that of :func:`f32_lt_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2456,9 +2302,9 @@ class Float64:
         ...
 
     def is_signaling_nan(self) -> bool:
-        """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
+        """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
 
-        The result is the same as that of :func:`f64_is_signaling_nan()`.
+        The result is the same as that of :func:`f32_is_signaling_nan()`.
 
         Returns:
             ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
@@ -2530,11 +2376,14 @@ class Float64:
         ...
 
 
-class Float128:
-    """An IEEE 754 binary128 floating point.
+class Float64:
+    """An IEEE 754 binary64 floating point.
 
     The object is immutable.
 
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
     The following operators are supported:
 
     - unary operators: ``+``, ``-``.
@@ -2548,10 +2397,6 @@ class Float128:
     - binary operators: ``<<``, ``>>``, ``&``, ``|``, ``^``, ``**``,
       ``<<=``, ``>>=``, ``&=``, ``|=``, ``^=``, ``**=``.
 
-    Note:
-        Currently, cannot represent the exact number as a string
-        if the number is unable to be expressed as an IEEE 754 binary64 floating point.
-
     """
 
     @classmethod
@@ -2559,7 +2404,7 @@ class Float128:
         """Returns the native data size in bits.
 
         Returns:
-            The native data size in bits, i.e. 128.
+            The native data size in bits, i.e. 64.
 
         """
         ...
@@ -2570,13 +2415,13 @@ class Float128:
 
         Args:
             src: The byte sequence representing the native data with big endian.
-                 The length must be 16.
+                 The length must be 8.
 
         Returns:
             A new instance created from the specified byte sequence.
 
         Raises:
-            ValueError: If the length of bytes is not 16.
+            ValueError: If the length of bytes is not 8.
 
         """
         ...
@@ -2586,7 +2431,7 @@ class Float128:
 
         Returns:
             A byte sequence representing the native data with big endian.
-            The length is 16.
+            The length is 8.
 
         """
         ...
@@ -2601,10 +2446,6 @@ class Float128:
         Returns:
             A new instance created from the specified floating point.
 
-        Note:
-            Cannot create an instance with a number that an IEEE 754 binary64
-            floating point is unable to express.
-
         """
         ...
 
@@ -2614,19 +2455,15 @@ class Float128:
         Returns:
             A floating point that represents the native data.
 
-        Note:
-            Cannot return the exact number if it is unable to be expressed
-            as an IEEE 754 binary64 floating point.
-
         """
         ...
 
     def to_ui32(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> UInt32:
-        """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
+        """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
 
-        The result is the same as that of :func:`f128_to_ui32()`.
+        The result is the same as that of :func:`f64_to_ui32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2642,9 +2479,9 @@ class Float128:
     def to_ui64(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> UInt64:
-        """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
+        """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
 
-        The result is the same as that of :func:`f128_to_ui64()`.
+        The result is the same as that of :func:`f64_to_ui64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2660,9 +2497,9 @@ class Float128:
     def to_i32(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> Int32:
-        """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
+        """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
 
-        The result is the same as that of :func:`f128_to_i32()`.
+        The result is the same as that of :func:`f64_to_i32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2678,9 +2515,9 @@ class Float128:
     def to_i64(
         self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
     ) -> Int64:
-        """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
+        """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
 
-        The result is the same as that of :func:`f128_to_i64()`.
+        The result is the same as that of :func:`f64_to_i64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2694,9 +2531,9 @@ class Float128:
         ...
 
     def to_f16(self) -> Float16:
-        """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
+        """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
 
-        The result is the same as that of :func:`f128_to_f16()`.
+        The result is the same as that of :func:`f64_to_f16()`.
 
         Returns:
             The IEEE 754 binary16 floating point.
@@ -2705,9 +2542,9 @@ class Float128:
         ...
 
     def to_f32(self) -> Float32:
-        """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+        """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
 
-        The result is the same as that of :func:`f128_to_f32()`.
+        The result is the same as that of :func:`f64_to_f32()`.
 
         Returns:
             The IEEE 754 binary32 floating point.
@@ -2715,13 +2552,13 @@ class Float128:
         """
         ...
 
-    def to_f64(self) -> Float64:
-        """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
+    def to_f128(self) -> Float128:
+        """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
 
-        The result is the same as that of :func:`f128_to_f64()`.
+        The result is the same as that of :func:`f64_to_f128()`.
 
         Returns:
-            The IEEE 754 binary64 floating point.
+            The IEEE 754 binary128 floating point.
 
         """
         ...
@@ -2731,7 +2568,7 @@ class Float128:
     ) -> Self:
         """Rounds the number.
 
-        The result is the same as that of :func:`f128_round_to_int()`.
+        The result is the same as that of :func:`f64_round_to_int()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2745,9 +2582,9 @@ class Float128:
         ...
 
     def neg(self) -> Self:
-        """Negates the IEEE 754 binary128 floating point.
+        """Negates the IEEE 754 binary64 floating point.
 
-        The result is the same as that of :func:`f128_neg()`.
+        The result is the same as that of :func:`f64_neg()`.
 
         Returns:
             The resulted number (``-x``).
@@ -2757,9 +2594,9 @@ class Float128:
 
     @classmethod
     def add(cls, x: Self, y: Self) -> Self:
-        """Adds the IEEE 754 binary128 floating points.
+        """Adds the IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_add()`.
+        The result is the same as that of :func:`f64_add()`.
 
         Args:
             x: The floating point to be added.
@@ -2773,9 +2610,9 @@ class Float128:
 
     @classmethod
     def sub(cls, x: Self, y: Self) -> Self:
-        """Subtracts the IEEE 754 binary128 floating points.
+        """Subtracts the IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_sub()`.
+        The result is the same as that of :func:`f64_sub()`.
 
         Args:
             x: The floating point to be subtracted.
@@ -2789,9 +2626,9 @@ class Float128:
 
     @classmethod
     def mul(cls, x: Self, y: Self) -> Self:
-        """Multiplies the IEEE 754 binary128 floating points.
+        """Multiplies the IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_mul()`.
+        The result is the same as that of :func:`f64_mul()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2805,9 +2642,9 @@ class Float128:
 
     @classmethod
     def mul_add(cls, x: Self, y: Self, z: Self) -> Self:
-        """Multiplies and Adds the IEEE 754 binary128 floating points.
+        """Multiplies and Adds the IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_mul_add()`.
+        The result is the same as that of :func:`f64_mul_add()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2822,9 +2659,9 @@ class Float128:
 
     @classmethod
     def div(cls, x: Self, y: Self) -> Self:
-        """Divides the IEEE 754 binary128 floating points.
+        """Divides the IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_div()`.
+        The result is the same as that of :func:`f64_div()`.
 
         Args:
             x: The floating point to be divided.
@@ -2838,9 +2675,9 @@ class Float128:
 
     @classmethod
     def rem(cls, x: Self, y: Self) -> Self:
-        """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
+        """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_rem()`.
+        The result is the same as that of :func:`f64_rem()`.
 
         Args:
             x: The floating point to be divided.
@@ -2854,9 +2691,9 @@ class Float128:
 
     @classmethod
     def sqrt(cls, x: Self) -> Self:
-        """Calculates a square root of the IEEE 754 binary128 floating point.
+        """Calculates a square root of the IEEE 754 binary64 floating point.
 
-        The result is the same as that of :func:`f128_sqrt()`.
+        The result is the same as that of :func:`f64_sqrt()`.
 
         Args:
             x: The floating point whose square root is to be calculated.
@@ -2869,9 +2706,9 @@ class Float128:
 
     @classmethod
     def eq(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_eq()`.
+        The result is the same as that of :func:`f64_eq()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2885,9 +2722,9 @@ class Float128:
 
     @classmethod
     def le(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_le()`.
+        The result is the same as that of :func:`f64_le()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2901,9 +2738,9 @@ class Float128:
 
     @classmethod
     def lt(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_lt()`.
+        The result is the same as that of :func:`f64_lt()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2917,11 +2754,11 @@ class Float128:
 
     @classmethod
     def eq_signaling(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
 
         The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-        The result is the same as that of :func:`f128_eq_signaling()`.
+        The result is the same as that of :func:`f64_eq_signaling()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2935,11 +2772,11 @@ class Float128:
 
     @classmethod
     def le_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f128_le_quiet()`.
+        The result is the same as that of :func:`f64_le_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2953,11 +2790,11 @@ class Float128:
 
     @classmethod
     def lt_quiet(cls, x: Self, y: Self) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f128_lt_quiet()`.
+        The result is the same as that of :func:`f64_lt_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2970,9 +2807,9 @@ class Float128:
         ...
 
     def is_signaling_nan(self) -> bool:
-        """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+        """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
 
-        The result is the same as that of :func:`f128_is_signaling_nan()`.
+        The result is the same as that of :func:`f64_is_signaling_nan()`.
 
         Returns:
             ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
@@ -3044,1693 +2881,8265 @@ class Float128:
         ...
 
 
-def set_tininess_mode(mode: TininessMode) -> None:
-    """Sets the tininess detection mode.
+class Float128:
+    """An IEEE 754 binary128 floating point.
 
-    Args:
-        mode: The tininess detection mode to be set.
+    The object is immutable.
 
-    """
-    ...
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
 
+    The following operators are supported:
 
-def get_tininess_mode() -> TininessMode:
-    """Returns the current tininess detection mode.
+    - unary operators: ``+``, ``-``.
+    - binary operators: ``+``, ``-``, ``*``, ``/``, ``//``, ``%``,
+      ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=``,
+      ``+=``, ``-=``, ``*=``, ``/=``, ``//=``, ``%=``.
 
-    Returns:
-        The current tininess detection mode.
+    The following operators are unsupported:
 
-    """
-    ...
+    - unary operator: ``~``.
+    - binary operators: ``<<``, ``>>``, ``&``, ``|``, ``^``, ``**``,
+      ``<<=``, ``>>=``, ``&=``, ``|=``, ``^=``, ``**=``.
 
+    """
 
-def set_rounding_mode(mode: RoundingMode) -> None:
-    """Sets the rounding mode.
+    @classmethod
+    def size(cls) -> int:
+        """Returns the native data size in bits.
 
-    Args:
-        mode: The rounding mode to be set.
+        Returns:
+            The native data size in bits, i.e. 128.
 
-    """
-    ...
+        """
+        ...
 
+    @classmethod
+    def from_bytes(cls, src: bytes) -> Self:
+        """Creates a new instance from the specified byte sequence.
 
-def get_rounding_mode() -> RoundingMode:
-    """Returns the current rounding mode.
+        Args:
+            src: The byte sequence representing the native data with big endian.
+                 The length must be 16.
 
-    Returns:
-        The current rounding mode.
+        Returns:
+            A new instance created from the specified byte sequence.
 
-    """
-    ...
+        Raises:
+            ValueError: If the length of bytes is not 16.
 
+        """
+        ...
 
-def set_exception_flags(flags: int) -> None:
-    """Sets the floating-point exception flags.
+    def to_bytes(self) -> bytes:
+        """Returns the native data as a byte sequence.
 
-    Args:
-        flags: The floating-point exception flags to be set.
+        Returns:
+            A byte sequence representing the native data with big endian.
+            The length is 16.
 
-    """
-    ...
+        """
+        ...
 
+    @classmethod
+    def from_float(cls, src: float) -> Self:
+        """Creates a new instance from the specified floating point.
 
-def get_exception_flags() -> int:
-    """Returns the current floating-point exception flags.
+        Args:
+            src: The floating point from which a new instance is created.
 
-    Returns:
-        The current floating-point exception flags.
+        Returns:
+            A new instance created from the specified floating point.
 
-    """
-    ...
+        Note:
+            Cannot create an instance with a number that an IEEE 754 binary64
+            floating point is unable to express.
 
+        """
+        ...
 
-def test_exception_flags(flags: int) -> bool:
-    """Tests the floating-point exception flags.
+    def to_float(self) -> float:
+        """Returns the native data as a floating point.
 
-    Args:
-        flags: The floating-point exception flags to be tested.
+        Returns:
+            A floating point that represents the native data.
 
-    Returns:
-        ``True`` if any of the specified exception flags is nonzero, ``False`` otherwise.
+        Note:
+            Cannot return the exact number if it is unable to be expressed
+            as an IEEE 754 binary64 floating point.
 
-    """
-    ...
+        """
+        ...
 
+    def to_ui32(
+        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+    ) -> UInt32:
+        """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
 
-def ui32_to_f16(x: UInt32) -> Float16:
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary16 floating point.
+        The result is the same as that of :func:`f128_to_ui32()`.
 
-    Args:
-        x: The 32-bit unsigned integer to be converted.
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
 
-    Returns:
-        The IEEE 754 binary16 floating point.
+        Returns:
+            The 32-bit unsigned integer.
 
-    """
-    ...
+        """
+        ...
 
+    def to_ui64(
+        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+    ) -> UInt64:
+        """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
 
-def ui32_to_f32(x: UInt32) -> Float32:
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary32 floating point.
+        The result is the same as that of :func:`f128_to_ui64()`.
 
-    Args:
-        x: The 32-bit unsigned integer to be converted.
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
 
-    Returns:
-        The IEEE 754 binary32 floating point.
+        Returns:
+            The 64-bit unsigned integer.
 
-    """
-    ...
+        """
+        ...
 
+    def to_i32(
+        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+    ) -> Int32:
+        """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
 
-def ui32_to_f64(x: UInt32) -> Float64:
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary64 floating point.
+        The result is the same as that of :func:`f128_to_i32()`.
 
-    Args:
-        x: The 32-bit unsigned integer to be converted.
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
 
-    Returns:
-        The IEEE 754 binary64 floating point.
+        Returns:
+            The 32-bit signed integer.
 
-    """
-    ...
+        """
+        ...
 
+    def to_i64(
+        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+    ) -> Int64:
+        """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
 
-def ui32_to_f128(x: UInt32) -> Float128:
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary128 floating point.
+        The result is the same as that of :func:`f128_to_i64()`.
 
-    Args:
-        x: The 32-bit unsigned integer to be converted.
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
 
-    Returns:
-        The IEEE 754 binary128 floating point.
+        Returns:
+            The 64-bit signed integer.
 
-    """
-    ...
+        """
+        ...
 
+    def to_f16(self) -> Float16:
+        """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
 
-def ui64_to_f16(x: UInt64) -> Float16:
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary16 floating point.
+        The result is the same as that of :func:`f128_to_f16()`.
+
+        Returns:
+            The IEEE 754 binary16 floating point.
+
+        """
+        ...
+
+    def to_f32(self) -> Float32:
+        """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+
+        The result is the same as that of :func:`f128_to_f32()`.
+
+        Returns:
+            The IEEE 754 binary32 floating point.
+
+        """
+        ...
+
+    def to_f64(self) -> Float64:
+        """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
+
+        The result is the same as that of :func:`f128_to_f64()`.
+
+        Returns:
+            The IEEE 754 binary64 floating point.
+
+        """
+        ...
+
+    def round_to_int(
+        self, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+    ) -> Self:
+        """Rounds the number.
+
+        The result is the same as that of :func:`f128_round_to_int()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact rounding is unable.
+
+        Returns:
+            The resulted integer.
+
+        """
+        ...
+
+    def neg(self) -> Self:
+        """Negates the IEEE 754 binary128 floating point.
+
+        The result is the same as that of :func:`f128_neg()`.
+
+        Returns:
+            The resulted number (``-x``).
+
+        """
+        ...
+
+    @classmethod
+    def add(cls, x: Self, y: Self) -> Self:
+        """Adds the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_add()`.
+
+        Args:
+            x: The floating point to be added.
+            y: The floating point to add.
+
+        Returns:
+            The resulted number (``x + y``).
+
+        """
+        ...
+
+    @classmethod
+    def sub(cls, x: Self, y: Self) -> Self:
+        """Subtracts the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_sub()`.
+
+        Args:
+            x: The floating point to be subtracted.
+            y: The floating point to subtract.
+
+        Returns:
+            The resulted number (``x - y``).
+
+        """
+        ...
+
+    @classmethod
+    def mul(cls, x: Self, y: Self) -> Self:
+        """Multiplies the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_mul()`.
+
+        Args:
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
+
+        Returns:
+            The resulted number (``x * y``).
+
+        """
+        ...
+
+    @classmethod
+    def mul_add(cls, x: Self, y: Self, z: Self) -> Self:
+        """Multiplies and Adds the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_mul_add()`.
+
+        Args:
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
+            z: The floating point to add.
+
+        Returns:
+            The resulted number (``x * y + z``).
+
+        """
+        ...
+
+    @classmethod
+    def div(cls, x: Self, y: Self) -> Self:
+        """Divides the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_div()`.
+
+        Args:
+            x: The floating point to be divided.
+            y: The floating point to divide.
+
+        Returns:
+            The resulted number (``x / y``).
+
+        """
+        ...
+
+    @classmethod
+    def rem(cls, x: Self, y: Self) -> Self:
+        """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_rem()`.
+
+        Args:
+            x: The floating point to be divided.
+            y: The floating point to divide.
+
+        Returns:
+            The resulted number (``x % y``).
+
+        """
+        ...
+
+    @classmethod
+    def sqrt(cls, x: Self) -> Self:
+        """Calculates a square root of the IEEE 754 binary128 floating point.
+
+        The result is the same as that of :func:`f128_sqrt()`.
+
+        Args:
+            x: The floating point whose square root is to be calculated.
+
+        Returns:
+            The resulted number (``sqrt(x)``).
+
+        """
+        ...
+
+    @classmethod
+    def eq(cls, x: Self, y: Self) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_eq()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+        """
+        ...
+
+    @classmethod
+    def le(cls, x: Self, y: Self) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_le()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+        """
+        ...
+
+    @classmethod
+    def lt(cls, x: Self, y: Self) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_lt()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+        """
+        ...
+
+    @classmethod
+    def eq_signaling(cls, x: Self, y: Self) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+        The result is the same as that of :func:`f128_eq_signaling()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+        """
+        ...
+
+    @classmethod
+    def le_quiet(cls, x: Self, y: Self) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`f128_le_quiet()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+        """
+        ...
+
+    @classmethod
+    def lt_quiet(cls, x: Self, y: Self) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`f128_lt_quiet()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+        """
+        ...
+
+    def is_signaling_nan(self) -> bool:
+        """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+
+        The result is the same as that of :func:`f128_is_signaling_nan()`.
+
+        Returns:
+            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+        """
+        ...
+
+    def __str__(self) -> str:
+        ...
+
+    def __pos__(self) -> Self:
+        ...
+
+    def __neg__(self) -> Self:
+        ...
+
+    def __add__(self, other: Self) -> Self:
+        ...
+
+    def __sub__(self, other: Self) -> Self:
+        ...
+
+    def __mul__(self, other: Self) -> Self:
+        ...
+
+    def __truediv__(self, other: Self) -> Self:
+        ...
+
+    def __floordiv__(self, other: Self) -> Self:
+        ...
+
+    def __mod__(self, other: Self) -> Self:
+        ...
+
+    def __lt__(self, other: Self) -> bool:
+        ...
+
+    def __le__(self, other: Self) -> bool:
+        ...
+
+    def __gt__(self, other: Self) -> bool:
+        ...
+
+    def __ge__(self, other: Self) -> bool:
+        ...
+
+    def __eq__(self, other: object) -> bool:
+        ...
+
+    def __ne__(self, other: object) -> bool:
+        ...
+
+    def __iadd__(self, other: Self) -> Self:
+        ...
+
+    def __isub__(self, other: Self) -> Self:
+        ...
+
+    def __imul__(self, other: Self) -> Self:
+        ...
+
+    def __itruediv__(self, other: Self) -> Self:
+        ...
+
+    def __ifloordiv__(self, other: Self) -> Self:
+        ...
+
+    def __imod__(self, other: Self) -> Self:
+        ...
+
+
+def set_tininess_mode(mode: TininessMode) -> None:
+    """Sets the tininess detection mode of the current thread.
+
+    Args:
+        mode: The tininess detection mode to be set.
+
+    """
+    ...
+
+
+def get_tininess_mode() -> TininessMode:
+    """Returns the tininess detection mode of the current thread.
+
+    Returns:
+        The current tininess detection mode.
+
+    """
+    ...
+
+
+def set_rounding_mode(mode: RoundingMode) -> None:
+    """Sets the rounding mode of the current thread.
+
+    Args:
+        mode: The rounding mode to be set.
+
+    """
+    ...
+
+
+def get_rounding_mode() -> RoundingMode:
+    """Returns the rounding mode of the current thread.
+
+    Returns:
+        The current rounding mode.
+
+    """
+    ...
+
+
+def set_exception_flags(flags: int) -> None:
+    """Sets the floating-point exception flags of the current thread.
+
+    Args:
+        flags: The floating-point exception flags to be set.
+
+    """
+    ...
+
+
+def get_exception_flags() -> int:
+    """Returns the floating-point exception flags of the current thread.
+
+    Returns:
+        The current floating-point exception flags.
+
+    """
+    ...
+
+
+def test_exception_flags(flags: int) -> bool:
+    """Tests the floating-point exception flags of the current thread.
+
+    Args:
+        flags: The floating-point exception flags to be tested.
+
+    Returns:
+        ``True`` if any of the specified exception flags is nonzero, ``False`` otherwise.
+
+    """
+    ...
+
+
+class FloatContext:
+    """A floating-point context that holds the rounding mode, the tininess detection mode,
+    and the floating-point exception flags.
+
+    When used in a ``with`` statement, the context saves the rounding mode, the tininess
+    detection mode, and the floating-point exception flags of the current thread on entry,
+    applies its modes and clears the flags, and restores all of them on exit. The flags raised
+    inside the statement are accumulated into :attr:`flags` of the context.
+
+    The context can also be passed to the batch operations as ``context``, in which case
+    they are performed in the same way as inside the statement.
+
+    If any of the exception flags specified as the traps is raised, :class:`FloatingPointError`
+    is raised on exit from the statement or from the batch operation.
+
+    """
+
+    def __init__(
+        self, rounding_mode: RoundingMode | None = None, tininess_mode: TininessMode | None = None, traps: int = 0
+    ) -> None:
+        """Creates a new instance.
+
+        Args:
+            rounding_mode: The rounding mode. If ``None`` is specified, that of the current thread is used.
+            tininess_mode: The tininess detection mode. If ``None`` is specified, that of the current thread is used.
+            traps: The floating-point exception flags to be trapped.
+
+        """
+        ...
+
+    @property
+    def rounding_mode(self) -> RoundingMode | None:
+        """The rounding mode, or ``None`` to use that of the current thread."""
+        ...
+
+    @property
+    def tininess_mode(self) -> TininessMode | None:
+        """The tininess detection mode, or ``None`` to use that of the current thread."""
+        ...
+
+    @property
+    def traps(self) -> int:
+        """The floating-point exception flags to be trapped."""
+        ...
+
+    @property
+    def flags(self) -> int:
+        """The floating-point exception flags raised in the context."""
+        ...
+
+    @flags.setter
+    def flags(self, value: int) -> None:
+        ...
+
+    def __enter__(self) -> Self:
+        ...
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> bool:
+        ...
+
+
+def set_num_threads(n: int) -> None:
+    """Sets the number of threads used by the batch operations.
+
+    The batch operations split long operands into chunks and run them in parallel
+    without holding the GIL. The rounding mode and the tininess detection mode of
+    the calling thread are applied to all the chunks, and the exception flags raised
+    by them are accumulated into those of the calling thread.
+
+    Args:
+        n: The number of threads. If ``1`` is specified, the batch operations run
+           only in the calling thread.
+
+    Raises:
+        ValueError: If the number of threads is less than 1.
+
+    """
+    ...
+
+
+def get_num_threads() -> int:
+    """Returns the number of threads used by the batch operations.
+
+    Returns:
+        The number of threads.
+
+    """
+    ...
+
+
+def set_interning(enabled: bool) -> None:
+    """Sets whether the 16-bit floating-point objects are interned.
+
+    While interning is enabled, all the :class:`Float16` and :class:`BFloat16` objects
+    created by the operations, the conversions, and the packed arrays are shared instances,
+    one for each bit pattern. This eliminates object allocation in the half-precision
+    scalar loops, and allows the identity test to be used instead of the bitwise equality test.
+
+    Args:
+        enabled: ``True`` to enable interning, ``False`` to disable it.
+
+    """
+    ...
+
+
+def get_interning() -> bool:
+    """Returns whether the 16-bit floating-point objects are interned.
+
+    Returns:
+        ``True`` if interning is enabled, ``False`` otherwise.
+
+    """
+    ...
+
+
+def set_hardware_acceleration(enabled: bool) -> None:
+    """Sets whether the arithmetic of the narrow floating points is performed on the hardware.
+
+    While the hardware acceleration is enabled, the addition, the subtraction, the multiplication,
+    and the division of IEEE 754 binary16 and binary32 floating points, and the square root of
+    IEEE 754 binary32 floating points are computed on the binary64 floating-point unit of the host
+    and rounded once to the target format. The operations whose results the host unit is unable
+    to reproduce, such as those with NaN or infinite operands, fall back to SoftFloat.
+    The results and the floating-point exception flags are identical to those of SoftFloat
+    in all the rounding and tininess detection modes.
+
+    Args:
+        enabled: ``True`` to enable the hardware acceleration, ``False`` to disable it.
+
+    Raises:
+        RuntimeError: If the host evaluates floating-point expressions with excess precision.
+
+    """
+    ...
+
+
+def get_hardware_acceleration() -> bool:
+    """Returns whether the arithmetic of the narrow floating points is performed on the hardware.
+
+    Returns:
+        ``True`` if the hardware acceleration is enabled, ``False`` otherwise.
+
+    """
+    ...
+
+
+def ui32_to_f16(x: UInt32) -> Float16:
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def ui32_to_f32(x: UInt32) -> Float32:
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def ui32_to_f64(x: UInt32) -> Float64:
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def ui32_to_f128(x: UInt32) -> Float128:
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def ui64_to_f16(x: UInt64) -> Float16:
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def ui64_to_f32(x: UInt64) -> Float32:
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def ui64_to_f64(x: UInt64) -> Float64:
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def ui64_to_f128(x: UInt64) -> Float128:
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def i32_to_f16(x: Int32) -> Float16:
+    """Converts the 32-bit signed integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def i32_to_f32(x: Int32) -> Float32:
+    """Converts the 32-bit signed integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def i32_to_f64(x: Int32) -> Float64:
+    """Converts the 32-bit signed integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def i32_to_f128(x: Int32) -> Float128:
+    """Converts the 32-bit signed integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def i64_to_f16(x: Int64) -> Float16:
+    """Converts the 64-bit signed integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def i64_to_f32(x: Int64) -> Float32:
+    """Converts the 64-bit signed integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def i64_to_f64(x: Int64) -> Float64:
+    """Converts the 64-bit signed integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def i64_to_f128(x: Int64) -> Float128:
+    """Converts the 64-bit signed integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def f16_to_ui32(
+    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt32:
+    """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    ...
+
+
+def f16_to_ui64(
+    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt64:
+    """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    ...
+
+
+def f16_to_i32(
+    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int32:
+    """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    ...
+
+
+def f16_to_i64(
+    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int64:
+    """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    ...
+
+
+def f16_to_f32(x: Float16) -> Float32:
+    """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def f16_to_f64(x: Float16) -> Float64:
+    """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def f16_to_f128(x: Float16) -> Float128:
+    """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def f16_round_to_int(
+    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Float16:
+    """Rounds the number expressed as an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def f16_neg(x: Float16) -> Float16:
+    """Negates the IEEE 754 binary16 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``-x``).
+
+    """
+    ...
+
+
+def f16_add(x: Float16, y: Float16) -> Float16:
+    """Adds the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x + y``).
+
+    """
+    ...
+
+
+def f16_sub(x: Float16, y: Float16) -> Float16:
+    """Subtracts the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x - y``).
+
+    """
+    ...
+
+
+def f16_mul(x: Float16, y: Float16) -> Float16:
+    """Multiplies the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y``).
+
+    """
+    ...
+
+
+def f16_mul_add(x: Float16, y: Float16, z: Float16) -> Float16:
+    """Multiplies and Adds the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y + z``).
+
+    """
+    ...
+
+
+def f16_div(x: Float16, y: Float16) -> Float16:
+    """Divides the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x / y``).
+
+    """
+    ...
+
+
+def f16_rem(x: Float16, y: Float16) -> Float16:
+    """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x % y``).
+
+    """
+    ...
+
+
+def f16_sqrt(x: Float16) -> Float16:
+    """Calculates a square root of the IEEE 754 binary16 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``sqrt(x)``).
+
+    """
+    ...
+
+
+def f16_eq(x: Float16, y: Float16) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f16_le(x: Float16, y: Float16) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f16_lt(x: Float16, y: Float16) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f16_eq_signaling(x: Float16, y: Float16) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f16_le_quiet(x: Float16, y: Float16) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f16_lt_quiet(x: Float16, y: Float16) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f16_is_signaling_nan(x: Float16) -> bool:
+    """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    ...
+
+
+def bf16_to_f32(x: BFloat16) -> Float32:
+    """Converts the 16-bit brain floating point to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 16-bit brain floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def f32_to_bf16(x: Float32) -> BFloat16:
+    """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The 16-bit brain floating point.
+
+    """
+    ...
+
+
+def bf16_round_to_int(
+    x: BFloat16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> BFloat16:
+    """Rounds the number expressed as an 16-bit brain floating point.
+
+    Args:
+        x: The 16-bit brain floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an 16-bit brain floating point.
+
+    """
+    ...
+
+
+def bf16_neg(x: BFloat16) -> BFloat16:
+    """Negates the 16-bit brain floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``-x``).
+
+    """
+    ...
+
+
+def bf16_add(x: BFloat16, y: BFloat16) -> BFloat16:
+    """Adds the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x + y``).
+
+    """
+    ...
+
+
+def bf16_sub(x: BFloat16, y: BFloat16) -> BFloat16:
+    """Subtracts the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x - y``).
+
+    """
+    ...
+
+
+def bf16_mul(x: BFloat16, y: BFloat16) -> BFloat16:
+    """Multiplies the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x * y``).
+
+    """
+    ...
+
+
+def bf16_mul_add(x: BFloat16, y: BFloat16, z: BFloat16) -> BFloat16:
+    """Multiplies and Adds the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x * y + z``).
+
+    """
+    ...
+
+
+def bf16_div(x: BFloat16, y: BFloat16) -> BFloat16:
+    """Divides the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x / y``).
+
+    """
+    ...
+
+
+def bf16_rem(x: BFloat16, y: BFloat16) -> BFloat16:
+    """Calculates a remainder by dividing the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x % y``).
+
+    """
+    ...
+
+
+def bf16_sqrt(x: BFloat16) -> BFloat16:
+    """Calculates a square root of the 16-bit brain floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``sqrt(x)``).
+
+    """
+    ...
+
+
+def bf16_eq(x: BFloat16, y: BFloat16) -> bool:
+    """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def bf16_le(x: BFloat16, y: BFloat16) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def bf16_lt(x: BFloat16, y: BFloat16) -> bool:
+    """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def bf16_eq_signaling(x: BFloat16, y: BFloat16) -> bool:
+    """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def bf16_le_quiet(x: BFloat16, y: BFloat16) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def bf16_lt_quiet(x: BFloat16, y: BFloat16) -> bool:
+    """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def bf16_is_signaling_nan(x: BFloat16) -> bool:
+    """Tests if the 16-bit brain floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    ...
+
+
+def f32_to_ui32(
+    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt32:
+    """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    ...
+
+
+def f32_to_ui64(
+    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt64:
+    """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    ...
+
+
+def f32_to_i32(
+    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int32:
+    """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    ...
+
+
+def f32_to_i64(
+    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int64:
+    """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    ...
+
+
+def f32_to_f16(x: Float32) -> Float16:
+    """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def f32_to_f64(x: Float32) -> Float64:
+    """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def f32_to_f128(x: Float32) -> Float128:
+    """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def f32_round_to_int(
+    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Float32:
+    """Rounds the number expressed as an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def f32_neg(x: Float32) -> Float32:
+    """Negates the IEEE 754 binary32 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``-x``).
+
+    """
+    ...
+
+
+def f32_add(x: Float32, y: Float32) -> Float32:
+    """Adds the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x + y``).
+
+    """
+    ...
+
+
+def f32_sub(x: Float32, y: Float32) -> Float32:
+    """Subtracts the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x - y``).
+
+    """
+    ...
+
+
+def f32_mul(x: Float32, y: Float32) -> Float32:
+    """Multiplies the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y``).
+
+    """
+    ...
+
+
+def f32_mul_add(x: Float32, y: Float32, z: Float32) -> Float32:
+    """Multiplies and Adds the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y + z``).
+
+    """
+    ...
+
+
+def f32_div(x: Float32, y: Float32) -> Float32:
+    """Divides the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x / y``).
+
+    """
+    ...
+
+
+def f32_rem(x: Float32, y: Float32) -> Float32:
+    """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x % y``).
+
+    """
+    ...
+
+
+def f32_sqrt(x: Float32) -> Float32:
+    """Calculates a square root of the IEEE 754 binary32 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``sqrt(x)``).
+
+    """
+    ...
+
+
+def f32_eq(x: Float32, y: Float32) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f32_le(x: Float32, y: Float32) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f32_lt(x: Float32, y: Float32) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f32_eq_signaling(x: Float32, y: Float32) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f32_le_quiet(x: Float32, y: Float32) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f32_lt_quiet(x: Float32, y: Float32) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f32_is_signaling_nan(x: Float32) -> bool:
+    """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    ...
+
+
+def f64_to_ui32(
+    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt32:
+    """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    ...
+
+
+def f64_to_ui64(
+    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt64:
+    """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    ...
+
+
+def f64_to_i32(
+    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int32:
+    """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    ...
+
+
+def f64_to_i64(
+    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int64:
+    """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    ...
+
+
+def f64_to_f16(x: Float64) -> Float16:
+    """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def f64_to_f32(x: Float64) -> Float32:
+    """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def f64_to_f128(x: Float64) -> Float128:
+    """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def f64_round_to_int(
+    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Float64:
+    """Rounds the number expressed as an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def f64_neg(x: Float64) -> Float64:
+    """Negates the IEEE 754 binary64 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``-x``).
+
+    """
+    ...
+
+
+def f64_add(x: Float64, y: Float64) -> Float64:
+    """Adds the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x + y``).
+
+    """
+    ...
+
+
+def f64_sub(x: Float64, y: Float64) -> Float64:
+    """Subtracts the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x - y``).
+
+    """
+    ...
+
+
+def f64_mul(x: Float64, y: Float64) -> Float64:
+    """Multiplies the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y``).
+
+    """
+    ...
+
+
+def f64_mul_add(x: Float64, y: Float64, z: Float64) -> Float64:
+    """Multiplies and Adds the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y + z``).
+
+    """
+    ...
+
+
+def f64_div(x: Float64, y: Float64) -> Float64:
+    """Divides the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x / y``).
+
+    """
+    ...
+
+
+def f64_rem(x: Float64, y: Float64) -> Float64:
+    """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x % y``).
+
+    """
+    ...
+
+
+def f64_sqrt(x: Float64) -> Float64:
+    """Calculates a square root of the IEEE 754 binary64 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``sqrt(x)``).
+
+    """
+    ...
+
+
+def f64_eq(x: Float64, y: Float64) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f64_le(x: Float64, y: Float64) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f64_lt(x: Float64, y: Float64) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f64_eq_signaling(x: Float64, y: Float64) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f64_le_quiet(x: Float64, y: Float64) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f64_lt_quiet(x: Float64, y: Float64) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f64_is_signaling_nan(x: Float64) -> bool:
+    """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    ...
+
+
+def f128_to_ui32(
+    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt32:
+    """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    ...
+
+
+def f128_to_ui64(
+    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> UInt64:
+    """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    ...
+
+
+def f128_to_i32(
+    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int32:
+    """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    ...
+
+
+def f128_to_i64(
+    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Int64:
+    """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    ...
+
+
+def f128_to_f16(x: Float128) -> Float16:
+    """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    ...
+
+
+def f128_to_f32(x: Float128) -> Float32:
+    """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    ...
+
+
+def f128_to_f64(x: Float128) -> Float64:
+    """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    ...
+
+
+def f128_round_to_int(
+    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
+) -> Float128:
+    """Rounds the number expressed as an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary128 floating point.
+
+    """
+    ...
+
+
+def f128_neg(x: Float128) -> Float128:
+    """Negates the IEEE 754 binary128 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``-x``).
+
+    """
+    ...
+
+
+def f128_add(x: Float128, y: Float128) -> Float128:
+    """Adds the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x + y``).
+
+    """
+    ...
+
+
+def f128_sub(x: Float128, y: Float128) -> Float128:
+    """Subtracts the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x - y``).
+
+    """
+    ...
+
+
+def f128_mul(x: Float128, y: Float128) -> Float128:
+    """Multiplies the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y``).
+
+    """
+    ...
+
+
+def f128_mul_add(x: Float128, y: Float128, z: Float128) -> Float128:
+    """Multiplies and Adds the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y + z``).
+
+    """
+    ...
+
+
+def f128_div(x: Float128, y: Float128) -> Float128:
+    """Divides the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x / y``).
+
+    """
+    ...
+
+
+def f128_rem(x: Float128, y: Float128) -> Float128:
+    """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x % y``).
+
+    """
+    ...
+
+
+def f128_sqrt(x: Float128) -> Float128:
+    """Calculates a square root of the IEEE 754 binary128 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``sqrt(x)``).
+
+    """
+    ...
+
+
+def f128_eq(x: Float128, y: Float128) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f128_le(x: Float128, y: Float128) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f128_lt(x: Float128, y: Float128) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f128_eq_signaling(x: Float128, y: Float128) -> bool:
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    ...
+
+
+def f128_le_quiet(x: Float128, y: Float128) -> bool:
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    ...
+
+
+def f128_lt_quiet(x: Float128, y: Float128) -> bool:
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    ...
+
+
+def f128_is_signaling_nan(x: Float128) -> bool:
+    """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    ...
+
+
+class BFloat16Array:
+    """A packed array of 16-bit brain floating points.
+
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`BFloat16` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
+
+    The buffer protocol is supported with the format ``'H'``.
+
+    """
+
+    def __init__(self, src: int | Iterable[BFloat16] = 0) -> None:
+        """Creates a new instance.
+
+        Args:
+            src: The number of the elements initialized with positive zeros,
+                 or the elements from which a new instance is created.
+
+        """
+        ...
+
+    @classmethod
+    def from_floats(cls, src: Iterable[float]) -> Self:
+        """Creates a new instance from the specified floating points.
+
+        Args:
+            src: The floating points from which a new instance is created.
+
+        Returns:
+            A new instance created from the specified floating points.
+
+        """
+        ...
+
+    def to_floats(self) -> list[float]:
+        """Returns the elements as floating points.
+
+        Returns:
+            A list of floating points that represent the elements.
+
+        """
+        ...
+
+    @classmethod
+    def from_buffer(cls, src: Buffer, byteorder: str = 'native', count: int = -1, offset: int = 0) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified buffer.
+
+        If the byte order is that of the host and the elements are aligned, the new instance shares
+        the memory of the buffer without copying it, so that the modifications of either are visible
+        from the other. In this case, the new instance is read-only if the buffer is read-only.
+        Otherwise, the elements are copied with their bytes reversed as needed.
+
+        Args:
+            src: The buffer that stores the elements.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+
+        Returns:
+            A new instance created from the elements stored in the specified buffer.
+
+        Raises:
+            ValueError: If the byte order is unknown, or the buffer is too short.
+
+        """
+        ...
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], byteorder: str = 'native', count: int = -1, offset: int = 0, mode: str = 'r'
+    ) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified file.
+
+        The file is mapped into memory, and the elements are read from the pages on demand,
+        so that files larger than the physical memory can be processed by the batch operations.
+        In the byte order other than that of the host, the elements are copied as :meth:`from_buffer()` does.
+
+        Args:
+            path: The path of the file.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+            mode: ``'r'`` to map the file read-only, or ``'c'`` to map it copy-on-write,
+                  in which the modifications of the elements are not written to the file.
+
+        Returns:
+            A new instance created from the elements stored in the specified file.
+
+        Raises:
+            ValueError: If the byte order or the mode is unknown, or the file is too short.
+
+        """
+        ...
+
+    def to_bytes(self, byteorder: str = 'native') -> bytes:
+        """Returns the elements as bytes.
+
+        Args:
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+
+        Returns:
+            The bytes that store the elements contiguously in the specified byte order.
+
+        Raises:
+            ValueError: If the byte order is unknown.
+
+        """
+        ...
+
+    def to_f32(self) -> Float32Array:
+        """Converts the 16-bit brain floating points to IEEE 754 binary32 floating points.
+
+        The result is the same as that of :func:`bf16_to_f32_array()`.
+
+        Returns:
+            The IEEE 754 binary32 floating points.
+
+        """
+        ...
+
+    def to_str(self, sep: str = ', ') -> str:
+        """Returns the elements as decimal strings joined with the specified separator.
+
+        Each element is represented by the shortest decimal string that is rounded to the element,
+        which is the same as :func:`str()` of the element.
+
+        Args:
+            sep: The separator inserted between the elements.
+
+        Returns:
+            The string that represents the elements.
+
+        """
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> BFloat16:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Self:
+        ...
+
+    @overload
+    def __setitem__(self, key: SupportsIndex, value: BFloat16) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, key: slice, value: Iterable[BFloat16]) -> None:
+        ...
+
+    def __iter__(self) -> Iterator[BFloat16]:
+        ...
+
+    def __str__(self) -> str:
+        ...
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        ...
+
+    def __add__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __sub__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __mul__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __truediv__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __radd__(self, other: BFloat16) -> Self:
+        ...
+
+    def __rsub__(self, other: BFloat16) -> Self:
+        ...
+
+    def __rmul__(self, other: BFloat16) -> Self:
+        ...
+
+    def __rtruediv__(self, other: BFloat16) -> Self:
+        ...
+
+    def __iadd__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __isub__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __imul__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __itruediv__(self, other: BFloat16 | Buffer) -> Self:
+        ...
+
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """Performs a NumPy universal function using the batch operations.
+
+        The supported universal functions are ``add``, ``subtract``, ``multiply``, ``divide``,
+        ``sqrt``, ``equal``, ``not_equal``, ``less``, ``less_equal``, ``greater``, and ``greater_equal``.
+        The comparisons return NumPy arrays of booleans.
+
+        Args:
+            ufunc: The universal function.
+            method: The method of the universal function. Only ``'__call__'`` is supported.
+            inputs: The operands.
+            kwargs: The keyword arguments. Only ``out`` is supported.
+
+        Returns:
+            The result, or ``NotImplemented`` if the universal function or the operands are unsupported.
+
+        """
+        ...
+
+
+class Float16Array:
+    """A packed array of IEEE 754 binary16 floating points.
+
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float16` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
+
+    The buffer protocol is supported with the format ``'H'``.
+
+    """
+
+    def __init__(self, src: int | Iterable[Float16] = 0) -> None:
+        """Creates a new instance.
+
+        Args:
+            src: The number of the elements initialized with positive zeros,
+                 or the elements from which a new instance is created.
+
+        """
+        ...
+
+    @classmethod
+    def from_floats(cls, src: Iterable[float]) -> Self:
+        """Creates a new instance from the specified floating points.
+
+        Args:
+            src: The floating points from which a new instance is created.
+
+        Returns:
+            A new instance created from the specified floating points.
+
+        """
+        ...
+
+    def to_floats(self) -> list[float]:
+        """Returns the elements as floating points.
+
+        Returns:
+            A list of floating points that represent the elements.
+
+        """
+        ...
+
+    @classmethod
+    def from_buffer(cls, src: Buffer, byteorder: str = 'native', count: int = -1, offset: int = 0) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified buffer.
+
+        If the byte order is that of the host and the elements are aligned, the new instance shares
+        the memory of the buffer without copying it, so that the modifications of either are visible
+        from the other. In this case, the new instance is read-only if the buffer is read-only.
+        Otherwise, the elements are copied with their bytes reversed as needed.
+
+        Args:
+            src: The buffer that stores the elements.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+
+        Returns:
+            A new instance created from the elements stored in the specified buffer.
+
+        Raises:
+            ValueError: If the byte order is unknown, or the buffer is too short.
+
+        """
+        ...
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], byteorder: str = 'native', count: int = -1, offset: int = 0, mode: str = 'r'
+    ) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified file.
+
+        The file is mapped into memory, and the elements are read from the pages on demand,
+        so that files larger than the physical memory can be processed by the batch operations.
+        In the byte order other than that of the host, the elements are copied as :meth:`from_buffer()` does.
+
+        Args:
+            path: The path of the file.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+            mode: ``'r'`` to map the file read-only, or ``'c'`` to map it copy-on-write,
+                  in which the modifications of the elements are not written to the file.
+
+        Returns:
+            A new instance created from the elements stored in the specified file.
+
+        Raises:
+            ValueError: If the byte order or the mode is unknown, or the file is too short.
+
+        """
+        ...
+
+    def to_bytes(self, byteorder: str = 'native') -> bytes:
+        """Returns the elements as bytes.
+
+        Args:
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+
+        Returns:
+            The bytes that store the elements contiguously in the specified byte order.
+
+        Raises:
+            ValueError: If the byte order is unknown.
+
+        """
+        ...
+
+    def to_f32(self) -> Float32Array:
+        """Converts the IEEE 754 binary16 floating points to binary32 floating points.
+
+        The result is the same as that of :func:`f16_to_f32_array()`.
+
+        Returns:
+            The IEEE 754 binary32 floating points.
+
+        """
+        ...
+
+    def to_f64(self) -> Float64Array:
+        """Converts the IEEE 754 binary16 floating points to binary64 floating points.
+
+        The result is the same as that of :func:`f16_to_f64_array()`.
+
+        Returns:
+            The IEEE 754 binary64 floating points.
+
+        """
+        ...
+
+    def to_f128(self) -> Float128Array:
+        """Converts the IEEE 754 binary16 floating points to binary128 floating points.
+
+        The result is the same as that of :func:`f16_to_f128_array()`.
+
+        Returns:
+            The IEEE 754 binary128 floating points.
+
+        """
+        ...
+
+    def to_str(self, sep: str = ', ') -> str:
+        """Returns the elements as decimal strings joined with the specified separator.
+
+        Each element is represented by the shortest decimal string that is rounded to the element,
+        which is the same as :func:`str()` of the element.
+
+        Args:
+            sep: The separator inserted between the elements.
+
+        Returns:
+            The string that represents the elements.
+
+        """
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> Float16:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Self:
+        ...
+
+    @overload
+    def __setitem__(self, key: SupportsIndex, value: Float16) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, key: slice, value: Iterable[Float16]) -> None:
+        ...
+
+    def __iter__(self) -> Iterator[Float16]:
+        ...
+
+    def __str__(self) -> str:
+        ...
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        ...
+
+    def __add__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __sub__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __mul__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __truediv__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __radd__(self, other: Float16) -> Self:
+        ...
+
+    def __rsub__(self, other: Float16) -> Self:
+        ...
+
+    def __rmul__(self, other: Float16) -> Self:
+        ...
+
+    def __rtruediv__(self, other: Float16) -> Self:
+        ...
+
+    def __iadd__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __isub__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __imul__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __itruediv__(self, other: Float16 | Buffer) -> Self:
+        ...
+
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """Performs a NumPy universal function using the batch operations.
+
+        The supported universal functions are ``add``, ``subtract``, ``multiply``, ``divide``,
+        ``sqrt``, ``equal``, ``not_equal``, ``less``, ``less_equal``, ``greater``, and ``greater_equal``.
+        The comparisons return NumPy arrays of booleans.
+
+        Args:
+            ufunc: The universal function.
+            method: The method of the universal function. Only ``'__call__'`` is supported.
+            inputs: The operands.
+            kwargs: The keyword arguments. Only ``out`` is supported.
+
+        Returns:
+            The result, or ``NotImplemented`` if the universal function or the operands are unsupported.
+
+        """
+        ...
+
+
+class Float32Array:
+    """A packed array of IEEE 754 binary32 floating points.
+
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float32` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
+
+    The buffer protocol is supported with the format ``'I'``.
+
+    """
+
+    def __init__(self, src: int | Iterable[Float32] = 0) -> None:
+        """Creates a new instance.
+
+        Args:
+            src: The number of the elements initialized with positive zeros,
+                 or the elements from which a new instance is created.
+
+        """
+        ...
+
+    @classmethod
+    def from_floats(cls, src: Iterable[float]) -> Self:
+        """Creates a new instance from the specified floating points.
+
+        Args:
+            src: The floating points from which a new instance is created.
+
+        Returns:
+            A new instance created from the specified floating points.
+
+        """
+        ...
+
+    def to_floats(self) -> list[float]:
+        """Returns the elements as floating points.
+
+        Returns:
+            A list of floating points that represent the elements.
+
+        """
+        ...
+
+    @classmethod
+    def from_buffer(cls, src: Buffer, byteorder: str = 'native', count: int = -1, offset: int = 0) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified buffer.
+
+        If the byte order is that of the host and the elements are aligned, the new instance shares
+        the memory of the buffer without copying it, so that the modifications of either are visible
+        from the other. In this case, the new instance is read-only if the buffer is read-only.
+        Otherwise, the elements are copied with their bytes reversed as needed.
+
+        Args:
+            src: The buffer that stores the elements.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+
+        Returns:
+            A new instance created from the elements stored in the specified buffer.
+
+        Raises:
+            ValueError: If the byte order is unknown, or the buffer is too short.
+
+        """
+        ...
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], byteorder: str = 'native', count: int = -1, offset: int = 0, mode: str = 'r'
+    ) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified file.
+
+        The file is mapped into memory, and the elements are read from the pages on demand,
+        so that files larger than the physical memory can be processed by the batch operations.
+        In the byte order other than that of the host, the elements are copied as :meth:`from_buffer()` does.
+
+        Args:
+            path: The path of the file.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+            mode: ``'r'`` to map the file read-only, or ``'c'`` to map it copy-on-write,
+                  in which the modifications of the elements are not written to the file.
+
+        Returns:
+            A new instance created from the elements stored in the specified file.
+
+        Raises:
+            ValueError: If the byte order or the mode is unknown, or the file is too short.
+
+        """
+        ...
+
+    def to_bytes(self, byteorder: str = 'native') -> bytes:
+        """Returns the elements as bytes.
+
+        Args:
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+
+        Returns:
+            The bytes that store the elements contiguously in the specified byte order.
+
+        Raises:
+            ValueError: If the byte order is unknown.
+
+        """
+        ...
+
+    def to_bf16(self) -> BFloat16Array:
+        """Converts the IEEE 754 binary32 floating points to 16-bit brain floating points.
+
+        The result is the same as that of :func:`f32_to_bf16_array()`.
+
+        Returns:
+            The 16-bit brain floating points.
+
+        """
+        ...
+
+    def to_f16(self) -> Float16Array:
+        """Converts the IEEE 754 binary32 floating points to binary16 floating points.
+
+        The result is the same as that of :func:`f32_to_f16_array()`.
+
+        Returns:
+            The IEEE 754 binary16 floating points.
+
+        """
+        ...
+
+    def to_f64(self) -> Float64Array:
+        """Converts the IEEE 754 binary32 floating points to binary64 floating points.
+
+        The result is the same as that of :func:`f32_to_f64_array()`.
+
+        Returns:
+            The IEEE 754 binary64 floating points.
+
+        """
+        ...
+
+    def to_f128(self) -> Float128Array:
+        """Converts the IEEE 754 binary32 floating points to binary128 floating points.
+
+        The result is the same as that of :func:`f32_to_f128_array()`.
+
+        Returns:
+            The IEEE 754 binary128 floating points.
+
+        """
+        ...
+
+    def to_str(self, sep: str = ', ') -> str:
+        """Returns the elements as decimal strings joined with the specified separator.
+
+        Each element is represented by the shortest decimal string that is rounded to the element,
+        which is the same as :func:`str()` of the element.
+
+        Args:
+            sep: The separator inserted between the elements.
+
+        Returns:
+            The string that represents the elements.
+
+        """
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> Float32:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Self:
+        ...
+
+    @overload
+    def __setitem__(self, key: SupportsIndex, value: Float32) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, key: slice, value: Iterable[Float32]) -> None:
+        ...
+
+    def __iter__(self) -> Iterator[Float32]:
+        ...
+
+    def __str__(self) -> str:
+        ...
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        ...
+
+    def __add__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __sub__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __mul__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __truediv__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __radd__(self, other: Float32) -> Self:
+        ...
+
+    def __rsub__(self, other: Float32) -> Self:
+        ...
+
+    def __rmul__(self, other: Float32) -> Self:
+        ...
+
+    def __rtruediv__(self, other: Float32) -> Self:
+        ...
+
+    def __iadd__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __isub__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __imul__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __itruediv__(self, other: Float32 | Buffer) -> Self:
+        ...
+
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """Performs a NumPy universal function using the batch operations.
+
+        The supported universal functions are ``add``, ``subtract``, ``multiply``, ``divide``,
+        ``sqrt``, ``equal``, ``not_equal``, ``less``, ``less_equal``, ``greater``, and ``greater_equal``.
+        The comparisons return NumPy arrays of booleans.
+
+        Args:
+            ufunc: The universal function.
+            method: The method of the universal function. Only ``'__call__'`` is supported.
+            inputs: The operands.
+            kwargs: The keyword arguments. Only ``out`` is supported.
+
+        Returns:
+            The result, or ``NotImplemented`` if the universal function or the operands are unsupported.
+
+        """
+        ...
+
+
+class Float64Array:
+    """A packed array of IEEE 754 binary64 floating points.
+
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float64` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
+
+    The buffer protocol is supported with the format ``'Q'``.
+
+    """
+
+    def __init__(self, src: int | Iterable[Float64] = 0) -> None:
+        """Creates a new instance.
+
+        Args:
+            src: The number of the elements initialized with positive zeros,
+                 or the elements from which a new instance is created.
+
+        """
+        ...
+
+    @classmethod
+    def from_floats(cls, src: Iterable[float]) -> Self:
+        """Creates a new instance from the specified floating points.
+
+        Args:
+            src: The floating points from which a new instance is created.
+
+        Returns:
+            A new instance created from the specified floating points.
+
+        """
+        ...
+
+    def to_floats(self) -> list[float]:
+        """Returns the elements as floating points.
+
+        Returns:
+            A list of floating points that represent the elements.
+
+        """
+        ...
+
+    @classmethod
+    def from_buffer(cls, src: Buffer, byteorder: str = 'native', count: int = -1, offset: int = 0) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified buffer.
+
+        If the byte order is that of the host and the elements are aligned, the new instance shares
+        the memory of the buffer without copying it, so that the modifications of either are visible
+        from the other. In this case, the new instance is read-only if the buffer is read-only.
+        Otherwise, the elements are copied with their bytes reversed as needed.
+
+        Args:
+            src: The buffer that stores the elements.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+
+        Returns:
+            A new instance created from the elements stored in the specified buffer.
+
+        Raises:
+            ValueError: If the byte order is unknown, or the buffer is too short.
+
+        """
+        ...
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], byteorder: str = 'native', count: int = -1, offset: int = 0, mode: str = 'r'
+    ) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified file.
+
+        The file is mapped into memory, and the elements are read from the pages on demand,
+        so that files larger than the physical memory can be processed by the batch operations.
+        In the byte order other than that of the host, the elements are copied as :meth:`from_buffer()` does.
+
+        Args:
+            path: The path of the file.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+            mode: ``'r'`` to map the file read-only, or ``'c'`` to map it copy-on-write,
+                  in which the modifications of the elements are not written to the file.
+
+        Returns:
+            A new instance created from the elements stored in the specified file.
+
+        Raises:
+            ValueError: If the byte order or the mode is unknown, or the file is too short.
+
+        """
+        ...
+
+    def to_bytes(self, byteorder: str = 'native') -> bytes:
+        """Returns the elements as bytes.
+
+        Args:
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+
+        Returns:
+            The bytes that store the elements contiguously in the specified byte order.
+
+        Raises:
+            ValueError: If the byte order is unknown.
+
+        """
+        ...
+
+    def to_f16(self) -> Float16Array:
+        """Converts the IEEE 754 binary64 floating points to binary16 floating points.
+
+        The result is the same as that of :func:`f64_to_f16_array()`.
+
+        Returns:
+            The IEEE 754 binary16 floating points.
+
+        """
+        ...
+
+    def to_f32(self) -> Float32Array:
+        """Converts the IEEE 754 binary64 floating points to binary32 floating points.
+
+        The result is the same as that of :func:`f64_to_f32_array()`.
+
+        Returns:
+            The IEEE 754 binary32 floating points.
+
+        """
+        ...
+
+    def to_f128(self) -> Float128Array:
+        """Converts the IEEE 754 binary64 floating points to binary128 floating points.
+
+        The result is the same as that of :func:`f64_to_f128_array()`.
+
+        Returns:
+            The IEEE 754 binary128 floating points.
+
+        """
+        ...
+
+    def to_str(self, sep: str = ', ') -> str:
+        """Returns the elements as decimal strings joined with the specified separator.
+
+        Each element is represented by the shortest decimal string that is rounded to the element,
+        which is the same as :func:`str()` of the element.
+
+        Args:
+            sep: The separator inserted between the elements.
+
+        Returns:
+            The string that represents the elements.
+
+        """
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> Float64:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Self:
+        ...
+
+    @overload
+    def __setitem__(self, key: SupportsIndex, value: Float64) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, key: slice, value: Iterable[Float64]) -> None:
+        ...
+
+    def __iter__(self) -> Iterator[Float64]:
+        ...
+
+    def __str__(self) -> str:
+        ...
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        ...
+
+    def __add__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __sub__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __mul__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __truediv__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __radd__(self, other: Float64) -> Self:
+        ...
+
+    def __rsub__(self, other: Float64) -> Self:
+        ...
+
+    def __rmul__(self, other: Float64) -> Self:
+        ...
+
+    def __rtruediv__(self, other: Float64) -> Self:
+        ...
+
+    def __iadd__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __isub__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __imul__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __itruediv__(self, other: Float64 | Buffer) -> Self:
+        ...
+
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """Performs a NumPy universal function using the batch operations.
+
+        The supported universal functions are ``add``, ``subtract``, ``multiply``, ``divide``,
+        ``sqrt``, ``equal``, ``not_equal``, ``less``, ``less_equal``, ``greater``, and ``greater_equal``.
+        The comparisons return NumPy arrays of booleans.
+
+        Args:
+            ufunc: The universal function.
+            method: The method of the universal function. Only ``'__call__'`` is supported.
+            inputs: The operands.
+            kwargs: The keyword arguments. Only ``out`` is supported.
+
+        Returns:
+            The result, or ``NotImplemented`` if the universal function or the operands are unsupported.
+
+        """
+        ...
+
+
+class Float128Array:
+    """A packed array of IEEE 754 binary128 floating points.
+
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float128` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
+
+    The buffer protocol is supported with the format ``'2Q'``.
+
+    """
+
+    def __init__(self, src: int | Iterable[Float128] = 0) -> None:
+        """Creates a new instance.
+
+        Args:
+            src: The number of the elements initialized with positive zeros,
+                 or the elements from which a new instance is created.
+
+        """
+        ...
+
+    @classmethod
+    def from_floats(cls, src: Iterable[float]) -> Self:
+        """Creates a new instance from the specified floating points.
+
+        Args:
+            src: The floating points from which a new instance is created.
+
+        Returns:
+            A new instance created from the specified floating points.
+
+        """
+        ...
+
+    def to_floats(self) -> list[float]:
+        """Returns the elements as floating points.
+
+        Returns:
+            A list of floating points that represent the elements.
+
+        """
+        ...
+
+    @classmethod
+    def from_buffer(cls, src: Buffer, byteorder: str = 'native', count: int = -1, offset: int = 0) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified buffer.
+
+        If the byte order is that of the host and the elements are aligned, the new instance shares
+        the memory of the buffer without copying it, so that the modifications of either are visible
+        from the other. In this case, the new instance is read-only if the buffer is read-only.
+        Otherwise, the elements are copied with their bytes reversed as needed.
+
+        Args:
+            src: The buffer that stores the elements.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+
+        Returns:
+            A new instance created from the elements stored in the specified buffer.
+
+        Raises:
+            ValueError: If the byte order is unknown, or the buffer is too short.
+
+        """
+        ...
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], byteorder: str = 'native', count: int = -1, offset: int = 0, mode: str = 'r'
+    ) -> Self:
+        """Creates a new instance from the elements stored contiguously in the specified file.
+
+        The file is mapped into memory, and the elements are read from the pages on demand,
+        so that files larger than the physical memory can be processed by the batch operations.
+        In the byte order other than that of the host, the elements are copied as :meth:`from_buffer()` does.
+
+        Args:
+            path: The path of the file.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+            mode: ``'r'`` to map the file read-only, or ``'c'`` to map it copy-on-write,
+                  in which the modifications of the elements are not written to the file.
+
+        Returns:
+            A new instance created from the elements stored in the specified file.
+
+        Raises:
+            ValueError: If the byte order or the mode is unknown, or the file is too short.
+
+        """
+        ...
+
+    def to_bytes(self, byteorder: str = 'native') -> bytes:
+        """Returns the elements as bytes.
+
+        Args:
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+
+        Returns:
+            The bytes that store the elements contiguously in the specified byte order.
+
+        Raises:
+            ValueError: If the byte order is unknown.
+
+        """
+        ...
+
+    def to_f16(self) -> Float16Array:
+        """Converts the IEEE 754 binary128 floating points to binary16 floating points.
+
+        The result is the same as that of :func:`f128_to_f16_array()`.
+
+        Returns:
+            The IEEE 754 binary16 floating points.
+
+        """
+        ...
+
+    def to_f32(self) -> Float32Array:
+        """Converts the IEEE 754 binary128 floating points to binary32 floating points.
+
+        The result is the same as that of :func:`f128_to_f32_array()`.
+
+        Returns:
+            The IEEE 754 binary32 floating points.
+
+        """
+        ...
+
+    def to_f64(self) -> Float64Array:
+        """Converts the IEEE 754 binary128 floating points to binary64 floating points.
+
+        The result is the same as that of :func:`f128_to_f64_array()`.
+
+        Returns:
+            The IEEE 754 binary64 floating points.
+
+        """
+        ...
+
+    def to_str(self, sep: str = ', ') -> str:
+        """Returns the elements as decimal strings joined with the specified separator.
+
+        Each element is represented by the shortest decimal string that is rounded to the element,
+        which is the same as :func:`str()` of the element.
+
+        Args:
+            sep: The separator inserted between the elements.
+
+        Returns:
+            The string that represents the elements.
+
+        """
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> Float128:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Self:
+        ...
+
+    @overload
+    def __setitem__(self, key: SupportsIndex, value: Float128) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, key: slice, value: Iterable[Float128]) -> None:
+        ...
+
+    def __iter__(self) -> Iterator[Float128]:
+        ...
+
+    def __str__(self) -> str:
+        ...
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        ...
+
+    def __add__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __sub__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __mul__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __truediv__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __radd__(self, other: Float128) -> Self:
+        ...
+
+    def __rsub__(self, other: Float128) -> Self:
+        ...
+
+    def __rmul__(self, other: Float128) -> Self:
+        ...
+
+    def __rtruediv__(self, other: Float128) -> Self:
+        ...
+
+    def __iadd__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __isub__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __imul__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __itruediv__(self, other: Float128 | Buffer) -> Self:
+        ...
+
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """Performs a NumPy universal function using the batch operations.
+
+        The supported universal functions are ``add``, ``subtract``, ``multiply``, ``divide``,
+        ``sqrt``, ``equal``, ``not_equal``, ``less``, ``less_equal``, ``greater``, and ``greater_equal``.
+        The comparisons return NumPy arrays of booleans.
+
+        Args:
+            ufunc: The universal function.
+            method: The method of the universal function. Only ``'__call__'`` is supported.
+            inputs: The operands.
+            kwargs: The keyword arguments. Only ``out`` is supported.
+
+        Returns:
+            The result, or ``NotImplemented`` if the universal function or the operands are unsupported.
+
+        """
+        ...
+
+
+@overload
+def bf16_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Rounds the numbers expressed as 16-bit brain floating points element-wise.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+
+    Args:
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted integers expressed as 16-bit brain floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True, *,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_add_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Adds the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as 16-bit brain floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_add_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_sub_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Subtracts the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as 16-bit brain floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_sub_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_mul_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Multiplies the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def ui64_to_f32(x: UInt64) -> Float32:
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary32 floating point.
+@overload
+def bf16_mul_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_mul_add_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer, z: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Multiplies and Adds the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def ui64_to_f64(x: UInt64) -> Float64:
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary64 floating point.
+@overload
+def bf16_mul_add_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer, z: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_div_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Divides the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def ui64_to_f128(x: UInt64) -> Float128:
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary128 floating point.
+@overload
+def bf16_div_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_rem_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Calculates remainders by dividing the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i32_to_f16(x: Int32) -> Float16:
-    """Converts the 32-bit signed integer to an IEEE 754 binary16 floating point.
+@overload
+def bf16_rem_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_sqrt_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Calculates square roots of the 16-bit brain floating points element-wise.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i32_to_f32(x: Int32) -> Float32:
-    """Converts the 32-bit signed integer to an IEEE 754 binary32 floating point.
+@overload
+def bf16_sqrt_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_eq_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_eq_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_le_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_le_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_lt_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_lt_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_eq_signaling_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_eq_signaling_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_le_quiet_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_le_quiet_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_lt_quiet_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as 16-bit brain floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def bf16_lt_quiet_array(
+    x: BFloat16 | Buffer, y: BFloat16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Rounds the numbers expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+
+    Args:
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted integers expressed as IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True, *,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_add_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Adds the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_add_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_sub_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Subtracts the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_sub_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_mul_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Multiplies the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_mul_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_mul_add_array(
+    x: Float16 | Buffer, y: Float16 | Buffer, z: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Multiplies and Adds the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_mul_add_array(
+    x: Float16 | Buffer, y: Float16 | Buffer, z: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_div_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Divides the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_div_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_rem_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Calculates remainders by dividing the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_rem_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_sqrt_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Calculates square roots of the IEEE 754 binary16 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+
+    Args:
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
+
+
+@overload
+def f16_sqrt_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_eq_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
+    Args:
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
+
+    Returns:
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i32_to_f64(x: Int32) -> Float64:
-    """Converts the 32-bit signed integer to an IEEE 754 binary64 floating point.
+@overload
+def f16_eq_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_le_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i32_to_f128(x: Int32) -> Float128:
-    """Converts the 32-bit signed integer to an IEEE 754 binary128 floating point.
+@overload
+def f16_le_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_lt_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i64_to_f16(x: Int64) -> Float16:
-    """Converts the 64-bit signed integer to an IEEE 754 binary16 floating point.
+@overload
+def f16_lt_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_eq_signaling_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i64_to_f32(x: Int64) -> Float32:
-    """Converts the 64-bit signed integer to an IEEE 754 binary32 floating point.
+@overload
+def f16_eq_signaling_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_le_quiet_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i64_to_f64(x: Int64) -> Float64:
-    """Converts the 64-bit signed integer to an IEEE 754 binary64 floating point.
+@overload
+def f16_le_quiet_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_lt_quiet_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def i64_to_f128(x: Int64) -> Float128:
-    """Converts the 64-bit signed integer to an IEEE 754 binary128 floating point.
+@overload
+def f16_lt_quiet_array(
+    x: Float16 | Buffer, y: Float16 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Rounds the numbers expressed as IEEE 754 binary32 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted integers expressed as IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_to_ui32(
-    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt32:
-    """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
+@overload
+def f32_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True, *,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_add_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Adds the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_to_ui64(
-    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt64:
-    """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
+@overload
+def f32_add_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_sub_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Subtracts the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_to_i32(
-    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int32:
-    """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
+@overload
+def f32_sub_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_mul_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Multiplies the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_to_i64(
-    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int64:
-    """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
+@overload
+def f32_mul_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_mul_add_array(
+    x: Float32 | Buffer, y: Float32 | Buffer, z: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Multiplies and Adds the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_to_f32(x: Float16) -> Float32:
-    """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
+@overload
+def f32_mul_add_array(
+    x: Float32 | Buffer, y: Float32 | Buffer, z: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_div_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Divides the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_to_f64(x: Float16) -> Float64:
-    """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
+@overload
+def f32_div_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_rem_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Calculates remainders by dividing the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_to_f128(x: Float16) -> Float128:
-    """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
+@overload
+def f32_rem_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_sqrt_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Calculates square roots of the IEEE 754 binary32 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_round_to_int(
-    x: Float16, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Float16:
-    """Rounds the number expressed as an IEEE 754 binary16 floating point.
+@overload
+def f32_sqrt_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_eq_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary16 floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_neg(x: Float16) -> Float16:
-    """Negates the IEEE 754 binary16 floating point.
+@overload
+def f32_eq_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_le_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be negated.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``-x``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_add(x: Float16, y: Float16) -> Float16:
-    """Adds the IEEE 754 binary16 floating points.
+@overload
+def f32_le_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_lt_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be added.
-        y: The floating point to add.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x + y``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_sub(x: Float16, y: Float16) -> Float16:
-    """Subtracts the IEEE 754 binary16 floating points.
+@overload
+def f32_lt_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_eq_signaling_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x - y``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_mul(x: Float16, y: Float16) -> Float16:
-    """Multiplies the IEEE 754 binary16 floating points.
+@overload
+def f32_eq_signaling_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_le_quiet_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_mul_add(x: Float16, y: Float16, z: Float16) -> Float16:
-    """Multiplies and Adds the IEEE 754 binary16 floating points.
+@overload
+def f32_le_quiet_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_lt_quiet_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y + z``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_div(x: Float16, y: Float16) -> Float16:
-    """Divides the IEEE 754 binary16 floating points.
+@overload
+def f32_lt_quiet_array(
+    x: Float32 | Buffer, y: Float32 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Rounds the numbers expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x / y``).
+        The resulted integers expressed as IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_rem(x: Float16, y: Float16) -> Float16:
-    """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
+@overload
+def f64_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True, *,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_add_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Adds the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x % y``).
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_sqrt(x: Float16) -> Float16:
-    """Calculates a square root of the IEEE 754 binary16 floating point.
+@overload
+def f64_add_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_sub_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Subtracts the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point whose square root is to be calculated.
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``sqrt(x)``).
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_eq(x: Float16, y: Float16) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+@overload
+def f64_sub_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_mul_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Multiplies the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    ...
 
-    """
+
+@overload
+def f64_mul_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
     ...
 
 
-def f16_le(x: Float16, y: Float16) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+@overload
+def f64_mul_add_array(
+    x: Float64 | Buffer, y: Float64 | Buffer, z: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Multiplies and Adds the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_lt(x: Float16, y: Float16) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+@overload
+def f64_mul_add_array(
+    x: Float64 | Buffer, y: Float64 | Buffer, z: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_div_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Divides the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_eq_signaling(x: Float16, y: Float16) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+@overload
+def f64_div_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+@overload
+def f64_rem_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Calculates remainders by dividing the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_le_quiet(x: Float16, y: Float16) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+@overload
+def f64_rem_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
 
-    The invalid exception flag is not set for quiet NaNs.
+
+@overload
+def f64_sqrt_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Calculates square roots of the IEEE 754 binary64 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_lt_quiet(x: Float16, y: Float16) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+@overload
+def f64_sqrt_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
 
-    The invalid exception flag is not set for quiet NaNs.
+
+@overload
+def f64_eq_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f16_is_signaling_nan(x: Float16) -> bool:
-    """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
+@overload
+def f64_eq_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_le_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be tested.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def bf16_to_f32(x: BFloat16) -> Float32:
-    """Converts the 16-bit brain floating point to an IEEE 754 binary32 floating point.
+@overload
+def f64_le_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_lt_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 16-bit brain floating point to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_bf16(x: Float32) -> BFloat16:
-    """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
+@overload
+def f64_lt_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_eq_signaling_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 16-bit brain floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def bf16_is_signaling_nan(x: BFloat16) -> bool:
-    """Tests if the 16-bit brain floating point is a signaling NaN.
+@overload
+def f64_eq_signaling_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_le_quiet_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be tested.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_ui32(
-    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt32:
-    """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
+@overload
+def f64_le_quiet_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_lt_quiet_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_ui64(
-    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt64:
-    """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
+@overload
+def f64_lt_quiet_array(
+    x: Float64 | Buffer, y: Float64 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Rounds the numbers expressed as IEEE 754 binary128 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
         exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The resulted integers expressed as IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_i32(
-    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int32:
-    """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
+@overload
+def f128_round_to_int_array(
+    x: Buffer, rounding_mode: RoundingMode | None = None, exact: bool = True, *,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_add_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Adds the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_i64(
-    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int64:
-    """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
+@overload
+def f128_add_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_sub_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Subtracts the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_f16(x: Float32) -> Float16:
-    """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
+@overload
+def f128_sub_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_mul_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Multiplies the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_f64(x: Float32) -> Float64:
-    """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
+@overload
+def f128_mul_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_mul_add_array(
+    x: Float128 | Buffer, y: Float128 | Buffer, z: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Multiplies and Adds the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_to_f128(x: Float32) -> Float128:
-    """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
+@overload
+def f128_mul_add_array(
+    x: Float128 | Buffer, y: Float128 | Buffer, z: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_div_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Divides the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_round_to_int(
-    x: Float32, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Float32:
-    """Rounds the number expressed as an IEEE 754 binary32 floating point.
+@overload
+def f128_div_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_rem_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Calculates remainders by dividing the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary32 floating point.
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_neg(x: Float32) -> Float32:
-    """Negates the IEEE 754 binary32 floating point.
+@overload
+def f128_rem_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_sqrt_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Calculates square roots of the IEEE 754 binary128 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be negated.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``-x``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_add(x: Float32, y: Float32) -> Float32:
-    """Adds the IEEE 754 binary32 floating points.
+@overload
+def f128_sqrt_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_eq_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be added.
-        y: The floating point to add.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x + y``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_sub(x: Float32, y: Float32) -> Float32:
-    """Subtracts the IEEE 754 binary32 floating points.
+@overload
+def f128_eq_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_le_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x - y``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_mul(x: Float32, y: Float32) -> Float32:
-    """Multiplies the IEEE 754 binary32 floating points.
+@overload
+def f128_le_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_lt_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_mul_add(x: Float32, y: Float32, z: Float32) -> Float32:
-    """Multiplies and Adds the IEEE 754 binary32 floating points.
+@overload
+def f128_lt_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_eq_signaling_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y + z``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_div(x: Float32, y: Float32) -> Float32:
-    """Divides the IEEE 754 binary32 floating points.
+@overload
+def f128_eq_signaling_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_le_quiet_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x / y``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_rem(x: Float32, y: Float32) -> Float32:
-    """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
+@overload
+def f128_le_quiet_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_lt_quiet_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> bytearray:
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x % y``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_sqrt(x: Float32) -> Float32:
-    """Calculates a square root of the IEEE 754 binary32 floating point.
+@overload
+def f128_lt_quiet_array(
+    x: Float128 | Buffer, y: Float128 | Buffer,
+    out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def bf16_to_f32_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Converts the 16-bit brain floating points to IEEE 754 binary32 floating points element-wise.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point whose square root is to be calculated.
+        x: The 16-bit brain floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``sqrt(x)``).
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_eq(x: Float32, y: Float32) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+@overload
+def bf16_to_f32_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_to_f32_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Converts the IEEE 754 binary16 floating points to binary32 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The IEEE 754 binary16 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_le(x: Float32, y: Float32) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+@overload
+def f16_to_f32_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_to_f64_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Converts the IEEE 754 binary16 floating points to binary64 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The IEEE 754 binary16 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_lt(x: Float32, y: Float32) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+@overload
+def f16_to_f64_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f16_to_f128_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Converts the IEEE 754 binary16 floating points to binary128 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The IEEE 754 binary16 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_eq_signaling(x: Float32, y: Float32) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+@overload
+def f16_to_f128_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+@overload
+def f32_to_bf16_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> BFloat16Array:
+    """Converts the IEEE 754 binary32 floating points to 16-bit brain floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The 16-bit brain floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_le_quiet(x: Float32, y: Float32) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+@overload
+def f32_to_bf16_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
 
-    The invalid exception flag is not set for quiet NaNs.
+
+@overload
+def f32_to_f16_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Converts the IEEE 754 binary32 floating points to binary16 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_lt_quiet(x: Float32, y: Float32) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+@overload
+def f32_to_f16_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
 
-    The invalid exception flag is not set for quiet NaNs.
+
+@overload
+def f32_to_f64_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Converts the IEEE 754 binary32 floating points to binary64 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f32_is_signaling_nan(x: Float32) -> bool:
-    """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
+@overload
+def f32_to_f64_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f32_to_f128_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Converts the IEEE 754 binary32 floating points to binary128 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be tested.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_to_ui32(
-    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt32:
-    """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
+@overload
+def f32_to_f128_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_to_f16_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Converts the IEEE 754 binary64 floating points to binary16 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The IEEE 754 binary64 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_to_ui64(
-    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt64:
-    """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
+@overload
+def f64_to_f16_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_to_f32_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Converts the IEEE 754 binary64 floating points to binary32 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The IEEE 754 binary64 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_to_i32(
-    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int32:
-    """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
+@overload
+def f64_to_f32_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f64_to_f128_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float128Array:
+    """Converts the IEEE 754 binary64 floating points to binary128 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The IEEE 754 binary64 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_to_i64(
-    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int64:
-    """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
+@overload
+def f64_to_f128_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_to_f16_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float16Array:
+    """Converts the IEEE 754 binary128 floating points to binary16 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The IEEE 754 binary128 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_to_f16(x: Float64) -> Float16:
-    """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
+@overload
+def f128_to_f16_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_to_f32_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float32Array:
+    """Converts the IEEE 754 binary128 floating points to binary32 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
+        x: The IEEE 754 binary128 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_to_f32(x: Float64) -> Float32:
-    """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
+@overload
+def f128_to_f32_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+@overload
+def f128_to_f64_array(
+    x: Buffer, out: None = None, flags: Buffer | None = None, context: FloatContext | None = None
+) -> Float64Array:
+    """Converts the IEEE 754 binary128 floating points to binary64 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
+        x: The IEEE 754 binary128 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_to_f128(x: Float64) -> Float128:
-    """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
+@overload
+def f128_to_f64_array(
+    x: Buffer, out: _BufferT, flags: Buffer | None = None, context: FloatContext | None = None
+) -> _BufferT:
+    ...
+
+
+def bf16_sum(
+    x: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, context: FloatContext | None = None
+) -> BFloat16:
+    """Sums the 16-bit brain floating points.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted number expressed as a 16-bit brain floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_round_to_int(
-    x: Float64, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Float64:
-    """Rounds the number expressed as an IEEE 754 binary64 floating point.
+def bf16_dot(
+    x: Buffer, y: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False,
+    context: FloatContext | None = None
+) -> BFloat16:
+    """Calculates the dot product of the 16-bit brain floating points.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary64 floating point.
+        The resulted number expressed as a 16-bit brain floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_neg(x: Float64) -> Float64:
-    """Negates the IEEE 754 binary64 floating point.
+def bf16_prod(x: Buffer, context: FloatContext | None = None) -> BFloat16:
+    """Multiplies the 16-bit brain floating points from the first to the last.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The floating point to be negated.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``-x``).
+        The resulted number expressed as a 16-bit brain floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_add(x: Float64, y: Float64) -> Float64:
-    """Adds the IEEE 754 binary64 floating points.
+def bf16_min(x: Buffer, context: FloatContext | None = None) -> BFloat16:
+    """Returns the minimum of the 16-bit brain floating points.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The floating point to be added.
-        y: The floating point to add.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x + y``).
+        The minimum expressed as a 16-bit brain floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_sub(x: Float64, y: Float64) -> Float64:
-    """Subtracts the IEEE 754 binary64 floating points.
+def bf16_max(x: Buffer, context: FloatContext | None = None) -> BFloat16:
+    """Returns the maximum of the 16-bit brain floating points.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x - y``).
+        The maximum expressed as a 16-bit brain floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_mul(x: Float64, y: Float64) -> Float64:
-    """Multiplies the IEEE 754 binary64 floating points.
+def f16_sum(
+    x: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, context: FloatContext | None = None
+) -> Float16:
+    """Sums the IEEE 754 binary16 floating points.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y``).
+        The resulted number expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_mul_add(x: Float64, y: Float64, z: Float64) -> Float64:
-    """Multiplies and Adds the IEEE 754 binary64 floating points.
+def f16_dot(
+    x: Buffer, y: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False,
+    context: FloatContext | None = None
+) -> Float16:
+    """Calculates the dot product of the IEEE 754 binary16 floating points.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y + z``).
+        The resulted number expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_div(x: Float64, y: Float64) -> Float64:
-    """Divides the IEEE 754 binary64 floating points.
+def f16_prod(x: Buffer, context: FloatContext | None = None) -> Float16:
+    """Multiplies the IEEE 754 binary16 floating points from the first to the last.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x / y``).
+        The resulted number expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_rem(x: Float64, y: Float64) -> Float64:
-    """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
+def f16_min(x: Buffer, context: FloatContext | None = None) -> Float16:
+    """Returns the minimum of the IEEE 754 binary16 floating points.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x % y``).
+        The minimum expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_sqrt(x: Float64) -> Float64:
-    """Calculates a square root of the IEEE 754 binary64 floating point.
+def f16_max(x: Buffer, context: FloatContext | None = None) -> Float16:
+    """Returns the maximum of the IEEE 754 binary16 floating points.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The floating point whose square root is to be calculated.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``sqrt(x)``).
+        The maximum expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_eq(x: Float64, y: Float64) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+def f32_sum(
+    x: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, context: FloatContext | None = None
+) -> Float32:
+    """Sums the IEEE 754 binary32 floating points.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The resulted number expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_le(x: Float64, y: Float64) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+def f32_dot(
+    x: Buffer, y: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False,
+    context: FloatContext | None = None
+) -> Float32:
+    """Calculates the dot product of the IEEE 754 binary32 floating points.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted number expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_lt(x: Float64, y: Float64) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+def f32_prod(x: Buffer, context: FloatContext | None = None) -> Float32:
+    """Multiplies the IEEE 754 binary32 floating points from the first to the last.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted number expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_eq_signaling(x: Float64, y: Float64) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+def f32_min(x: Buffer, context: FloatContext | None = None) -> Float32:
+    """Returns the minimum of the IEEE 754 binary32 floating points.
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The minimum expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_le_quiet(x: Float64, y: Float64) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+def f32_max(x: Buffer, context: FloatContext | None = None) -> Float32:
+    """Returns the maximum of the IEEE 754 binary32 floating points.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The maximum expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_lt_quiet(x: Float64, y: Float64) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+def f64_sum(
+    x: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, context: FloatContext | None = None
+) -> Float64:
+    """Sums the IEEE 754 binary64 floating points.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted number expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f64_is_signaling_nan(x: Float64) -> bool:
-    """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
+def f64_dot(
+    x: Buffer, y: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False,
+    context: FloatContext | None = None
+) -> Float64:
+    """Calculates the dot product of the IEEE 754 binary64 floating points.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The floating point to be tested.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The resulted number expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_to_ui32(
-    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt32:
-    """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
+def f64_prod(x: Buffer, context: FloatContext | None = None) -> Float64:
+    """Multiplies the IEEE 754 binary64 floating points from the first to the last.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The resulted number expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_to_ui64(
-    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> UInt64:
-    """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
+def f64_min(x: Buffer, context: FloatContext | None = None) -> Float64:
+    """Returns the minimum of the IEEE 754 binary64 floating points.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The minimum expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_to_i32(
-    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int32:
-    """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
+def f64_max(x: Buffer, context: FloatContext | None = None) -> Float64:
+    """Returns the maximum of the IEEE 754 binary64 floating points.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The maximum expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_to_i64(
-    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Int64:
-    """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
+def f128_sum(
+    x: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, context: FloatContext | None = None
+) -> Float128:
+    """Sums the IEEE 754 binary128 floating points.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The resulted number expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_to_f16(x: Float128) -> Float16:
-    """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
+def f128_dot(
+    x: Buffer, y: Buffer, method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False,
+    context: FloatContext | None = None
+) -> Float128:
+    """Calculates the dot product of the IEEE 754 binary128 floating points.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted number expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_to_f32(x: Float128) -> Float32:
-    """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+def f128_prod(x: Buffer, context: FloatContext | None = None) -> Float128:
+    """Multiplies the IEEE 754 binary128 floating points from the first to the last.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The resulted number expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_to_f64(x: Float128) -> Float64:
-    """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
+def f128_min(x: Buffer, context: FloatContext | None = None) -> Float128:
+    """Returns the minimum of the IEEE 754 binary128 floating points.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The minimum expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_round_to_int(
-    x: Float128, rounding_mode: RoundingMode = get_rounding_mode(), exact: bool = True
-) -> Float128:
-    """Rounds the number expressed as an IEEE 754 binary128 floating point.
+def f128_max(x: Buffer, context: FloatContext | None = None) -> Float128:
+    """Returns the maximum of the IEEE 754 binary128 floating points.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary128 floating point.
+        The maximum expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_neg(x: Float128) -> Float128:
-    """Negates the IEEE 754 binary128 floating point.
+@overload
+def bf16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> BFloat16Array:
+    """Multiplies the matrices of the 16-bit brain floating points.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The floating point to be negated.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`BFloat16` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``-x``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_add(x: Float128, y: Float128) -> Float128:
-    """Adds the IEEE 754 binary128 floating points.
+@overload
+def bf16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[BFloat16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> BFloat16Array:
+    ...
 
-    Args:
-        x: The floating point to be added.
-        y: The floating point to add.
 
-    Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x + y``).
+@overload
+def bf16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float16Array:
+    ...
 
-    """
+
+@overload
+def bf16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float32],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float32Array:
     ...
 
 
-def f128_sub(x: Float128, y: Float128) -> Float128:
-    """Subtracts the IEEE 754 binary128 floating points.
+@overload
+def bf16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float64],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float64Array:
+    ...
 
-    Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
 
-    Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x - y``).
+@overload
+def bf16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float128],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float128Array:
+    ...
 
-    """
+
+@overload
+def bf16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int,
+    accumulator: type[BFloat16] | type[Float16] | type[Float32] | type[Float64] | type[Float128] | None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, *, out: _BufferT,
+    context: FloatContext | None = None
+) -> _BufferT:
     ...
 
 
-def f128_mul(x: Float128, y: Float128) -> Float128:
-    """Multiplies the IEEE 754 binary128 floating points.
+@overload
+def f16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float16Array:
+    """Multiplies the matrices of the IEEE 754 binary16 floating points.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float16` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_mul_add(x: Float128, y: Float128, z: Float128) -> Float128:
-    """Multiplies and Adds the IEEE 754 binary128 floating points.
+@overload
+def f16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[BFloat16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> BFloat16Array:
+    ...
 
-    Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
 
-    Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y + z``).
+@overload
+def f16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float16Array:
+    ...
 
-    """
+
+@overload
+def f16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float32],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float32Array:
     ...
 
 
-def f128_div(x: Float128, y: Float128) -> Float128:
-    """Divides the IEEE 754 binary128 floating points.
+@overload
+def f16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float64],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float64Array:
+    ...
 
-    Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
 
-    Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x / y``).
+@overload
+def f16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float128],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float128Array:
+    ...
 
-    """
+
+@overload
+def f16_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int,
+    accumulator: type[BFloat16] | type[Float16] | type[Float32] | type[Float64] | type[Float128] | None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, *, out: _BufferT,
+    context: FloatContext | None = None
+) -> _BufferT:
     ...
 
 
-def f128_rem(x: Float128, y: Float128) -> Float128:
-    """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
+@overload
+def f32_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float32Array:
+    """Multiplies the matrices of the IEEE 754 binary32 floating points.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float32` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x % y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_sqrt(x: Float128) -> Float128:
-    """Calculates a square root of the IEEE 754 binary128 floating point.
+@overload
+def f32_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[BFloat16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> BFloat16Array:
+    ...
 
-    Args:
-        x: The floating point whose square root is to be calculated.
 
-    Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``sqrt(x)``).
+@overload
+def f32_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float16Array:
+    ...
 
-    """
+
+@overload
+def f32_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float32],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float32Array:
     ...
 
 
-def f128_eq(x: Float128, y: Float128) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+@overload
+def f32_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float64],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float64Array:
+    ...
 
-    Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
 
-    Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+@overload
+def f32_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float128],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float128Array:
+    ...
 
-    """
+
+@overload
+def f32_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int,
+    accumulator: type[BFloat16] | type[Float16] | type[Float32] | type[Float64] | type[Float128] | None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, *, out: _BufferT,
+    context: FloatContext | None = None
+) -> _BufferT:
     ...
 
 
-def f128_le(x: Float128, y: Float128) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+@overload
+def f64_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float64Array:
+    """Multiplies the matrices of the IEEE 754 binary64 floating points.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float64` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_lt(x: Float128, y: Float128) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+@overload
+def f64_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[BFloat16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> BFloat16Array:
+    ...
 
-    Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
 
-    Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+@overload
+def f64_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float16Array:
+    ...
 
-    """
+
+@overload
+def f64_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float32],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float32Array:
     ...
 
 
-def f128_eq_signaling(x: Float128, y: Float128) -> bool:
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+@overload
+def f64_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float64],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float64Array:
+    ...
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-    Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+@overload
+def f64_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float128],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float128Array:
+    ...
 
-    Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
 
-    """
+@overload
+def f64_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int,
+    accumulator: type[BFloat16] | type[Float16] | type[Float32] | type[Float64] | type[Float128] | None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, *, out: _BufferT,
+    context: FloatContext | None = None
+) -> _BufferT:
     ...
 
 
-def f128_le_quiet(x: Float128, y: Float128) -> bool:
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+@overload
+def f128_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float128Array:
+    """Multiplies the matrices of the IEEE 754 binary128 floating points.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float128` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
     ...
 
 
-def f128_lt_quiet(x: Float128, y: Float128) -> bool:
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+@overload
+def f128_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[BFloat16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> BFloat16Array:
+    ...
 
-    The invalid exception flag is not set for quiet NaNs.
 
-    Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+@overload
+def f128_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float16],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float16Array:
+    ...
 
-    Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
 
-    """
+@overload
+def f128_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float32],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float32Array:
     ...
 
 
-def f128_is_signaling_nan(x: Float128) -> bool:
-    """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+@overload
+def f128_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float64],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float64Array:
+    ...
 
-    Args:
-        x: The floating point to be tested.
 
-    Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+@overload
+def f128_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int, accumulator: type[Float128],
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, out: None = None,
+    context: FloatContext | None = None
+) -> Float128Array:
+    ...
 
-    """
+
+@overload
+def f128_matmul(
+    x: Buffer, y: Buffer, m: int, n: int, k: int,
+    accumulator: type[BFloat16] | type[Float16] | type[Float32] | type[Float64] | type[Float128] | None = None,
+    method: SummationMethod = SummationMethod.SEQUENTIAL, fused: bool = False, *, out: _BufferT,
+    context: FloatContext | None = None
+) -> _BufferT:
     ...
@@ -22,14 +22,30 @@
 
 # cython: language_level=3
 # cython: embedsignature=True
+# cython: freethreading_compatible=True
 
+import mmap
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
 from typing import Self
 
+cimport cython
 from cython.view cimport array
+from cpython.buffer cimport (
+    PyObject_CheckBuffer, PyObject_GetBuffer, PyBuffer_Release,
+    PyBUF_WRITABLE, PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_C_CONTIGUOUS
+)
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.mem cimport PyMem_Malloc, PyMem_Calloc, PyMem_Free
+from cpython.slice cimport PySlice_Unpack, PySlice_AdjustIndices
+from libc.math cimport ceil, fma, sqrt
+from libc.string cimport memcpy
 from libc.stdint cimport (
     uint8_t, uint16_t, uint32_t, uint64_t,
     int32_t, int64_t,
-    uint_fast8_t
+    uint_fast8_t, uint_fast16_t, uint_fast32_t, uint_fast64_t,
+    int_fast16_t, int_fast32_t
 )
 
 cimport softfloat as sf
@@ -53,6 +69,19 @@ cdef extern from "internals.h":
         uint128 ui
         sf.float128_t f
 
+    uint_fast8_t softfloat_countLeadingZeros64(uint64_t a) noexcept nogil
+    uint128 softfloat_mul64To128(uint64_t a, uint64_t b) noexcept nogil
+    void softfloat_mul128To256M(uint64_t a64, uint64_t a0, uint64_t b64, uint64_t b0, uint64_t* zPtr) noexcept nogil
+    sf.float16_t softfloat_normRoundPackToF16(bint sign, int_fast16_t exp, uint_fast16_t sig) noexcept nogil
+    sf.float32_t softfloat_normRoundPackToF32(bint sign, int_fast16_t exp, uint_fast32_t sig) noexcept nogil
+    sf.float64_t softfloat_normRoundPackToF64(bint sign, int_fast16_t exp, uint_fast64_t sig) noexcept nogil
+    sf.float128_t softfloat_normRoundPackToF128(bint sign, int_fast32_t exp, uint_fast64_t sig64, uint_fast64_t sig0) noexcept nogil
+
+
+cdef extern from "<stdbool.h>":
+
+    ctypedef bint _c_bool "bool"
+
 
 cdef union _ui64_double:
     uint64_t ui
@@ -104,6 +133,25 @@ cpdef enum ExceptionFlag:
     INVALID = 16
 
 
+cpdef enum SummationMethod:
+    """The summation methods of the reductions.
+
+    - ``SEQUENTIAL``: Adding the elements one by one from the first to the last.
+    - ``PAIRWISE``: Adding the sums of the two halves, each of which is summed recursively,
+      or sequentially if it has 8 or fewer elements.
+    - ``COMPENSATED``: Adding the elements sequentially while accumulating the rounding errors separately.
+    - ``EXACT``: Adding the elements, or the products of the dot product, exactly and rounding the result
+      only once. The result does not depend on the order of the elements, and the elements are added
+      in parallel by the threads set by :func:`set_num_threads()`.
+
+    """
+    SEQUENTIAL = 0
+    PAIRWISE = 1
+    COMPENSATED = 2
+    EXACT = 3
+
+
+@cython.freelist(64)
 cdef class UInt32:
     """A 32-bit unsigned integer.
 
@@ -157,7 +205,7 @@ cdef class UInt32:
         if len(src) != 4:
             raise ValueError('length of bytes must be 4')
         cdef const uint8_t[:] a = src
-        cdef UInt32 o = UInt32()
+        cdef UInt32 o = UInt32.__new__(UInt32)
         o._data = (
             (<uint32_t>a[0] << 24) |
             (<uint32_t>a[1] << 16) |
@@ -192,7 +240,7 @@ cdef class UInt32:
             A new instance created from the specified integer.
 
         """
-        cdef UInt32 o = UInt32()
+        cdef UInt32 o = UInt32.__new__(UInt32)
         o._data = <uint32_t>src
         return o
 
@@ -350,6 +398,7 @@ cdef class UInt32:
         return self.__xor__(other)
 
 
+@cython.freelist(64)
 cdef class UInt64:
     """A 64-bit unsigned integer.
 
@@ -403,7 +452,7 @@ cdef class UInt64:
         if len(src) != 8:
             raise ValueError('length of bytes must be 8')
         cdef const uint8_t[:] a = src
-        cdef UInt64 o = UInt64()
+        cdef UInt64 o = UInt64.__new__(UInt64)
         o._data = (
             (<uint64_t>a[0] << 56) |
             (<uint64_t>a[1] << 48) |
@@ -446,7 +495,7 @@ cdef class UInt64:
             A new instance created from the specified integer.
 
         """
-        cdef UInt64 o = UInt64()
+        cdef UInt64 o = UInt64.__new__(UInt64)
         o._data = <uint64_t>src
         return o
 
@@ -604,6 +653,7 @@ cdef class UInt64:
         return self.__xor__(other)
 
 
+@cython.freelist(64)
 cdef class Int32:
     """A 32-bit signed integer.
 
@@ -656,7 +706,7 @@ cdef class Int32:
         if len(src) != 4:
             raise ValueError('length of bytes must be 4')
         cdef const uint8_t[:] a = src
-        cdef Int32 o = Int32()
+        cdef Int32 o = Int32.__new__(Int32)
         o._data = (
             (<int32_t>a[0] << 24) |
             (<int32_t>a[1] << 16) |
@@ -691,7 +741,7 @@ cdef class Int32:
             A new instance created from the specified integer.
 
         """
-        cdef Int32 o = Int32()
+        cdef Int32 o = Int32.__new__(Int32)
         o._data = <int32_t>src
         return o
 
@@ -847,6 +897,7 @@ cdef class Int32:
         return self.__xor__(other)
 
 
+@cython.freelist(64)
 cdef class Int64:
     """A 64-bit signed integer.
 
@@ -899,7 +950,7 @@ cdef class Int64:
         if len(src) != 8:
             raise ValueError('length of bytes must be 8')
         cdef const uint8_t[:] a = src
-        cdef Int64 o = Int64()
+        cdef Int64 o = Int64.__new__(Int64)
         o._data = (
             (<int64_t>a[0] << 56) |
             (<int64_t>a[1] << 48) |
@@ -942,7 +993,7 @@ cdef class Int64:
             A new instance created from the specified integer.
 
         """
-        cdef Int64 o = Int64()
+        cdef Int64 o = Int64.__new__(Int64)
         o._data = <int64_t>src
         return o
 
@@ -1098,12 +1149,27 @@ cdef class Int64:
         return self.__xor__(other)
 
 
+@cython.freelist(64)
 cdef class BFloat16:
     """A 16-bit brain floating point.
 
     The object is immutable.
 
-    No operators are supported.
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
+    The following operators are supported:
+
+    - unary operators: ``+``, ``-``.
+    - binary operators: ``+``, ``-``, ``*``, ``/``, ``//``, ``%``,
+      ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=``,
+      ``+=``, ``-=``, ``*=``, ``/=``, ``//=``, ``%=``.
+
+    The following operators are unsupported:
+
+    - unary operator: ``~``.
+    - binary operators: ``<<``, ``>>``, ``&``, ``|``, ``^``, ``**``,
+      ``<<=``, ``>>=``, ``&=``, ``|=``, ``^=``, ``**=``.
 
     """
 
@@ -1141,9 +1207,9 @@ cdef class BFloat16:
         if len(src) != 2:
             raise ValueError('length of bytes must be 2')
         cdef const uint8_t[:] a = src
-        cdef BFloat16 o = BFloat16()
-        o._data.v = (<uint16_t>a[0] << 8) | <uint16_t>a[1]
-        return o
+        cdef sf.bfloat16_t d
+        d.v = (<uint16_t>a[0] << 8) | <uint16_t>a[1]
+        return _make_bfloat16(d)
 
     cpdef bytes to_bytes(self):
         """Returns the native data as a byte sequence.
@@ -1173,9 +1239,7 @@ cdef class BFloat16:
         cdef sf.float64_t f
         t.f = src
         f.v = t.ui
-        cdef BFloat16 o = BFloat16()
-        o._data = sf.f32_to_bf16(sf.f64_to_f32(f))
-        return o
+        return _make_bfloat16(sf.f32_to_bf16(sf.f64_to_f32(f)))
 
     cpdef double to_float(self):
         """Returns the native data as a floating point.
@@ -1199,529 +1263,317 @@ cdef class BFloat16:
         """
         return bf16_to_f32(self)
 
-    cpdef bool is_signaling_nan(self):
-        """Tests if the 16-bit brain floating point is a signaling NaN.
+    cpdef BFloat16 round_to_int(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Rounds the number.
 
-        The result is the same as that of :func:`bf16_is_signaling_nan()`.
+        The result is the same as that of :func:`bf16_round_to_int()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact rounding is unable.
 
         Returns:
-            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+            The resulted integer.
 
         """
-        return bf16_is_signaling_nan(self)
+        return bf16_round_to_int(self, rounding_mode, exact)
 
-    def __str__(self) -> str:
-        return str(self.to_float())
+    cpdef BFloat16 neg(self):
+        """Negates the 16-bit brain floating point.
 
+        The result is the same as that of :func:`bf16_neg()`.
 
-cdef class Float16:
-    """An IEEE 754 binary16 floating point.
+        Returns:
+            The resulted number (``-x``).
 
-    The object is immutable.
+        """
+        return bf16_neg(self)
 
-    The following operators are supported:
+    @classmethod
+    def add(cls, BFloat16 x, BFloat16 y) -> BFloat16:
+        """Adds the 16-bit brain floating points.
 
-    - unary operators: ``+``, ``-``.
-    - binary operators: ``+``, ``-``, ``*``, ``/``, ``//``, ``%``,
-      ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=``,
-      ``+=``, ``-=``, ``*=``, ``/=``, ``//=``, ``%=``.
+        The result is the same as that of :func:`bf16_add()`.
 
-    The following operators are unsupported:
+        Args:
+            x: The floating point to be added.
+            y: The floating point to add.
 
-    - unary operator: ``~``.
-    - binary operators: ``<<``, ``>>``, ``&``, ``|``, ``^``, ``**``,
-      ``<<=``, ``>>=``, ``&=``, ``|=``, ``^=``, ``**=``.
+        Returns:
+            The resulted number (``x + y``).
 
-    """
+        """
+        return bf16_add(x, y)
 
-    cdef sf.float16_t _data
-    """The native data."""
+    @classmethod
+    def sub(cls, BFloat16 x, BFloat16 y) -> BFloat16:
+        """Subtracts the 16-bit brain floating points.
 
-    cpdef sf.float16_t _get_data(self):  # To access the native data in another instance.
-        return self._data
+        The result is the same as that of :func:`bf16_sub()`.
 
-    @classmethod
-    def size(cls) -> int:
-        """Returns the native data size in bits.
+        Args:
+            x: The floating point to be subtracted.
+            y: The floating point to subtract.
 
         Returns:
-            The native data size in bits, i.e. 16.
+            The resulted number (``x - y``).
 
         """
-        return 16
+        return bf16_sub(x, y)
 
     @classmethod
-    def from_bytes(cls, bytes src) -> Float16:
-        """Creates a new instance from the specified byte sequence.
+    def mul(cls, BFloat16 x, BFloat16 y) -> BFloat16:
+        """Multiplies the 16-bit brain floating points.
+
+        The result is the same as that of :func:`bf16_mul()`.
 
         Args:
-            src: The byte sequence representing the native data with big endian.
-                 The length must be 2.
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
 
         Returns:
-            A new instance created from the specified byte sequence.
-
-        Raises:
-            ValueError: If the length of bytes is not 2.
+            The resulted number (``x * y``).
 
         """
-        if len(src) != 2:
-            raise ValueError('length of bytes must be 2')
-        cdef const uint8_t[:] a = src
-        cdef Float16 o = Float16()
-        o._data.v = (<uint16_t>a[0] << 8) | <uint16_t>a[1]
-        return o
+        return bf16_mul(x, y)
 
-    cpdef bytes to_bytes(self):
-        """Returns the native data as a byte sequence.
+    @classmethod
+    def mul_add(cls, BFloat16 x, BFloat16 y, BFloat16 z) -> BFloat16:
+        """Multiplies and Adds the 16-bit brain floating points.
+
+        The result is the same as that of :func:`bf16_mul_add()`.
+
+        Args:
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
+            z: The floating point to add.
 
         Returns:
-            A byte sequence representing the native data with big endian.
-            The length is 2.
+            The resulted number (``x * y + z``).
 
         """
-        cdef uint8_t a[2]
-        a[0] = <uint8_t>(self._data.v >> 8)
-        a[1] = <uint8_t>self._data.v
-        return <bytes>a[:2]
+        return bf16_mul_add(x, y, z)
 
     @classmethod
-    def from_float(cls, double src) -> Float16:
-        """Creates a new instance from the specified floating point.
+    def div(cls, BFloat16 x, BFloat16 y) -> BFloat16:
+        """Divides the 16-bit brain floating points.
+
+        The result is the same as that of :func:`bf16_div()`.
 
         Args:
-            src: The floating point from which a new instance is created.
+            x: The floating point to be divided.
+            y: The floating point to divide.
 
         Returns:
-            A new instance created from the specified floating point.
+            The resulted number (``x / y``).
 
         """
-        cdef _ui64_double t
-        cdef sf.float64_t f
-        t.f = src
-        f.v = t.ui
-        cdef Float16 o = Float16()
-        o._data = sf.f64_to_f16(f)
-        return o
+        return bf16_div(x, y)
 
-    cpdef double to_float(self):
-        """Returns the native data as a floating point.
+    @classmethod
+    def rem(cls, BFloat16 x, BFloat16 y) -> BFloat16:
+        """Calculates a remainder by dividing the 16-bit brain floating points.
+
+        The result is the same as that of :func:`bf16_rem()`.
+
+        Args:
+            x: The floating point to be divided.
+            y: The floating point to divide.
 
         Returns:
-            A floating point that represents the native data.
+            The resulted number (``x % y``).
 
         """
-        cdef _ui64_double t
-        t.ui = sf.f16_to_f64(self._data).v
-        return t.f
+        return bf16_rem(x, y)
 
-    cpdef UInt32 to_ui32(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
+    @classmethod
+    def sqrt(cls, BFloat16 x) -> BFloat16:
+        """Calculates a square root of the 16-bit brain floating point.
 
-        The result is the same as that of :func:`f16_to_ui32()`.
+        The result is the same as that of :func:`bf16_sqrt()`.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            x: The floating point whose square root is to be calculated.
 
         Returns:
-            The 32-bit unsigned integer.
+            The resulted number (``sqrt(x)``).
 
         """
-        return f16_to_ui32(self, rounding_mode, exact)
+        return bf16_sqrt(x)
 
-    cpdef UInt64 to_ui64(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
+    @classmethod
+    def eq(cls, BFloat16 x, BFloat16 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_to_ui64()`.
+        The result is the same as that of :func:`bf16_eq()`.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
 
         Returns:
-            The 64-bit unsigned integer.
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
 
         """
-        return f16_to_ui64(self, rounding_mode, exact)
+        return bf16_eq(x, y)
 
-    cpdef Int32 to_i32(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
+    @classmethod
+    def le(cls, BFloat16 x, BFloat16 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_to_i32()`.
+        The result is the same as that of :func:`bf16_le()`.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
 
         Returns:
-            The 32-bit signed integer.
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
 
         """
-        return f16_to_i32(self, rounding_mode, exact)
+        return bf16_le(x, y)
 
-    cpdef Int64 to_i64(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
+    @classmethod
+    def lt(cls, BFloat16 x, BFloat16 y) -> bool:
+        """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_to_i64()`.
+        The result is the same as that of :func:`bf16_lt()`.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
 
         Returns:
-            The 64-bit signed integer.
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
 
         """
-        return f16_to_i64(self, rounding_mode, exact)
-
-    cpdef Float32 to_f32(self):
-        """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
-
-        The result is the same as that of :func:`f16_to_f32()`.
+        return bf16_lt(x, y)
 
-        Returns:
-            The IEEE 754 binary32 floating point.
+    @classmethod
+    def eq_signaling(cls, BFloat16 x, BFloat16 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
 
-        """
-        return f16_to_f32(self)
+        The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-    cpdef Float64 to_f64(self):
-        """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
+        The result is the same as that of :func:`bf16_eq_signaling()`.
 
-        The result is the same as that of :func:`f16_to_f64()`.
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
 
         Returns:
-            The IEEE 754 binary64 floating point.
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
 
         """
-        return f16_to_f64(self)
+        return bf16_eq_signaling(x, y)
 
-    cpdef Float128 to_f128(self):
-        """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
+    @classmethod
+    def le_quiet(cls, BFloat16 x, BFloat16 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_to_f128()`.
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`bf16_le_quiet()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
 
         Returns:
-            The IEEE 754 binary128 floating point.
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
 
         """
-        return f16_to_f128(self)
+        return bf16_le_quiet(x, y)
 
-    cpdef Float16 round_to_int(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Rounds the number.
+    @classmethod
+    def lt_quiet(cls, BFloat16 x, BFloat16 y) -> bool:
+        """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
 
-        The result is the same as that of :func:`f16_round_to_int()`.
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`bf16_lt_quiet()`.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact rounding is unable.
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
 
         Returns:
-            The resulted integer.
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
 
         """
-        return f16_round_to_int(self, rounding_mode, exact)
+        return bf16_lt_quiet(x, y)
 
-    cpdef Float16 neg(self):
-        """Negates the IEEE 754 binary16 floating point.
+    cpdef bool is_signaling_nan(self):
+        """Tests if the 16-bit brain floating point is a signaling NaN.
 
-        The result is the same as that of :func:`f16_neg()`.
+        The result is the same as that of :func:`bf16_is_signaling_nan()`.
 
         Returns:
-            The resulted number (``-x``).
+            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
 
         """
-        return f16_neg(self)
+        return bf16_is_signaling_nan(self)
 
-    @classmethod
-    def add(cls, Float16 x, Float16 y) -> Float16:
-        """Adds the IEEE 754 binary16 floating points.
+    def __str__(self) -> str:
+        cdef char buffer[_FORMAT_SIZE]
+        return buffer[:_bf16_format(buffer, self._data)].decode('ascii')
 
-        The result is the same as that of :func:`f16_add()`.
-
-        Args:
-            x: The floating point to be added.
-            y: The floating point to add.
-
-        Returns:
-            The resulted number (``x + y``).
-
-        """
-        return f16_add(x, y)
-
-    @classmethod
-    def sub(cls, Float16 x, Float16 y) -> Float16:
-        """Subtracts the IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_sub()`.
-
-        Args:
-            x: The floating point to be subtracted.
-            y: The floating point to subtract.
-
-        Returns:
-            The resulted number (``x - y``).
-
-        """
-        return f16_sub(x, y)
-
-    @classmethod
-    def mul(cls, Float16 x, Float16 y) -> Float16:
-        """Multiplies the IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_mul()`.
-
-        Args:
-            x: The floating point to be multiplied.
-            y: The floating point to multiply.
-
-        Returns:
-            The resulted number (``x * y``).
-
-        """
-        return f16_mul(x, y)
-
-    @classmethod
-    def mul_add(cls, Float16 x, Float16 y, Float16 z) -> Float16:
-        """Multiplies and Adds the IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_mul_add()`.
-
-        Args:
-            x: The floating point to be multiplied.
-            y: The floating point to multiply.
-            z: The floating point to add.
-
-        Returns:
-            The resulted number (``x * y + z``).
-
-        """
-        return f16_mul_add(x, y, z)
-
-    @classmethod
-    def div(cls, Float16 x, Float16 y) -> Float16:
-        """Divides the IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_div()`.
-
-        Args:
-            x: The floating point to be divided.
-            y: The floating point to divide.
-
-        Returns:
-            The resulted number (``x / y``).
-
-        """
-        return f16_div(x, y)
-
-    @classmethod
-    def rem(cls, Float16 x, Float16 y) -> Float16:
-        """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_rem()`.
-
-        Args:
-            x: The floating point to be divided.
-            y: The floating point to divide.
-
-        Returns:
-            The resulted number (``x % y``).
-
-        """
-        return f16_rem(x, y)
-
-    @classmethod
-    def sqrt(cls, Float16 x) -> Float16:
-        """Calculates a square root of the IEEE 754 binary16 floating point.
-
-        The result is the same as that of :func:`f16_sqrt()`.
-
-        Args:
-            x: The floating point whose square root is to be calculated.
-
-        Returns:
-            The resulted number (``sqrt(x)``).
-
-        """
-        return f16_sqrt(x)
-
-    @classmethod
-    def eq(cls, Float16 x, Float16 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_eq()`.
-
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
-
-        Returns:
-            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
-
-        """
-        return f16_eq(x, y)
-
-    @classmethod
-    def le(cls, Float16 x, Float16 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_le()`.
-
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
-
-        Returns:
-            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
-
-        """
-        return f16_le(x, y)
-
-    @classmethod
-    def lt(cls, Float16 x, Float16 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
-
-        The result is the same as that of :func:`f16_lt()`.
-
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
-
-        Returns:
-            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
-
-        """
-        return f16_lt(x, y)
-
-    @classmethod
-    def eq_signaling(cls, Float16 x, Float16 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
-
-        The invalid exception flag is set for any NaN input, not just for signaling NaNs.
-
-        The result is the same as that of :func:`f16_eq_signaling()`.
-
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
-
-        Returns:
-            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
-
-        """
-        return f16_eq_signaling(x, y)
-
-    @classmethod
-    def le_quiet(cls, Float16 x, Float16 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
-
-        The invalid exception flag is not set for quiet NaNs.
-
-        The result is the same as that of :func:`f16_le_quiet()`.
-
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
-
-        Returns:
-            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
-
-        """
-        return f16_le_quiet(x, y)
-
-    @classmethod
-    def lt_quiet(cls, Float16 x, Float16 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
-
-        The invalid exception flag is not set for quiet NaNs.
-
-        The result is the same as that of :func:`f16_lt_quiet()`.
-
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
-
-        Returns:
-            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
-
-        """
-        return f16_lt_quiet(x, y)
-
-    cpdef bool is_signaling_nan(self):
-        """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
-
-        The result is the same as that of :func:`f16_is_signaling_nan()`.
-
-        Returns:
-            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
-
-        """
-        return f16_is_signaling_nan(self)
-
-    def __str__(self) -> str:
-        return str(self.to_float())
-
-    def __pos__(self) -> Self:
-        return _make_float16(self._data)
+    def __pos__(self) -> Self:
+        return _make_bfloat16(self._data)
 
     def __neg__(self) -> Self:
-        return f16_neg(self)
+        return bf16_neg(self)
 
     def __add__(self, other: Self) -> Self:
-        return f16_add(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return bf16_add(self, other)
 
     def __sub__(self, other: Self) -> Self:
-        return f16_sub(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return bf16_sub(self, other)
 
     def __mul__(self, other: Self) -> Self:
-        return f16_mul(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return bf16_mul(self, other)
 
     def __truediv__(self, other: Self) -> Self:
-        return f16_div(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return bf16_div(self, other)
 
     def __floordiv__(self, other: Self) -> Self:
-        return f16_round_to_int(f16_div(self, other), RoundingMode.MIN)
+        return bf16_round_to_int(bf16_div(self, other), RoundingMode.MIN)
 
     def __mod__(self, other: Self) -> Self:
-        return f16_sub(self, f16_mul(other, f16_round_to_int(f16_div(self, other), RoundingMode.MIN)))
+        return bf16_sub(self, bf16_mul(other, bf16_round_to_int(bf16_div(self, other), RoundingMode.MIN)))
 
     def __lt__(self, other: Self) -> bool:
-        return f16_lt(self, other)
+        return bf16_lt(self, other)
 
     def __le__(self, other: Self) -> bool:
-        return f16_le(self, other)
+        return bf16_le(self, other)
 
     def __gt__(self, other: Self) -> bool:
-        return f16_lt(other, self)
+        return bf16_lt(other, self)
 
     def __ge__(self, other: Self) -> bool:
-        return f16_le(other, self)
+        return bf16_le(other, self)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError('type mismatch')
-        return f16_eq(self, other)
+        return bf16_eq(self, other)
 
     def __ne__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError('type mismatch')
-        return not f16_eq(self, other)
+        return not bf16_eq(self, other)
 
     def __iadd__(self, other: Self) -> Self:
         return self.__add__(other)
@@ -1742,11 +1594,15 @@ cdef class Float16:
         return self.__mod__(other)
 
 
-cdef class Float32:
-    """An IEEE 754 binary32 floating point.
+@cython.freelist(64)
+cdef class Float16:
+    """An IEEE 754 binary16 floating point.
 
     The object is immutable.
 
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
     The following operators are supported:
 
     - unary operators: ``+``, ``-``.
@@ -1762,10 +1618,10 @@ cdef class Float32:
 
     """
 
-    cdef sf.float32_t _data
+    cdef sf.float16_t _data
     """The native data."""
 
-    cpdef sf.float32_t _get_data(self):  # To access the native data in another instance.
+    cpdef sf.float16_t _get_data(self):  # To access the native data in another instance.
         return self._data
 
     @classmethod
@@ -1773,55 +1629,48 @@ cdef class Float32:
         """Returns the native data size in bits.
 
         Returns:
-            The native data size in bits, i.e. 32.
+            The native data size in bits, i.e. 16.
 
         """
-        return 32
+        return 16
 
     @classmethod
-    def from_bytes(cls, bytes src) -> Float32:
+    def from_bytes(cls, bytes src) -> Float16:
         """Creates a new instance from the specified byte sequence.
 
         Args:
             src: The byte sequence representing the native data with big endian.
-                 The length must be 4.
+                 The length must be 2.
 
         Returns:
             A new instance created from the specified byte sequence.
 
         Raises:
-            ValueError: If the length of bytes is not 4.
+            ValueError: If the length of bytes is not 2.
 
         """
-        if len(src) != 4:
-            raise ValueError('length of bytes must be 4')
+        if len(src) != 2:
+            raise ValueError('length of bytes must be 2')
         cdef const uint8_t[:] a = src
-        cdef Float32 o = Float32()
-        o._data.v = (
-            (<uint32_t>a[0] << 24) |
-            (<uint32_t>a[1] << 16) |
-            (<uint32_t>a[2] << 8) |
-            <uint32_t>a[3]
-        )
-        return o
+        cdef sf.float16_t d
+        d.v = (<uint16_t>a[0] << 8) | <uint16_t>a[1]
+        return _make_float16(d)
 
     cpdef bytes to_bytes(self):
         """Returns the native data as a byte sequence.
 
         Returns:
             A byte sequence representing the native data with big endian.
-            The length is 4.
+            The length is 2.
 
         """
-        cdef uint8_t a[4]
-        a[0] = <uint8_t>(self._data.v >> 24)
-        a[1] = <uint8_t>(self._data.v >> 16)
-        a[2] = <uint8_t>(self._data.v >> 8)
-        a[3] = <uint8_t>self._data.v
-        return <bytes>a[:4]
+        cdef uint8_t a[2]
+        a[0] = <uint8_t>(self._data.v >> 8)
+        a[1] = <uint8_t>self._data.v
+        return <bytes>a[:2]
 
     @classmethod
-    def from_float(cls, double src) -> Float32:
+    def from_float(cls, double src) -> Float16:
         """Creates a new instance from the specified floating point.
 
         Args:
@@ -1835,9 +1684,7 @@ cdef class Float32:
         cdef sf.float64_t f
         t.f = src
         f.v = t.ui
-        cdef Float32 o = Float32()
-        o._data = sf.f64_to_f32(f)
-        return o
+        return _make_float16(sf.f64_to_f16(f))
 
     cpdef double to_float(self):
         """Returns the native data as a floating point.
@@ -1847,26 +1694,15 @@ cdef class Float32:
 
         """
         cdef _ui64_double t
-        t.ui = sf.f32_to_f64(self._data).v
+        t.ui = sf.f16_to_f64(self._data).v
         return t.f
 
-    cpdef BFloat16 to_bf16(self):
-        """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
-
-        The result is the same as that of :func:`f32_to_bf16()`.
-
-        Returns:
-            The 16-bit brain floating point.
-
-        """
-        return f32_to_bf16(self)
-
     cpdef UInt32 to_ui32(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
+        """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
 
-        The result is the same as that of :func:`f32_to_ui32()`.
+        The result is the same as that of :func:`f16_to_ui32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1877,14 +1713,14 @@ cdef class Float32:
             The 32-bit unsigned integer.
 
         """
-        return f32_to_ui32(self, rounding_mode, exact)
+        return f16_to_ui32(self, rounding_mode, exact)
 
     cpdef UInt64 to_ui64(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
+        """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
 
-        The result is the same as that of :func:`f32_to_ui64()`.
+        The result is the same as that of :func:`f16_to_ui64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1895,14 +1731,14 @@ cdef class Float32:
             The 64-bit unsigned integer.
 
         """
-        return f32_to_ui64(self, rounding_mode, exact)
+        return f16_to_ui64(self, rounding_mode, exact)
 
     cpdef Int32 to_i32(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
+        """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
 
-        The result is the same as that of :func:`f32_to_i32()`.
+        The result is the same as that of :func:`f16_to_i32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1913,14 +1749,14 @@ cdef class Float32:
             The 32-bit signed integer.
 
         """
-        return f32_to_i32(self, rounding_mode, exact)
+        return f16_to_i32(self, rounding_mode, exact)
 
     cpdef Int64 to_i64(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
+        """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
 
-        The result is the same as that of :func:`f32_to_i64()`.
+        The result is the same as that of :func:`f16_to_i64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1931,47 +1767,47 @@ cdef class Float32:
             The 64-bit signed integer.
 
         """
-        return f32_to_i64(self, rounding_mode, exact)
+        return f16_to_i64(self, rounding_mode, exact)
 
-    cpdef Float16 to_f16(self):
-        """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
+    cpdef Float32 to_f32(self):
+        """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
 
-        The result is the same as that of :func:`f32_to_f16()`.
+        The result is the same as that of :func:`f16_to_f32()`.
 
         Returns:
-            The IEEE 754 binary16 floating point.
+            The IEEE 754 binary32 floating point.
 
         """
-        return f32_to_f16(self)
+        return f16_to_f32(self)
 
     cpdef Float64 to_f64(self):
-        """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
+        """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
 
-        The result is the same as that of :func:`f32_to_f64()`.
+        The result is the same as that of :func:`f16_to_f64()`.
 
         Returns:
             The IEEE 754 binary64 floating point.
 
         """
-        return f32_to_f64(self)
+        return f16_to_f64(self)
 
     cpdef Float128 to_f128(self):
-        """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
+        """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
 
-        The result is the same as that of :func:`f32_to_f128()`.
+        The result is the same as that of :func:`f16_to_f128()`.
 
         Returns:
             The IEEE 754 binary128 floating point.
 
         """
-        return f32_to_f128(self)
+        return f16_to_f128(self)
 
-    cpdef Float32 round_to_int(
+    cpdef Float16 round_to_int(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
         """Rounds the number.
 
-        The result is the same as that of :func:`f32_round_to_int()`.
+        The result is the same as that of :func:`f16_round_to_int()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -1982,24 +1818,24 @@ cdef class Float32:
             The resulted integer.
 
         """
-        return f32_round_to_int(self, rounding_mode, exact)
+        return f16_round_to_int(self, rounding_mode, exact)
 
-    cpdef Float32 neg(self):
-        """Negates the IEEE 754 binary32 floating point.
+    cpdef Float16 neg(self):
+        """Negates the IEEE 754 binary16 floating point.
 
-        The result is the same as that of :func:`f32_neg()`.
+        The result is the same as that of :func:`f16_neg()`.
 
         Returns:
             The resulted number (``-x``).
 
         """
-        return f32_neg(self)
+        return f16_neg(self)
 
     @classmethod
-    def add(cls, Float32 x, Float32 y) -> Float32:
-        """Adds the IEEE 754 binary32 floating points.
+    def add(cls, Float16 x, Float16 y) -> Float16:
+        """Adds the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_add()`.
+        The result is the same as that of :func:`f16_add()`.
 
         Args:
             x: The floating point to be added.
@@ -2009,13 +1845,13 @@ cdef class Float32:
             The resulted number (``x + y``).
 
         """
-        return f32_add(x, y)
+        return f16_add(x, y)
 
     @classmethod
-    def sub(cls, Float32 x, Float32 y) -> Float32:
-        """Subtracts the IEEE 754 binary32 floating points.
+    def sub(cls, Float16 x, Float16 y) -> Float16:
+        """Subtracts the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_sub()`.
+        The result is the same as that of :func:`f16_sub()`.
 
         Args:
             x: The floating point to be subtracted.
@@ -2025,13 +1861,13 @@ cdef class Float32:
             The resulted number (``x - y``).
 
         """
-        return f32_sub(x, y)
+        return f16_sub(x, y)
 
     @classmethod
-    def mul(cls, Float32 x, Float32 y) -> Float32:
-        """Multiplies the IEEE 754 binary32 floating points.
+    def mul(cls, Float16 x, Float16 y) -> Float16:
+        """Multiplies the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_mul()`.
+        The result is the same as that of :func:`f16_mul()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2041,13 +1877,13 @@ cdef class Float32:
             The resulted number (``x * y``).
 
         """
-        return f32_mul(x, y)
+        return f16_mul(x, y)
 
     @classmethod
-    def mul_add(cls, Float32 x, Float32 y, Float32 z) -> Float32:
-        """Multiplies and Adds the IEEE 754 binary32 floating points.
+    def mul_add(cls, Float16 x, Float16 y, Float16 z) -> Float16:
+        """Multiplies and Adds the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_mul_add()`.
+        The result is the same as that of :func:`f16_mul_add()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2058,13 +1894,13 @@ cdef class Float32:
             The resulted number (``x * y + z``).
 
         """
-        return f32_mul_add(x, y, z)
+        return f16_mul_add(x, y, z)
 
     @classmethod
-    def div(cls, Float32 x, Float32 y) -> Float32:
-        """Divides the IEEE 754 binary32 floating points.
+    def div(cls, Float16 x, Float16 y) -> Float16:
+        """Divides the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_div()`.
+        The result is the same as that of :func:`f16_div()`.
 
         Args:
             x: The floating point to be divided.
@@ -2074,13 +1910,13 @@ cdef class Float32:
             The resulted number (``x / y``).
 
         """
-        return f32_div(x, y)
+        return f16_div(x, y)
 
     @classmethod
-    def rem(cls, Float32 x, Float32 y) -> Float32:
-        """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
+    def rem(cls, Float16 x, Float16 y) -> Float16:
+        """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_rem()`.
+        The result is the same as that of :func:`f16_rem()`.
 
         Args:
             x: The floating point to be divided.
@@ -2090,13 +1926,13 @@ cdef class Float32:
             The resulted number (``x % y``).
 
         """
-        return f32_rem(x, y)
+        return f16_rem(x, y)
 
     @classmethod
-    def sqrt(cls, Float32 x) -> Float32:
-        """Calculates a square root of the IEEE 754 binary32 floating point.
+    def sqrt(cls, Float16 x) -> Float16:
+        """Calculates a square root of the IEEE 754 binary16 floating point.
 
-        The result is the same as that of :func:`f32_sqrt()`.
+        The result is the same as that of :func:`f16_sqrt()`.
 
         Args:
             x: The floating point whose square root is to be calculated.
@@ -2105,13 +1941,13 @@ cdef class Float32:
             The resulted number (``sqrt(x)``).
 
         """
-        return f32_sqrt(x)
+        return f16_sqrt(x)
 
     @classmethod
-    def eq(cls, Float32 x, Float32 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+    def eq(cls, Float16 x, Float16 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_eq()`.
+        The result is the same as that of :func:`f16_eq()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2121,13 +1957,13 @@ cdef class Float32:
             ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
 
         """
-        return f32_eq(x, y)
+        return f16_eq(x, y)
 
     @classmethod
-    def le(cls, Float32 x, Float32 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+    def le(cls, Float16 x, Float16 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_le()`.
+        The result is the same as that of :func:`f16_le()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2137,13 +1973,13 @@ cdef class Float32:
             ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
 
         """
-        return f32_le(x, y)
+        return f16_le(x, y)
 
     @classmethod
-    def lt(cls, Float32 x, Float32 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+    def lt(cls, Float16 x, Float16 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
 
-        The result is the same as that of :func:`f32_lt()`.
+        The result is the same as that of :func:`f16_lt()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2153,15 +1989,15 @@ cdef class Float32:
             ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
 
         """
-        return f32_lt(x, y)
+        return f16_lt(x, y)
 
     @classmethod
-    def eq_signaling(cls, Float32 x, Float32 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+    def eq_signaling(cls, Float16 x, Float16 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
 
         The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-        The result is the same as that of :func:`f32_eq_signaling()`.
+        The result is the same as that of :func:`f16_eq_signaling()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2171,15 +2007,15 @@ cdef class Float32:
             ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
 
         """
-        return f32_eq_signaling(x, y)
+        return f16_eq_signaling(x, y)
 
     @classmethod
-    def le_quiet(cls, Float32 x, Float32 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+    def le_quiet(cls, Float16 x, Float16 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f32_le_quiet()`.
+        The result is the same as that of :func:`f16_le_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2189,15 +2025,15 @@ cdef class Float32:
             ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
 
         """
-        return f32_le_quiet(x, y)
+        return f16_le_quiet(x, y)
 
     @classmethod
-    def lt_quiet(cls, Float32 x, Float32 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+    def lt_quiet(cls, Float16 x, Float16 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f32_lt_quiet()`.
+        The result is the same as that of :func:`f16_lt_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2207,67 +2043,76 @@ cdef class Float32:
             ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
 
         """
-        return f32_lt_quiet(x, y)
+        return f16_lt_quiet(x, y)
 
     cpdef bool is_signaling_nan(self):
-        """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
+        """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
 
-        The result is the same as that of :func:`f32_is_signaling_nan()`.
+        The result is the same as that of :func:`f16_is_signaling_nan()`.
 
         Returns:
             ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
 
         """
-        return f32_is_signaling_nan(self)
+        return f16_is_signaling_nan(self)
 
     def __str__(self) -> str:
-        return str(self.to_float())
+        cdef char buffer[_FORMAT_SIZE]
+        return buffer[:_f16_format(buffer, self._data)].decode('ascii')
 
     def __pos__(self) -> Self:
-        return _make_float32(self._data)
+        return _make_float16(self._data)
 
     def __neg__(self) -> Self:
-        return f32_neg(self)
+        return f16_neg(self)
 
     def __add__(self, other: Self) -> Self:
-        return f32_add(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f16_add(self, other)
 
     def __sub__(self, other: Self) -> Self:
-        return f32_sub(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f16_sub(self, other)
 
     def __mul__(self, other: Self) -> Self:
-        return f32_mul(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f16_mul(self, other)
 
     def __truediv__(self, other: Self) -> Self:
-        return f32_div(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f16_div(self, other)
 
     def __floordiv__(self, other: Self) -> Self:
-        return f32_round_to_int(f32_div(self, other), RoundingMode.MIN)
+        return f16_round_to_int(f16_div(self, other), RoundingMode.MIN)
 
     def __mod__(self, other: Self) -> Self:
-        return f32_sub(self, f32_mul(other, f32_round_to_int(f32_div(self, other), RoundingMode.MIN)))
+        return f16_sub(self, f16_mul(other, f16_round_to_int(f16_div(self, other), RoundingMode.MIN)))
 
     def __lt__(self, other: Self) -> bool:
-        return f32_lt(self, other)
+        return f16_lt(self, other)
 
     def __le__(self, other: Self) -> bool:
-        return f32_le(self, other)
+        return f16_le(self, other)
 
     def __gt__(self, other: Self) -> bool:
-        return f32_lt(other, self)
+        return f16_lt(other, self)
 
     def __ge__(self, other: Self) -> bool:
-        return f32_le(other, self)
+        return f16_le(other, self)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError('type mismatch')
-        return f32_eq(self, other)
+        return f16_eq(self, other)
 
     def __ne__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError('type mismatch')
-        return not f32_eq(self, other)
+        return not f16_eq(self, other)
 
     def __iadd__(self, other: Self) -> Self:
         return self.__add__(other)
@@ -2288,11 +2133,15 @@ cdef class Float32:
         return self.__mod__(other)
 
 
-cdef class Float64:
-    """An IEEE 754 binary64 floating point.
+@cython.freelist(64)
+cdef class Float32:
+    """An IEEE 754 binary32 floating point.
 
     The object is immutable.
 
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
     The following operators are supported:
 
     - unary operators: ``+``, ``-``.
@@ -2308,10 +2157,10 @@ cdef class Float64:
 
     """
 
-    cdef sf.float64_t _data
+    cdef sf.float32_t _data
     """The native data."""
 
-    cpdef sf.float64_t _get_data(self):  # To access the native data in another instance.
+    cpdef sf.float32_t _get_data(self):  # To access the native data in another instance.
         return self._data
 
     @classmethod
@@ -2319,39 +2168,35 @@ cdef class Float64:
         """Returns the native data size in bits.
 
         Returns:
-            The native data size in bits, i.e. 64.
+            The native data size in bits, i.e. 32.
 
         """
-        return 64
+        return 32
 
     @classmethod
-    def from_bytes(cls, bytes src) -> Float64:
+    def from_bytes(cls, bytes src) -> Float32:
         """Creates a new instance from the specified byte sequence.
 
         Args:
             src: The byte sequence representing the native data with big endian.
-                 The length must be 8.
+                 The length must be 4.
 
         Returns:
             A new instance created from the specified byte sequence.
 
         Raises:
-            ValueError: If the length of bytes is not 8.
+            ValueError: If the length of bytes is not 4.
 
         """
-        if len(src) != 8:
-            raise ValueError('length of bytes must be 8')
+        if len(src) != 4:
+            raise ValueError('length of bytes must be 4')
         cdef const uint8_t[:] a = src
-        cdef Float64 o = Float64()
+        cdef Float32 o = Float32.__new__(Float32)
         o._data.v = (
-            (<uint64_t>a[0] << 56) |
-            (<uint64_t>a[1] << 48) |
-            (<uint64_t>a[2] << 40) |
-            (<uint64_t>a[3] << 32) |
-            (<uint64_t>a[4] << 24) |
-            (<uint64_t>a[5] << 16) |
-            (<uint64_t>a[6] << 8) |
-            <uint64_t>a[7]
+            (<uint32_t>a[0] << 24) |
+            (<uint32_t>a[1] << 16) |
+            (<uint32_t>a[2] << 8) |
+            <uint32_t>a[3]
         )
         return o
 
@@ -2360,22 +2205,18 @@ cdef class Float64:
 
         Returns:
             A byte sequence representing the native data with big endian.
-            The length is 8.
+            The length is 4.
 
         """
-        cdef uint8_t a[8]
-        a[0] = <uint8_t>(self._data.v >> 56)
-        a[1] = <uint8_t>(self._data.v >> 48)
-        a[2] = <uint8_t>(self._data.v >> 40)
-        a[3] = <uint8_t>(self._data.v >> 32)
-        a[4] = <uint8_t>(self._data.v >> 24)
-        a[5] = <uint8_t>(self._data.v >> 16)
-        a[6] = <uint8_t>(self._data.v >> 8)
-        a[7] = <uint8_t>self._data.v
-        return <bytes>a[:8]
+        cdef uint8_t a[4]
+        a[0] = <uint8_t>(self._data.v >> 24)
+        a[1] = <uint8_t>(self._data.v >> 16)
+        a[2] = <uint8_t>(self._data.v >> 8)
+        a[3] = <uint8_t>self._data.v
+        return <bytes>a[:4]
 
     @classmethod
-    def from_float(cls, double src) -> Float64:
+    def from_float(cls, double src) -> Float32:
         """Creates a new instance from the specified floating point.
 
         Args:
@@ -2386,9 +2227,11 @@ cdef class Float64:
 
         """
         cdef _ui64_double t
+        cdef sf.float64_t f
         t.f = src
-        cdef Float64 o = Float64()
-        o._data.v = t.ui
+        f.v = t.ui
+        cdef Float32 o = Float32.__new__(Float32)
+        o._data = sf.f64_to_f32(f)
         return o
 
     cpdef double to_float(self):
@@ -2399,15 +2242,26 @@ cdef class Float64:
 
         """
         cdef _ui64_double t
-        t.ui = self._data.v
+        t.ui = sf.f32_to_f64(self._data).v
         return t.f
 
+    cpdef BFloat16 to_bf16(self):
+        """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
+
+        The result is the same as that of :func:`f32_to_bf16()`.
+
+        Returns:
+            The 16-bit brain floating point.
+
+        """
+        return f32_to_bf16(self)
+
     cpdef UInt32 to_ui32(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
+        """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
 
-        The result is the same as that of :func:`f64_to_ui32()`.
+        The result is the same as that of :func:`f32_to_ui32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2418,14 +2272,14 @@ cdef class Float64:
             The 32-bit unsigned integer.
 
         """
-        return f64_to_ui32(self, rounding_mode, exact)
+        return f32_to_ui32(self, rounding_mode, exact)
 
     cpdef UInt64 to_ui64(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
+        """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
 
-        The result is the same as that of :func:`f64_to_ui64()`.
+        The result is the same as that of :func:`f32_to_ui64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2436,14 +2290,14 @@ cdef class Float64:
             The 64-bit unsigned integer.
 
         """
-        return f64_to_ui64(self, rounding_mode, exact)
+        return f32_to_ui64(self, rounding_mode, exact)
 
     cpdef Int32 to_i32(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
+        """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
 
-        The result is the same as that of :func:`f64_to_i32()`.
+        The result is the same as that of :func:`f32_to_i32()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2454,14 +2308,14 @@ cdef class Float64:
             The 32-bit signed integer.
 
         """
-        return f64_to_i32(self, rounding_mode, exact)
+        return f32_to_i32(self, rounding_mode, exact)
 
     cpdef Int64 to_i64(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
-        """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
+        """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
 
-        The result is the same as that of :func:`f64_to_i64()`.
+        The result is the same as that of :func:`f32_to_i64()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2472,47 +2326,47 @@ cdef class Float64:
             The 64-bit signed integer.
 
         """
-        return f64_to_i64(self, rounding_mode, exact)
+        return f32_to_i64(self, rounding_mode, exact)
 
     cpdef Float16 to_f16(self):
-        """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
+        """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
 
-        The result is the same as that of :func:`f64_to_f16()`.
+        The result is the same as that of :func:`f32_to_f16()`.
 
         Returns:
             The IEEE 754 binary16 floating point.
 
         """
-        return f64_to_f16(self)
+        return f32_to_f16(self)
 
-    cpdef Float32 to_f32(self):
-        """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
+    cpdef Float64 to_f64(self):
+        """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
 
-        The result is the same as that of :func:`f64_to_f32()`.
+        The result is the same as that of :func:`f32_to_f64()`.
 
         Returns:
-            The IEEE 754 binary32 floating point.
+            The IEEE 754 binary64 floating point.
 
         """
-        return f64_to_f32(self)
+        return f32_to_f64(self)
 
     cpdef Float128 to_f128(self):
-        """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
+        """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
 
-        The result is the same as that of :func:`f64_to_f128()`.
+        The result is the same as that of :func:`f32_to_f128()`.
 
         Returns:
             The IEEE 754 binary128 floating point.
 
         """
-        return f64_to_f128(self)
+        return f32_to_f128(self)
 
-    cpdef Float64 round_to_int(
+    cpdef Float32 round_to_int(
         self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
     ):
         """Rounds the number.
 
-        The result is the same as that of :func:`f64_round_to_int()`.
+        The result is the same as that of :func:`f32_round_to_int()`.
 
         Args:
             rounding_mode: The rounding mode.
@@ -2523,24 +2377,24 @@ cdef class Float64:
             The resulted integer.
 
         """
-        return f64_round_to_int(self, rounding_mode, exact)
+        return f32_round_to_int(self, rounding_mode, exact)
 
-    cpdef Float64 neg(self):
-        """Negates the IEEE 754 binary64 floating point.
+    cpdef Float32 neg(self):
+        """Negates the IEEE 754 binary32 floating point.
 
-        The result is the same as that of :func:`f64_neg()`.
+        The result is the same as that of :func:`f32_neg()`.
 
         Returns:
             The resulted number (``-x``).
 
         """
-        return f64_neg(self)
+        return f32_neg(self)
 
     @classmethod
-    def add(cls, Float64 x, Float64 y) -> Float64:
-        """Adds the IEEE 754 binary64 floating points.
+    def add(cls, Float32 x, Float32 y) -> Float32:
+        """Adds the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_add()`.
+        The result is the same as that of :func:`f32_add()`.
 
         Args:
             x: The floating point to be added.
@@ -2550,13 +2404,13 @@ cdef class Float64:
             The resulted number (``x + y``).
 
         """
-        return f64_add(x, y)
+        return f32_add(x, y)
 
     @classmethod
-    def sub(cls, Float64 x, Float64 y) -> Float64:
-        """Subtracts the IEEE 754 binary64 floating points.
+    def sub(cls, Float32 x, Float32 y) -> Float32:
+        """Subtracts the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_sub()`.
+        The result is the same as that of :func:`f32_sub()`.
 
         Args:
             x: The floating point to be subtracted.
@@ -2566,13 +2420,13 @@ cdef class Float64:
             The resulted number (``x - y``).
 
         """
-        return f64_sub(x, y)
+        return f32_sub(x, y)
 
     @classmethod
-    def mul(cls, Float64 x, Float64 y) -> Float64:
-        """Multiplies the IEEE 754 binary64 floating points.
+    def mul(cls, Float32 x, Float32 y) -> Float32:
+        """Multiplies the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_mul()`.
+        The result is the same as that of :func:`f32_mul()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2582,13 +2436,13 @@ cdef class Float64:
             The resulted number (``x * y``).
 
         """
-        return f64_mul(x, y)
+        return f32_mul(x, y)
 
     @classmethod
-    def mul_add(cls, Float64 x, Float64 y, Float64 z) -> Float64:
-        """Multiplies and Adds the IEEE 754 binary64 floating points.
+    def mul_add(cls, Float32 x, Float32 y, Float32 z) -> Float32:
+        """Multiplies and Adds the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_mul_add()`.
+        The result is the same as that of :func:`f32_mul_add()`.
 
         Args:
             x: The floating point to be multiplied.
@@ -2599,13 +2453,13 @@ cdef class Float64:
             The resulted number (``x * y + z``).
 
         """
-        return f64_mul_add(x, y, z)
+        return f32_mul_add(x, y, z)
 
     @classmethod
-    def div(cls, Float64 x, Float64 y) -> Float64:
-        """Divides the IEEE 754 binary64 floating points.
+    def div(cls, Float32 x, Float32 y) -> Float32:
+        """Divides the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_div()`.
+        The result is the same as that of :func:`f32_div()`.
 
         Args:
             x: The floating point to be divided.
@@ -2615,13 +2469,13 @@ cdef class Float64:
             The resulted number (``x / y``).
 
         """
-        return f64_div(x, y)
+        return f32_div(x, y)
 
     @classmethod
-    def rem(cls, Float64 x, Float64 y) -> Float64:
-        """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
+    def rem(cls, Float32 x, Float32 y) -> Float32:
+        """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_rem()`.
+        The result is the same as that of :func:`f32_rem()`.
 
         Args:
             x: The floating point to be divided.
@@ -2631,13 +2485,13 @@ cdef class Float64:
             The resulted number (``x % y``).
 
         """
-        return f64_rem(x, y)
+        return f32_rem(x, y)
 
     @classmethod
-    def sqrt(cls, Float64 x) -> Float64:
-        """Calculates a square root of the IEEE 754 binary64 floating point.
+    def sqrt(cls, Float32 x) -> Float32:
+        """Calculates a square root of the IEEE 754 binary32 floating point.
 
-        The result is the same as that of :func:`f64_sqrt()`.
+        The result is the same as that of :func:`f32_sqrt()`.
 
         Args:
             x: The floating point whose square root is to be calculated.
@@ -2646,13 +2500,13 @@ cdef class Float64:
             The resulted number (``sqrt(x)``).
 
         """
-        return f64_sqrt(x)
+        return f32_sqrt(x)
 
     @classmethod
-    def eq(cls, Float64 x, Float64 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+    def eq(cls, Float32 x, Float32 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_eq()`.
+        The result is the same as that of :func:`f32_eq()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2662,13 +2516,13 @@ cdef class Float64:
             ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
 
         """
-        return f64_eq(x, y)
+        return f32_eq(x, y)
 
     @classmethod
-    def le(cls, Float64 x, Float64 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+    def le(cls, Float32 x, Float32 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_le()`.
+        The result is the same as that of :func:`f32_le()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2678,13 +2532,13 @@ cdef class Float64:
             ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
 
         """
-        return f64_le(x, y)
+        return f32_le(x, y)
 
     @classmethod
-    def lt(cls, Float64 x, Float64 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+    def lt(cls, Float32 x, Float32 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f64_lt()`.
+        The result is the same as that of :func:`f32_lt()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2694,15 +2548,15 @@ cdef class Float64:
             ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
 
         """
-        return f64_lt(x, y)
+        return f32_lt(x, y)
 
     @classmethod
-    def eq_signaling(cls, Float64 x, Float64 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+    def eq_signaling(cls, Float32 x, Float32 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
 
         The invalid exception flag is set for any NaN input, not just for signaling NaNs.
 
-        The result is the same as that of :func:`f64_eq_signaling()`.
+        The result is the same as that of :func:`f32_eq_signaling()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2712,15 +2566,15 @@ cdef class Float64:
             ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
 
         """
-        return f64_eq_signaling(x, y)
+        return f32_eq_signaling(x, y)
 
     @classmethod
-    def le_quiet(cls, Float64 x, Float64 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+    def le_quiet(cls, Float32 x, Float32 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f64_le_quiet()`.
+        The result is the same as that of :func:`f32_le_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2730,15 +2584,15 @@ cdef class Float64:
             ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
 
         """
-        return f64_le_quiet(x, y)
+        return f32_le_quiet(x, y)
 
     @classmethod
-    def lt_quiet(cls, Float64 x, Float64 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+    def lt_quiet(cls, Float32 x, Float32 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
 
         The invalid exception flag is not set for quiet NaNs.
 
-        The result is the same as that of :func:`f64_lt_quiet()`.
+        The result is the same as that of :func:`f32_lt_quiet()`.
 
         Args:
             x: The first floating point to be compared.
@@ -2748,67 +2602,76 @@ cdef class Float64:
             ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
 
         """
-        return f64_lt_quiet(x, y)
+        return f32_lt_quiet(x, y)
 
     cpdef bool is_signaling_nan(self):
-        """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
+        """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
 
-        The result is the same as that of :func:`f64_is_signaling_nan()`.
+        The result is the same as that of :func:`f32_is_signaling_nan()`.
 
         Returns:
             ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
 
         """
-        return f64_is_signaling_nan(self)
+        return f32_is_signaling_nan(self)
 
     def __str__(self) -> str:
-        return str(self.to_float())
+        cdef char buffer[_FORMAT_SIZE]
+        return buffer[:_f32_format(buffer, self._data)].decode('ascii')
 
     def __pos__(self) -> Self:
-        return _make_float64(self._data)
+        return _make_float32(self._data)
 
     def __neg__(self) -> Self:
-        return f64_neg(self)
+        return f32_neg(self)
 
     def __add__(self, other: Self) -> Self:
-        return f64_add(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f32_add(self, other)
 
     def __sub__(self, other: Self) -> Self:
-        return f64_sub(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f32_sub(self, other)
 
     def __mul__(self, other: Self) -> Self:
-        return f64_mul(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f32_mul(self, other)
 
     def __truediv__(self, other: Self) -> Self:
-        return f64_div(self, other)
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f32_div(self, other)
 
     def __floordiv__(self, other: Self) -> Self:
-        return f64_round_to_int(f64_div(self, other), RoundingMode.MIN)
+        return f32_round_to_int(f32_div(self, other), RoundingMode.MIN)
 
     def __mod__(self, other: Self) -> Self:
-        return f64_sub(self, f64_mul(other, f64_round_to_int(f64_div(self, other), RoundingMode.MIN)))
+        return f32_sub(self, f32_mul(other, f32_round_to_int(f32_div(self, other), RoundingMode.MIN)))
 
     def __lt__(self, other: Self) -> bool:
-        return f64_lt(self, other)
+        return f32_lt(self, other)
 
     def __le__(self, other: Self) -> bool:
-        return f64_le(self, other)
+        return f32_le(self, other)
 
     def __gt__(self, other: Self) -> bool:
-        return f64_lt(other, self)
+        return f32_lt(other, self)
 
     def __ge__(self, other: Self) -> bool:
-        return f64_le(other, self)
+        return f32_le(other, self)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError('type mismatch')
-        return f64_eq(self, other)
+        return f32_eq(self, other)
 
     def __ne__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError('type mismatch')
-        return not f64_eq(self, other)
+        return not f32_eq(self, other)
 
     def __iadd__(self, other: Self) -> Self:
         return self.__add__(other)
@@ -2829,2335 +2692,12280 @@ cdef class Float64:
         return self.__mod__(other)
 
 
-cdef class Float128:
-    """An IEEE 754 binary128 floating point.
+@cython.freelist(64)
+cdef class Float64:
+    """An IEEE 754 binary64 floating point.
+
+    The object is immutable.
+
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
+    The following operators are supported:
+
+    - unary operators: ``+``, ``-``.
+    - binary operators: ``+``, ``-``, ``*``, ``/``, ``//``, ``%``,
+      ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=``,
+      ``+=``, ``-=``, ``*=``, ``/=``, ``//=``, ``%=``.
+
+    The following operators are unsupported:
+
+    - unary operator: ``~``.
+    - binary operators: ``<<``, ``>>``, ``&``, ``|``, ``^``, ``**``,
+      ``<<=``, ``>>=``, ``&=``, ``|=``, ``^=``, ``**=``.
+
+    """
+
+    cdef sf.float64_t _data
+    """The native data."""
+
+    cpdef sf.float64_t _get_data(self):  # To access the native data in another instance.
+        return self._data
+
+    @classmethod
+    def size(cls) -> int:
+        """Returns the native data size in bits.
+
+        Returns:
+            The native data size in bits, i.e. 64.
+
+        """
+        return 64
+
+    @classmethod
+    def from_bytes(cls, bytes src) -> Float64:
+        """Creates a new instance from the specified byte sequence.
+
+        Args:
+            src: The byte sequence representing the native data with big endian.
+                 The length must be 8.
+
+        Returns:
+            A new instance created from the specified byte sequence.
+
+        Raises:
+            ValueError: If the length of bytes is not 8.
+
+        """
+        if len(src) != 8:
+            raise ValueError('length of bytes must be 8')
+        cdef const uint8_t[:] a = src
+        cdef Float64 o = Float64.__new__(Float64)
+        o._data.v = (
+            (<uint64_t>a[0] << 56) |
+            (<uint64_t>a[1] << 48) |
+            (<uint64_t>a[2] << 40) |
+            (<uint64_t>a[3] << 32) |
+            (<uint64_t>a[4] << 24) |
+            (<uint64_t>a[5] << 16) |
+            (<uint64_t>a[6] << 8) |
+            <uint64_t>a[7]
+        )
+        return o
+
+    cpdef bytes to_bytes(self):
+        """Returns the native data as a byte sequence.
+
+        Returns:
+            A byte sequence representing the native data with big endian.
+            The length is 8.
+
+        """
+        cdef uint8_t a[8]
+        a[0] = <uint8_t>(self._data.v >> 56)
+        a[1] = <uint8_t>(self._data.v >> 48)
+        a[2] = <uint8_t>(self._data.v >> 40)
+        a[3] = <uint8_t>(self._data.v >> 32)
+        a[4] = <uint8_t>(self._data.v >> 24)
+        a[5] = <uint8_t>(self._data.v >> 16)
+        a[6] = <uint8_t>(self._data.v >> 8)
+        a[7] = <uint8_t>self._data.v
+        return <bytes>a[:8]
+
+    @classmethod
+    def from_float(cls, double src) -> Float64:
+        """Creates a new instance from the specified floating point.
+
+        Args:
+            src: The floating point from which a new instance is created.
+
+        Returns:
+            A new instance created from the specified floating point.
+
+        """
+        cdef _ui64_double t
+        t.f = src
+        cdef Float64 o = Float64.__new__(Float64)
+        o._data.v = t.ui
+        return o
+
+    cpdef double to_float(self):
+        """Returns the native data as a floating point.
+
+        Returns:
+            A floating point that represents the native data.
+
+        """
+        cdef _ui64_double t
+        t.ui = self._data.v
+        return t.f
+
+    cpdef UInt32 to_ui32(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
+
+        The result is the same as that of :func:`f64_to_ui32()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 32-bit unsigned integer.
+
+        """
+        return f64_to_ui32(self, rounding_mode, exact)
+
+    cpdef UInt64 to_ui64(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
+
+        The result is the same as that of :func:`f64_to_ui64()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 64-bit unsigned integer.
+
+        """
+        return f64_to_ui64(self, rounding_mode, exact)
+
+    cpdef Int32 to_i32(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
+
+        The result is the same as that of :func:`f64_to_i32()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 32-bit signed integer.
+
+        """
+        return f64_to_i32(self, rounding_mode, exact)
+
+    cpdef Int64 to_i64(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
+
+        The result is the same as that of :func:`f64_to_i64()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 64-bit signed integer.
+
+        """
+        return f64_to_i64(self, rounding_mode, exact)
+
+    cpdef Float16 to_f16(self):
+        """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
+
+        The result is the same as that of :func:`f64_to_f16()`.
+
+        Returns:
+            The IEEE 754 binary16 floating point.
+
+        """
+        return f64_to_f16(self)
+
+    cpdef Float32 to_f32(self):
+        """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
+
+        The result is the same as that of :func:`f64_to_f32()`.
+
+        Returns:
+            The IEEE 754 binary32 floating point.
+
+        """
+        return f64_to_f32(self)
+
+    cpdef Float128 to_f128(self):
+        """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
+
+        The result is the same as that of :func:`f64_to_f128()`.
+
+        Returns:
+            The IEEE 754 binary128 floating point.
+
+        """
+        return f64_to_f128(self)
+
+    cpdef Float64 round_to_int(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Rounds the number.
+
+        The result is the same as that of :func:`f64_round_to_int()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact rounding is unable.
+
+        Returns:
+            The resulted integer.
+
+        """
+        return f64_round_to_int(self, rounding_mode, exact)
+
+    cpdef Float64 neg(self):
+        """Negates the IEEE 754 binary64 floating point.
+
+        The result is the same as that of :func:`f64_neg()`.
+
+        Returns:
+            The resulted number (``-x``).
+
+        """
+        return f64_neg(self)
+
+    @classmethod
+    def add(cls, Float64 x, Float64 y) -> Float64:
+        """Adds the IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_add()`.
+
+        Args:
+            x: The floating point to be added.
+            y: The floating point to add.
+
+        Returns:
+            The resulted number (``x + y``).
+
+        """
+        return f64_add(x, y)
+
+    @classmethod
+    def sub(cls, Float64 x, Float64 y) -> Float64:
+        """Subtracts the IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_sub()`.
+
+        Args:
+            x: The floating point to be subtracted.
+            y: The floating point to subtract.
+
+        Returns:
+            The resulted number (``x - y``).
+
+        """
+        return f64_sub(x, y)
+
+    @classmethod
+    def mul(cls, Float64 x, Float64 y) -> Float64:
+        """Multiplies the IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_mul()`.
+
+        Args:
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
+
+        Returns:
+            The resulted number (``x * y``).
+
+        """
+        return f64_mul(x, y)
+
+    @classmethod
+    def mul_add(cls, Float64 x, Float64 y, Float64 z) -> Float64:
+        """Multiplies and Adds the IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_mul_add()`.
+
+        Args:
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
+            z: The floating point to add.
+
+        Returns:
+            The resulted number (``x * y + z``).
+
+        """
+        return f64_mul_add(x, y, z)
+
+    @classmethod
+    def div(cls, Float64 x, Float64 y) -> Float64:
+        """Divides the IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_div()`.
+
+        Args:
+            x: The floating point to be divided.
+            y: The floating point to divide.
+
+        Returns:
+            The resulted number (``x / y``).
+
+        """
+        return f64_div(x, y)
+
+    @classmethod
+    def rem(cls, Float64 x, Float64 y) -> Float64:
+        """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_rem()`.
+
+        Args:
+            x: The floating point to be divided.
+            y: The floating point to divide.
+
+        Returns:
+            The resulted number (``x % y``).
+
+        """
+        return f64_rem(x, y)
+
+    @classmethod
+    def sqrt(cls, Float64 x) -> Float64:
+        """Calculates a square root of the IEEE 754 binary64 floating point.
+
+        The result is the same as that of :func:`f64_sqrt()`.
+
+        Args:
+            x: The floating point whose square root is to be calculated.
+
+        Returns:
+            The resulted number (``sqrt(x)``).
+
+        """
+        return f64_sqrt(x)
+
+    @classmethod
+    def eq(cls, Float64 x, Float64 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_eq()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+        """
+        return f64_eq(x, y)
+
+    @classmethod
+    def le(cls, Float64 x, Float64 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_le()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+        """
+        return f64_le(x, y)
+
+    @classmethod
+    def lt(cls, Float64 x, Float64 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+
+        The result is the same as that of :func:`f64_lt()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+        """
+        return f64_lt(x, y)
+
+    @classmethod
+    def eq_signaling(cls, Float64 x, Float64 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+
+        The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+        The result is the same as that of :func:`f64_eq_signaling()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+        """
+        return f64_eq_signaling(x, y)
+
+    @classmethod
+    def le_quiet(cls, Float64 x, Float64 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`f64_le_quiet()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+        """
+        return f64_le_quiet(x, y)
+
+    @classmethod
+    def lt_quiet(cls, Float64 x, Float64 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`f64_lt_quiet()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+        """
+        return f64_lt_quiet(x, y)
+
+    cpdef bool is_signaling_nan(self):
+        """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
+
+        The result is the same as that of :func:`f64_is_signaling_nan()`.
+
+        Returns:
+            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+        """
+        return f64_is_signaling_nan(self)
+
+    def __str__(self) -> str:
+        cdef char buffer[_FORMAT_SIZE]
+        return buffer[:_f64_format(buffer, self._data)].decode('ascii')
+
+    def __pos__(self) -> Self:
+        return _make_float64(self._data)
+
+    def __neg__(self) -> Self:
+        return f64_neg(self)
+
+    def __add__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f64_add(self, other)
+
+    def __sub__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f64_sub(self, other)
+
+    def __mul__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f64_mul(self, other)
+
+    def __truediv__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f64_div(self, other)
+
+    def __floordiv__(self, other: Self) -> Self:
+        return f64_round_to_int(f64_div(self, other), RoundingMode.MIN)
+
+    def __mod__(self, other: Self) -> Self:
+        return f64_sub(self, f64_mul(other, f64_round_to_int(f64_div(self, other), RoundingMode.MIN)))
+
+    def __lt__(self, other: Self) -> bool:
+        return f64_lt(self, other)
+
+    def __le__(self, other: Self) -> bool:
+        return f64_le(self, other)
+
+    def __gt__(self, other: Self) -> bool:
+        return f64_lt(other, self)
+
+    def __ge__(self, other: Self) -> bool:
+        return f64_le(other, self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            raise ValueError('type mismatch')
+        return f64_eq(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            raise ValueError('type mismatch')
+        return not f64_eq(self, other)
+
+    def __iadd__(self, other: Self) -> Self:
+        return self.__add__(other)
+
+    def __isub__(self, other: Self) -> Self:
+        return self.__sub__(other)
+
+    def __imul__(self, other: Self) -> Self:
+        return self.__mul__(other)
+
+    def __itruediv__(self, other: Self) -> Self:
+        return self.__truediv__(other)
+
+    def __ifloordiv__(self, other: Self) -> Self:
+        return self.__floordiv__(other)
+
+    def __imod__(self, other: Self) -> Self:
+        return self.__mod__(other)
+
+
+@cython.freelist(64)
+cdef class Float128:
+    """An IEEE 754 binary128 floating point.
+
+    The object is immutable.
+
+    The string representation by :func:`str()` is the shortest decimal string
+    that is rounded to the same floating point.
+
+    The following operators are supported:
+
+    - unary operators: ``+``, ``-``.
+    - binary operators: ``+``, ``-``, ``*``, ``/``, ``//``, ``%``,
+      ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=``,
+      ``+=``, ``-=``, ``*=``, ``/=``, ``//=``, ``%=``.
+
+    The following operators are unsupported:
+
+    - unary operator: ``~``.
+    - binary operators: ``<<``, ``>>``, ``&``, ``|``, ``^``, ``**``,
+      ``<<=``, ``>>=``, ``&=``, ``|=``, ``^=``, ``**=``.
+
+    """
+
+    cdef sf.float128_t _data
+    """The native data."""
+
+    cpdef sf.float128_t _get_data(self):  # To access the native data in another instance.
+        return self._data
+
+    @classmethod
+    def size(cls) -> int:
+        """Returns the native data size in bits.
+
+        Returns:
+            The native data size in bits, i.e. 128.
+
+        """
+        return 128
+
+    @classmethod
+    def from_bytes(cls, bytes src) -> Float128:
+        """Creates a new instance from the specified byte sequence.
+
+        Args:
+            src: The byte sequence representing the native data with big endian.
+                 The length must be 16.
+
+        Returns:
+            A new instance created from the specified byte sequence.
+
+        Raises:
+            ValueError: If the length of bytes is not 16.
+
+        """
+        if len(src) != 16:
+            raise ValueError('length of bytes must be 16')
+        cdef const uint8_t[:] a = src
+        cdef ui128_f128 t
+        t.ui.v64 = (
+            (<uint64_t>a[0] << 56) |
+            (<uint64_t>a[1] << 48) |
+            (<uint64_t>a[2] << 40) |
+            (<uint64_t>a[3] << 32) |
+            (<uint64_t>a[4] << 24) |
+            (<uint64_t>a[5] << 16) |
+            (<uint64_t>a[6] << 8) |
+            <uint64_t>a[7]
+        )
+        t.ui.v0 = (
+            (<uint64_t>a[8] << 56) |
+            (<uint64_t>a[9] << 48) |
+            (<uint64_t>a[10] << 40) |
+            (<uint64_t>a[11] << 32) |
+            (<uint64_t>a[12] << 24) |
+            (<uint64_t>a[13] << 16) |
+            (<uint64_t>a[14] << 8) |
+            <uint64_t>a[15]
+        )
+        cdef Float128 o = Float128.__new__(Float128)
+        o._data = t.f
+        return o
+
+    cpdef bytes to_bytes(self):
+        """Returns the native data as a byte sequence.
+
+        Returns:
+            A byte sequence representing the native data with big endian.
+            The length is 16.
+
+        """
+        cdef uint8_t a[16]
+        cdef ui128_f128 t
+        t.f = self._data
+        a[0] = <uint8_t>(t.ui.v64 >> 56)
+        a[1] = <uint8_t>(t.ui.v64 >> 48)
+        a[2] = <uint8_t>(t.ui.v64 >> 40)
+        a[3] = <uint8_t>(t.ui.v64 >> 32)
+        a[4] = <uint8_t>(t.ui.v64 >> 24)
+        a[5] = <uint8_t>(t.ui.v64 >> 16)
+        a[6] = <uint8_t>(t.ui.v64 >> 8)
+        a[7] = <uint8_t>t.ui.v64
+        a[8] = <uint8_t>(t.ui.v0 >> 56)
+        a[9] = <uint8_t>(t.ui.v0 >> 48)
+        a[10] = <uint8_t>(t.ui.v0 >> 40)
+        a[11] = <uint8_t>(t.ui.v0 >> 32)
+        a[12] = <uint8_t>(t.ui.v0 >> 24)
+        a[13] = <uint8_t>(t.ui.v0 >> 16)
+        a[14] = <uint8_t>(t.ui.v0 >> 8)
+        a[15] = <uint8_t>t.ui.v0
+        return <bytes>a[:16]
+
+    @classmethod
+    def from_float(cls, double src) -> Float128:
+        """Creates a new instance from the specified floating point.
+
+        Args:
+            src: The floating point from which a new instance is created.
+
+        Returns:
+            A new instance created from the specified floating point.
+
+        Note:
+            Cannot create an instance with a number that an IEEE 754 binary64
+            floating point is unable to express.
+
+        """
+        cdef _ui64_double t
+        cdef sf.float64_t f
+        t.f = src
+        f.v = t.ui
+        cdef Float128 o = Float128.__new__(Float128)
+        o._data = sf.f64_to_f128(f)
+        return o
+
+    cpdef double to_float(self):
+        """Returns the native data as a floating point.
+
+        Returns:
+            A floating point that represents the native data.
+
+        Note:
+            Cannot return the exact number if it is unable to be expressed
+            as an IEEE 754 binary64 floating point.
+
+        """
+        cdef _ui64_double t
+        t.ui = sf.f128_to_f64(self._data).v
+        return t.f
+
+    cpdef UInt32 to_ui32(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
+
+        The result is the same as that of :func:`f128_to_ui32()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 32-bit unsigned integer.
+
+        """
+        return f128_to_ui32(self, rounding_mode, exact)
+
+    cpdef UInt64 to_ui64(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
+
+        The result is the same as that of :func:`f128_to_ui64()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 64-bit unsigned integer.
+
+        """
+        return f128_to_ui64(self, rounding_mode, exact)
+
+    cpdef Int32 to_i32(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
+
+        The result is the same as that of :func:`f128_to_i32()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 32-bit signed integer.
+
+        """
+        return f128_to_i32(self, rounding_mode, exact)
+
+    cpdef Int64 to_i64(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
+
+        The result is the same as that of :func:`f128_to_i64()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact conversion is unable.
+
+        Returns:
+            The 64-bit signed integer.
+
+        """
+        return f128_to_i64(self, rounding_mode, exact)
+
+    cpdef Float16 to_f16(self):
+        """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
+
+        The result is the same as that of :func:`f128_to_f16()`.
+
+        Returns:
+            The IEEE 754 binary16 floating point.
+
+        """
+        return f128_to_f16(self)
+
+    cpdef Float32 to_f32(self):
+        """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+
+        The result is the same as that of :func:`f128_to_f32()`.
+
+        Returns:
+            The IEEE 754 binary32 floating point.
+
+        """
+        return f128_to_f32(self)
+
+    cpdef Float64 to_f64(self):
+        """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
+
+        The result is the same as that of :func:`f128_to_f64()`.
+
+        Returns:
+            The IEEE 754 binary64 floating point.
+
+        """
+        return f128_to_f64(self)
+
+    cpdef Float128 round_to_int(
+        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+    ):
+        """Rounds the number.
+
+        The result is the same as that of :func:`f128_round_to_int()`.
+
+        Args:
+            rounding_mode: The rounding mode.
+            exact: If ``True`` is specified, the floating-point exception flags are to be set
+                   when exact rounding is unable.
+
+        Returns:
+            The resulted integer.
+
+        """
+        return f128_round_to_int(self, rounding_mode, exact)
+
+    cpdef Float128 neg(self):
+        """Negates the IEEE 754 binary128 floating point.
+
+        The result is the same as that of :func:`f128_neg()`.
+
+        Returns:
+            The resulted number (``-x``).
+
+        """
+        return f128_neg(self)
+
+    @classmethod
+    def add(cls, Float128 x, Float128 y) -> Float128:
+        """Adds the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_add()`.
+
+        Args:
+            x: The floating point to be added.
+            y: The floating point to add.
+
+        Returns:
+            The resulted number (``x + y``).
+
+        """
+        return f128_add(x, y)
+
+    @classmethod
+    def sub(cls, Float128 x, Float128 y) -> Float128:
+        """Subtracts the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_sub()`.
+
+        Args:
+            x: The floating point to be subtracted.
+            y: The floating point to subtract.
+
+        Returns:
+            The resulted number (``x - y``).
+
+        """
+        return f128_sub(x, y)
+
+    @classmethod
+    def mul(cls, Float128 x, Float128 y) -> Float128:
+        """Multiplies the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_mul()`.
+
+        Args:
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
+
+        Returns:
+            The resulted number (``x * y``).
+
+        """
+        return f128_mul(x, y)
+
+    @classmethod
+    def mul_add(cls, Float128 x, Float128 y, Float128 z) -> Float128:
+        """Multiplies and Adds the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_mul_add()`.
+
+        Args:
+            x: The floating point to be multiplied.
+            y: The floating point to multiply.
+            z: The floating point to add.
+
+        Returns:
+            The resulted number (``x * y + z``).
+
+        """
+        return f128_mul_add(x, y, z)
+
+    @classmethod
+    def div(cls, Float128 x, Float128 y) -> Float128:
+        """Divides the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_div()`.
+
+        Args:
+            x: The floating point to be divided.
+            y: The floating point to divide.
+
+        Returns:
+            The resulted number (``x / y``).
+
+        """
+        return f128_div(x, y)
+
+    @classmethod
+    def rem(cls, Float128 x, Float128 y) -> Float128:
+        """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_rem()`.
+
+        Args:
+            x: The floating point to be divided.
+            y: The floating point to divide.
+
+        Returns:
+            The resulted number (``x % y``).
+
+        """
+        return f128_rem(x, y)
+
+    @classmethod
+    def sqrt(cls, Float128 x) -> Float128:
+        """Calculates a square root of the IEEE 754 binary128 floating point.
+
+        The result is the same as that of :func:`f128_sqrt()`.
+
+        Args:
+            x: The floating point whose square root is to be calculated.
+
+        Returns:
+            The resulted number (``sqrt(x)``).
+
+        """
+        return f128_sqrt(x)
+
+    @classmethod
+    def eq(cls, Float128 x, Float128 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_eq()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+        """
+        return f128_eq(x, y)
+
+    @classmethod
+    def le(cls, Float128 x, Float128 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_le()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+        """
+        return f128_le(x, y)
+
+    @classmethod
+    def lt(cls, Float128 x, Float128 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+        The result is the same as that of :func:`f128_lt()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+        """
+        return f128_lt(x, y)
+
+    @classmethod
+    def eq_signaling(cls, Float128 x, Float128 y) -> bool:
+        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+        The result is the same as that of :func:`f128_eq_signaling()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+        """
+        return f128_eq_signaling(x, y)
+
+    @classmethod
+    def le_quiet(cls, Float128 x, Float128 y) -> bool:
+        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`f128_le_quiet()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+        """
+        return f128_le_quiet(x, y)
+
+    @classmethod
+    def lt_quiet(cls, Float128 x, Float128 y) -> bool:
+        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+        The invalid exception flag is not set for quiet NaNs.
+
+        The result is the same as that of :func:`f128_lt_quiet()`.
+
+        Args:
+            x: The first floating point to be compared.
+            y: The second floating point to be compared.
+
+        Returns:
+            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+        """
+        return f128_lt_quiet(x, y)
+
+    cpdef bool is_signaling_nan(self):
+        """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+
+        The result is the same as that of :func:`f128_is_signaling_nan()`.
+
+        Returns:
+            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+        """
+        return f128_is_signaling_nan(self)
+
+    def __str__(self) -> str:
+        cdef char buffer[_FORMAT_SIZE]
+        return buffer[:_f128_format(buffer, self._data)].decode('ascii')
+
+    def __pos__(self) -> Self:
+        return _make_float128(self._data)
+
+    def __neg__(self) -> Self:
+        return f128_neg(self)
+
+    def __add__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f128_add(self, other)
+
+    def __sub__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f128_sub(self, other)
+
+    def __mul__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f128_mul(self, other)
+
+    def __truediv__(self, other: Self) -> Self:
+        if isinstance(other, _FloatArray):
+            return NotImplemented
+        return f128_div(self, other)
+
+    def __floordiv__(self, other: Self) -> Self:
+        return f128_round_to_int(f128_div(self, other), RoundingMode.MIN)
+
+    def __mod__(self, other: Self) -> Self:
+        return f128_sub(self, f128_mul(other, f128_round_to_int(f128_div(self, other), RoundingMode.MIN)))
+
+    def __lt__(self, other: Self) -> bool:
+        return f128_lt(self, other)
+
+    def __le__(self, other: Self) -> bool:
+        return f128_le(self, other)
+
+    def __gt__(self, other: Self) -> bool:
+        return f128_lt(other, self)
+
+    def __ge__(self, other: Self) -> bool:
+        return f128_le(other, self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            raise ValueError('type mismatch')
+        return f128_eq(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            raise ValueError('type mismatch')
+        return not f128_eq(self, other)
+
+    def __iadd__(self, other: Self) -> Self:
+        return self.__add__(other)
+
+    def __isub__(self, other: Self) -> Self:
+        return self.__sub__(other)
+
+    def __imul__(self, other: Self) -> Self:
+        return self.__mul__(other)
+
+    def __itruediv__(self, other: Self) -> Self:
+        return self.__truediv__(other)
+
+    def __ifloordiv__(self, other: Self) -> Self:
+        return self.__floordiv__(other)
+
+    def __imod__(self, other: Self) -> Self:
+        return self.__mod__(other)
+
+
+cpdef void set_tininess_mode(TininessMode mode):
+    """Sets the tininess detection mode of the current thread.
+
+    Args:
+        mode: The tininess detection mode to be set.
+
+    """
+    sf.softfloat_detectTininess = <uint_fast8_t>mode
+
+
+cpdef TininessMode get_tininess_mode():
+    """Returns the tininess detection mode of the current thread.
+
+    Returns:
+        The current tininess detection mode.
+
+    """
+    return <TininessMode>sf.softfloat_detectTininess
+
+
+cpdef void set_rounding_mode(RoundingMode mode):
+    """Sets the rounding mode of the current thread.
+
+    Args:
+        mode: The rounding mode to be set.
+
+    """
+    sf.softfloat_roundingMode = <uint_fast8_t>mode
+
+
+cpdef RoundingMode get_rounding_mode():
+    """Returns the rounding mode of the current thread.
+
+    Returns:
+        The current rounding mode.
+
+    """
+    return <RoundingMode>sf.softfloat_roundingMode
+
+
+cpdef void set_exception_flags(flags):
+    """Sets the floating-point exception flags of the current thread.
+
+    Args:
+        flags: The floating-point exception flags to be set.
+
+    """
+    sf.softfloat_exceptionFlags = <uint_fast8_t>flags
+
+
+cpdef get_exception_flags():
+    """Returns the floating-point exception flags of the current thread.
+
+    Returns:
+        The current floating-point exception flags.
+
+    """
+    return int(sf.softfloat_exceptionFlags)
+
+
+cpdef bool test_exception_flags(flags):
+    """Tests the floating-point exception flags of the current thread.
+
+    Args:
+        flags: The floating-point exception flags to be tested.
+
+    Returns:
+        ``True`` if any of the specified exception flags is nonzero, ``False`` otherwise.
+
+    """
+    return (sf.softfloat_exceptionFlags & <uint_fast8_t>flags) != 0
+
+
+cdef struct _State:
+    # The floating-point state of a thread.
+    uint_fast8_t rounding_mode
+    uint_fast8_t tininess_mode
+    uint_fast8_t flags
+
+
+cdef class FloatContext:
+    """A floating-point context that holds the rounding mode, the tininess detection mode,
+    and the floating-point exception flags.
+
+    When used in a ``with`` statement, the context saves the rounding mode, the tininess
+    detection mode, and the floating-point exception flags of the current thread on entry,
+    applies its modes and clears the flags, and restores all of them on exit. The flags raised
+    inside the statement are accumulated into :attr:`flags` of the context.
+
+    The context can also be passed to the batch operations as ``context``, in which case
+    they are performed in the same way as inside the statement.
+
+    If any of the exception flags specified as the traps is raised, :class:`FloatingPointError`
+    is raised on exit from the statement or from the batch operation.
+
+    """
+
+    cdef int _rounding_mode
+    """The rounding mode, or -1 to use that of the current thread."""
+
+    cdef int _tininess_mode
+    """The tininess detection mode, or -1 to use that of the current thread."""
+
+    cdef uint_fast8_t _traps
+    """The floating-point exception flags to be trapped."""
+
+    cdef uint_fast8_t _flags
+    """The floating-point exception flags raised in the context."""
+
+    cdef _State _saved
+    """The state of the current thread saved on entry."""
+
+    cdef bint _entered
+    """``True`` if the context has been entered."""
+
+    def __init__(self, rounding_mode=None, tininess_mode=None, traps=0):
+        """Creates a new instance.
+
+        Args:
+            rounding_mode: The rounding mode. If ``None`` is specified, that of the current thread is used.
+            tininess_mode: The tininess detection mode. If ``None`` is specified, that of the current thread is used.
+            traps: The floating-point exception flags to be trapped.
+
+        """
+        self._rounding_mode = -1 if rounding_mode is None else <int><RoundingMode>rounding_mode
+        self._tininess_mode = -1 if tininess_mode is None else <int><TininessMode>tininess_mode
+        self._traps = <uint_fast8_t>traps
+        self._flags = 0
+
+    @property
+    def rounding_mode(self) -> RoundingMode | None:
+        """The rounding mode, or ``None`` to use that of the current thread."""
+        return None if self._rounding_mode < 0 else <RoundingMode>self._rounding_mode
+
+    @property
+    def tininess_mode(self) -> TininessMode | None:
+        """The tininess detection mode, or ``None`` to use that of the current thread."""
+        return None if self._tininess_mode < 0 else <TininessMode>self._tininess_mode
+
+    @property
+    def traps(self) -> int:
+        """The floating-point exception flags to be trapped."""
+        return int(self._traps)
+
+    @property
+    def flags(self) -> int:
+        """The floating-point exception flags raised in the context."""
+        return int(self._flags)
+
+    @flags.setter
+    def flags(self, value: int) -> None:
+        self._flags = <uint_fast8_t>value
+
+    cdef void _enter(self, _State* saved) noexcept nogil:
+        saved.rounding_mode = sf.softfloat_roundingMode
+        saved.tininess_mode = sf.softfloat_detectTininess
+        saved.flags = sf.softfloat_exceptionFlags
+        if self._rounding_mode >= 0:
+            sf.softfloat_roundingMode = <uint_fast8_t>self._rounding_mode
+        if self._tininess_mode >= 0:
+            sf.softfloat_detectTininess = <uint_fast8_t>self._tininess_mode
+        sf.softfloat_exceptionFlags = 0
+
+    cdef uint_fast8_t _exit(self, const _State* saved) noexcept nogil:
+        cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+        sf.softfloat_roundingMode = saved.rounding_mode
+        sf.softfloat_detectTininess = saved.tininess_mode
+        sf.softfloat_exceptionFlags = saved.flags
+        self._flags |= raised
+        return raised & self._traps
+
+    cdef int _trap(self, uint_fast8_t trapped) except -1:
+        if trapped != 0:
+            raise FloatingPointError(f'floating-point exception trapped: {ExceptionFlag(trapped)!r}')
+        return 0
+
+    def __enter__(self) -> Self:
+        if self._entered:
+            raise RuntimeError('context has already been entered')
+        self._entered = True
+        self._enter(&self._saved)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._entered = False
+        cdef uint_fast8_t trapped = self._exit(&self._saved)
+        if exc_type is None:
+            self._trap(trapped)
+        return False
+
+
+cdef int _num_threads = 1
+"""The number of threads used by the batch operations."""
+
+cdef object _executor = None
+"""The thread pool running the chunks of the batch operations, created on demand."""
+
+cdef object _executor_lock = Lock()
+"""The lock guarding the number of threads and the thread pool."""
+
+
+cpdef void set_num_threads(int n):
+    """Sets the number of threads used by the batch operations.
+
+    The batch operations split long operands into chunks and run them in parallel
+    without holding the GIL. The rounding mode and the tininess detection mode of
+    the calling thread are applied to all the chunks, and the exception flags raised
+    by them are accumulated into those of the calling thread.
+
+    Args:
+        n: The number of threads. If ``1`` is specified, the batch operations run
+           only in the calling thread.
+
+    Raises:
+        ValueError: If the number of threads is less than 1.
+
+    """
+    global _num_threads, _executor
+    if n < 1:
+        raise ValueError('number of threads must be positive')
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+        _num_threads = n
+
+
+cpdef int get_num_threads():
+    """Returns the number of threads used by the batch operations.
+
+    Returns:
+        The number of threads.
+
+    """
+    return _num_threads
+
+
+cdef bint _interning = False
+"""``True`` if the 16-bit floating-point objects are interned."""
+
+cdef list _float16_table = None
+"""The interned :class:`Float16` objects indexed by the native data, populated on demand."""
+
+cdef list _bfloat16_table = None
+"""The interned :class:`BFloat16` objects indexed by the native data, populated on demand."""
+
+cdef object _interning_lock = Lock()
+"""The lock guarding the population of the interned objects."""
+
+
+cpdef void set_interning(bint enabled):
+    """Sets whether the 16-bit floating-point objects are interned.
+
+    While interning is enabled, all the :class:`Float16` and :class:`BFloat16` objects
+    created by the operations, the conversions, and the packed arrays are shared instances,
+    one for each bit pattern. This eliminates object allocation in the half-precision
+    scalar loops, and allows the identity test to be used instead of the bitwise equality test.
+
+    Args:
+        enabled: ``True`` to enable interning, ``False`` to disable it.
+
+    """
+    global _interning, _float16_table, _bfloat16_table
+    with _interning_lock:
+        if enabled and _float16_table is None:
+            _float16_table = [None] * 65536
+            _bfloat16_table = [None] * 65536
+        _interning = enabled
+
+
+cpdef bint get_interning():
+    """Returns whether the 16-bit floating-point objects are interned.
+
+    Returns:
+        ``True`` if interning is enabled, ``False`` otherwise.
+
+    """
+    return _interning
+
+
+cdef extern from "<float.h>":
+    const int FLT_EVAL_METHOD
+
+
+cdef bint _hardware = False
+"""``True`` if the hardware acceleration is enabled."""
+
+
+cpdef void set_hardware_acceleration(bint enabled):
+    """Sets whether the arithmetic of the narrow floating points is performed on the hardware.
+
+    While the hardware acceleration is enabled, the addition, the subtraction, the multiplication,
+    and the division of IEEE 754 binary16 and binary32 floating points, and the square root of
+    IEEE 754 binary32 floating points are computed on the binary64 floating-point unit of the host
+    and rounded once to the target format. The operations whose results the host unit is unable
+    to reproduce, such as those with NaN or infinite operands, fall back to SoftFloat.
+    The results and the floating-point exception flags are identical to those of SoftFloat
+    in all the rounding and tininess detection modes.
+
+    Args:
+        enabled: ``True`` to enable the hardware acceleration, ``False`` to disable it.
+
+    Raises:
+        RuntimeError: If the host evaluates floating-point expressions with excess precision.
+
+    """
+    global _hardware
+    if enabled and FLT_EVAL_METHOD != 0:
+        raise RuntimeError('hardware acceleration requires FLT_EVAL_METHOD == 0')
+    _hardware = enabled
+
+
+cpdef bint get_hardware_acceleration():
+    """Returns whether the arithmetic of the narrow floating points is performed on the hardware.
+
+    Returns:
+        ``True`` if the hardware acceleration is enabled, ``False`` otherwise.
+
+    """
+    return _hardware
+
+
+cdef UInt32 _make_uint32(uint32_t src):
+    cdef UInt32 i = UInt32.__new__(UInt32)
+    i._data = src
+    return i
+
+
+cdef UInt64 _make_uint64(uint64_t src):
+    cdef UInt64 i = UInt64.__new__(UInt64)
+    i._data = src
+    return i
+
+
+cdef Int32 _make_int32(int32_t src):
+    cdef Int32 i = Int32.__new__(Int32)
+    i._data = src
+    return i
+
+
+cdef Int64 _make_int64(int64_t src):
+    cdef Int64 i = Int64.__new__(Int64)
+    i._data = src
+    return i
+
+
+cdef BFloat16 _make_bfloat16(sf.bfloat16_t src):
+    cdef BFloat16 f
+    if _interning:
+        f = <BFloat16>_bfloat16_table[src.v]
+        if f is not None:
+            return f
+    f = BFloat16.__new__(BFloat16)
+    f._data = src
+    if _interning:
+        with _interning_lock:
+            if _bfloat16_table[src.v] is None:
+                _bfloat16_table[src.v] = f
+            else:
+                f = <BFloat16>_bfloat16_table[src.v]
+    return f
+
+
+cdef Float16 _make_float16(sf.float16_t src):
+    cdef Float16 f
+    if _interning:
+        f = <Float16>_float16_table[src.v]
+        if f is not None:
+            return f
+    f = Float16.__new__(Float16)
+    f._data = src
+    if _interning:
+        with _interning_lock:
+            if _float16_table[src.v] is None:
+                _float16_table[src.v] = f
+            else:
+                f = <Float16>_float16_table[src.v]
+    return f
+
+
+cdef Float32 _make_float32(sf.float32_t src):
+    cdef Float32 f = Float32.__new__(Float32)
+    f._data = src
+    return f
+
+
+cdef Float64 _make_float64(sf.float64_t src):
+    cdef Float64 f = Float64.__new__(Float64)
+    f._data = src
+    return f
+
+
+cdef Float128 _make_float128(sf.float128_t src):
+    cdef Float128 f = Float128.__new__(Float128)
+    f._data = src
+    return f
+
+
+cdef inline sf.float64_t _double_to_f64(double src) noexcept nogil:
+    cdef _ui64_double t
+    cdef sf.float64_t f
+    t.f = src
+    f.v = t.ui
+    return f
+
+
+cdef inline double _f64_to_double(sf.float64_t src) noexcept nogil:
+    cdef _ui64_double t
+    t.ui = src.v
+    return t.f
+
+
+# The hardware engine computes the result in binary64 and rounds it to the target format
+# by f64_to_f16() or f64_to_f32(). The binary64 result is either exact or rounded to odd;
+# rounding to odd with at least two extra bits makes the second rounding correct in every
+# rounding mode, including the exception flags and the tininess detection.
+# The operands are converted to binary64 by integer operations, and the intermediate results
+# are never subnormal, so that the flush-to-zero modes of the host do not matter.
+
+
+cdef inline double _round_to_odd(double s, double e) noexcept nogil:
+    # Rounds the exact result s + e (s = RN(s + e)) to odd, without branches.
+    cdef _ui64_double t, d
+    t.f = s
+    d.f = e
+    cdef uint64_t inexact = <uint64_t>((<uint32_t>d.ui | (<uint32_t>(d.ui >> 32) << 1)) != 0)
+    t.ui = (t.ui - (inexact & ((t.ui ^ d.ui) >> 63))) | inexact
+    return t.f
+
+
+cdef inline double _two_sum_to_odd(double x, double y) noexcept nogil:
+    cdef double s = x + y
+    cdef double b = s - x
+    return _round_to_odd(s, (x - (s - b)) + (y - b))
+
+
+cdef inline double _div_to_odd(double x, double y) noexcept nogil:
+    cdef double q = x / y
+    cdef double r = fma(-q, y, x)
+    return _round_to_odd(q, r if y > 0.0 else -r)
+
+
+cdef inline double _sqrt_to_odd(double x) noexcept nogil:
+    cdef double q = sqrt(x)
+    return _round_to_odd(q, fma(-q, q, x))
+
+
+cdef inline bint _f16_is_finite(sf.float16_t a) noexcept nogil:
+    return (a.v & 0x7C00) != 0x7C00
+
+
+cdef inline bint _f16_is_zero(sf.float16_t a) noexcept nogil:
+    return (a.v & 0x7FFF) == 0
+
+
+cdef inline double _f16_to_double(sf.float16_t a) noexcept nogil:
+    # Converts the finite binary16 floating point to binary64 exactly.
+    cdef uint64_t exp = (a.v >> 10) & 0x1F
+    cdef uint64_t sig = a.v & 0x3FF
+    cdef _ui64_double t
+    if exp == 0:
+        t.f = <double>sig * 5.9604644775390625e-08  # 2^-24
+    else:
+        t.ui = ((exp + 1008) << 52) | (sig << 42)
+    t.ui |= <uint64_t>(a.v >> 15) << 63
+    return t.f
+
+
+cdef inline sf.float16_t _double_to_f16(double x) noexcept nogil:
+    # Rounds the binary64 floating point to binary16, by integer operations if to nearest even
+    # and in the normal range of binary16.
+    cdef _ui64_double t
+    cdef uint64_t u
+    cdef sf.float16_t z
+    t.f = x
+    u = t.ui & <uint64_t>0x7FFFFFFFFFFFFFFF
+    if sf.softfloat_roundingMode == sf.softfloat_round_near_even and 1009 <= (u >> 52) <= 1038:
+        u = (u + <uint64_t>0x1FFFFFFFFFF + ((u >> 42) & 1)) >> 42
+        if u < (<uint64_t>1039 << 10):
+            if t.ui & <uint64_t>0x3FFFFFFFFFF:
+                sf.softfloat_exceptionFlags |= sf.softfloat_flag_inexact
+            z.v = (<uint16_t>(t.ui >> 48) & <uint16_t>0x8000) | <uint16_t>(u - (<uint64_t>1008 << 10))
+            return z
+    return sf.f64_to_f16(_double_to_f64(x))
+
+
+cdef inline bint _f32_is_finite(sf.float32_t a) noexcept nogil:
+    return (a.v & 0x7F800000) != 0x7F800000
+
+
+cdef inline bint _f32_is_zero(sf.float32_t a) noexcept nogil:
+    return (a.v & 0x7FFFFFFF) == 0
+
+
+cdef inline double _f32_to_double(sf.float32_t a) noexcept nogil:
+    # Converts the finite binary32 floating point to binary64 exactly.
+    cdef uint64_t exp = (a.v >> 23) & 0xFF
+    cdef uint64_t sig = a.v & 0x7FFFFF
+    cdef _ui64_double t
+    if exp == 0:
+        t.f = <double>sig * 1.401298464324817e-45  # 2^-149
+    else:
+        t.ui = ((exp + 896) << 52) | (sig << 29)
+    t.ui |= <uint64_t>(a.v >> 31) << 63
+    return t.f
+
+
+cdef inline sf.float32_t _double_to_f32(double x) noexcept nogil:
+    # Rounds the binary64 floating point to binary32, by integer operations if to nearest even
+    # and in the normal range of binary32.
+    cdef _ui64_double t
+    cdef uint64_t u
+    cdef sf.float32_t z
+    t.f = x
+    u = t.ui & <uint64_t>0x7FFFFFFFFFFFFFFF
+    if sf.softfloat_roundingMode == sf.softfloat_round_near_even and 897 <= (u >> 52) <= 1150:
+        u = (u + <uint64_t>0xFFFFFFF + ((u >> 29) & 1)) >> 29
+        if u < (<uint64_t>1151 << 23):
+            if t.ui & <uint64_t>0x1FFFFFFF:
+                sf.softfloat_exceptionFlags |= sf.softfloat_flag_inexact
+            z.v = (<uint32_t>(t.ui >> 32) & <uint32_t>0x80000000) | <uint32_t>(u - (<uint64_t>896 << 23))
+            return z
+    return sf.f64_to_f32(_double_to_f64(x))
+
+
+cdef sf.float16_t _hw_f16_add(sf.float16_t a, sf.float16_t b) noexcept nogil:
+    if not (_f16_is_finite(a) and _f16_is_finite(b)):
+        return sf.f16_add(a, b)
+    cdef double s = _f16_to_double(a) + _f16_to_double(b)  # exact
+    if s == 0.0:  # the sign of an exact zero sum depends on the rounding mode
+        return sf.f16_add(a, b)
+    return _double_to_f16(s)
+
+
+cdef sf.float16_t _hw_f16_sub(sf.float16_t a, sf.float16_t b) noexcept nogil:
+    if not (_f16_is_finite(a) and _f16_is_finite(b)):
+        return sf.f16_sub(a, b)
+    cdef double s = _f16_to_double(a) - _f16_to_double(b)  # exact
+    if s == 0.0:  # the sign of an exact zero difference depends on the rounding mode
+        return sf.f16_sub(a, b)
+    return _double_to_f16(s)
+
+
+cdef sf.float16_t _hw_f16_mul(sf.float16_t a, sf.float16_t b) noexcept nogil:
+    if not (_f16_is_finite(a) and _f16_is_finite(b)):
+        return sf.f16_mul(a, b)
+    return _double_to_f16(_f16_to_double(a) * _f16_to_double(b))  # exact
+
+
+cdef sf.float16_t _hw_f16_div(sf.float16_t a, sf.float16_t b) noexcept nogil:
+    if not (_f16_is_finite(a) and _f16_is_finite(b)) or _f16_is_zero(b):
+        return sf.f16_div(a, b)
+    return _double_to_f16(_div_to_odd(_f16_to_double(a), _f16_to_double(b)))
+
+
+cdef sf.float32_t _hw_f32_add(sf.float32_t a, sf.float32_t b) noexcept nogil:
+    if not (_f32_is_finite(a) and _f32_is_finite(b)):
+        return sf.f32_add(a, b)
+    cdef double x = _f32_to_double(a)
+    cdef double y = _f32_to_double(b)
+    if x + y == 0.0:  # the sign of an exact zero sum depends on the rounding mode
+        return sf.f32_add(a, b)
+    return _double_to_f32(_two_sum_to_odd(x, y))
+
+
+cdef sf.float32_t _hw_f32_sub(sf.float32_t a, sf.float32_t b) noexcept nogil:
+    if not (_f32_is_finite(a) and _f32_is_finite(b)):
+        return sf.f32_sub(a, b)
+    cdef double x = _f32_to_double(a)
+    cdef double y = -_f32_to_double(b)
+    if x + y == 0.0:  # the sign of an exact zero difference depends on the rounding mode
+        return sf.f32_sub(a, b)
+    return _double_to_f32(_two_sum_to_odd(x, y))
+
+
+cdef sf.float32_t _hw_f32_mul(sf.float32_t a, sf.float32_t b) noexcept nogil:
+    if not (_f32_is_finite(a) and _f32_is_finite(b)):
+        return sf.f32_mul(a, b)
+    return _double_to_f32(_f32_to_double(a) * _f32_to_double(b))  # exact
+
+
+cdef sf.float32_t _hw_f32_div(sf.float32_t a, sf.float32_t b) noexcept nogil:
+    if not (_f32_is_finite(a) and _f32_is_finite(b)) or _f32_is_zero(b):
+        return sf.f32_div(a, b)
+    return _double_to_f32(_div_to_odd(_f32_to_double(a), _f32_to_double(b)))
+
+
+cdef sf.float32_t _hw_f32_sqrt(sf.float32_t a) noexcept nogil:
+    if not _f32_is_finite(a) or (a.v >> 31 != 0 and not _f32_is_zero(a)):
+        return sf.f32_sqrt(a)
+    return _double_to_f32(_sqrt_to_odd(_f32_to_double(a)))
+
+
+# The vector loops of the hardware engine process the operands in blocks. The first pass over
+# a block has no branches, so that the compiler maps it onto the SIMD lanes of the target.
+# It rounds to nearest even the results in the normal range of the target format by integer
+# operations, and marks the other elements, which the second pass computes one by one.
+
+cdef enum:
+    _VECTOR_BLOCK = 256
+    _VECTOR_FALLBACK = 0x80  # The bit 7 of the status, which the exception flags do not use.
+
+
+cdef inline double _f16_widen(uint16_t a) noexcept nogil:
+    # Converts the binary16 floating point to binary64 exactly, without branches.
+    # Infinities and NaNs are converted to meaningless finite values.
+    cdef uint32_t exp = (a >> 10) & 0x1F
+    cdef int32_t sig = <int32_t>((a & 0x3FF) | (<uint32_t>(exp != 0) << 10))
+    cdef _ui64_double t
+    t.ui = (<uint64_t>(exp + (exp == 0) + 998) << 52) | (<uint64_t>(a >> 15) << 63)
+    return <double>sig * t.f
+
+
+cdef inline uint8_t _f16_special(uint16_t a) noexcept nogil:
+    return <uint8_t>((a & 0x7C00) == 0x7C00) << 7
+
+
+cdef inline uint16_t _f16_narrow(double x, uint8_t* status) noexcept nogil:
+    # Rounds the binary64 floating point to nearest even in binary16, without branches.
+    # Stores the exception flags to status, or _VECTOR_FALLBACK if the result is not normal.
+    # The comparisons are done in 32 bits, which the SIMD instructions of all the targets support.
+    cdef _ui64_double t
+    t.f = x
+    cdef uint64_t u = t.ui & <uint64_t>0x7FFFFFFFFFFFFFFF
+    cdef uint32_t e = <uint32_t>(u >> 52)
+    cdef uint32_t r = <uint32_t>(((u + <uint64_t>0x1FFFFFFFFFF + ((u >> 42) & 1)) >> 42) - (<uint64_t>1008 << 10))
+    cdef bint normal = (e >= 1009) & (e <= 1038) & (r < (<uint32_t>31 << 10))
+    cdef bint inexact = ((<uint32_t>u | (<uint32_t>(u >> 32) & 0x3FF)) != 0) & normal
+    status[0] = (<uint8_t>inexact * <uint8_t>sf.softfloat_flag_inexact) | (<uint8_t>(not normal) << 7)
+    return <uint16_t>((t.ui >> 48) & 0x8000) | <uint16_t>r
+
+
+cdef inline double _f32_widen(uint32_t a) noexcept nogil:
+    # Converts the binary32 floating point to binary64 exactly, without branches.
+    # Infinities and NaNs are converted to meaningless finite values.
+    cdef uint32_t exp = (a >> 23) & 0xFF
+    cdef int32_t sig = <int32_t>((a & 0x7FFFFF) | (<uint32_t>(exp != 0) << 23))
+    cdef _ui64_double t
+    t.ui = (<uint64_t>(exp + (exp == 0) + 873) << 52) | (<uint64_t>(a >> 31) << 63)
+    return <double>sig * t.f
+
+
+cdef inline uint8_t _f32_special(uint32_t a) noexcept nogil:
+    return <uint8_t>((a & 0x7F800000) == 0x7F800000) << 7
+
+
+cdef inline uint32_t _f32_narrow(double x, uint8_t* status) noexcept nogil:
+    # Rounds the binary64 floating point to nearest even in binary32, without branches.
+    # Stores the exception flags to status, or _VECTOR_FALLBACK if the result is not normal.
+    # The comparisons are done in 32 bits, which the SIMD instructions of all the targets support.
+    cdef _ui64_double t
+    t.f = x
+    cdef uint64_t u = t.ui & <uint64_t>0x7FFFFFFFFFFFFFFF
+    cdef uint32_t e = <uint32_t>(u >> 52)
+    cdef uint32_t r = <uint32_t>(((u + <uint64_t>0xFFFFFFF + ((u >> 29) & 1)) >> 29) - (<uint64_t>896 << 23))
+    cdef bint normal = (e >= 897) & (e <= 1150) & (r < (<uint32_t>255 << 23))
+    cdef bint inexact = ((<uint32_t>u & 0x1FFFFFFF) != 0) & normal
+    status[0] = (<uint8_t>inexact * <uint8_t>sf.softfloat_flag_inexact) | (<uint8_t>(not normal) << 7)
+    return <uint32_t>((t.ui >> 32) & <uint64_t>0x80000000) | r
+
+
+# The arithmetic of the 16-bit brain floating points is performed in binary32 rounded to odd,
+# and the result is rounded once to the 16-bit brain floating point in the current rounding mode.
+# Since binary32 has more than twice as many significant bits as the 16-bit brain floating point,
+# the second rounding is correct, and so are the exception flags. The underflow exception flag
+# of the binary32 operation is discarded, since the tininess is detected again by the rounding
+# to the 16-bit brain floating point. The overflow exception flag is kept, since the binary32
+# operation rounded to odd returns the largest finite number on overflow, which the rounding
+# toward zero does not detect as overflow.
+
+
+cdef inline void _bf16_enter(uint_fast8_t* mode, uint_fast8_t* flags) noexcept nogil:
+    mode[0] = sf.softfloat_roundingMode
+    flags[0] = sf.softfloat_exceptionFlags
+    sf.softfloat_roundingMode = sf.softfloat_round_odd
+    sf.softfloat_exceptionFlags = 0
+
+
+cdef inline sf.bfloat16_t _bf16_exit(sf.float32_t z, uint_fast8_t mode, uint_fast8_t flags) noexcept nogil:
+    sf.softfloat_roundingMode = mode
+    sf.softfloat_exceptionFlags = flags | (sf.softfloat_exceptionFlags & ~<uint_fast8_t>sf.softfloat_flag_underflow)
+    return sf.f32_to_bf16(z)
+
+
+cdef sf.bfloat16_t _bf16_roundToInt(sf.bfloat16_t a, uint_fast8_t rounding_mode, bint exact) noexcept nogil:
+    # The integers are exactly representable, since the magnitude of the non-integer is below 2^7.
+    return sf.f32_to_bf16(sf.f32_roundToInt(sf.bf16_to_f32(a), rounding_mode, exact))
+
+
+cdef sf.bfloat16_t _bf16_add(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    return _bf16_exit(sf.f32_add(sf.bf16_to_f32(a), sf.bf16_to_f32(b)), mode, flags)
+
+
+cdef sf.bfloat16_t _bf16_sub(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    return _bf16_exit(sf.f32_sub(sf.bf16_to_f32(a), sf.bf16_to_f32(b)), mode, flags)
+
+
+cdef sf.bfloat16_t _bf16_mul(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    return _bf16_exit(sf.f32_mul(sf.bf16_to_f32(a), sf.bf16_to_f32(b)), mode, flags)
+
+
+cdef sf.bfloat16_t _bf16_mulAdd(sf.bfloat16_t a, sf.bfloat16_t b, sf.bfloat16_t c) noexcept nogil:
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    return _bf16_exit(sf.f32_mulAdd(sf.bf16_to_f32(a), sf.bf16_to_f32(b), sf.bf16_to_f32(c)), mode, flags)
+
+
+cdef sf.bfloat16_t _bf16_div(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    return _bf16_exit(sf.f32_div(sf.bf16_to_f32(a), sf.bf16_to_f32(b)), mode, flags)
+
+
+cdef sf.bfloat16_t _bf16_rem(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    # The remainder is exact.
+    return sf.f32_to_bf16(sf.f32_rem(sf.bf16_to_f32(a), sf.bf16_to_f32(b)))
+
+
+cdef sf.bfloat16_t _bf16_sqrt(sf.bfloat16_t a) noexcept nogil:
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    return _bf16_exit(sf.f32_sqrt(sf.bf16_to_f32(a)), mode, flags)
+
+
+cdef _c_bool _bf16_eq(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    return sf.f32_eq(sf.bf16_to_f32(a), sf.bf16_to_f32(b))
+
+
+cdef _c_bool _bf16_le(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    return sf.f32_le(sf.bf16_to_f32(a), sf.bf16_to_f32(b))
+
+
+cdef _c_bool _bf16_lt(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    return sf.f32_lt(sf.bf16_to_f32(a), sf.bf16_to_f32(b))
+
+
+cdef _c_bool _bf16_eq_signaling(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    return sf.f32_eq_signaling(sf.bf16_to_f32(a), sf.bf16_to_f32(b))
+
+
+cdef _c_bool _bf16_le_quiet(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    return sf.f32_le_quiet(sf.bf16_to_f32(a), sf.bf16_to_f32(b))
+
+
+cdef _c_bool _bf16_lt_quiet(sf.bfloat16_t a, sf.bfloat16_t b) noexcept nogil:
+    return sf.f32_lt_quiet(sf.bf16_to_f32(a), sf.bf16_to_f32(b))
+
+
+cdef enum:
+    # The kinds of the lookup tables of the 16-bit unary operations.
+    _LUT_F16_SQRT = 0
+    _LUT_F16_ROUND_TO_INT = 1
+    _LUT_F16_TO_I32 = 2
+    _LUT_F16_TO_F32 = 3
+    _LUT_BF16_TO_F32 = 4
+
+
+cdef struct _Lut:
+    # The results and the exception flags of a 16-bit unary operation for all the inputs.
+    uint32_t values[65536]
+    uint8_t flags[65536]
+
+
+cdef _Lut* _luts[50]  # indexed by kind * 10 + rounding mode * 2 + exactness, built on demand
+
+cdef object _lut_lock = Lock()
+"""The lock guarding the construction of the lookup tables."""
+
+
+cdef extern from *:
+    """
+    /* Without the GIL, the pointers to the lookup tables are published with the release ordering and read with
+       the acquire ordering, so that the contents of a table are visible to the threads that see its pointer. */
+    #if PY_VERSION_HEX >= 0x030D0000 && !defined(Py_LIMITED_API)
+    #define SOFTFLOATPY_LOAD_ACQUIRE(p) _Py_atomic_load_ptr_acquire(p)
+    #define SOFTFLOATPY_STORE_RELEASE(p, v) _Py_atomic_store_ptr_release((p), (v))
+    #else
+    #define SOFTFLOATPY_LOAD_ACQUIRE(p) (*(void* const*)(p))
+    #define SOFTFLOATPY_STORE_RELEASE(p, v) ((void)(*(void**)(p) = (v)))
+    #endif
+    """
+    void* _load_acquire "SOFTFLOATPY_LOAD_ACQUIRE"(void** p) noexcept nogil
+    void _store_release "SOFTFLOATPY_STORE_RELEASE"(void** p, void* v) noexcept nogil
+
+cdef _Lut* _build_lut(int kind, uint_fast8_t rounding_mode, bint exact) except NULL:
+    cdef _Lut* t = <_Lut*>PyMem_Malloc(sizeof(_Lut))
+    if t == NULL:
+        raise MemoryError()
+    cdef _State saved
+    cdef sf.float16_t a
+    cdef sf.bfloat16_t b
+    cdef uint32_t i
+    with nogil:
+        saved.rounding_mode = sf.softfloat_roundingMode
+        saved.flags = sf.softfloat_exceptionFlags
+        sf.softfloat_roundingMode = rounding_mode
+        for i in range(65536):
+            a.v = <uint16_t>i
+            b.v = <uint16_t>i
+            sf.softfloat_exceptionFlags = 0
+            if kind == _LUT_F16_SQRT:
+                t.values[i] = sf.f16_sqrt(a).v
+            elif kind == _LUT_F16_ROUND_TO_INT:
+                t.values[i] = sf.f16_roundToInt(a, rounding_mode, exact).v
+            elif kind == _LUT_F16_TO_I32:
+                t.values[i] = <uint32_t>sf.f16_to_i32(a, rounding_mode, exact)
+            elif kind == _LUT_F16_TO_F32:
+                t.values[i] = sf.f16_to_f32(a).v
+            else:
+                t.values[i] = sf.bf16_to_f32(b).v
+            t.flags[i] = sf.softfloat_exceptionFlags
+        sf.softfloat_roundingMode = saved.rounding_mode
+        sf.softfloat_exceptionFlags = saved.flags
+    return t
+
+
+cdef const _Lut* _get_lut(int kind, uint_fast8_t rounding_mode, bint exact) except? NULL:
+    # Returns NULL for the rounding modes without tables, such as round-to-odd.
+    if rounding_mode > <uint_fast8_t>RoundingMode.NEAR_MAX_MAG:
+        return NULL
+    cdef Py_ssize_t index = kind * 10 + rounding_mode * 2 + exact
+    cdef _Lut* t = <_Lut*>_load_acquire(<void**>&_luts[index])
+    if t == NULL:
+        with _lut_lock:
+            t = _luts[index]
+            if t == NULL:
+                t = _build_lut(kind, rounding_mode, exact)
+                _store_release(<void**>&_luts[index], t)
+    return t
+
+
+cdef inline uint32_t _lut_apply(const _Lut* t, uint16_t v) noexcept nogil:
+    sf.softfloat_exceptionFlags |= t.flags[v]
+    return t.values[v]
+
+
+cpdef Float16 ui32_to_f16(UInt32 x):
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    return _make_float16(sf.ui32_to_f16(x._data))
+
+
+cpdef Float32 ui32_to_f32(UInt32 x):
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    return _make_float32(sf.ui32_to_f32(x._data))
+
+
+cpdef Float64 ui32_to_f64(UInt32 x):
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.ui32_to_f64(x._data))
+
+
+cpdef Float128 ui32_to_f128(UInt32 x):
+    """Converts the 32-bit unsigned integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 32-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.ui32_to_f128(x._data))
+
+
+cpdef Float16 ui64_to_f16(UInt64 x):
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    return _make_float16(sf.ui64_to_f16(x._data))
+
+
+cpdef Float32 ui64_to_f32(UInt64 x):
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    return _make_float32(sf.ui64_to_f32(x._data))
+
+
+cpdef Float64 ui64_to_f64(UInt64 x):
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.ui64_to_f64(x._data))
+
+
+cpdef Float128 ui64_to_f128(UInt64 x):
+    """Converts the 64-bit unsigned integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 64-bit unsigned integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.ui64_to_f128(x._data))
+
+
+cpdef Float16 i32_to_f16(Int32 x):
+    """Converts the 32-bit signed integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    return _make_float16(sf.i32_to_f16(x._data))
+
+
+cpdef Float32 i32_to_f32(Int32 x):
+    """Converts the 32-bit signed integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    return _make_float32(sf.i32_to_f32(x._data))
+
+
+cpdef Float64 i32_to_f64(Int32 x):
+    """Converts the 32-bit signed integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.i32_to_f64(x._data))
+
+
+cpdef Float128 i32_to_f128(Int32 x):
+    """Converts the 32-bit signed integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 32-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.i32_to_f128(x._data))
+
+
+cpdef Float16 i64_to_f16(Int64 x):
+    """Converts the 64-bit signed integer to an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    return _make_float16(sf.i64_to_f16(x._data))
+
+
+cpdef Float32 i64_to_f32(Int64 x):
+    """Converts the 64-bit signed integer to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    return _make_float32(sf.i64_to_f32(x._data))
+
+
+cpdef Float64 i64_to_f64(Int64 x):
+    """Converts the 64-bit signed integer to an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.i64_to_f64(x._data))
+
+
+cpdef Float128 i64_to_f128(Int64 x):
+    """Converts the 64-bit signed integer to an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The 64-bit signed integer to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.i64_to_f128(x._data))
+
+
+cpdef UInt32 f16_to_ui32(
+    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    return _make_uint32(sf.f16_to_ui32(x._data, rounding_mode, exact))
+
+
+cpdef UInt64 f16_to_ui64(
+    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    return _make_uint64(sf.f16_to_ui64(x._data, rounding_mode, exact))
+
+
+cpdef Int32 f16_to_i32(
+    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    cdef const _Lut* t = _get_lut(_LUT_F16_TO_I32, <uint_fast8_t>rounding_mode, exact)
+    if t == NULL:
+        return _make_int32(sf.f16_to_i32(x._data, rounding_mode, exact))
+    return _make_int32(<int32_t>_lut_apply(t, x._data.v))
+
+
+cpdef Int64 f16_to_i64(
+    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    return _make_int64(sf.f16_to_i64(x._data, rounding_mode, exact))
+
+
+cpdef Float32 f16_to_f32(Float16 x):
+    """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    cdef const _Lut* t = _get_lut(_LUT_F16_TO_F32, 0, False)
+    cdef sf.float32_t z
+    z.v = _lut_apply(t, x._data.v)
+    return _make_float32(z)
+
+
+cpdef Float64 f16_to_f64(Float16 x):
+    """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.f16_to_f64(x._data))
+
+
+cpdef Float128 f16_to_f128(Float16 x):
+    """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.f16_to_f128(x._data))
+
+
+cpdef Float16 f16_round_to_int(
+    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Rounds the number expressed as an IEEE 754 binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary16 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary16 floating point.
+
+    """
+    cdef const _Lut* t = _get_lut(_LUT_F16_ROUND_TO_INT, <uint_fast8_t>rounding_mode, exact)
+    cdef sf.float16_t z
+    if t == NULL:
+        return _make_float16(sf.f16_roundToInt(x._data, rounding_mode, exact))
+    z.v = <uint16_t>_lut_apply(t, x._data.v)
+    return _make_float16(z)
+
+
+cpdef Float16 f16_neg(Float16 x):
+    """Negates the IEEE 754 binary16 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``-x``).
+
+    """
+    cdef sf.float16_t d
+    d.v = x._data.v ^ <uint16_t>0x8000
+    return _make_float16(d)
+
+
+cpdef Float16 f16_add(Float16 x, Float16 y):
+    """Adds the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x + y``).
+
+    """
+    if _hardware:
+        return _make_float16(_hw_f16_add(x._data, y._data))
+    return _make_float16(sf.f16_add(x._data, y._data))
+
+
+cpdef Float16 f16_sub(Float16 x, Float16 y):
+    """Subtracts the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x - y``).
+
+    """
+    if _hardware:
+        return _make_float16(_hw_f16_sub(x._data, y._data))
+    return _make_float16(sf.f16_sub(x._data, y._data))
+
+
+cpdef Float16 f16_mul(Float16 x, Float16 y):
+    """Multiplies the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y``).
+
+    """
+    if _hardware:
+        return _make_float16(_hw_f16_mul(x._data, y._data))
+    return _make_float16(sf.f16_mul(x._data, y._data))
+
+
+cpdef Float16 f16_mul_add(Float16 x, Float16 y, Float16 z):
+    """Multiplies and Adds the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y + z``).
+
+    """
+    return _make_float16(sf.f16_mulAdd(x._data, y._data, z._data))
+
+
+cpdef Float16 f16_div(Float16 x, Float16 y):
+    """Divides the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x / y``).
+
+    """
+    if _hardware:
+        return _make_float16(_hw_f16_div(x._data, y._data))
+    return _make_float16(sf.f16_div(x._data, y._data))
+
+
+cpdef Float16 f16_rem(Float16 x, Float16 y):
+    """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``x % y``).
+
+    """
+    return _make_float16(sf.f16_rem(x._data, y._data))
+
+
+cpdef Float16 f16_sqrt(Float16 x):
+    """Calculates a square root of the IEEE 754 binary16 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary16 floating point (``sqrt(x)``).
+
+    """
+    cdef const _Lut* t = _get_lut(_LUT_F16_SQRT, sf.softfloat_roundingMode, False)
+    cdef sf.float16_t z
+    if t == NULL:
+        return _make_float16(sf.f16_sqrt(x._data))
+    z.v = <uint16_t>_lut_apply(t, x._data.v)
+    return _make_float16(z)
+
+
+cpdef bool f16_eq(Float16 x, Float16 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f16_eq(x._data, y._data)
+
+
+cpdef bool f16_le(Float16 x, Float16 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f16_le(x._data, y._data)
+
+
+cpdef bool f16_lt(Float16 x, Float16 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f16_lt(x._data, y._data)
+
+
+cpdef bool f16_eq_signaling(Float16 x, Float16 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f16_eq_signaling(x._data, y._data)
+
+
+cpdef bool f16_le_quiet(Float16 x, Float16 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f16_le_quiet(x._data, y._data)
+
+
+cpdef bool f16_lt_quiet(Float16 x, Float16 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f16_lt_quiet(x._data, y._data)
+
+
+cpdef bool f16_is_signaling_nan(Float16 x):
+    """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    return sf.f16_isSignalingNaN(x._data)
+
+
+cpdef Float32 bf16_to_f32(BFloat16 x):
+    """Converts the 16-bit brain floating point to an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The 16-bit brain floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    cdef const _Lut* t = _get_lut(_LUT_BF16_TO_F32, 0, False)
+    cdef sf.float32_t z
+    z.v = _lut_apply(t, x._data.v)
+    return _make_float32(z)
+
+
+cpdef BFloat16 f32_to_bf16(Float32 x):
+    """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The 16-bit brain floating point.
+
+    """
+    return _make_bfloat16(sf.f32_to_bf16(x._data))
+
+
+cpdef BFloat16 bf16_round_to_int(
+    BFloat16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Rounds the number expressed as an 16-bit brain floating point.
+
+    Args:
+        x: The 16-bit brain floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an 16-bit brain floating point.
+
+    """
+    return _make_bfloat16(_bf16_roundToInt(x._data, rounding_mode, exact))
+
+
+cpdef BFloat16 bf16_neg(BFloat16 x):
+    """Negates the 16-bit brain floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``-x``).
+
+    """
+    cdef sf.bfloat16_t d
+    d.v = x._data.v ^ <uint16_t>0x8000
+    return _make_bfloat16(d)
+
+
+cpdef BFloat16 bf16_add(BFloat16 x, BFloat16 y):
+    """Adds the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x + y``).
+
+    """
+    return _make_bfloat16(_bf16_add(x._data, y._data))
+
+
+cpdef BFloat16 bf16_sub(BFloat16 x, BFloat16 y):
+    """Subtracts the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x - y``).
+
+    """
+    return _make_bfloat16(_bf16_sub(x._data, y._data))
+
+
+cpdef BFloat16 bf16_mul(BFloat16 x, BFloat16 y):
+    """Multiplies the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x * y``).
+
+    """
+    return _make_bfloat16(_bf16_mul(x._data, y._data))
+
+
+cpdef BFloat16 bf16_mul_add(BFloat16 x, BFloat16 y, BFloat16 z):
+    """Multiplies and Adds the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x * y + z``).
+
+    """
+    return _make_bfloat16(_bf16_mulAdd(x._data, y._data, z._data))
+
+
+cpdef BFloat16 bf16_div(BFloat16 x, BFloat16 y):
+    """Divides the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x / y``).
+
+    """
+    return _make_bfloat16(_bf16_div(x._data, y._data))
+
+
+cpdef BFloat16 bf16_rem(BFloat16 x, BFloat16 y):
+    """Calculates a remainder by dividing the 16-bit brain floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``x % y``).
+
+    """
+    return _make_bfloat16(_bf16_rem(x._data, y._data))
+
+
+cpdef BFloat16 bf16_sqrt(BFloat16 x):
+    """Calculates a square root of the 16-bit brain floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an 16-bit brain floating point (``sqrt(x)``).
+
+    """
+    return _make_bfloat16(_bf16_sqrt(x._data))
+
+
+cpdef bool bf16_eq(BFloat16 x, BFloat16 y):
+    """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return _bf16_eq(x._data, y._data)
+
+
+cpdef bool bf16_le(BFloat16 x, BFloat16 y):
+    """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return _bf16_le(x._data, y._data)
+
+
+cpdef bool bf16_lt(BFloat16 x, BFloat16 y):
+    """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return _bf16_lt(x._data, y._data)
+
+
+cpdef bool bf16_eq_signaling(BFloat16 x, BFloat16 y):
+    """Tests if the first one is equal to the second one expressed as 16-bit brain floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return _bf16_eq_signaling(x._data, y._data)
+
+
+cpdef bool bf16_le_quiet(BFloat16 x, BFloat16 y):
+    """Tests if the first one is less than or equal to the second one expressed as 16-bit brain floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return _bf16_le_quiet(x._data, y._data)
+
+
+cpdef bool bf16_lt_quiet(BFloat16 x, BFloat16 y):
+    """Tests if the first one is less than the second one expressed as 16-bit brain floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return _bf16_lt_quiet(x._data, y._data)
+
+
+cpdef bool bf16_is_signaling_nan(BFloat16 x):
+    """Tests if the 16-bit brain floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    return sf.bf16_isSignalingNaN(x._data)
+
+
+cpdef UInt32 f32_to_ui32(
+    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    return _make_uint32(sf.f32_to_ui32(x._data, rounding_mode, exact))
+
+
+cpdef UInt64 f32_to_ui64(
+    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    return _make_uint64(sf.f32_to_ui64(x._data, rounding_mode, exact))
+
+
+cpdef Int32 f32_to_i32(
+    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    return _make_int32(sf.f32_to_i32(x._data, rounding_mode, exact))
+
+
+cpdef Int64 f32_to_i64(
+    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    return _make_int64(sf.f32_to_i64(x._data, rounding_mode, exact))
+
+
+cpdef Float16 f32_to_f16(Float32 x):
+    """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    return _make_float16(sf.f32_to_f16(x._data))
+
+
+cpdef Float64 f32_to_f64(Float32 x):
+    """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.f32_to_f64(x._data))
+
+
+cpdef Float128 f32_to_f128(Float32 x):
+    """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.f32_to_f128(x._data))
+
+
+cpdef Float32 f32_round_to_int(
+    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Rounds the number expressed as an IEEE 754 binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary32 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary32 floating point.
+
+    """
+    return _make_float32(sf.f32_roundToInt(x._data, rounding_mode, exact))
+
+
+cpdef Float32 f32_neg(Float32 x):
+    """Negates the IEEE 754 binary32 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``-x``).
+
+    """
+    cdef Float32 f = Float32.__new__(Float32)
+    f._data.v = x._data.v ^ <uint32_t>0x80000000
+    return f
+
+
+cpdef Float32 f32_add(Float32 x, Float32 y):
+    """Adds the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x + y``).
+
+    """
+    if _hardware:
+        return _make_float32(_hw_f32_add(x._data, y._data))
+    return _make_float32(sf.f32_add(x._data, y._data))
+
+
+cpdef Float32 f32_sub(Float32 x, Float32 y):
+    """Subtracts the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x - y``).
+
+    """
+    if _hardware:
+        return _make_float32(_hw_f32_sub(x._data, y._data))
+    return _make_float32(sf.f32_sub(x._data, y._data))
+
+
+cpdef Float32 f32_mul(Float32 x, Float32 y):
+    """Multiplies the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y``).
+
+    """
+    if _hardware:
+        return _make_float32(_hw_f32_mul(x._data, y._data))
+    return _make_float32(sf.f32_mul(x._data, y._data))
+
+
+cpdef Float32 f32_mul_add(Float32 x, Float32 y, Float32 z):
+    """Multiplies and Adds the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y + z``).
+
+    """
+    return _make_float32(sf.f32_mulAdd(x._data, y._data, z._data))
+
+
+cpdef Float32 f32_div(Float32 x, Float32 y):
+    """Divides the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x / y``).
+
+    """
+    if _hardware:
+        return _make_float32(_hw_f32_div(x._data, y._data))
+    return _make_float32(sf.f32_div(x._data, y._data))
+
+
+cpdef Float32 f32_rem(Float32 x, Float32 y):
+    """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``x % y``).
+
+    """
+    return _make_float32(sf.f32_rem(x._data, y._data))
+
+
+cpdef Float32 f32_sqrt(Float32 x):
+    """Calculates a square root of the IEEE 754 binary32 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary32 floating point (``sqrt(x)``).
+
+    """
+    if _hardware:
+        return _make_float32(_hw_f32_sqrt(x._data))
+    return _make_float32(sf.f32_sqrt(x._data))
+
+
+cpdef bool f32_eq(Float32 x, Float32 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f32_eq(x._data, y._data)
+
+
+cpdef bool f32_le(Float32 x, Float32 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f32_le(x._data, y._data)
+
+
+cpdef bool f32_lt(Float32 x, Float32 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f32_lt(x._data, y._data)
+
+
+cpdef bool f32_eq_signaling(Float32 x, Float32 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f32_eq_signaling(x._data, y._data)
+
+
+cpdef bool f32_le_quiet(Float32 x, Float32 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f32_le_quiet(x._data, y._data)
+
+
+cpdef bool f32_lt_quiet(Float32 x, Float32 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f32_lt_quiet(x._data, y._data)
+
+
+cpdef bool f32_is_signaling_nan(Float32 x):
+    """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    return sf.f32_isSignalingNaN(x._data)
+
+
+cpdef UInt32 f64_to_ui32(
+    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    return _make_uint32(sf.f64_to_ui32(x._data, rounding_mode, exact))
+
+
+cpdef UInt64 f64_to_ui64(
+    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    return _make_uint64(sf.f64_to_ui64(x._data, rounding_mode, exact))
+
+
+cpdef Int32 f64_to_i32(
+    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    return _make_int32(sf.f64_to_i32(x._data, rounding_mode, exact))
+
+
+cpdef Int64 f64_to_i64(
+    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    return _make_int64(sf.f64_to_i64(x._data, rounding_mode, exact))
+
+
+cpdef Float16 f64_to_f16(Float64 x):
+    """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    return _make_float16(sf.f64_to_f16(x._data))
+
+
+cpdef Float32 f64_to_f32(Float64 x):
+    """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    return _make_float32(sf.f64_to_f32(x._data))
+
+
+cpdef Float128 f64_to_f128(Float64 x):
+    """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.f64_to_f128(x._data))
+
+
+cpdef Float64 f64_round_to_int(
+    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Rounds the number expressed as an IEEE 754 binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary64 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.f64_roundToInt(x._data, rounding_mode, exact))
+
+
+cpdef Float64 f64_neg(Float64 x):
+    """Negates the IEEE 754 binary64 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``-x``).
+
+    """
+    cdef Float64 f = Float64.__new__(Float64)
+    f._data.v = x._data.v ^ <uint64_t>0x80000000_00000000
+    return f
+
+
+cpdef Float64 f64_add(Float64 x, Float64 y):
+    """Adds the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x + y``).
+
+    """
+    return _make_float64(sf.f64_add(x._data, y._data))
+
+
+cpdef Float64 f64_sub(Float64 x, Float64 y):
+    """Subtracts the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x - y``).
+
+    """
+    return _make_float64(sf.f64_sub(x._data, y._data))
+
+
+cpdef Float64 f64_mul(Float64 x, Float64 y):
+    """Multiplies the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y``).
+
+    """
+    return _make_float64(sf.f64_mul(x._data, y._data))
+
+
+cpdef Float64 f64_mul_add(Float64 x, Float64 y, Float64 z):
+    """Multiplies and Adds the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y + z``).
+
+    """
+    return _make_float64(sf.f64_mulAdd(x._data, y._data, z._data))
+
+
+cpdef Float64 f64_div(Float64 x, Float64 y):
+    """Divides the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x / y``).
+
+    """
+    return _make_float64(sf.f64_div(x._data, y._data))
+
+
+cpdef Float64 f64_rem(Float64 x, Float64 y):
+    """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``x % y``).
+
+    """
+    return _make_float64(sf.f64_rem(x._data, y._data))
+
+
+cpdef Float64 f64_sqrt(Float64 x):
+    """Calculates a square root of the IEEE 754 binary64 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary64 floating point (``sqrt(x)``).
+
+    """
+    return _make_float64(sf.f64_sqrt(x._data))
+
+
+cpdef bool f64_eq(Float64 x, Float64 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f64_eq(x._data, y._data)
+
+
+cpdef bool f64_le(Float64 x, Float64 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f64_le(x._data, y._data)
+
+
+cpdef bool f64_lt(Float64 x, Float64 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f64_lt(x._data, y._data)
+
+
+cpdef bool f64_eq_signaling(Float64 x, Float64 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f64_eq_signaling(x._data, y._data)
+
+
+cpdef bool f64_le_quiet(Float64 x, Float64 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f64_le_quiet(x._data, y._data)
+
+
+cpdef bool f64_lt_quiet(Float64 x, Float64 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f64_lt_quiet(x._data, y._data)
+
+
+cpdef bool f64_is_signaling_nan(Float64 x):
+    """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    return sf.f64_isSignalingNaN(x._data)
+
+
+cpdef UInt32 f128_to_ui32(
+    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit unsigned integer.
+
+    """
+    return _make_uint32(sf.f128_to_ui32(x._data, rounding_mode, exact))
+
+
+cpdef UInt64 f128_to_ui64(
+    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit unsigned integer.
+
+    """
+    return _make_uint64(sf.f128_to_ui64(x._data, rounding_mode, exact))
+
+
+cpdef Int32 f128_to_i32(
+    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 32-bit signed integer.
+
+    """
+    return _make_int32(sf.f128_to_i32(x._data, rounding_mode, exact))
+
+
+cpdef Int64 f128_to_i64(
+    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact conversion is unable.
+
+    Returns:
+        The 64-bit signed integer.
+
+    """
+    return _make_int64(sf.f128_to_i64(x._data, rounding_mode, exact))
+
+
+cpdef Float16 f128_to_f16(Float128 x):
+    """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary16 floating point.
+
+    """
+    return _make_float16(sf.f128_to_f16(x._data))
+
+
+cpdef Float32 f128_to_f32(Float128 x):
+    """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary32 floating point.
+
+    """
+    return _make_float32(sf.f128_to_f32(x._data))
+
+
+cpdef Float64 f128_to_f64(Float128 x):
+    """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be converted.
+
+    Returns:
+        The IEEE 754 binary64 floating point.
+
+    """
+    return _make_float64(sf.f128_to_f64(x._data))
+
+
+cpdef Float128 f128_round_to_int(
+    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
+):
+    """Rounds the number expressed as an IEEE 754 binary128 floating point.
+
+    Args:
+        x: The IEEE 754 binary128 floating point to be rounded.
+        rounding_mode: The rounding mode.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+
+    Returns:
+        The resulted integer expressed as an IEEE 754 binary128 floating point.
+
+    """
+    return _make_float128(sf.f128_roundToInt(x._data, rounding_mode, exact))
+
+
+cpdef Float128 f128_neg(Float128 x):
+    """Negates the IEEE 754 binary128 floating point.
+
+    Args:
+        x: The floating point to be negated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``-x``).
+
+    """
+    cdef ui128_f128 t
+    t.f = x._data
+    t.ui.v64 ^= <uint64_t>0x80000000_00000000
+    cdef Float128 o = Float128.__new__(Float128)
+    o._data = t.f
+    return o
+
+
+cpdef Float128 f128_add(Float128 x, Float128 y):
+    """Adds the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be added.
+        y: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x + y``).
+
+    """
+    return _make_float128(sf.f128_add(x._data, y._data))
+
+
+cpdef Float128 f128_sub(Float128 x, Float128 y):
+    """Subtracts the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be subtracted.
+        y: The floating point to subtract.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x - y``).
+
+    """
+    return _make_float128(sf.f128_sub(x._data, y._data))
+
+
+cpdef Float128 f128_mul(Float128 x, Float128 y):
+    """Multiplies the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y``).
+
+    """
+    return _make_float128(sf.f128_mul(x._data, y._data))
+
+
+cpdef Float128 f128_mul_add(Float128 x, Float128 y, Float128 z):
+    """Multiplies and Adds the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be multiplied.
+        y: The floating point to multiply.
+        z: The floating point to add.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y + z``).
+
+    """
+    return _make_float128(sf.f128_mulAdd(x._data, y._data, z._data))
+
+
+cpdef Float128 f128_div(Float128 x, Float128 y):
+    """Divides the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x / y``).
+
+    """
+    return _make_float128(sf.f128_div(x._data, y._data))
+
+
+cpdef Float128 f128_rem(Float128 x, Float128 y):
+    """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
+
+    Args:
+        x: The floating point to be divided.
+        y: The floating point to divide.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``x % y``).
+
+    """
+    return _make_float128(sf.f128_rem(x._data, y._data))
+
+
+cpdef Float128 f128_sqrt(Float128 x):
+    """Calculates a square root of the IEEE 754 binary128 floating point.
+
+    Args:
+        x: The floating point whose square root is to be calculated.
+
+    Returns:
+        The resulted number expressed as an IEEE 754 binary128 floating point (``sqrt(x)``).
+
+    """
+    return _make_float128(sf.f128_sqrt(x._data))
+
+
+cpdef bool f128_eq(Float128 x, Float128 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f128_eq(x._data, y._data)
+
+
+cpdef bool f128_le(Float128 x, Float128 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f128_le(x._data, y._data)
+
+
+cpdef bool f128_lt(Float128 x, Float128 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f128_lt(x._data, y._data)
+
+
+cpdef bool f128_eq_signaling(Float128 x, Float128 y):
+    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+
+    """
+    return sf.f128_eq_signaling(x._data, y._data)
+
+
+cpdef bool f128_le_quiet(Float128 x, Float128 y):
+    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+
+    """
+    return sf.f128_le_quiet(x._data, y._data)
+
+
+cpdef bool f128_lt_quiet(Float128 x, Float128 y):
+    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    Args:
+        x: The first floating point to be compared.
+        y: The second floating point to be compared.
+
+    Returns:
+        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+
+    """
+    return sf.f128_lt_quiet(x._data, y._data)
+
+
+cpdef bool f128_is_signaling_nan(Float128 x):
+    """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+
+    Args:
+        x: The floating point to be tested.
+
+    Returns:
+        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+
+    """
+    return sf.f128_isSignalingNaN(x._data)
+
+
+cdef enum:
+    _BIG_WORDS = 528
+    _FORMAT_SIZE = 48
+
+
+ctypedef struct _Big:
+    # A non-negative integer large enough to scale any binary128 floating point to integers.
+    uint32_t w[_BIG_WORDS]
+    Py_ssize_t n
+
+
+cdef inline void _big_trim(_Big* a) noexcept nogil:
+    while a.n > 0 and a.w[a.n - 1] == 0:
+        a.n -= 1
+
+
+cdef void _big_set(_Big* a, uint64_t hi, uint64_t lo, Py_ssize_t shift) noexcept nogil:
+    # Sets (hi * 2**64 + lo) * 2**shift.
+    cdef Py_ssize_t q = shift >> 5
+    cdef int r = shift & 31
+    cdef Py_ssize_t i
+    cdef uint32_t c = 0
+    cdef uint32_t v[4]
+    v[0] = <uint32_t>lo
+    v[1] = <uint32_t>(lo >> 32)
+    v[2] = <uint32_t>hi
+    v[3] = <uint32_t>(hi >> 32)
+    for i in range(q):
+        a.w[i] = 0
+    for i in range(4):
+        a.w[q + i] = (v[i] << r) | c
+        c = (v[i] >> (32 - r)) if r != 0 else 0
+    a.w[q + 4] = c
+    a.n = q + 5
+    _big_trim(a)
+
+
+cdef void _big_mul_small(_Big* a, uint32_t m) noexcept nogil:
+    cdef uint64_t c = 0
+    cdef Py_ssize_t i
+    for i in range(a.n):
+        c += <uint64_t>a.w[i] * m
+        a.w[i] = <uint32_t>c
+        c >>= 32
+    if c != 0:
+        a.w[a.n] = <uint32_t>c
+        a.n += 1
+
+
+cdef void _big_mul_pow10(_Big* a, Py_ssize_t k) noexcept nogil:
+    cdef uint32_t m = 1
+    while k >= 9:
+        _big_mul_small(a, 1000000000)
+        k -= 9
+    while k > 0:
+        m *= 10
+        k -= 1
+    if m != 1:
+        _big_mul_small(a, m)
+
+
+cdef void _big_shl(_Big* a, int shift) noexcept nogil:
+    # Shifts a to the left by fewer than 64 bits.
+    cdef Py_ssize_t q = shift >> 5
+    cdef int r = shift & 31
+    cdef Py_ssize_t i
+    if a.n == 0:
+        return
+    a.w[a.n + q] = 0
+    i = a.n - 1
+    while i >= 0:
+        if r != 0:
+            a.w[i + q + 1] |= a.w[i] >> (32 - r)
+        a.w[i + q] = a.w[i] << r
+        i -= 1
+    for i in range(q):
+        a.w[i] = 0
+    a.n += q + 1
+    _big_trim(a)
+
+
+cdef void _big_mul_sub(_Big* a, const _Big* b, uint32_t m) noexcept nogil:
+    # Subtracts b * m from a, which must not be less than b * m.
+    cdef uint64_t c = 0
+    cdef uint64_t s
+    cdef uint64_t borrow = 0
+    cdef Py_ssize_t i
+    for i in range(a.n):
+        if i < b.n:
+            c += <uint64_t>b.w[i] * m
+        s = <uint64_t>a.w[i] - <uint32_t>c - borrow
+        c >>= 32
+        a.w[i] = <uint32_t>s
+        borrow = s >> 63
+    _big_trim(a)
+
+
+cdef void _big_add(_Big* c, const _Big* a, const _Big* b) noexcept nogil:
+    # Sets a + b to c, which must not be a or b.
+    cdef const _Big* t
+    cdef uint64_t s = 0
+    cdef Py_ssize_t i
+    if a.n < b.n:
+        t = a
+        a = b
+        b = t
+    for i in range(a.n):
+        s += a.w[i]
+        if i < b.n:
+            s += b.w[i]
+        c.w[i] = <uint32_t>s
+        s >>= 32
+    c.n = a.n
+    if s != 0:
+        c.w[c.n] = <uint32_t>s
+        c.n += 1
+
+
+cdef void _big_sub(_Big* a, const _Big* b) noexcept nogil:
+    # Subtracts b from a, which must not be less than b.
+    cdef uint64_t s
+    cdef uint64_t borrow = 0
+    cdef Py_ssize_t i
+    for i in range(a.n):
+        s = <uint64_t>a.w[i] - (b.w[i] if i < b.n else 0) - borrow
+        a.w[i] = <uint32_t>s
+        borrow = s >> 63
+    _big_trim(a)
+
+
+cdef int _big_cmp(const _Big* a, const _Big* b) noexcept nogil:
+    cdef Py_ssize_t i
+    if a.n != b.n:
+        return 1 if a.n > b.n else -1
+    i = a.n - 1
+    while i >= 0:
+        if a.w[i] != b.w[i]:
+            return 1 if a.w[i] > b.w[i] else -1
+        i -= 1
+    return 0
+
+
+cdef Py_ssize_t _format_shortest(
+    char* out, bint sign, int_fast32_t exp, uint64_t hi, uint64_t lo, int frac_bits, int_fast32_t max_exp, int_fast32_t bias
+) noexcept nogil:
+    # Writes the shortest decimal string that rounds to the floating point to nearest, and returns its length.
+    # The floating point is given as the biased exponent and the fraction, and formatted in the same way as
+    # repr() of float. The digits are generated by the free-format algorithm of Burger and Dybvig.
+    cdef Py_ssize_t n = 0
+    cdef Py_ssize_t m, i, k
+    cdef bint closer, even, low, high
+    cdef int_fast32_t e
+    cdef int d, c
+    cdef char digits[40]
+    cdef _Big r, s, mp, mm, t
+    cdef _Big* pm
+    if sign:
+        out[n] = c'-'
+        n += 1
+    if exp == max_exp:
+        if hi != 0 or lo != 0:
+            memcpy(out, b'nan', 3)
+            return 3
+        memcpy(out + n, b'inf', 3)
+        return n + 3
+    if exp == 0 and hi == 0 and lo == 0:
+        memcpy(out + n, b'0.0', 3)
+        return n + 3
+    closer = hi == 0 and lo == 0 and exp > 1
+    pm = &mm if closer else &mp
+    if exp != 0:
+        if frac_bits >= 64:
+            hi |= <uint64_t>1 << (frac_bits - 64)
+        else:
+            lo |= <uint64_t>1 << frac_bits
+    e = (exp if exp != 0 else 1) - bias - frac_bits
+    even = (lo & 1) == 0
+    # The value is (r / s), and the halfway points to the neighbors are (r - mm) / s and (r + mp) / s.
+    # mm differs from mp only if the lower neighbor is closer, and pm points to the one in use.
+    if e >= 0:
+        _big_set(&r, hi, lo, e + (2 if closer else 1))
+        _big_set(&s, 0, 4 if closer else 2, 0)
+        _big_set(&mp, 0, 1, e + (1 if closer else 0))
+        if closer:
+            _big_set(&mm, 0, 1, e)
+    else:
+        _big_set(&r, hi, lo, 2 if closer else 1)
+        _big_set(&s, 0, 1, (2 if closer else 1) - e)
+        _big_set(&mp, 0, 2 if closer else 1, 0)
+        if closer:
+            _big_set(&mm, 0, 1, 0)
+    k = <Py_ssize_t>ceil(
+        (e + (128 - softfloat_countLeadingZeros64(hi) if hi != 0 else 64 - softfloat_countLeadingZeros64(lo)) - 1)
+        * 0.30102999566398114 - 1e-10
+    )
+    if k >= 0:
+        _big_mul_pow10(&s, k)
+    else:
+        _big_mul_pow10(&r, -k)
+        _big_mul_pow10(&mp, -k)
+        if closer:
+            _big_mul_pow10(&mm, -k)
+    while True:
+        _big_add(&t, &r, &mp)
+        c = _big_cmp(&t, &s)
+        if c < 0 or (c == 0 and not even):
+            break
+        _big_mul_small(&s, 10)
+        k += 1
+    # The top word of s is normalized to [2**27, 2**28), so that 10 * r has no more words than s,
+    # and the quotient estimated from the top words is exact or one less.
+    c = 60 - (64 - softfloat_countLeadingZeros64(s.w[s.n - 1]))
+    if c >= 32:
+        c -= 32
+    _big_shl(&r, c)
+    _big_shl(&s, c)
+    _big_shl(&mp, c)
+    if closer:
+        _big_shl(&mm, c)
+    # The value is 0.d1 d2 d3 ... times 10 ** k.
+    m = 0
+    while True:
+        _big_mul_small(&r, 10)
+        _big_mul_small(&mp, 10)
+        if closer:
+            _big_mul_small(&mm, 10)
+        d = (r.w[s.n - 1] if r.n == s.n else 0) // (s.w[s.n - 1] + 1)
+        if d != 0:
+            _big_mul_sub(&r, &s, d)
+        if _big_cmp(&r, &s) >= 0:
+            _big_sub(&r, &s)
+            d += 1
+        if m == 0 and d == 0:
+            # The gap to the neighbors is so large that 10 ** k exceeds the value tenfold. The leading zero is
+            # skipped to choose the closest one among the shortest strings, and the first digit may then carry.
+            k -= 1
+            continue
+        c = _big_cmp(&r, pm)
+        low = c < 0 or (c == 0 and even)
+        _big_add(&t, &r, &mp)
+        c = _big_cmp(&t, &s)
+        high = c > 0 or (c == 0 and even)
+        if low and high:
+            _big_add(&t, &r, &r)
+            c = _big_cmp(&t, &s)
+            if c > 0 or (c == 0 and d % 2 == 1):
+                d += 1
+        elif high:
+            d += 1
+        if d == 10:
+            d = 1
+            k += 1
+        digits[m] = <char>(c'0' + d)
+        m += 1
+        if low or high:
+            break
+    if k <= -4 or k > 16:
+        out[n] = digits[0]
+        n += 1
+        if m > 1:
+            out[n] = c'.'
+            memcpy(out + n + 1, digits + 1, m - 1)
+            n += m
+        out[n] = c'e'
+        out[n + 1] = c'-' if k - 1 < 0 else c'+'
+        n += 2
+        e = k - 1 if k - 1 >= 0 else 1 - k
+        if e >= 1000:
+            out[n] = <char>(c'0' + e // 1000)
+            n += 1
+        if e >= 100:
+            out[n] = <char>(c'0' + e // 100 % 10)
+            n += 1
+        out[n] = <char>(c'0' + e // 10 % 10)
+        out[n + 1] = <char>(c'0' + e % 10)
+        return n + 2
+    if k <= 0:
+        memcpy(out + n, b'0.000', 2 - k)
+        n += 2 - k
+        memcpy(out + n, digits, m)
+        return n + m
+    if k >= m:
+        memcpy(out + n, digits, m)
+        n += m
+        for i in range(k - m):
+            out[n + i] = c'0'
+        n += k - m
+        memcpy(out + n, b'.0', 2)
+        return n + 2
+    memcpy(out + n, digits, k)
+    out[n + k] = c'.'
+    memcpy(out + n + k + 1, digits + k, m - k)
+    return n + m + 1
+
+
+cdef inline Py_ssize_t _bf16_format(char* out, sf.bfloat16_t x) noexcept nogil:
+    return _format_shortest(out, x.v >> 15, (x.v >> 7) & 0xFF, 0, x.v & 0x7F, 7, 0xFF, 127)
+
+
+cdef inline Py_ssize_t _f16_format(char* out, sf.float16_t x) noexcept nogil:
+    return _format_shortest(out, x.v >> 15, (x.v >> 10) & 0x1F, 0, x.v & 0x3FF, 10, 0x1F, 15)
+
+
+cdef inline Py_ssize_t _f32_format(char* out, sf.float32_t x) noexcept nogil:
+    return _format_shortest(out, x.v >> 31, (x.v >> 23) & 0xFF, 0, x.v & 0x7FFFFF, 23, 0xFF, 127)
+
+
+cdef inline Py_ssize_t _f64_format(char* out, sf.float64_t x) noexcept nogil:
+    return _format_shortest(out, x.v >> 63, (x.v >> 52) & 0x7FF, 0, x.v & <uint64_t>0xFFFFFFFFFFFFF, 52, 0x7FF, 1023)
+
+
+cdef inline Py_ssize_t _f128_format(char* out, sf.float128_t x) noexcept nogil:
+    cdef ui128_f128 u
+    u.f = x
+    return _format_shortest(
+        out, u.ui.v64 >> 63, (u.ui.v64 >> 48) & 0x7FFF, u.ui.v64 & <uint64_t>0xFFFFFFFFFFFF, u.ui.v0, 112, 0x7FFF, 16383
+    )
+
+
+cdef bint _swaps_bytes(str byteorder) except -1:
+    # Returns True if the byte order differs from that of the host.
+    if byteorder == 'native':
+        return False
+    if byteorder != 'little' and byteorder != 'big':
+        raise ValueError("byteorder must be 'little', 'big', or 'native'")
+    return byteorder != sys.byteorder
+
+
+cdef inline uint16_t _bswap16(uint16_t x) noexcept nogil:
+    return <uint16_t>((x >> 8) | (x << 8))
+
+
+cdef inline uint32_t _bswap32(uint32_t x) noexcept nogil:
+    x = ((x >> 8) & <uint32_t>0x00FF00FF) | ((x & <uint32_t>0x00FF00FF) << 8)
+    return (x >> 16) | (x << 16)
+
+
+cdef inline uint64_t _bswap64(uint64_t x) noexcept nogil:
+    x = ((x >> 8) & <uint64_t>0x00FF00FF00FF00FF) | ((x & <uint64_t>0x00FF00FF00FF00FF) << 8)
+    x = ((x >> 16) & <uint64_t>0x0000FFFF0000FFFF) | ((x & <uint64_t>0x0000FFFF0000FFFF) << 16)
+    return (x >> 32) | (x << 32)
+
+
+cdef void _copy_elements(char* dst, const char* src, Py_ssize_t n, Py_ssize_t itemsize, bint swap) noexcept nogil:
+    # Copies n elements, reversing the bytes of each element if swap is true.
+    # The source and the destination need not be aligned.
+    cdef Py_ssize_t i
+    cdef uint16_t u16
+    cdef uint32_t u32
+    cdef uint64_t u64[2]
+    cdef uint64_t t
+    if not swap:
+        memcpy(dst, src, <size_t>(n * itemsize))
+    elif itemsize == 2:
+        for i in range(n):
+            memcpy(&u16, src + i * 2, 2)
+            u16 = _bswap16(u16)
+            memcpy(dst + i * 2, &u16, 2)
+    elif itemsize == 4:
+        for i in range(n):
+            memcpy(&u32, src + i * 4, 4)
+            u32 = _bswap32(u32)
+            memcpy(dst + i * 4, &u32, 4)
+    elif itemsize == 8:
+        for i in range(n):
+            memcpy(&u64[0], src + i * 8, 8)
+            u64[0] = _bswap64(u64[0])
+            memcpy(dst + i * 8, &u64[0], 8)
+    else:
+        for i in range(n):
+            memcpy(u64, src + i * 16, 16)
+            t = _bswap64(u64[0])
+            u64[0] = _bswap64(u64[1])
+            u64[1] = t
+            memcpy(dst + i * 16, u64, 16)
+
+
+# The accessors of an element of a packed array, which is given as the pointer to its native data.
+ctypedef object (*_get_fn)(const char* p)
+ctypedef int (*_set_fn)(char* p, object v) except -1
+ctypedef Py_ssize_t (*_format_fn)(char* out, const char* p) noexcept nogil
+
+
+
+cdef object _bf16_get(const char* p):
+    return _make_bfloat16((<const sf.bfloat16_t*>p)[0])
+
+
+cdef int _bf16_set(char* p, object v) except -1:
+    (<sf.bfloat16_t*>p)[0] = (<BFloat16?>v)._data
+    return 0
+
+
+cdef Py_ssize_t _bf16_format_at(char* out, const char* p) noexcept nogil:
+    return _bf16_format(out, (<const sf.bfloat16_t*>p)[0])
+
+
+cdef object _f16_get(const char* p):
+    return _make_float16((<const sf.float16_t*>p)[0])
+
+
+cdef int _f16_set(char* p, object v) except -1:
+    (<sf.float16_t*>p)[0] = (<Float16?>v)._data
+    return 0
+
+
+cdef Py_ssize_t _f16_format_at(char* out, const char* p) noexcept nogil:
+    return _f16_format(out, (<const sf.float16_t*>p)[0])
+
+
+cdef object _f32_get(const char* p):
+    return _make_float32((<const sf.float32_t*>p)[0])
+
+
+cdef int _f32_set(char* p, object v) except -1:
+    (<sf.float32_t*>p)[0] = (<Float32?>v)._data
+    return 0
+
 
-    The object is immutable.
+cdef Py_ssize_t _f32_format_at(char* out, const char* p) noexcept nogil:
+    return _f32_format(out, (<const sf.float32_t*>p)[0])
 
-    The following operators are supported:
 
-    - unary operators: ``+``, ``-``.
-    - binary operators: ``+``, ``-``, ``*``, ``/``, ``//``, ``%``,
-      ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=``,
-      ``+=``, ``-=``, ``*=``, ``/=``, ``//=``, ``%=``.
+cdef object _f64_get(const char* p):
+    return _make_float64((<const sf.float64_t*>p)[0])
 
-    The following operators are unsupported:
 
-    - unary operator: ``~``.
-    - binary operators: ``<<``, ``>>``, ``&``, ``|``, ``^``, ``**``,
-      ``<<=``, ``>>=``, ``&=``, ``|=``, ``^=``, ``**=``.
+cdef int _f64_set(char* p, object v) except -1:
+    (<sf.float64_t*>p)[0] = (<Float64?>v)._data
+    return 0
 
-    Note:
-        Currently, cannot represent the exact number as a string
-        if the number is unable to be expressed as an IEEE 754 binary64 floating point.
 
-    """
+cdef Py_ssize_t _f64_format_at(char* out, const char* p) noexcept nogil:
+    return _f64_format(out, (<const sf.float64_t*>p)[0])
 
-    cdef sf.float128_t _data
-    """The native data."""
 
-    cpdef sf.float128_t _get_data(self):  # To access the native data in another instance.
-        return self._data
+cdef object _f128_get(const char* p):
+    return _make_float128((<const sf.float128_t*>p)[0])
 
-    @classmethod
-    def size(cls) -> int:
-        """Returns the native data size in bits.
 
-        Returns:
-            The native data size in bits, i.e. 128.
+cdef int _f128_set(char* p, object v) except -1:
+    (<sf.float128_t*>p)[0] = (<Float128?>v)._data
+    return 0
 
-        """
-        return 128
 
-    @classmethod
-    def from_bytes(cls, bytes src) -> Float128:
-        """Creates a new instance from the specified byte sequence.
+cdef Py_ssize_t _f128_format_at(char* out, const char* p) noexcept nogil:
+    return _f128_format(out, (<const sf.float128_t*>p)[0])
 
-        Args:
-            src: The byte sequence representing the native data with big endian.
-                 The length must be 16.
 
-        Returns:
-            A new instance created from the specified byte sequence.
+cdef class _FloatArray:
+    """The base class of the packed floating-point arrays."""
 
-        Raises:
-            ValueError: If the length of bytes is not 16.
+    cdef char* _ptr
+    """The pointer to the native data."""
 
-        """
-        if len(src) != 16:
-            raise ValueError('length of bytes must be 16')
-        cdef const uint8_t[:] a = src
-        cdef ui128_f128 t
-        t.ui.v0 = (
-            (<uint64_t>a[0] << 56) |
-            (<uint64_t>a[1] << 48) |
-            (<uint64_t>a[2] << 40) |
-            (<uint64_t>a[3] << 32) |
-            (<uint64_t>a[4] << 24) |
-            (<uint64_t>a[5] << 16) |
-            (<uint64_t>a[6] << 8) |
-            <uint64_t>a[7]
-        )
-        t.ui.v64 = (
-            (<uint64_t>a[8] << 56) |
-            (<uint64_t>a[9] << 48) |
-            (<uint64_t>a[10] << 40) |
-            (<uint64_t>a[11] << 32) |
-            (<uint64_t>a[12] << 24) |
-            (<uint64_t>a[13] << 16) |
-            (<uint64_t>a[14] << 8) |
-            <uint64_t>a[15]
-        )
-        cdef Float128 o = Float128()
-        o._data = t.f
-        return o
+    cdef Py_ssize_t _length
+    """The number of the elements."""
 
-    cpdef bytes to_bytes(self):
-        """Returns the native data as a byte sequence.
+    cdef Py_ssize_t _itemsize
+    """The size of an element in bytes."""
 
-        Returns:
-            A byte sequence representing the native data with big endian.
-            The length is 16.
+    cdef bytes _format
+    """The element format of the buffer protocol."""
 
-        """
-        cdef uint8_t a[16]
-        cdef ui128_f128 t
-        t.f = self._data
-        a[0] = <uint8_t>(t.ui.v0 >> 56)
-        a[1] = <uint8_t>(t.ui.v0 >> 48)
-        a[2] = <uint8_t>(t.ui.v0 >> 40)
-        a[3] = <uint8_t>(t.ui.v0 >> 32)
-        a[4] = <uint8_t>(t.ui.v0 >> 24)
-        a[5] = <uint8_t>(t.ui.v0 >> 16)
-        a[6] = <uint8_t>(t.ui.v0 >> 8)
-        a[7] = <uint8_t>t.ui.v0
-        a[8] = <uint8_t>(t.ui.v64 >> 56)
-        a[9] = <uint8_t>(t.ui.v64 >> 48)
-        a[10] = <uint8_t>(t.ui.v64 >> 40)
-        a[11] = <uint8_t>(t.ui.v64 >> 32)
-        a[12] = <uint8_t>(t.ui.v64 >> 24)
-        a[13] = <uint8_t>(t.ui.v64 >> 16)
-        a[14] = <uint8_t>(t.ui.v64 >> 8)
-        a[15] = <uint8_t>t.ui.v64
-        return <bytes>a[:16]
+    cdef type _scalar_type
+    """The floating-point class of the elements."""
 
-    @classmethod
-    def from_float(cls, double src) -> Float128:
-        """Creates a new instance from the specified floating point.
+    cdef _get_fn _get
+    """The function creating a floating point from an element."""
 
-        Args:
-            src: The floating point from which a new instance is created.
+    cdef _set_fn _set
+    """The function storing a floating point into an element."""
 
-        Returns:
-            A new instance created from the specified floating point.
+    cdef _format_fn _format_at
+    """The function writing the decimal string of an element."""
 
-        Note:
-            Cannot create an instance with a number that an IEEE 754 binary64
-            floating point is unable to express.
+    cdef bint _readonly
+    """``True`` if the elements are unable to be modified."""
 
-        """
-        cdef _ui64_double t
-        cdef sf.float64_t f
-        t.f = src
-        f.v = t.ui
-        cdef Float128 o = Float128()
-        o._data = sf.f64_to_f128(f)
-        return o
+    cdef Py_ssize_t _exports
+    """The number of the exported buffers."""
 
-    cpdef double to_float(self):
-        """Returns the native data as a floating point.
+    cdef Py_buffer _view
+    """The buffer whose memory holds the elements if :attr:`_viewing` is ``True``."""
 
-        Returns:
-            A floating point that represents the native data.
+    cdef bint _viewing
+    """``True`` if the elements are held in the memory of another buffer."""
 
-        Note:
-            Cannot return the exact number if it is unable to be expressed
-            as an IEEE 754 binary64 floating point.
+    def __init__(self, src=0):
+        """Creates a new instance.
 
-        """
-        cdef _ui64_double t
-        t.ui = sf.f128_to_f64(self._data).v
-        return t.f
+        Args:
+            src: The number of the elements initialized with positive zeros,
+                 or the elements from which a new instance is created.
+
+        """
+        if self._get == NULL:
+            raise TypeError('cannot create instances of the base class')
+        cdef list a = None if isinstance(src, int) else list(src)
+        cdef Py_ssize_t i
+        with cython.critical_section(self):
+            if a is None:
+                self._allocate(src)
+            else:
+                self._allocate(len(a))
+                for i in range(len(a)):
+                    self._set_item(i, a[i])
+
+    def __dealloc__(self):
+        self._release()
+
+    cdef void _release(self):
+        if self._viewing:
+            PyBuffer_Release(&self._view)
+            self._viewing = False
+        else:
+            PyMem_Free(self._ptr)
+
+    cdef int _allocate(self, Py_ssize_t length) except -1:
+        if length < 0:
+            raise ValueError('length must be non-negative')
+        if self._exports > 0:
+            raise BufferError('cannot reallocate the exported array')
+        cdef char* p = <char*>PyMem_Calloc(<size_t>(length if length > 0 else 1), <size_t>self._itemsize)
+        if p == NULL:
+            raise MemoryError()
+        self._release()
+        self._ptr = p
+        self._length = length
+        self._readonly = False
+        return 0
 
-    cpdef UInt32 to_ui32(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
+    @classmethod
+    def from_buffer(cls, src, str byteorder='native', Py_ssize_t count=-1, Py_ssize_t offset=0):
+        """Creates a new instance from the elements stored contiguously in the specified buffer.
 
-        The result is the same as that of :func:`f128_to_ui32()`.
+        If the byte order is that of the host and the elements are aligned, the new instance shares
+        the memory of the buffer without copying it, so that the modifications of either are visible
+        from the other. In this case, the new instance is read-only if the buffer is read-only.
+        Otherwise, the elements are copied with their bytes reversed as needed.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            src: The buffer that stores the elements.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
 
         Returns:
-            The 32-bit unsigned integer.
+            A new instance created from the elements stored in the specified buffer.
 
-        """
-        return f128_to_ui32(self, rounding_mode, exact)
+        Raises:
+            ValueError: If the byte order is unknown, or the buffer is too short.
+
+        """
+        cdef _FloatArray o = cls(0)
+        cdef bint swap = _swaps_bytes(byteorder)
+        cdef Py_buffer view
+        cdef char* p
+        PyObject_GetBuffer(src, &view, PyBUF_C_CONTIGUOUS)
+        try:
+            if offset < 0 or offset > view.len:
+                raise ValueError('offset out of range')
+            if count < 0:
+                if (view.len - offset) % o._itemsize != 0:
+                    raise ValueError(f'length of buffer must be a multiple of {o._itemsize}')
+                count = (view.len - offset) // o._itemsize
+            elif count > (view.len - offset) // o._itemsize:
+                raise ValueError('buffer is too short')
+            p = <char*>view.buf + offset
+            if swap or <size_t>p % <size_t>(o._itemsize if o._itemsize < 8 else 8) != 0:
+                o._allocate(count)
+                with nogil:
+                    _copy_elements(o._ptr, p, count, o._itemsize, swap)
+                return o
+            o._release()
+            o._ptr = p
+            o._length = count
+            o._readonly = view.readonly
+            o._view = view
+            o._viewing = True
+            return o
+        finally:
+            if not o._viewing:
+                PyBuffer_Release(&view)
 
-    cpdef UInt64 to_ui64(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
+    @classmethod
+    def from_file(cls, path, str byteorder='native', Py_ssize_t count=-1, Py_ssize_t offset=0, str mode='r'):
+        """Creates a new instance from the elements stored contiguously in the specified file.
 
-        The result is the same as that of :func:`f128_to_ui64()`.
+        The file is mapped into memory, and the elements are read from the pages on demand,
+        so that files larger than the physical memory can be processed by the batch operations.
+        In the byte order other than that of the host, the elements are copied as :meth:`from_buffer()` does.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            path: The path of the file.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+            count: The number of the elements, or -1 to take all the elements after the offset.
+            offset: The offset in bytes to the first element.
+            mode: ``'r'`` to map the file read-only, or ``'c'`` to map it copy-on-write,
+                  in which the modifications of the elements are not written to the file.
 
         Returns:
-            The 64-bit unsigned integer.
+            A new instance created from the elements stored in the specified file.
 
-        """
-        return f128_to_ui64(self, rounding_mode, exact)
+        Raises:
+            ValueError: If the byte order or the mode is unknown, or the file is too short.
 
-    cpdef Int32 to_i32(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
+        """
+        if mode != 'r' and mode != 'c':
+            raise ValueError("mode must be 'r' or 'c'")
+        with open(path, 'rb') as f:
+            if f.seek(0, 2) == 0:
+                return cls.from_buffer(b'', byteorder, count, offset)
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ if mode == 'r' else mmap.ACCESS_COPY)
+        return cls.from_buffer(m, byteorder, count, offset)
 
-        The result is the same as that of :func:`f128_to_i32()`.
+    def to_bytes(self, str byteorder='native') -> bytes:
+        """Returns the elements as bytes.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
 
         Returns:
-            The 32-bit signed integer.
+            The bytes that store the elements contiguously in the specified byte order.
 
-        """
-        return f128_to_i32(self, rounding_mode, exact)
+        Raises:
+            ValueError: If the byte order is unknown.
+
+        """
+        cdef bint swap = _swaps_bytes(byteorder)
+        cdef bytes b
+        cdef char* p
+        with cython.critical_section(self):
+            b = PyBytes_FromStringAndSize(NULL, self._length * self._itemsize)
+            p = PyBytes_AS_STRING(b)
+            with nogil:
+                _copy_elements(p, self._ptr, self._length, self._itemsize, swap)
+        return b
+
+    cdef object _get_item(self, Py_ssize_t i):
+        return self._get(self._ptr + i * self._itemsize)
+
+    cdef int _set_item(self, Py_ssize_t i, object v) except -1:
+        return self._set(self._ptr + i * self._itemsize, v)
+
+    cdef Py_ssize_t _format_item(self, char* out, Py_ssize_t i) noexcept nogil:
+        return self._format_at(out, self._ptr + i * self._itemsize)
+
+    cdef Py_ssize_t _check_index(self, Py_ssize_t i) except -1:
+        if i < 0:
+            i += self._length
+        if i < 0 or i >= self._length:
+            raise IndexError('index out of range')
+        return i
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key):
+        cdef Py_ssize_t first, last, start, stop, step, length, i
+        cdef _FloatArray o
+        if not isinstance(key, slice):
+            with cython.critical_section(self):
+                return self._get_item(self._check_index(key))
+        PySlice_Unpack(key, &first, &last, &step)
+        # The new array is created outside the critical section, and created again
+        # if the length of this array is changed concurrently before the elements are copied.
+        while True:
+            start, stop = first, last
+            length = PySlice_AdjustIndices(self._length, &start, &stop, step)
+            o = type(self)(length)
+            with cython.critical_section(self):
+                start, stop = first, last
+                if PySlice_AdjustIndices(self._length, &start, &stop, step) != length:
+                    continue
+                if step == 1:
+                    memcpy(o._ptr, self._ptr + start * self._itemsize, length * self._itemsize)
+                else:
+                    for i in range(length):
+                        memcpy(
+                            o._ptr + i * self._itemsize,
+                            self._ptr + (start + i * step) * self._itemsize,
+                            self._itemsize
+                        )
+                return o
+
+    def __setitem__(self, key, value):
+        cdef Py_ssize_t start, stop, step, length, i
+        cdef bint sliced = isinstance(key, slice)
+        cdef _FloatArray s = None
+        cdef list a = None
+        if sliced:
+            PySlice_Unpack(key, &start, &stop, &step)
+            if type(value) is type(self):
+                s = value[:] if value is self else value
+            else:
+                a = list(value)
+        # The source array is locked together, which is the same as locking only this one if s is None.
+        with cython.critical_section(self, s if s is not None else self):
+            if self._readonly:
+                raise TypeError('array is read-only')
+            if not sliced:
+                self._set_item(self._check_index(key), value)
+                return
+            length = PySlice_AdjustIndices(self._length, &start, &stop, step)
+            if s is not None:
+                if s._length != length:
+                    raise ValueError('length mismatch')
+                for i in range(length):
+                    memcpy(
+                        self._ptr + (start + i * step) * self._itemsize,
+                        s._ptr + i * self._itemsize,
+                        self._itemsize
+                    )
+            else:
+                if len(a) != length:
+                    raise ValueError('length mismatch')
+                for i in range(length):
+                    self._set_item(start + i * step, a[i])
+
+    def __iter__(self):
+        cdef Py_ssize_t i = 0
+        while True:
+            with cython.critical_section(self):
+                if i >= self._length:
+                    break
+                o = self._get_item(i)
+            yield o
+            i += 1
+
+    def to_str(self, str sep=', ') -> str:
+        """Returns the elements as decimal strings joined with the specified separator.
+
+        Each element is represented by the shortest decimal string that is rounded to the element,
+        which is the same as :func:`str()` of the element.
 
-    cpdef Int64 to_i64(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
+        Args:
+            sep: The separator inserted between the elements.
+
+        Returns:
+            The string that represents the elements.
+
+        """
+        cdef bytes b = sep.encode('utf-8')
+        cdef const char* p = b
+        cdef Py_ssize_t m = len(b)
+        cdef Py_ssize_t n = 0
+        cdef Py_ssize_t i
+        cdef char* buffer
+        with cython.critical_section(self):
+            buffer = <char*>PyMem_Malloc(<size_t>(self._length * (_FORMAT_SIZE + m) + 1))
+            if buffer == NULL:
+                raise MemoryError()
+            try:
+                with nogil:
+                    for i in range(self._length):
+                        if i > 0:
+                            memcpy(buffer + n, p, <size_t>m)
+                            n += m
+                        n += self._format_item(buffer + n, i)
+                return buffer[:n].decode('utf-8')
+            finally:
+                PyMem_Free(buffer)
 
-        The result is the same as that of :func:`f128_to_i64()`.
+    def __str__(self) -> str:
+        return '[' + self.to_str() + ']'
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        with cython.critical_section(self):
+            if (flags & PyBUF_WRITABLE) == PyBUF_WRITABLE and self._readonly:
+                raise BufferError('array is read-only')
+            buffer.buf = self._ptr
+            buffer.obj = self
+            buffer.len = self._length * self._itemsize
+            buffer.readonly = self._readonly
+            buffer.itemsize = self._itemsize
+            buffer.format = <char*>self._format if (flags & PyBUF_FORMAT) == PyBUF_FORMAT else NULL
+            buffer.ndim = 1
+            buffer.shape = &self._length if (flags & PyBUF_ND) == PyBUF_ND else NULL
+            buffer.strides = &self._itemsize if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
+            buffer.suboffsets = NULL
+            buffer.internal = NULL
+            self._exports += 1
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        with cython.critical_section(self):
+            self._exports -= 1
+
+    cdef object _operate(self, str name, object other, object out, bint reflected=False):
+        # The other operand is an array of the same class, a buffer of native data, or a floating point
+        # of the element class broadcast to all the elements. NotImplemented is returned for the others,
+        # so that Python tries the reflected operation of the other operand or raises TypeError.
+        # The reflected operations accept only the floating points, since a buffer on the left side,
+        # such as bytes, has its own meaning of the operators like concatenation.
+        if reflected:
+            if not isinstance(other, self._scalar_type):
+                return NotImplemented
+        elif not (
+            isinstance(other, (type(self), self._scalar_type))
+            or (not isinstance(other, _FloatArray) and PyObject_CheckBuffer(other) and not _is_zero_dim(other))
+        ):
+            return NotImplemented
+        if out is self and self._readonly:
+            raise TypeError('array is read-only')
+        kernel = _ARRAY_UFUNCS[type(self)][name][0]
+        return kernel(other, self, out=out) if reflected else kernel(self, other, out=out)
+
+    def __add__(self, other):
+        return self._operate('add', other, None)
+
+    def __sub__(self, other):
+        return self._operate('subtract', other, None)
+
+    def __mul__(self, other):
+        return self._operate('multiply', other, None)
+
+    def __truediv__(self, other):
+        return self._operate('divide', other, None)
+
+    def __radd__(self, other):
+        return self._operate('add', other, None, True)
+
+    def __rsub__(self, other):
+        return self._operate('subtract', other, None, True)
+
+    def __rmul__(self, other):
+        return self._operate('multiply', other, None, True)
+
+    def __rtruediv__(self, other):
+        return self._operate('divide', other, None, True)
+
+    def __iadd__(self, other):
+        return self._operate('add', other, self)
+
+    def __isub__(self, other):
+        return self._operate('subtract', other, self)
+
+    def __imul__(self, other):
+        return self._operate('multiply', other, self)
+
+    def __itruediv__(self, other):
+        return self._operate('divide', other, self)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Performs a NumPy universal function using the batch operations.
+
+        The supported universal functions are ``add``, ``subtract``, ``multiply``, ``divide``,
+        ``sqrt``, ``equal``, ``not_equal``, ``less``, ``less_equal``, ``greater``, and ``greater_equal``.
+        The comparisons return NumPy arrays of booleans.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact conversion is unable.
+            ufunc: The universal function.
+            method: The method of the universal function. Only ``'__call__'`` is supported.
+            inputs: The operands.
+            kwargs: The keyword arguments. Only ``out`` is supported.
+
+        Returns:
+            The result, or ``NotImplemented`` if the universal function or the operands are unsupported.
+
+        """
+        cdef dict kernels = _ARRAY_UFUNCS.get(type(self), {})
+        if method != '__call__' or ufunc.__name__ not in kernels:
+            return NotImplemented
+        for x in inputs:
+            if _is_zero_dim(x):
+                return NotImplemented
+        out = kwargs.pop('out', None)
+        if kwargs or (out is not None and len(out) != 1):
+            return NotImplemented
+        kernel, swapped, inverted = kernels[ufunc.__name__]
+        if swapped:
+            inputs = inputs[::-1]
+        if out is None:
+            r = kernel(*inputs)
+        else:
+            r = kernel(*inputs, out=out[0])
+        if isinstance(r, bytearray):
+            import numpy
+            r = numpy.frombuffer(r, dtype=numpy.bool_)
+        if inverted:
+            import numpy
+            numpy.logical_not(r, out=r)
+        return r
+
+
+cdef bint _is_zero_dim(object x):
+    # NumPy scalars and 0-d arrays expose buffers of a single element, which are not broadcast as floating points.
+    return getattr(x, 'ndim', None) == 0
+
+
+cdef class BFloat16Array(_FloatArray):
+    """A packed array of 16-bit brain floating points.
+
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`BFloat16` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
+
+    The buffer protocol is supported with the format ``'H'`` (16-bit unsigned integers).
+
+    """
+
+    def __cinit__(self, *args, **kwargs):
+        self._itemsize = 2
+        self._format = b'H'
+        self._scalar_type = BFloat16
+        self._get = _bf16_get
+        self._set = _bf16_set
+        self._format_at = _bf16_format_at
+
+    @classmethod
+    def from_floats(cls, src) -> BFloat16Array:
+        """Creates a new instance from the specified floating points.
+
+        Args:
+            src: The floating points from which a new instance is created.
 
         Returns:
-            The 64-bit signed integer.
+            A new instance created from the specified floating points.
 
         """
-        return f128_to_i64(self, rounding_mode, exact)
-
-    cpdef Float16 to_f16(self):
-        """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
+        cdef list a = list(src)
+        cdef BFloat16Array o = cls(len(a))
+        cdef sf.bfloat16_t* p = <sf.bfloat16_t*>o._ptr
+        cdef Py_ssize_t i
+        for i in range(len(a)):
+            p[i] = sf.f32_to_bf16(sf.f64_to_f32(_double_to_f64(a[i])))
+        return o
 
-        The result is the same as that of :func:`f128_to_f16()`.
+    cpdef list to_floats(self):
+        """Returns the elements as floating points.
 
         Returns:
-            The IEEE 754 binary16 floating point.
+            A list of floating points that represent the elements.
 
         """
-        return f128_to_f16(self)
+        cdef sf.bfloat16_t* p
+        with cython.critical_section(self):
+            p = <sf.bfloat16_t*>self._ptr
+            return [_f64_to_double(sf.f32_to_f64(sf.bf16_to_f32(p[i]))) for i in range(self._length)]
 
-    cpdef Float32 to_f32(self):
-        """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+    cpdef Float32Array to_f32(self):
+        """Converts the 16-bit brain floating points to IEEE 754 binary32 floating points.
 
-        The result is the same as that of :func:`f128_to_f32()`.
+        The result is the same as that of :func:`bf16_to_f32_array()`.
 
         Returns:
-            The IEEE 754 binary32 floating point.
+            The IEEE 754 binary32 floating points.
 
         """
-        return f128_to_f32(self)
+        return bf16_to_f32_array(self)
 
-    cpdef Float64 to_f64(self):
-        """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
 
-        The result is the same as that of :func:`f128_to_f64()`.
+cdef class Float16Array(_FloatArray):
+    """A packed array of IEEE 754 binary16 floating points.
 
-        Returns:
-            The IEEE 754 binary64 floating point.
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float16` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
 
-        """
-        return f128_to_f64(self)
+    The buffer protocol is supported with the format ``'H'`` (16-bit unsigned integers).
 
-    cpdef Float128 round_to_int(
-        self, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-    ):
-        """Rounds the number.
+    """
 
-        The result is the same as that of :func:`f128_round_to_int()`.
+    def __cinit__(self, *args, **kwargs):
+        self._itemsize = 2
+        self._format = b'H'
+        self._scalar_type = Float16
+        self._get = _f16_get
+        self._set = _f16_set
+        self._format_at = _f16_format_at
+
+    @classmethod
+    def from_floats(cls, src) -> Float16Array:
+        """Creates a new instance from the specified floating points.
 
         Args:
-            rounding_mode: The rounding mode.
-            exact: If ``True`` is specified, the floating-point exception flags are to be set
-                   when exact rounding is unable.
+            src: The floating points from which a new instance is created.
 
         Returns:
-            The resulted integer.
+            A new instance created from the specified floating points.
 
         """
-        return f128_round_to_int(self, rounding_mode, exact)
-
-    cpdef Float128 neg(self):
-        """Negates the IEEE 754 binary128 floating point.
+        cdef list a = list(src)
+        cdef Float16Array o = cls(len(a))
+        cdef sf.float16_t* p = <sf.float16_t*>o._ptr
+        cdef Py_ssize_t i
+        for i in range(len(a)):
+            p[i] = sf.f64_to_f16(_double_to_f64(a[i]))
+        return o
 
-        The result is the same as that of :func:`f128_neg()`.
+    cpdef list to_floats(self):
+        """Returns the elements as floating points.
 
         Returns:
-            The resulted number (``-x``).
+            A list of floating points that represent the elements.
 
         """
-        return f128_neg(self)
-
-    @classmethod
-    def add(cls, Float128 x, Float128 y) -> Float128:
-        """Adds the IEEE 754 binary128 floating points.
+        cdef sf.float16_t* p
+        with cython.critical_section(self):
+            p = <sf.float16_t*>self._ptr
+            return [_f64_to_double(sf.f16_to_f64(p[i])) for i in range(self._length)]
 
-        The result is the same as that of :func:`f128_add()`.
+    cpdef Float32Array to_f32(self):
+        """Converts the IEEE 754 binary16 floating points to binary32 floating points.
 
-        Args:
-            x: The floating point to be added.
-            y: The floating point to add.
+        The result is the same as that of :func:`f16_to_f32_array()`.
 
         Returns:
-            The resulted number (``x + y``).
+            The IEEE 754 binary32 floating points.
 
         """
-        return f128_add(x, y)
-
-    @classmethod
-    def sub(cls, Float128 x, Float128 y) -> Float128:
-        """Subtracts the IEEE 754 binary128 floating points.
+        return f16_to_f32_array(self)
 
-        The result is the same as that of :func:`f128_sub()`.
+    cpdef Float64Array to_f64(self):
+        """Converts the IEEE 754 binary16 floating points to binary64 floating points.
 
-        Args:
-            x: The floating point to be subtracted.
-            y: The floating point to subtract.
+        The result is the same as that of :func:`f16_to_f64_array()`.
 
         Returns:
-            The resulted number (``x - y``).
+            The IEEE 754 binary64 floating points.
 
         """
-        return f128_sub(x, y)
-
-    @classmethod
-    def mul(cls, Float128 x, Float128 y) -> Float128:
-        """Multiplies the IEEE 754 binary128 floating points.
+        return f16_to_f64_array(self)
 
-        The result is the same as that of :func:`f128_mul()`.
+    cpdef Float128Array to_f128(self):
+        """Converts the IEEE 754 binary16 floating points to binary128 floating points.
 
-        Args:
-            x: The floating point to be multiplied.
-            y: The floating point to multiply.
+        The result is the same as that of :func:`f16_to_f128_array()`.
 
         Returns:
-            The resulted number (``x * y``).
+            The IEEE 754 binary128 floating points.
 
         """
-        return f128_mul(x, y)
+        return f16_to_f128_array(self)
 
-    @classmethod
-    def mul_add(cls, Float128 x, Float128 y, Float128 z) -> Float128:
-        """Multiplies and Adds the IEEE 754 binary128 floating points.
 
-        The result is the same as that of :func:`f128_mul_add()`.
+cdef class Float32Array(_FloatArray):
+    """A packed array of IEEE 754 binary32 floating points.
 
-        Args:
-            x: The floating point to be multiplied.
-            y: The floating point to multiply.
-            z: The floating point to add.
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float32` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
 
-        Returns:
-            The resulted number (``x * y + z``).
+    The buffer protocol is supported with the format ``'I'`` (32-bit unsigned integers).
 
-        """
-        return f128_mul_add(x, y, z)
+    """
 
-    @classmethod
-    def div(cls, Float128 x, Float128 y) -> Float128:
-        """Divides the IEEE 754 binary128 floating points.
+    def __cinit__(self, *args, **kwargs):
+        self._itemsize = 4
+        self._format = b'I'
+        self._scalar_type = Float32
+        self._get = _f32_get
+        self._set = _f32_set
+        self._format_at = _f32_format_at
 
-        The result is the same as that of :func:`f128_div()`.
+    @classmethod
+    def from_floats(cls, src) -> Float32Array:
+        """Creates a new instance from the specified floating points.
 
         Args:
-            x: The floating point to be divided.
-            y: The floating point to divide.
+            src: The floating points from which a new instance is created.
 
         Returns:
-            The resulted number (``x / y``).
+            A new instance created from the specified floating points.
 
         """
-        return f128_div(x, y)
-
-    @classmethod
-    def rem(cls, Float128 x, Float128 y) -> Float128:
-        """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
-
-        The result is the same as that of :func:`f128_rem()`.
-
-        Args:
-            x: The floating point to be divided.
-            y: The floating point to divide.
+        cdef list a = list(src)
+        cdef Float32Array o = cls(len(a))
+        cdef sf.float32_t* p = <sf.float32_t*>o._ptr
+        cdef Py_ssize_t i
+        for i in range(len(a)):
+            p[i] = sf.f64_to_f32(_double_to_f64(a[i]))
+        return o
+
+    cpdef list to_floats(self):
+        """Returns the elements as floating points.
 
         Returns:
-            The resulted number (``x % y``).
+            A list of floating points that represent the elements.
 
         """
-        return f128_rem(x, y)
-
-    @classmethod
-    def sqrt(cls, Float128 x) -> Float128:
-        """Calculates a square root of the IEEE 754 binary128 floating point.
+        cdef sf.float32_t* p
+        with cython.critical_section(self):
+            p = <sf.float32_t*>self._ptr
+            return [_f64_to_double(sf.f32_to_f64(p[i])) for i in range(self._length)]
 
-        The result is the same as that of :func:`f128_sqrt()`.
+    cpdef BFloat16Array to_bf16(self):
+        """Converts the IEEE 754 binary32 floating points to 16-bit brain floating points.
 
-        Args:
-            x: The floating point whose square root is to be calculated.
+        The result is the same as that of :func:`f32_to_bf16_array()`.
 
         Returns:
-            The resulted number (``sqrt(x)``).
+            The 16-bit brain floating points.
 
         """
-        return f128_sqrt(x)
-
-    @classmethod
-    def eq(cls, Float128 x, Float128 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+        return f32_to_bf16_array(self)
 
-        The result is the same as that of :func:`f128_eq()`.
+    cpdef Float16Array to_f16(self):
+        """Converts the IEEE 754 binary32 floating points to binary16 floating points.
 
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
+        The result is the same as that of :func:`f32_to_f16_array()`.
 
         Returns:
-            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+            The IEEE 754 binary16 floating points.
 
         """
-        return f128_eq(x, y)
-
-    @classmethod
-    def le(cls, Float128 x, Float128 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+        return f32_to_f16_array(self)
 
-        The result is the same as that of :func:`f128_le()`.
+    cpdef Float64Array to_f64(self):
+        """Converts the IEEE 754 binary32 floating points to binary64 floating points.
 
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
+        The result is the same as that of :func:`f32_to_f64_array()`.
 
         Returns:
-            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+            The IEEE 754 binary64 floating points.
 
         """
-        return f128_le(x, y)
-
-    @classmethod
-    def lt(cls, Float128 x, Float128 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+        return f32_to_f64_array(self)
 
-        The result is the same as that of :func:`f128_lt()`.
+    cpdef Float128Array to_f128(self):
+        """Converts the IEEE 754 binary32 floating points to binary128 floating points.
 
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
+        The result is the same as that of :func:`f32_to_f128_array()`.
 
         Returns:
-            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+            The IEEE 754 binary128 floating points.
 
         """
-        return f128_lt(x, y)
+        return f32_to_f128_array(self)
 
-    @classmethod
-    def eq_signaling(cls, Float128 x, Float128 y) -> bool:
-        """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
 
-        The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+cdef class Float64Array(_FloatArray):
+    """A packed array of IEEE 754 binary64 floating points.
 
-        The result is the same as that of :func:`f128_eq_signaling()`.
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float64` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
 
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
+    The buffer protocol is supported with the format ``'Q'`` (64-bit unsigned integers).
 
-        Returns:
-            ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+    """
 
-        """
-        return f128_eq_signaling(x, y)
+    def __cinit__(self, *args, **kwargs):
+        self._itemsize = 8
+        self._format = b'Q'
+        self._scalar_type = Float64
+        self._get = _f64_get
+        self._set = _f64_set
+        self._format_at = _f64_format_at
 
     @classmethod
-    def le_quiet(cls, Float128 x, Float128 y) -> bool:
-        """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
-
-        The invalid exception flag is not set for quiet NaNs.
-
-        The result is the same as that of :func:`f128_le_quiet()`.
+    def from_floats(cls, src) -> Float64Array:
+        """Creates a new instance from the specified floating points.
 
         Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
+            src: The floating points from which a new instance is created.
 
         Returns:
-            ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+            A new instance created from the specified floating points.
 
         """
-        return f128_le_quiet(x, y)
+        cdef list a = list(src)
+        cdef Float64Array o = cls(len(a))
+        cdef sf.float64_t* p = <sf.float64_t*>o._ptr
+        cdef Py_ssize_t i
+        for i in range(len(a)):
+            p[i] = _double_to_f64(a[i])
+        return o
 
-    @classmethod
-    def lt_quiet(cls, Float128 x, Float128 y) -> bool:
-        """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+    cpdef list to_floats(self):
+        """Returns the elements as floating points.
 
-        The invalid exception flag is not set for quiet NaNs.
+        Returns:
+            A list of floating points that represent the elements.
 
-        The result is the same as that of :func:`f128_lt_quiet()`.
+        """
+        cdef sf.float64_t* p
+        with cython.critical_section(self):
+            p = <sf.float64_t*>self._ptr
+            return [_f64_to_double(p[i]) for i in range(self._length)]
 
-        Args:
-            x: The first floating point to be compared.
-            y: The second floating point to be compared.
+    cpdef Float16Array to_f16(self):
+        """Converts the IEEE 754 binary64 floating points to binary16 floating points.
+
+        The result is the same as that of :func:`f64_to_f16_array()`.
 
         Returns:
-            ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+            The IEEE 754 binary16 floating points.
 
         """
-        return f128_lt_quiet(x, y)
+        return f64_to_f16_array(self)
 
-    cpdef bool is_signaling_nan(self):
-        """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+    cpdef Float32Array to_f32(self):
+        """Converts the IEEE 754 binary64 floating points to binary32 floating points.
 
-        The result is the same as that of :func:`f128_is_signaling_nan()`.
+        The result is the same as that of :func:`f64_to_f32_array()`.
 
         Returns:
-            ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+            The IEEE 754 binary32 floating points.
 
         """
-        return f128_is_signaling_nan(self)
-
-    def __str__(self) -> str:
-        return str(self.to_float())
+        return f64_to_f32_array(self)
 
-    def __pos__(self) -> Self:
-        return _make_float128(self._data)
+    cpdef Float128Array to_f128(self):
+        """Converts the IEEE 754 binary64 floating points to binary128 floating points.
 
-    def __neg__(self) -> Self:
-        return f128_neg(self)
+        The result is the same as that of :func:`f64_to_f128_array()`.
 
-    def __add__(self, other: Self) -> Self:
-        return f128_add(self, other)
+        Returns:
+            The IEEE 754 binary128 floating points.
 
-    def __sub__(self, other: Self) -> Self:
-        return f128_sub(self, other)
+        """
+        return f64_to_f128_array(self)
 
-    def __mul__(self, other: Self) -> Self:
-        return f128_mul(self, other)
 
-    def __truediv__(self, other: Self) -> Self:
-        return f128_div(self, other)
+cdef class Float128Array(_FloatArray):
+    """A packed array of IEEE 754 binary128 floating points.
 
-    def __floordiv__(self, other: Self) -> Self:
-        return f128_round_to_int(f128_div(self, other), RoundingMode.MIN)
+    The elements are stored contiguously as their native data.
+    Indexing returns a :class:`Float128` instance, and slicing returns a new array.
+    The operators ``+``, ``-``, ``*``, and ``/`` perform the batch operations, in which either operand may be
+    a floating point broadcast to all the elements, and the augmented assignments such as ``+=`` store
+    the results into the array itself without allocating a new one.
 
-    def __mod__(self, other: Self) -> Self:
-        return f128_sub(self, f128_mul(other, f128_round_to_int(f128_div(self, other), RoundingMode.MIN)))
+    The buffer protocol is supported with the format ``'2Q'`` (pairs of 64-bit unsigned integers, the lower half first).
 
-    def __lt__(self, other: Self) -> bool:
-        return f128_lt(self, other)
+    """
 
-    def __le__(self, other: Self) -> bool:
-        return f128_le(self, other)
+    def __cinit__(self, *args, **kwargs):
+        self._itemsize = 16
+        self._format = b'2Q'
+        self._scalar_type = Float128
+        self._get = _f128_get
+        self._set = _f128_set
+        self._format_at = _f128_format_at
 
-    def __gt__(self, other: Self) -> bool:
-        return f128_lt(other, self)
+    @classmethod
+    def from_floats(cls, src) -> Float128Array:
+        """Creates a new instance from the specified floating points.
 
-    def __ge__(self, other: Self) -> bool:
-        return f128_le(other, self)
+        Args:
+            src: The floating points from which a new instance is created.
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
-            raise ValueError('type mismatch')
-        return f128_eq(self, other)
+        Returns:
+            A new instance created from the specified floating points.
 
-    def __ne__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
-            raise ValueError('type mismatch')
-        return not f128_eq(self, other)
+        """
+        cdef list a = list(src)
+        cdef Float128Array o = cls(len(a))
+        cdef sf.float128_t* p = <sf.float128_t*>o._ptr
+        cdef Py_ssize_t i
+        for i in range(len(a)):
+            p[i] = sf.f64_to_f128(_double_to_f64(a[i]))
+        return o
 
-    def __iadd__(self, other: Self) -> Self:
-        return self.__add__(other)
+    cpdef list to_floats(self):
+        """Returns the elements as floating points.
 
-    def __isub__(self, other: Self) -> Self:
-        return self.__sub__(other)
+        Returns:
+            A list of floating points that represent the elements.
 
-    def __imul__(self, other: Self) -> Self:
-        return self.__mul__(other)
+        """
+        cdef sf.float128_t* p
+        with cython.critical_section(self):
+            p = <sf.float128_t*>self._ptr
+            return [_f64_to_double(sf.f128_to_f64(p[i])) for i in range(self._length)]
 
-    def __itruediv__(self, other: Self) -> Self:
-        return self.__truediv__(other)
+    cpdef Float16Array to_f16(self):
+        """Converts the IEEE 754 binary128 floating points to binary16 floating points.
 
-    def __ifloordiv__(self, other: Self) -> Self:
-        return self.__floordiv__(other)
+        The result is the same as that of :func:`f128_to_f16_array()`.
 
-    def __imod__(self, other: Self) -> Self:
-        return self.__mod__(other)
+        Returns:
+            The IEEE 754 binary16 floating points.
 
+        """
+        return f128_to_f16_array(self)
 
-cpdef void set_tininess_mode(TininessMode mode):
-    """Sets the tininess detection mode.
+    cpdef Float32Array to_f32(self):
+        """Converts the IEEE 754 binary128 floating points to binary32 floating points.
 
-    Args:
-        mode: The tininess detection mode to be set.
+        The result is the same as that of :func:`f128_to_f32_array()`.
 
-    """
-    sf.softfloat_detectTininess = <uint_fast8_t>mode
+        Returns:
+            The IEEE 754 binary32 floating points.
 
+        """
+        return f128_to_f32_array(self)
 
-cpdef TininessMode get_tininess_mode():
-    """Returns the current tininess detection mode.
+    cpdef Float64Array to_f64(self):
+        """Converts the IEEE 754 binary128 floating points to binary64 floating points.
 
-    Returns:
-        The current tininess detection mode.
+        The result is the same as that of :func:`f128_to_f64_array()`.
 
-    """
-    return <TininessMode>sf.softfloat_detectTininess
+        Returns:
+            The IEEE 754 binary64 floating points.
 
+        """
+        return f128_to_f64_array(self)
 
-cpdef void set_rounding_mode(RoundingMode mode):
-    """Sets the rounding mode.
 
-    Args:
-        mode: The rounding mode to be set.
+cdef class _Operand:
+    """A C-contiguous buffer of native data used as an operand of the batch operations,
+    or a floating point broadcast to all the elements."""
 
-    """
-    sf.softfloat_roundingMode = <uint_fast8_t>mode
+    cdef Py_buffer _view
+    """The acquired buffer."""
 
+    cdef bint _acquired
+    """``True`` if the buffer has been acquired."""
 
-cpdef RoundingMode get_rounding_mode():
-    """Returns the current rounding mode.
+    cdef object _scalar
+    """The floating point broadcast to all the elements, or ``None``."""
 
-    Returns:
-        The current rounding mode.
+    cdef char* ptr
+    """The pointer to the native data."""
 
-    """
-    return <RoundingMode>sf.softfloat_roundingMode
+    cdef Py_ssize_t length
+    """The number of the elements, or -1 if broadcast."""
 
+    cdef Py_ssize_t stride
+    """The number of the elements advanced per element, which is 0 if broadcast."""
 
-cpdef void set_exception_flags(flags):
-    """Sets the floating-point exception flags.
+    def __cinit__(self, object src, Py_ssize_t itemsize, bint writable, object scalar_type=None):
+        if scalar_type is not None and isinstance(src, scalar_type):
+            self._scalar = src
+            self.ptr = _scalar_data(src)
+            self.length = -1
+            self.stride = 0
+            return
+        self.stride = 1
+        PyObject_GetBuffer(src, &self._view, PyBUF_C_CONTIGUOUS | (PyBUF_WRITABLE if writable else 0))
+        self._acquired = True
+        if self._view.itemsize != itemsize and not (itemsize == 16 and self._view.itemsize == 8):
+            raise ValueError(f'item size of buffer must be {itemsize}')
+        if self._view.len % itemsize != 0:
+            raise ValueError(f'length of buffer must be a multiple of {itemsize}')
+        self.ptr = <char*>self._view.buf
+        self.length = self._view.len // itemsize
 
-    Args:
-        flags: The floating-point exception flags to be set.
+    def __dealloc__(self):
+        if self._acquired:
+            PyBuffer_Release(&self._view)
 
-    """
-    sf.softfloat_exceptionFlags = <uint_fast8_t>flags
 
+cdef char* _scalar_data(object x):
+    # Returns the pointer to the native data of the floating point x.
+    if isinstance(x, BFloat16):
+        return <char*>&(<BFloat16>x)._data
+    if isinstance(x, Float16):
+        return <char*>&(<Float16>x)._data
+    if isinstance(x, Float32):
+        return <char*>&(<Float32>x)._data
+    if isinstance(x, Float64):
+        return <char*>&(<Float64>x)._data
+    return <char*>&(<Float128>x)._data
 
-cpdef get_exception_flags():
-    """Returns the current floating-point exception flags.
 
-    Returns:
-        The current floating-point exception flags.
+cdef int _check_lengths(Py_ssize_t m, Py_ssize_t n) except -1:
+    if m != n:
+        raise ValueError('length mismatch')
+    return 0
 
-    """
-    return int(sf.softfloat_exceptionFlags)
 
+cdef Py_ssize_t _broadcast_length(tuple operands) except -1:
+    # Returns the common length of the operands except the broadcast ones, or 1 if all are broadcast.
+    cdef Py_ssize_t n = -1
+    cdef _Operand o
+    for o in operands:
+        if o is None or o.stride == 0:
+            continue
+        if n >= 0:
+            _check_lengths(n, o.length)
+        n = o.length
+    return 1 if n < 0 else n
 
-cpdef bool test_exception_flags(flags):
-    """Tests the floating-point exception flags.
+
+cdef struct _Accumulator:
+    # The exact sum of floating points as a fixed-point number, which is rounded only once.
+    uint64_t* words               # the sum in two's complement, least significant word first
+    Py_ssize_t length             # the number of the words
+    Py_ssize_t nan                # the index of the first NaN, or -1
+    Py_ssize_t pos_inf            # the index of the first positive infinity, or -1
+    Py_ssize_t neg_inf            # the index of the first negative infinity, or -1
+    bint negative_zero            # True if all the elements are -0, which make a zero sum -0
+
+
+cdef struct _Kernel:
+    # The parameters of a batch operation shared by its loop.
+    void* op                      # the SoftFloat function applied to each element
+    const char* x                 # the first operand
+    const char* y                 # the second operand
+    const char* w                 # the third operand
+    char* z                       # the results
+    uint8_t* flags                # the per-element exception flags, or NULL
+    const _Lut* lut               # the lookup table of a 16-bit unary operation, or NULL
+    uint_fast8_t rounding_mode    # the rounding mode of round_to_int
+    bint exact                    # the exactness of round_to_int
+    uint_fast8_t method           # the summation method of a reduction
+    bint fused                    # True if a dot product adds the products without rounding them
+    Py_ssize_t sx                 # the stride of the first operand, which is 0 if broadcast
+    Py_ssize_t sy                 # the stride of the second operand, which is 0 if broadcast
+    Py_ssize_t sw                 # the stride of the third operand, which is 0 if broadcast
+    Py_ssize_t columns            # the number of the columns of a matrix product
+    Py_ssize_t depth              # the number of the products summed into each element of a matrix product
+    _Accumulator* acc             # the accumulator of the exact dot products of a matrix product
+
+
+# A loop of a batch operation over the elements in [start, stop).
+# The exception flags raised by the elements are accumulated into softfloat_exceptionFlags.
+ctypedef void (*_loop_fn)(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil
+
+
+cdef Py_ssize_t _MIN_CHUNK_LENGTH = 32768
+"""The minimum number of the elements in a chunk run by a thread."""
+
+
+cdef class _Chunk:
+    """A chunk of a batch operation run by a thread in the pool."""
+
+    cdef _loop_fn loop
+    """The loop of the batch operation."""
+
+    cdef const _Kernel* k
+    """The parameters of the batch operation."""
+
+    cdef Py_ssize_t start
+    """The index of the first element."""
+
+    cdef Py_ssize_t stop
+    """The index next to the last element."""
+
+    cdef uint_fast8_t rounding_mode
+    """The rounding mode of the calling thread."""
+
+    cdef uint_fast8_t detect_tininess
+    """The tininess detection mode of the calling thread."""
+
+    def run(self):
+        cdef uint_fast8_t raised
+        with nogil:
+            sf.softfloat_roundingMode = self.rounding_mode
+            sf.softfloat_detectTininess = self.detect_tininess
+            sf.softfloat_exceptionFlags = 0
+            self.loop(self.k, self.start, self.stop)
+            raised = sf.softfloat_exceptionFlags
+        return raised
+
+
+cdef Py_ssize_t _num_chunks(Py_ssize_t n) noexcept:
+    # The number of the threads may be changed before the chunks are run, which _run() allows for.
+    return max(1, min(<Py_ssize_t>_num_threads, n // _MIN_CHUNK_LENGTH))
+
+
+cdef int _run(_loop_fn loop, const _Kernel* k, Py_ssize_t n, Py_ssize_t m, bint separate) except -1:
+    # Runs the loop over the n elements in m chunks. If separate is True, the chunk i uses k[i],
+    # otherwise all the chunks share k[0]. If the number of the threads has been set to 1 since m was
+    # chosen, all the chunks run in the calling thread, and if it has been decreased, the pool queues them.
+    global _executor
+    if m <= 1:
+        with nogil:
+            loop(k, 0, n)
+        return 0
+    cdef list futures = []
+    cdef _Chunk c
+    cdef Py_ssize_t i
+    cdef int threads = 1
+    try:
+        with _executor_lock:
+            threads = _num_threads
+            if threads > 1:
+                if _executor is None:
+                    _executor = ThreadPoolExecutor(threads - 1, thread_name_prefix='softfloatpy')
+                for i in range(1, m):
+                    c = _Chunk()
+                    c.loop = loop
+                    c.k = k + i if separate else k
+                    c.start = n * i // m
+                    c.stop = n * (i + 1) // m
+                    c.rounding_mode = sf.softfloat_roundingMode
+                    c.detect_tininess = sf.softfloat_detectTininess
+                    futures.append(_executor.submit(c.run))
+        with nogil:
+            if threads > 1:
+                loop(k, 0, n // m)
+            else:
+                for i in range(m):
+                    loop(k + i if separate else k, n * i // m, n * (i + 1) // m)
+    finally:
+        wait(futures)  # the operands must outlive the chunks, even if some of them failed to be submitted
+    for f in futures:
+        sf.softfloat_exceptionFlags |= <uint_fast8_t>f.result()
+    return 0
+
+
+cdef inline uint_fast8_t _context_rounding_mode(FloatContext context):
+    if context is None or context._rounding_mode < 0:
+        return sf.softfloat_roundingMode
+    return <uint_fast8_t>context._rounding_mode
+
+
+cdef object _batch(
+    _loop_fn loop, _Kernel* k, tuple args, Py_ssize_t itemsize, object out, object out_type, Py_ssize_t out_itemsize,
+    object flags, FloatContext context, object scalar_type=None
+):
+    # The operands that are instances of scalar_type are broadcast to all the elements.
+    cdef _Operand a = _Operand(args[0], itemsize, False, scalar_type)
+    cdef _Operand b = _Operand(args[1], itemsize, False, scalar_type) if len(args) > 1 else None
+    cdef _Operand w = _Operand(args[2], itemsize, False, scalar_type) if len(args) > 2 else None
+    cdef Py_ssize_t n = _broadcast_length((a, b, w))
+    if out is None:
+        out = out_type(n)
+    cdef _Operand c = _Operand(out, out_itemsize, True)
+    _check_lengths(n, c.length)
+    cdef _Operand f = None
+    if flags is not None:
+        f = _Operand(flags, 1, True)
+        _check_lengths(n, f.length)
+    k.x = a.ptr
+    k.y = b.ptr if b is not None else NULL
+    k.w = w.ptr if w is not None else NULL
+    k.z = c.ptr
+    k.flags = <uint8_t*>f.ptr if f is not None else NULL
+    k.sx = a.stride
+    k.sy = b.stride if b is not None else 0
+    k.sw = w.stride if w is not None else 0
+    if context is None:
+        _run(loop, k, n, _num_chunks(n), False)
+        return out
+    cdef _State saved
+    cdef uint_fast8_t trapped
+    context._enter(&saved)
+    try:
+        _run(loop, k, n, _num_chunks(n), False)
+    finally:
+        trapped = context._exit(&saved)
+    context._trap(trapped)
+    return out
+
+
+# The final step of an exact reduction, which rounds the merged accumulator and stores the result to k.z.
+ctypedef void (*_finish_fn)(const _Kernel* k, _Accumulator* acc) noexcept nogil
+
+
+cdef void _acc_add(_Accumulator* acc, const uint64_t* sig, Py_ssize_t n, Py_ssize_t pos, bint negative) noexcept nogil:
+    # Adds sig * 2^pos to the sum, or subtracts it if negative is True.
+    # sig consists of n words, least significant first.
+    cdef Py_ssize_t w = pos >> 6
+    cdef unsigned int s = pos & 63
+    cdef uint64_t prev = 0
+    cdef uint64_t c = 0
+    cdef uint64_t cur, d, t, r
+    cdef Py_ssize_t i
+    for i in range(n + 1):
+        cur = sig[i] if i < n else 0
+        d = cur << s
+        if s != 0:
+            d |= prev >> (64 - s)
+        prev = cur
+        t = acc.words[w + i]
+        if negative:
+            r = t - d
+            acc.words[w + i] = r - c
+            c = <uint64_t>(t < d) | <uint64_t>(r < c)
+        else:
+            r = t + d
+            acc.words[w + i] = r + c
+            c = <uint64_t>(r < d) | <uint64_t>(r + c < c)
+    w += n + 1
+    while c != 0 and w < acc.length:
+        t = acc.words[w]
+        if negative:
+            acc.words[w] = t - 1
+            c = t == 0
+        else:
+            acc.words[w] = t + 1
+            c = t + 1 == 0
+        w += 1
+
+
+cdef inline Py_ssize_t _first_index(Py_ssize_t a, Py_ssize_t b) noexcept nogil:
+    if a < 0:
+        return b
+    if b < 0:
+        return a
+    return min(a, b)
+
+
+cdef void _acc_merge(_Accumulator* acc, const _Accumulator* other) noexcept nogil:
+    cdef uint64_t c = 0
+    cdef uint64_t r
+    cdef Py_ssize_t i
+    for i in range(acc.length):
+        r = acc.words[i] + other.words[i]
+        acc.words[i] = r + c
+        c = <uint64_t>(r < other.words[i]) | <uint64_t>(r + c < c)
+    acc.nan = _first_index(acc.nan, other.nan)
+    acc.pos_inf = _first_index(acc.pos_inf, other.pos_inf)
+    acc.neg_inf = _first_index(acc.neg_inf, other.neg_inf)
+    acc.negative_zero = acc.negative_zero and other.negative_zero
+
+
+cdef uint64_t _acc_bits(const _Accumulator* acc, Py_ssize_t pos) noexcept nogil:
+    # Returns the 64 bits of the sum from the position pos upwards, which may be negative.
+    cdef Py_ssize_t w
+    cdef unsigned int s
+    cdef uint64_t r
+    if pos <= -64:
+        return 0
+    if pos < 0:
+        return acc.words[0] << <unsigned int>(-pos)
+    w = pos >> 6
+    s = pos & 63
+    r = acc.words[w] >> s
+    if s != 0 and w + 1 < acc.length:
+        r |= acc.words[w + 1] << (64 - s)
+    return r
+
+
+cdef bint _acc_any_below(const _Accumulator* acc, Py_ssize_t pos) noexcept nogil:
+    # Tests if any bit of the sum below the position pos is set.
+    cdef Py_ssize_t w, i
+    cdef unsigned int s
+    if pos <= 0:
+        return False
+    w = pos >> 6
+    s = pos & 63
+    for i in range(w):
+        if acc.words[i] != 0:
+            return True
+    return s != 0 and (acc.words[w] & ((<uint64_t>1 << s) - 1)) != 0
+
+
+cdef void _acc_clear(_Accumulator* acc) noexcept nogil:
+    cdef Py_ssize_t i
+    for i in range(acc.length):
+        acc.words[i] = 0
+    acc.nan = -1
+    acc.pos_inf = -1
+    acc.neg_inf = -1
+    acc.negative_zero = True
+
+
+cdef Py_ssize_t _acc_top(_Accumulator* acc, bint* negative, uint64_t* hi, uint64_t* lo) noexcept nogil:
+    # Takes the absolute value of the sum and returns the position of its most significant bit,
+    # or -1 if the sum is zero. hi and lo are set to the 128 bits from the position downwards,
+    # with the lower bits jammed into the least significant bit.
+    cdef Py_ssize_t n = acc.length
+    cdef Py_ssize_t h = n - 1
+    cdef Py_ssize_t top, i
+    cdef uint64_t c = 1
+    negative[0] = (acc.words[n - 1] >> 63) != 0
+    if negative[0]:
+        for i in range(n):
+            acc.words[i] = ~acc.words[i] + c
+            c &= acc.words[i] == 0
+    while h >= 0 and acc.words[h] == 0:
+        h -= 1
+    if h < 0:
+        return -1
+    top = h * 64 + 63 - softfloat_countLeadingZeros64(acc.words[h])
+    hi[0] = _acc_bits(acc, top - 63)
+    lo[0] = _acc_bits(acc, top - 127) | <uint64_t>_acc_any_below(acc, top - 127)
+    return top
+
+
+cdef int _accumulate(_loop_fn loop, _finish_fn finish, const _Kernel* k, Py_ssize_t n, Py_ssize_t length) except -1:
+    # Runs the loop of an exact reduction in chunks, each of which adds its elements to its own
+    # accumulator of the length. Since the accumulators are exact, the result does not depend on
+    # how the elements are split.
+    cdef Py_ssize_t m = _num_chunks(n)
+    cdef _Kernel* ks = <_Kernel*>PyMem_Malloc(m * sizeof(_Kernel))
+    cdef _Accumulator* accs = <_Accumulator*>PyMem_Malloc(m * sizeof(_Accumulator))
+    cdef uint64_t* words = <uint64_t*>PyMem_Calloc(m * length, sizeof(uint64_t))
+    cdef Py_ssize_t i
+    try:
+        if ks == NULL or accs == NULL or words == NULL:
+            raise MemoryError()
+        for i in range(m):
+            ks[i] = k[0]
+            ks[i].z = <char*>&accs[i]
+            accs[i].words = words + i * length
+            accs[i].length = length
+            accs[i].nan = -1
+            accs[i].pos_inf = -1
+            accs[i].neg_inf = -1
+            accs[i].negative_zero = n > 0
+        _run(loop, ks, n, m, True)
+        with nogil:
+            for i in range(1, m):
+                _acc_merge(&accs[0], &accs[i])
+            finish(k, &accs[0])
+    finally:
+        PyMem_Free(words)
+        PyMem_Free(accs)
+        PyMem_Free(ks)
+    return 0
+
+
+cdef int _reduce(
+    _loop_fn loop, _Kernel* k, tuple args, Py_ssize_t itemsize, bint empty, FloatContext context,
+    _finish_fn finish=NULL, Py_ssize_t length=0
+) except -1:
+    # Runs the loop of a reduction, which stores the result to k.z.
+    # An empty operand is rejected unless the reduction has an identity element.
+    # If finish is specified, the reduction is exact, using the accumulators of the length.
+    cdef _Operand a = _Operand(args[0], itemsize, False)
+    cdef _Operand b = _Operand(args[1], itemsize, False) if len(args) > 1 else None
+    if b is not None:
+        _check_lengths(a.length, b.length)
+    if a.length == 0 and not empty:
+        raise ValueError('empty operand')
+    k.x = a.ptr
+    k.y = b.ptr if b is not None else NULL
+    k.flags = NULL
+    if context is None:
+        if finish != NULL:
+            _accumulate(loop, finish, k, a.length, length)
+            return 0
+        with nogil:
+            loop(k, 0, a.length)
+        return 0
+    cdef _State saved
+    cdef uint_fast8_t trapped
+    context._enter(&saved)
+    try:
+        if finish != NULL:
+            _accumulate(loop, finish, k, a.length, length)
+        else:
+            with nogil:
+                loop(k, 0, a.length)
+    finally:
+        trapped = context._exit(&saved)
+    context._trap(trapped)
+    return 0
+
+
+# A conversion of an element of a matrix to the format of the accumulator of a matrix product.
+ctypedef void (*_convert_fn)(const char* a, char* b) noexcept nogil
+
+
+cdef void _convert_matrix(
+    _convert_fn convert, const char* x, Py_ssize_t itemsize, char* z, Py_ssize_t z_itemsize,
+    Py_ssize_t rows, Py_ssize_t columns, bint transpose
+) noexcept nogil:
+    # Converts the matrix x in row-major order to z, which is transposed if transpose is True.
+    cdef Py_ssize_t i, j
+    for i in range(rows):
+        for j in range(columns):
+            if transpose:
+                convert(x + (i * columns + j) * itemsize, z + (j * rows + i) * z_itemsize)
+            else:
+                convert(x + (i * columns + j) * itemsize, z + (i * columns + j) * z_itemsize)
+
+
+cdef int _run_matmul(
+    _convert_fn convert, _loop_fn loop, _Kernel* ks, const char* x, const char* y, Py_ssize_t m, Py_ssize_t n,
+    Py_ssize_t itemsize, Py_ssize_t acc_itemsize, Py_ssize_t chunks
+) except -1:
+    with nogil:
+        _convert_matrix(convert, x, itemsize, <char*>ks[0].x, acc_itemsize, m, ks[0].depth, False)
+        _convert_matrix(convert, y, itemsize, <char*>ks[0].y, acc_itemsize, ks[0].depth, n, True)
+    _run(loop, ks, m, chunks, True)
+    return 0
+
+
+cdef object _matmul(
+    _convert_fn convert, _loop_fn loop, object x, object y, Py_ssize_t m, Py_ssize_t n, Py_ssize_t depth,
+    Py_ssize_t itemsize, Py_ssize_t acc_itemsize, Py_ssize_t acc_length, object out_type,
+    SummationMethod method, bint fused, object out, FloatContext context
+):
+    # Multiplies the m x depth matrix x by the depth x n matrix y. The elements are converted to
+    # the format of the accumulator, with the columns of y transposed to be contiguous, and the rows
+    # of the result are computed by the loop in chunks, each of which has its own accumulator.
+    if m < 0 or n < 0 or depth < 0:
+        raise ValueError('negative dimension')
+    cdef _Operand a = _Operand(x, itemsize, False)
+    cdef _Operand b = _Operand(y, itemsize, False)
+    _check_lengths(a.length, m * depth)
+    _check_lengths(b.length, depth * n)
+    if out is None:
+        out = out_type(m * n)
+    cdef _Operand c = _Operand(out, acc_itemsize, True)
+    _check_lengths(c.length, m * n)
+    cdef Py_ssize_t chunks = max(1, min(m, _num_chunks(m * n * depth)))
+    cdef bint exact = method == SummationMethod.EXACT
+    cdef char* xs = <char*>PyMem_Malloc(max(1, m * depth * acc_itemsize))
+    cdef char* ys = <char*>PyMem_Malloc(max(1, depth * n * acc_itemsize))
+    cdef _Kernel* ks = <_Kernel*>PyMem_Malloc(chunks * sizeof(_Kernel))
+    cdef _Accumulator* accs = <_Accumulator*>PyMem_Malloc(chunks * sizeof(_Accumulator))
+    cdef uint64_t* words = <uint64_t*>PyMem_Malloc((chunks * acc_length if exact else 1) * sizeof(uint64_t))
+    cdef _State saved
+    cdef uint_fast8_t trapped
+    cdef Py_ssize_t i
+    try:
+        if xs == NULL or ys == NULL or ks == NULL or accs == NULL or words == NULL:
+            raise MemoryError()
+        for i in range(chunks):
+            ks[i].x = xs
+            ks[i].y = ys
+            ks[i].z = c.ptr
+            ks[i].method = <uint_fast8_t>method
+            ks[i].fused = fused
+            ks[i].columns = n
+            ks[i].depth = depth
+            ks[i].acc = &accs[i]
+            accs[i].words = words + i * acc_length if exact else NULL
+            accs[i].length = acc_length if exact else 0
+        if context is None:
+            _run_matmul(convert, loop, ks, a.ptr, b.ptr, m, n, itemsize, acc_itemsize, chunks)
+            return out
+        context._enter(&saved)
+        try:
+            _run_matmul(convert, loop, ks, a.ptr, b.ptr, m, n, itemsize, acc_itemsize, chunks)
+        finally:
+            trapped = context._exit(&saved)
+        context._trap(trapped)
+        return out
+    finally:
+        PyMem_Free(words)
+        PyMem_Free(accs)
+        PyMem_Free(ks)
+        PyMem_Free(ys)
+        PyMem_Free(xs)
+
+
+ctypedef sf.bfloat16_t (*_bf16_unary_fn)(sf.bfloat16_t) noexcept nogil
+ctypedef sf.bfloat16_t (*_bf16_binary_fn)(sf.bfloat16_t, sf.bfloat16_t) noexcept nogil
+ctypedef sf.bfloat16_t (*_bf16_ternary_fn)(sf.bfloat16_t, sf.bfloat16_t, sf.bfloat16_t) noexcept nogil
+ctypedef _c_bool (*_bf16_compare_fn)(sf.bfloat16_t, sf.bfloat16_t) noexcept nogil
+
+
+cdef void _bf16_unary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _bf16_unary_fn op = <_bf16_unary_fn>k.op
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _bf16_binary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _bf16_binary_fn op = <_bf16_binary_fn>k.op
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef const sf.bfloat16_t* y = <const sf.bfloat16_t*>k.y
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _bf16_ternary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _bf16_ternary_fn op = <_bf16_ternary_fn>k.op
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef const sf.bfloat16_t* y = <const sf.bfloat16_t*>k.y
+    cdef const sf.bfloat16_t* w = <const sf.bfloat16_t*>k.w
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef Py_ssize_t sw = k.sw
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _bf16_compare_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _bf16_compare_fn op = <_bf16_compare_fn>k.op
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef const sf.bfloat16_t* y = <const sf.bfloat16_t*>k.y
+    cdef uint8_t* z = <uint8_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _bf16_round_to_int_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = _bf16_roundToInt(x[i], k.rounding_mode, k.exact)
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = _bf16_roundToInt(x[i], k.rounding_mode, k.exact)
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+ctypedef sf.float16_t (*_f16_unary_fn)(sf.float16_t) noexcept nogil
+ctypedef sf.float16_t (*_f16_binary_fn)(sf.float16_t, sf.float16_t) noexcept nogil
+ctypedef sf.float16_t (*_f16_ternary_fn)(sf.float16_t, sf.float16_t, sf.float16_t) noexcept nogil
+ctypedef _c_bool (*_f16_compare_fn)(sf.float16_t, sf.float16_t) noexcept nogil
+
+
+cdef void _f16_unary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_unary_fn op = <_f16_unary_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_binary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_binary_fn op = <_f16_binary_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_ternary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_ternary_fn op = <_f16_ternary_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef const sf.float16_t* w = <const sf.float16_t*>k.w
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef Py_ssize_t sw = k.sw
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_compare_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_compare_fn op = <_f16_compare_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef uint8_t* z = <uint8_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_round_to_int_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f16_roundToInt(x[i], k.rounding_mode, k.exact)
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f16_roundToInt(x[i], k.rounding_mode, k.exact)
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+ctypedef sf.float32_t (*_f32_unary_fn)(sf.float32_t) noexcept nogil
+ctypedef sf.float32_t (*_f32_binary_fn)(sf.float32_t, sf.float32_t) noexcept nogil
+ctypedef sf.float32_t (*_f32_ternary_fn)(sf.float32_t, sf.float32_t, sf.float32_t) noexcept nogil
+ctypedef _c_bool (*_f32_compare_fn)(sf.float32_t, sf.float32_t) noexcept nogil
+
+
+cdef void _f32_unary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_unary_fn op = <_f32_unary_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_binary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_binary_fn op = <_f32_binary_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_ternary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_ternary_fn op = <_f32_ternary_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef const sf.float32_t* w = <const sf.float32_t*>k.w
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef Py_ssize_t sw = k.sw
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_compare_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_compare_fn op = <_f32_compare_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef uint8_t* z = <uint8_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_round_to_int_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f32_roundToInt(x[i], k.rounding_mode, k.exact)
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f32_roundToInt(x[i], k.rounding_mode, k.exact)
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+ctypedef sf.float64_t (*_f64_unary_fn)(sf.float64_t) noexcept nogil
+ctypedef sf.float64_t (*_f64_binary_fn)(sf.float64_t, sf.float64_t) noexcept nogil
+ctypedef sf.float64_t (*_f64_ternary_fn)(sf.float64_t, sf.float64_t, sf.float64_t) noexcept nogil
+ctypedef _c_bool (*_f64_compare_fn)(sf.float64_t, sf.float64_t) noexcept nogil
+
+
+cdef void _f64_unary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f64_unary_fn op = <_f64_unary_fn>k.op
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f64_binary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f64_binary_fn op = <_f64_binary_fn>k.op
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef const sf.float64_t* y = <const sf.float64_t*>k.y
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f64_ternary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f64_ternary_fn op = <_f64_ternary_fn>k.op
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef const sf.float64_t* y = <const sf.float64_t*>k.y
+    cdef const sf.float64_t* w = <const sf.float64_t*>k.w
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef Py_ssize_t sw = k.sw
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f64_compare_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f64_compare_fn op = <_f64_compare_fn>k.op
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef const sf.float64_t* y = <const sf.float64_t*>k.y
+    cdef uint8_t* z = <uint8_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f64_round_to_int_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f64_roundToInt(x[i], k.rounding_mode, k.exact)
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f64_roundToInt(x[i], k.rounding_mode, k.exact)
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+ctypedef sf.float128_t (*_f128_unary_fn)(sf.float128_t) noexcept nogil
+ctypedef sf.float128_t (*_f128_binary_fn)(sf.float128_t, sf.float128_t) noexcept nogil
+ctypedef sf.float128_t (*_f128_ternary_fn)(sf.float128_t, sf.float128_t, sf.float128_t) noexcept nogil
+ctypedef _c_bool (*_f128_compare_fn)(sf.float128_t, sf.float128_t) noexcept nogil
+
+
+cdef void _f128_unary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f128_unary_fn op = <_f128_unary_fn>k.op
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f128_binary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f128_binary_fn op = <_f128_binary_fn>k.op
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef const sf.float128_t* y = <const sf.float128_t*>k.y
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f128_ternary_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f128_ternary_fn op = <_f128_ternary_fn>k.op
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef const sf.float128_t* y = <const sf.float128_t*>k.y
+    cdef const sf.float128_t* w = <const sf.float128_t*>k.w
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef Py_ssize_t sw = k.sw
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f128_compare_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f128_compare_fn op = <_f128_compare_fn>k.op
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef const sf.float128_t* y = <const sf.float128_t*>k.y
+    cdef uint8_t* z = <uint8_t*>k.z
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = op(x[i * sx], y[i * sy])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = op(x[i * sx], y[i * sy])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f128_round_to_int_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f128_roundToInt(x[i], k.rounding_mode, k.exact)
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f128_roundToInt(x[i], k.rounding_mode, k.exact)
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_add_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_binary_fn op = <_f16_binary_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint16_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint16_t a, b
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f16_binary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            v[j] = _f16_narrow(_f16_widen(a) + _f16_widen(b), &status[j])
+            status[j] |= _f16_special(a) | _f16_special(b)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_sub_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_binary_fn op = <_f16_binary_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint16_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint16_t a, b
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f16_binary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            v[j] = _f16_narrow(_f16_widen(a) - _f16_widen(b), &status[j])
+            status[j] |= _f16_special(a) | _f16_special(b)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_mul_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_binary_fn op = <_f16_binary_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint16_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint16_t a, b
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f16_binary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            v[j] = _f16_narrow(_f16_widen(a) * _f16_widen(b), &status[j])
+            status[j] |= _f16_special(a) | _f16_special(b)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_mul_add_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f16_ternary_fn op = <_f16_ternary_fn>k.op
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef const sf.float16_t* w = <const sf.float16_t*>k.w
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef Py_ssize_t sw = k.sw
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint16_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint16_t a, b, c
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f16_ternary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            c = w[i * sw].v
+            v[j] = _f16_narrow(_two_sum_to_odd(_f16_widen(a) * _f16_widen(b), _f16_widen(c)), &status[j])
+            status[j] |= _f16_special(a) | _f16_special(b) | _f16_special(c)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_add_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_binary_fn op = <_f32_binary_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint32_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint32_t a, b
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f32_binary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            v[j] = _f32_narrow(_two_sum_to_odd(_f32_widen(a), _f32_widen(b)), &status[j])
+            status[j] |= _f32_special(a) | _f32_special(b)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_sub_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_binary_fn op = <_f32_binary_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint32_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint32_t a, b
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f32_binary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            v[j] = _f32_narrow(_two_sum_to_odd(_f32_widen(a), -_f32_widen(b)), &status[j])
+            status[j] |= _f32_special(a) | _f32_special(b)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_mul_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_binary_fn op = <_f32_binary_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint32_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint32_t a, b
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f32_binary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            v[j] = _f32_narrow(_f32_widen(a) * _f32_widen(b), &status[j])
+            status[j] |= _f32_special(a) | _f32_special(b)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_mul_add_vector_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef _f32_ternary_fn op = <_f32_ternary_fn>k.op
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef const sf.float32_t* w = <const sf.float32_t*>k.w
+    cdef Py_ssize_t sx = k.sx
+    cdef Py_ssize_t sy = k.sy
+    cdef Py_ssize_t sw = k.sw
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint32_t v[_VECTOR_BLOCK]
+    cdef uint8_t status[_VECTOR_BLOCK]
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef uint32_t a, b, c
+    cdef Py_ssize_t i, j, n
+    if sf.softfloat_roundingMode != sf.softfloat_round_near_even:
+        _f32_ternary_loop(k, start, stop)
+        return
+    while start < stop:
+        n = min(stop - start, <Py_ssize_t>_VECTOR_BLOCK)
+        for j in range(n):
+            i = start + j
+            a = x[i * sx].v
+            b = y[i * sy].v
+            c = w[i * sw].v
+            v[j] = _f32_narrow(_two_sum_to_odd(_f32_widen(a) * _f32_widen(b), _f32_widen(c)), &status[j])
+            status[j] |= _f32_special(a) | _f32_special(b) | _f32_special(c)
+        for j in range(n):
+            i = start + j
+            if status[j] & _VECTOR_FALLBACK:
+                sf.softfloat_exceptionFlags = 0
+                z[i] = op(x[i * sx], y[i * sy], w[i * sw])
+                status[j] = sf.softfloat_exceptionFlags
+            else:
+                z[i].v = v[j]
+            raised |= status[j]
+        if k.flags != NULL:
+            memcpy(&k.flags[start], status, n)
+        start += n
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_to_f64_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f16_to_f64(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f16_to_f64(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f16_to_f128_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f16_to_f128(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f16_to_f128(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_to_bf16_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f32_to_bf16(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f32_to_bf16(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_to_f16_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f32_to_f16(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f32_to_f16(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_to_f64_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f32_to_f64(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f32_to_f64(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f32_to_f128_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f32_to_f128(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f32_to_f128(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f64_to_f16_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f64_to_f16(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f64_to_f16(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f64_to_f32_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f64_to_f32(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f64_to_f32(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f64_to_f128_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f64_to_f128(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f64_to_f128(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f128_to_f16_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f128_to_f16(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f128_to_f16(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f128_to_f32_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f128_to_f32(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f128_to_f32(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _f128_to_f64_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef uint_fast8_t raised = sf.softfloat_exceptionFlags
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            z[i] = sf.f128_to_f64(x[i])
+        return
+    for i in range(start, stop):
+        sf.softfloat_exceptionFlags = 0
+        z[i] = sf.f128_to_f64(x[i])
+        k.flags[i] = sf.softfloat_exceptionFlags
+        raised |= sf.softfloat_exceptionFlags
+    sf.softfloat_exceptionFlags = raised
+
+
+cdef void _lut16_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const _Lut* lut = k.lut
+    cdef const uint16_t* x = <const uint16_t*>k.x
+    cdef uint16_t* z = <uint16_t*>k.z
+    cdef uint_fast8_t raised = 0
+    cdef uint16_t v
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            v = x[i]
+            z[i] = <uint16_t>lut.values[v]
+            raised |= lut.flags[v]
+    else:
+        for i in range(start, stop):
+            v = x[i]
+            z[i] = <uint16_t>lut.values[v]
+            k.flags[i] = lut.flags[v]
+            raised |= lut.flags[v]
+    sf.softfloat_exceptionFlags |= raised
+
+
+cdef void _lut32_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const _Lut* lut = k.lut
+    cdef const uint16_t* x = <const uint16_t*>k.x
+    cdef uint32_t* z = <uint32_t*>k.z
+    cdef uint_fast8_t raised = 0
+    cdef uint16_t v
+    cdef Py_ssize_t i
+    if k.flags == NULL:
+        for i in range(start, stop):
+            v = x[i]
+            z[i] = <uint32_t>lut.values[v]
+            raised |= lut.flags[v]
+    else:
+        for i in range(start, stop):
+            v = x[i]
+            z[i] = <uint32_t>lut.values[v]
+            k.flags[i] = lut.flags[v]
+            raised |= lut.flags[v]
+    sf.softfloat_exceptionFlags |= raised
+
+
+cpdef bf16_round_to_int_array(x, rounding_mode=None, bint exact=True, out=None, flags=None, context=None):
+    """Rounds the numbers expressed as 16-bit brain floating points element-wise.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        flags: The floating-point exception flags to be tested.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if any of the specified exception flags is nonzero, ``False`` otherwise.
+        The resulted integers expressed as 16-bit brain floating points.
 
-    """
-    return (sf.softfloat_exceptionFlags & <uint_fast8_t>flags) != 0
-
-
-cdef UInt32 _make_uint32(uint32_t src):
-    cdef UInt32 i = UInt32()
-    i._data = src
-    return i
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
+    """
+    cdef _Kernel k
+    k.rounding_mode = _context_rounding_mode(context) if rounding_mode is None else <uint_fast8_t><RoundingMode>rounding_mode
+    k.exact = exact
+    return _batch(_bf16_round_to_int_loop, &k, (x,), 2, out, BFloat16Array, 2, flags, context)
 
-cdef UInt64 _make_uint64(uint64_t src):
-    cdef UInt64 i = UInt64()
-    i._data = src
-    return i
 
+cpdef bf16_add_array(x, y, out=None, flags=None, context=None):
+    """Adds the 16-bit brain floating points element-wise.
 
-cdef Int32 _make_int32(int32_t src):
-    cdef Int32 i = Int32()
-    i._data = src
-    return i
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
+    Args:
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
-cdef Int64 _make_int64(int64_t src):
-    cdef Int64 i = Int64()
-    i._data = src
-    return i
+    Returns:
+        The resulted numbers expressed as 16-bit brain floating points (``x + y``).
 
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
-cdef BFloat16 _make_bfloat16(sf.bfloat16_t src):
-    cdef BFloat16 f = BFloat16()
-    f._data = src
-    return f
+    """
+    cdef _Kernel k
+    k.op = <void*>_bf16_add
+    return _batch(_bf16_binary_loop, &k, (x, y), 2, out, BFloat16Array, 2, flags, context, BFloat16)
 
 
-cdef Float16 _make_float16(sf.float16_t src):
-    cdef Float16 f = Float16()
-    f._data = src
-    return f
+cpdef bf16_sub_array(x, y, out=None, flags=None, context=None):
+    """Subtracts the 16-bit brain floating points element-wise.
 
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
-cdef Float32 _make_float32(sf.float32_t src):
-    cdef Float32 f = Float32()
-    f._data = src
-    return f
+    Args:
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
+    Returns:
+        The resulted numbers expressed as 16-bit brain floating points (``x - y``).
 
-cdef Float64 _make_float64(sf.float64_t src):
-    cdef Float64 f = Float64()
-    f._data = src
-    return f
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
+    """
+    cdef _Kernel k
+    k.op = <void*>_bf16_sub
+    return _batch(_bf16_binary_loop, &k, (x, y), 2, out, BFloat16Array, 2, flags, context, BFloat16)
 
-cdef Float128 _make_float128(sf.float128_t src):
-    cdef Float128 f = Float128()
-    f._data = src
-    return f
 
+cpdef bf16_mul_array(x, y, out=None, flags=None, context=None):
+    """Multiplies the 16-bit brain floating points element-wise.
 
-cpdef Float16 ui32_to_f16(UInt32 x):
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary16 floating point.
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit unsigned integer to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.ui32_to_f16(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_mul
+    return _batch(_bf16_binary_loop, &k, (x, y), 2, out, BFloat16Array, 2, flags, context, BFloat16)
 
 
-cpdef Float32 ui32_to_f32(UInt32 x):
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary32 floating point.
+cpdef bf16_mul_add_array(x, y, z, out=None, flags=None, context=None):
+    """Multiplies and Adds the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit unsigned integer to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.ui32_to_f32(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_mulAdd
+    return _batch(_bf16_ternary_loop, &k, (x, y, z), 2, out, BFloat16Array, 2, flags, context, BFloat16)
 
 
-cpdef Float64 ui32_to_f64(UInt32 x):
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary64 floating point.
+cpdef bf16_div_array(x, y, out=None, flags=None, context=None):
+    """Divides the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit unsigned integer to be converted.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.ui32_to_f64(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_div
+    return _batch(_bf16_binary_loop, &k, (x, y), 2, out, BFloat16Array, 2, flags, context, BFloat16)
 
 
-cpdef Float128 ui32_to_f128(UInt32 x):
-    """Converts the 32-bit unsigned integer to an IEEE 754 binary128 floating point.
+cpdef bf16_rem_array(x, y, out=None, flags=None, context=None):
+    """Calculates remainders by dividing the 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit unsigned integer to be converted.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.ui32_to_f128(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_rem
+    return _batch(_bf16_binary_loop, &k, (x, y), 2, out, BFloat16Array, 2, flags, context, BFloat16)
 
 
-cpdef Float16 ui64_to_f16(UInt64 x):
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary16 floating point.
+cpdef bf16_sqrt_array(x, out=None, flags=None, context=None):
+    """Calculates square roots of the 16-bit brain floating points element-wise.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted numbers expressed as 16-bit brain floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.ui64_to_f16(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_sqrt
+    return _batch(_bf16_unary_loop, &k, (x,), 2, out, BFloat16Array, 2, flags, context)
 
 
-cpdef Float32 ui64_to_f32(UInt64 x):
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary32 floating point.
+cpdef bf16_eq_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.ui64_to_f32(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_eq
+    return _batch(_bf16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, BFloat16)
 
 
-cpdef Float64 ui64_to_f64(UInt64 x):
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary64 floating point.
+cpdef bf16_le_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.ui64_to_f64(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_le
+    return _batch(_bf16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, BFloat16)
 
 
-cpdef Float128 ui64_to_f128(UInt64 x):
-    """Converts the 64-bit unsigned integer to an IEEE 754 binary128 floating point.
+cpdef bf16_lt_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as 16-bit brain floating points element-wise.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit unsigned integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.ui64_to_f128(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_lt
+    return _batch(_bf16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, BFloat16)
 
 
-cpdef Float16 i32_to_f16(Int32 x):
-    """Converts the 32-bit signed integer to an IEEE 754 binary16 floating point.
+cpdef bf16_eq_signaling_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.i32_to_f16(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_eq_signaling
+    return _batch(_bf16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, BFloat16)
 
 
-cpdef Float32 i32_to_f32(Int32 x):
-    """Converts the 32-bit signed integer to an IEEE 754 binary32 floating point.
+cpdef bf16_le_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as 16-bit brain floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.i32_to_f32(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_le_quiet
+    return _batch(_bf16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, BFloat16)
 
 
-cpdef Float64 i32_to_f64(Int32 x):
-    """Converts the 32-bit signed integer to an IEEE 754 binary64 floating point.
+cpdef bf16_lt_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as 16-bit brain floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.i32_to_f64(x._data))
+    cdef _Kernel k
+    k.op = <void*>_bf16_lt_quiet
+    return _batch(_bf16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, BFloat16)
 
 
-cpdef Float128 i32_to_f128(Int32 x):
-    """Converts the 32-bit signed integer to an IEEE 754 binary128 floating point.
+cpdef f16_round_to_int_array(x, rounding_mode=None, bint exact=True, out=None, flags=None, context=None):
+    """Rounds the numbers expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The 32-bit signed integer to be converted.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted integers expressed as IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.i32_to_f128(x._data))
+    cdef _Kernel k
+    k.rounding_mode = _context_rounding_mode(context) if rounding_mode is None else <uint_fast8_t><RoundingMode>rounding_mode
+    k.exact = exact
+    k.lut = _get_lut(_LUT_F16_ROUND_TO_INT, k.rounding_mode, exact)
+    if k.lut != NULL:
+        return _batch(_lut16_loop, &k, (x,), 2, out, Float16Array, 2, flags, context)
+    return _batch(_f16_round_to_int_loop, &k, (x,), 2, out, Float16Array, 2, flags, context)
 
 
-cpdef Float16 i64_to_f16(Int64 x):
-    """Converts the 64-bit signed integer to an IEEE 754 binary16 floating point.
+cpdef f16_add_array(x, y, out=None, flags=None, context=None):
+    """Adds the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.i64_to_f16(x._data))
+    cdef _Kernel k
+    k.op = <void*>_hw_f16_add if _hardware else <void*>sf.f16_add
+    return _batch(_f16_add_vector_loop if _hardware else _f16_binary_loop, &k, (x, y), 2, out, Float16Array, 2, flags, context, Float16)
 
 
-cpdef Float32 i64_to_f32(Int64 x):
-    """Converts the 64-bit signed integer to an IEEE 754 binary32 floating point.
+cpdef f16_sub_array(x, y, out=None, flags=None, context=None):
+    """Subtracts the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.i64_to_f32(x._data))
+    cdef _Kernel k
+    k.op = <void*>_hw_f16_sub if _hardware else <void*>sf.f16_sub
+    return _batch(_f16_sub_vector_loop if _hardware else _f16_binary_loop, &k, (x, y), 2, out, Float16Array, 2, flags, context, Float16)
 
 
-cpdef Float64 i64_to_f64(Int64 x):
-    """Converts the 64-bit signed integer to an IEEE 754 binary64 floating point.
+cpdef f16_mul_array(x, y, out=None, flags=None, context=None):
+    """Multiplies the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.i64_to_f64(x._data))
+    cdef _Kernel k
+    k.op = <void*>_hw_f16_mul if _hardware else <void*>sf.f16_mul
+    return _batch(_f16_mul_vector_loop if _hardware else _f16_binary_loop, &k, (x, y), 2, out, Float16Array, 2, flags, context, Float16)
 
 
-cpdef Float128 i64_to_f128(Int64 x):
-    """Converts the 64-bit signed integer to an IEEE 754 binary128 floating point.
+cpdef f16_mul_add_array(x, y, z, out=None, flags=None, context=None):
+    """Multiplies and Adds the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The 64-bit signed integer to be converted.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.i64_to_f128(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_mulAdd
+    return _batch(_f16_mul_add_vector_loop if _hardware else _f16_ternary_loop, &k, (x, y, z), 2, out, Float16Array, 2, flags, context, Float16)
 
 
-cpdef UInt32 f16_to_ui32(
-    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary16 floating point to a 32-bit unsigned integer.
+cpdef f16_div_array(x, y, out=None, flags=None, context=None):
+    """Divides the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint32(sf.f16_to_ui32(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>_hw_f16_div if _hardware else <void*>sf.f16_div
+    return _batch(_f16_binary_loop, &k, (x, y), 2, out, Float16Array, 2, flags, context, Float16)
 
 
-cpdef UInt64 f16_to_ui64(
-    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary16 floating point to a 64-bit unsigned integer.
+cpdef f16_rem_array(x, y, out=None, flags=None, context=None):
+    """Calculates remainders by dividing the IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint64(sf.f16_to_ui64(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_rem
+    return _batch(_f16_binary_loop, &k, (x, y), 2, out, Float16Array, 2, flags, context, Float16)
 
 
-cpdef Int32 f16_to_i32(
-    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary16 floating point to a 32-bit signed integer.
+cpdef f16_sqrt_array(x, out=None, flags=None, context=None):
+    """Calculates square roots of the IEEE 754 binary16 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The resulted numbers expressed as IEEE 754 binary16 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int32(sf.f16_to_i32(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_sqrt
+    k.lut = _get_lut(_LUT_F16_SQRT, _context_rounding_mode(context), False)
+    if k.lut != NULL:
+        return _batch(_lut16_loop, &k, (x,), 2, out, Float16Array, 2, flags, context)
+    return _batch(_f16_unary_loop, &k, (x,), 2, out, Float16Array, 2, flags, context)
 
 
-cpdef Int64 f16_to_i64(
-    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary16 floating point to a 64-bit signed integer.
+cpdef f16_eq_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int64(sf.f16_to_i64(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_eq
+    return _batch(_f16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, Float16)
 
 
-cpdef Float32 f16_to_f32(Float16 x):
-    """Converts the IEEE 754 binary16 floating point to a binary32 floating point.
+cpdef f16_le_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f16_to_f32(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_le
+    return _batch(_f16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, Float16)
 
 
-cpdef Float64 f16_to_f64(Float16 x):
-    """Converts the IEEE 754 binary16 floating point to a binary64 floating point.
+cpdef f16_lt_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f16_to_f64(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_lt
+    return _batch(_f16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, Float16)
 
 
-cpdef Float128 f16_to_f128(Float16 x):
-    """Converts the IEEE 754 binary16 floating point to a binary128 floating point.
+cpdef f16_eq_signaling_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f16_to_f128(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_eq_signaling
+    return _batch(_f16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, Float16)
 
 
-cpdef Float16 f16_round_to_int(
-    Float16 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Rounds the number expressed as an IEEE 754 binary16 floating point.
+cpdef f16_le_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary16 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary16 floating point.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_roundToInt(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f16_le_quiet
+    return _batch(_f16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, Float16)
 
 
-cpdef Float16 f16_neg(Float16 x):
-    """Negates the IEEE 754 binary16 floating point.
+cpdef f16_lt_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary16 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be negated.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``-x``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    cdef Float16 f = Float16()
-    f._data.v = x._data.v ^ <uint16_t>0x8000
-    return f
+    cdef _Kernel k
+    k.op = <void*>sf.f16_lt_quiet
+    return _batch(_f16_compare_loop, &k, (x, y), 2, out, bytearray, 1, flags, context, Float16)
 
 
-cpdef Float16 f16_add(Float16 x, Float16 y):
-    """Adds the IEEE 754 binary16 floating points.
+cpdef f32_round_to_int_array(x, rounding_mode=None, bint exact=True, out=None, flags=None, context=None):
+    """Rounds the numbers expressed as IEEE 754 binary32 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be added.
-        y: The floating point to add.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x + y``).
+        The resulted integers expressed as IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_add(x._data, y._data))
+    cdef _Kernel k
+    k.rounding_mode = _context_rounding_mode(context) if rounding_mode is None else <uint_fast8_t><RoundingMode>rounding_mode
+    k.exact = exact
+    return _batch(_f32_round_to_int_loop, &k, (x,), 4, out, Float32Array, 4, flags, context)
 
 
-cpdef Float16 f16_sub(Float16 x, Float16 y):
-    """Subtracts the IEEE 754 binary16 floating points.
+cpdef f32_add_array(x, y, out=None, flags=None, context=None):
+    """Adds the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x - y``).
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_sub(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>_hw_f32_add if _hardware else <void*>sf.f32_add
+    return _batch(_f32_add_vector_loop if _hardware else _f32_binary_loop, &k, (x, y), 4, out, Float32Array, 4, flags, context, Float32)
 
 
-cpdef Float16 f16_mul(Float16 x, Float16 y):
-    """Multiplies the IEEE 754 binary16 floating points.
+cpdef f32_sub_array(x, y, out=None, flags=None, context=None):
+    """Subtracts the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y``).
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_mul(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>_hw_f32_sub if _hardware else <void*>sf.f32_sub
+    return _batch(_f32_sub_vector_loop if _hardware else _f32_binary_loop, &k, (x, y), 4, out, Float32Array, 4, flags, context, Float32)
 
 
-cpdef Float16 f16_mul_add(Float16 x, Float16 y, Float16 z):
-    """Multiplies and Adds the IEEE 754 binary16 floating points.
+cpdef f32_mul_array(x, y, out=None, flags=None, context=None):
+    """Multiplies the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x * y + z``).
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_mulAdd(x._data, y._data, z._data))
+    cdef _Kernel k
+    k.op = <void*>_hw_f32_mul if _hardware else <void*>sf.f32_mul
+    return _batch(_f32_mul_vector_loop if _hardware else _f32_binary_loop, &k, (x, y), 4, out, Float32Array, 4, flags, context, Float32)
 
 
-cpdef Float16 f16_div(Float16 x, Float16 y):
-    """Divides the IEEE 754 binary16 floating points.
+cpdef f32_mul_add_array(x, y, z, out=None, flags=None, context=None):
+    """Multiplies and Adds the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x / y``).
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_div(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f32_mulAdd
+    return _batch(_f32_mul_add_vector_loop if _hardware else _f32_ternary_loop, &k, (x, y, z), 4, out, Float32Array, 4, flags, context, Float32)
 
 
-cpdef Float16 f16_rem(Float16 x, Float16 y):
-    """Calculates a remainder by dividing the IEEE 754 binary16 floating points.
+cpdef f32_div_array(x, y, out=None, flags=None, context=None):
+    """Divides the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``x % y``).
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_rem(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>_hw_f32_div if _hardware else <void*>sf.f32_div
+    return _batch(_f32_binary_loop, &k, (x, y), 4, out, Float32Array, 4, flags, context, Float32)
 
 
-cpdef Float16 f16_sqrt(Float16 x):
-    """Calculates a square root of the IEEE 754 binary16 floating point.
+cpdef f32_rem_array(x, y, out=None, flags=None, context=None):
+    """Calculates remainders by dividing the IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point whose square root is to be calculated.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary16 floating point (``sqrt(x)``).
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f16_sqrt(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f32_rem
+    return _batch(_f32_binary_loop, &k, (x, y), 4, out, Float32Array, 4, flags, context, Float32)
 
 
-cpdef bool f16_eq(Float16 x, Float16 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+cpdef f32_sqrt_array(x, out=None, flags=None, context=None):
+    """Calculates square roots of the IEEE 754 binary32 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The resulted numbers expressed as IEEE 754 binary32 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f16_eq(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>_hw_f32_sqrt if _hardware else <void*>sf.f32_sqrt
+    return _batch(_f32_unary_loop, &k, (x,), 4, out, Float32Array, 4, flags, context)
 
 
-cpdef bool f16_le(Float16 x, Float16 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+cpdef f32_eq_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f16_le(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f32_eq
+    return _batch(_f32_compare_loop, &k, (x, y), 4, out, bytearray, 1, flags, context, Float32)
 
 
-cpdef bool f16_lt(Float16 x, Float16 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+cpdef f32_le_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f16_lt(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f32_le
+    return _batch(_f32_compare_loop, &k, (x, y), 4, out, bytearray, 1, flags, context, Float32)
 
 
-cpdef bool f16_eq_signaling(Float16 x, Float16 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary16 floating points.
+cpdef f32_lt_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary32 floating points element-wise.
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f16_eq_signaling(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f32_lt
+    return _batch(_f32_compare_loop, &k, (x, y), 4, out, bytearray, 1, flags, context, Float32)
 
 
-cpdef bool f16_le_quiet(Float16 x, Float16 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary16 floating points.
+cpdef f32_eq_signaling_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f16_le_quiet(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f32_eq_signaling
+    return _batch(_f32_compare_loop, &k, (x, y), 4, out, bytearray, 1, flags, context, Float32)
 
 
-cpdef bool f16_lt_quiet(Float16 x, Float16 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary16 floating points.
+cpdef f32_le_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary32 floating points element-wise.
 
     The invalid exception flag is not set for quiet NaNs.
 
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
+
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f16_lt_quiet(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f32_le_quiet
+    return _batch(_f32_compare_loop, &k, (x, y), 4, out, bytearray, 1, flags, context, Float32)
 
 
-cpdef bool f16_is_signaling_nan(Float16 x):
-    """Tests if the IEEE 754 binary16 floating point is a signaling NaN.
+cpdef f32_lt_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary32 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be tested.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f16_isSignalingNaN(x._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f32_lt_quiet
+    return _batch(_f32_compare_loop, &k, (x, y), 4, out, bytearray, 1, flags, context, Float32)
 
 
-cpdef Float32 bf16_to_f32(BFloat16 x):
-    """Converts the 16-bit brain floating point to an IEEE 754 binary32 floating point.
+cpdef f64_round_to_int_array(x, rounding_mode=None, bint exact=True, out=None, flags=None, context=None):
+    """Rounds the numbers expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The 16-bit brain floating point to be converted.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The resulted integers expressed as IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.bf16_to_f32(x._data))
+    cdef _Kernel k
+    k.rounding_mode = _context_rounding_mode(context) if rounding_mode is None else <uint_fast8_t><RoundingMode>rounding_mode
+    k.exact = exact
+    return _batch(_f64_round_to_int_loop, &k, (x,), 8, out, Float64Array, 8, flags, context)
 
 
-cpdef BFloat16 f32_to_bf16(Float32 x):
-    """Converts the IEEE 754 binary32 floating point to a 16-bit brain floating point.
+cpdef f64_add_array(x, y, out=None, flags=None, context=None):
+    """Adds the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 16-bit brain floating point.
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_bfloat16(sf.f32_to_bf16(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_add
+    return _batch(_f64_binary_loop, &k, (x, y), 8, out, Float64Array, 8, flags, context, Float64)
 
 
-cpdef bool bf16_is_signaling_nan(BFloat16 x):
-    """Tests if the 16-bit brain floating point is a signaling NaN.
+cpdef f64_sub_array(x, y, out=None, flags=None, context=None):
+    """Subtracts the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be tested.
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.bf16_isSignalingNaN(x._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f64_sub
+    return _batch(_f64_binary_loop, &k, (x, y), 8, out, Float64Array, 8, flags, context, Float64)
 
 
-cpdef UInt32 f32_to_ui32(
-    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary32 floating point to a 32-bit unsigned integer.
+cpdef f64_mul_array(x, y, out=None, flags=None, context=None):
+    """Multiplies the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint32(sf.f32_to_ui32(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_mul
+    return _batch(_f64_binary_loop, &k, (x, y), 8, out, Float64Array, 8, flags, context, Float64)
 
 
-cpdef UInt64 f32_to_ui64(
-    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary32 floating point to a 64-bit unsigned integer.
+cpdef f64_mul_add_array(x, y, z, out=None, flags=None, context=None):
+    """Multiplies and Adds the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint64(sf.f32_to_ui64(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_mulAdd
+    return _batch(_f64_ternary_loop, &k, (x, y, z), 8, out, Float64Array, 8, flags, context, Float64)
 
 
-cpdef Int32 f32_to_i32(
-    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary32 floating point to a 32-bit signed integer.
+cpdef f64_div_array(x, y, out=None, flags=None, context=None):
+    """Divides the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int32(sf.f32_to_i32(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_div
+    return _batch(_f64_binary_loop, &k, (x, y), 8, out, Float64Array, 8, flags, context, Float64)
 
 
-cpdef Int64 f32_to_i64(
-    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary32 floating point to a 64-bit signed integer.
+cpdef f64_rem_array(x, y, out=None, flags=None, context=None):
+    """Calculates remainders by dividing the IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int64(sf.f32_to_i64(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_rem
+    return _batch(_f64_binary_loop, &k, (x, y), 8, out, Float64Array, 8, flags, context, Float64)
 
 
-cpdef Float16 f32_to_f16(Float32 x):
-    """Converts the IEEE 754 binary32 floating point to a binary16 floating point.
+cpdef f64_sqrt_array(x, out=None, flags=None, context=None):
+    """Calculates square roots of the IEEE 754 binary64 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted numbers expressed as IEEE 754 binary64 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f32_to_f16(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_sqrt
+    return _batch(_f64_unary_loop, &k, (x,), 8, out, Float64Array, 8, flags, context)
 
 
-cpdef Float64 f32_to_f64(Float32 x):
-    """Converts the IEEE 754 binary32 floating point to a binary64 floating point.
+cpdef f64_eq_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f32_to_f64(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_eq
+    return _batch(_f64_compare_loop, &k, (x, y), 8, out, bytearray, 1, flags, context, Float64)
 
 
-cpdef Float128 f32_to_f128(Float32 x):
-    """Converts the IEEE 754 binary32 floating point to a binary128 floating point.
+cpdef f64_le_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be converted.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f32_to_f128(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_le
+    return _batch(_f64_compare_loop, &k, (x, y), 8, out, bytearray, 1, flags, context, Float64)
 
 
-cpdef Float32 f32_round_to_int(
-    Float32 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Rounds the number expressed as an IEEE 754 binary32 floating point.
+cpdef f64_lt_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary32 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary32 floating point.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_roundToInt(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_lt
+    return _batch(_f64_compare_loop, &k, (x, y), 8, out, bytearray, 1, flags, context, Float64)
 
 
-cpdef Float32 f32_neg(Float32 x):
-    """Negates the IEEE 754 binary32 floating point.
+cpdef f64_eq_signaling_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be negated.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``-x``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    cdef Float32 f = Float32()
-    f._data.v = x._data.v ^ <uint32_t>0x80000000
-    return f
+    cdef _Kernel k
+    k.op = <void*>sf.f64_eq_signaling
+    return _batch(_f64_compare_loop, &k, (x, y), 8, out, bytearray, 1, flags, context, Float64)
 
 
-cpdef Float32 f32_add(Float32 x, Float32 y):
-    """Adds the IEEE 754 binary32 floating points.
+cpdef f64_le_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be added.
-        y: The floating point to add.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x + y``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_add(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_le_quiet
+    return _batch(_f64_compare_loop, &k, (x, y), 8, out, bytearray, 1, flags, context, Float64)
 
 
-cpdef Float32 f32_sub(Float32 x, Float32 y):
-    """Subtracts the IEEE 754 binary32 floating points.
+cpdef f64_lt_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary64 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x - y``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_sub(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f64_lt_quiet
+    return _batch(_f64_compare_loop, &k, (x, y), 8, out, bytearray, 1, flags, context, Float64)
 
 
-cpdef Float32 f32_mul(Float32 x, Float32 y):
-    """Multiplies the IEEE 754 binary32 floating points.
+cpdef f128_round_to_int_array(x, rounding_mode=None, bint exact=True, out=None, flags=None, context=None):
+    """Rounds the numbers expressed as IEEE 754 binary128 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The floating points to be rounded.
+        rounding_mode: The rounding mode. If ``None`` is specified, the current rounding mode is used.
+        exact: If ``True`` is specified, the floating-point exception flags are to be set
+               when exact rounding is unable.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y``).
+        The resulted integers expressed as IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_mul(x._data, y._data))
+    cdef _Kernel k
+    k.rounding_mode = _context_rounding_mode(context) if rounding_mode is None else <uint_fast8_t><RoundingMode>rounding_mode
+    k.exact = exact
+    return _batch(_f128_round_to_int_loop, &k, (x,), 16, out, Float128Array, 16, flags, context)
 
 
-cpdef Float32 f32_mul_add(Float32 x, Float32 y, Float32 z):
-    """Multiplies and Adds the IEEE 754 binary32 floating points.
+cpdef f128_add_array(x, y, out=None, flags=None, context=None):
+    """Adds the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
+        x: The floating points to be added.
+        y: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x * y + z``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x + y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_mulAdd(x._data, y._data, z._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f128_add
+    return _batch(_f128_binary_loop, &k, (x, y), 16, out, Float128Array, 16, flags, context, Float128)
 
 
-cpdef Float32 f32_div(Float32 x, Float32 y):
-    """Divides the IEEE 754 binary32 floating points.
+cpdef f128_sub_array(x, y, out=None, flags=None, context=None):
+    """Subtracts the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be subtracted.
+        y: The floating points to subtract.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x / y``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x - y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_div(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f128_sub
+    return _batch(_f128_binary_loop, &k, (x, y), 16, out, Float128Array, 16, flags, context, Float128)
 
 
-cpdef Float32 f32_rem(Float32 x, Float32 y):
-    """Calculates a remainder by dividing the IEEE 754 binary32 floating points.
+cpdef f128_mul_array(x, y, out=None, flags=None, context=None):
+    """Multiplies the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``x % y``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x * y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_rem(x._data, y._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f128_mul
+    return _batch(_f128_binary_loop, &k, (x, y), 16, out, Float128Array, 16, flags, context, Float128)
 
 
-cpdef Float32 f32_sqrt(Float32 x):
-    """Calculates a square root of the IEEE 754 binary32 floating point.
+cpdef f128_mul_add_array(x, y, z, out=None, flags=None, context=None):
+    """Multiplies and Adds the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point whose square root is to be calculated.
+        x: The floating points to be multiplied.
+        y: The floating points to multiply.
+        z: The floating points to add.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary32 floating point (``sqrt(x)``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x * y + z``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f32_sqrt(x._data))
+    cdef _Kernel k
+    k.op = <void*>sf.f128_mulAdd
+    return _batch(_f128_ternary_loop, &k, (x, y, z), 16, out, Float128Array, 16, flags, context, Float128)
 
 
-cpdef bool f32_eq(Float32 x, Float32 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+cpdef f128_div_array(x, y, out=None, flags=None, context=None):
+    """Divides the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x / y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f32_eq(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f128_div
+    return _batch(_f128_binary_loop, &k, (x, y), 16, out, Float128Array, 16, flags, context, Float128)
 
 
-cpdef bool f32_le(Float32 x, Float32 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+cpdef f128_rem_array(x, y, out=None, flags=None, context=None):
+    """Calculates remainders by dividing the IEEE 754 binary128 floating points element-wise.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be divided.
+        y: The floating points to divide.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``x % y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f32_le(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f128_rem
+    return _batch(_f128_binary_loop, &k, (x, y), 16, out, Float128Array, 16, flags, context, Float128)
 
 
-cpdef bool f32_lt(Float32 x, Float32 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+cpdef f128_sqrt_array(x, out=None, flags=None, context=None):
+    """Calculates square roots of the IEEE 754 binary128 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points whose square roots are to be calculated.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted numbers expressed as IEEE 754 binary128 floating points (``sqrt(x)``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f32_lt(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f128_sqrt
+    return _batch(_f128_unary_loop, &k, (x,), 16, out, Float128Array, 16, flags, context)
 
 
-cpdef bool f32_eq_signaling(Float32 x, Float32 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary32 floating points.
+cpdef f128_eq_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f32_eq_signaling(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f128_eq
+    return _batch(_f128_compare_loop, &k, (x, y), 16, out, bytearray, 1, flags, context, Float128)
 
 
-cpdef bool f32_le_quiet(Float32 x, Float32 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary32 floating points.
+cpdef f128_le_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f32_le_quiet(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f128_le
+    return _batch(_f128_compare_loop, &k, (x, y), 16, out, bytearray, 1, flags, context, Float128)
 
 
-cpdef bool f32_lt_quiet(Float32 x, Float32 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary32 floating points.
+cpdef f128_lt_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary128 floating points element-wise.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f32_lt_quiet(x._data, y._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f128_lt
+    return _batch(_f128_compare_loop, &k, (x, y), 16, out, bytearray, 1, flags, context, Float128)
 
 
-cpdef bool f32_is_signaling_nan(Float32 x):
-    """Tests if the IEEE 754 binary32 floating point is a signaling NaN.
+cpdef f128_eq_signaling_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The floating point to be tested.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The results, each of which is 1 if the first one is equal to the second one, 0 otherwise (``x == y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f32_isSignalingNaN(x._data)
+    cdef _Kernel k
+    k.op = <void*>sf.f128_eq_signaling
+    return _batch(_f128_compare_loop, &k, (x, y), 16, out, bytearray, 1, flags, context, Float128)
 
 
-cpdef UInt32 f64_to_ui32(
-    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary64 floating point to a 32-bit unsigned integer.
+cpdef f128_le_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than or equal to the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The results, each of which is 1 if the first one is less than or equal to the second one, 0 otherwise (``x <= y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint32(sf.f64_to_ui32(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f128_le_quiet
+    return _batch(_f128_compare_loop, &k, (x, y), 16, out, bytearray, 1, flags, context, Float128)
 
 
-cpdef UInt64 f64_to_ui64(
-    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary64 floating point to a 64-bit unsigned integer.
+cpdef f128_lt_quiet_array(x, y, out=None, flags=None, context=None):
+    """Tests if the first ones are less than the second ones expressed as IEEE 754 binary128 floating points element-wise.
+
+    The invalid exception flag is not set for quiet NaNs.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data. An instance of the floating-point class is broadcast to all the elements.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The first floating points to be compared.
+        y: The second floating points to be compared.
+        out: The buffer to store the results. If ``None`` is specified, a new :class:`bytearray` is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The results, each of which is 1 if the first one is less than the second one, 0 otherwise (``x < y``).
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint64(sf.f64_to_ui64(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.op = <void*>sf.f128_lt_quiet
+    return _batch(_f128_compare_loop, &k, (x, y), 16, out, bytearray, 1, flags, context, Float128)
 
 
-cpdef Int32 f64_to_i32(
-    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary64 floating point to a 32-bit signed integer.
+cpdef bf16_to_f32_array(x, out=None, flags=None, context=None):
+    """Converts the 16-bit brain floating points to IEEE 754 binary32 floating points element-wise.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The 16-bit brain floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int32(sf.f64_to_i32(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.lut = _get_lut(_LUT_BF16_TO_F32, 0, False)
+    return _batch(_lut32_loop, &k, (x,), 2, out, Float32Array, 4, flags, context)
 
 
-cpdef Int64 f64_to_i64(
-    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary64 floating point to a 64-bit signed integer.
+cpdef f16_to_f32_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary16 floating points to binary32 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The IEEE 754 binary16 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int64(sf.f64_to_i64(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    k.lut = _get_lut(_LUT_F16_TO_F32, 0, False)
+    return _batch(_lut32_loop, &k, (x,), 2, out, Float32Array, 4, flags, context)
 
 
-cpdef Float16 f64_to_f16(Float64 x):
-    """Converts the IEEE 754 binary64 floating point to a binary16 floating point.
+cpdef f16_to_f64_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary16 floating points to binary64 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
+        x: The IEEE 754 binary16 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f64_to_f16(x._data))
+    cdef _Kernel k
+    return _batch(_f16_to_f64_loop, &k, (x,), 2, out, Float64Array, 8, flags, context)
 
 
-cpdef Float32 f64_to_f32(Float64 x):
-    """Converts the IEEE 754 binary64 floating point to a binary32 floating point.
+cpdef f16_to_f128_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary16 floating points to binary128 floating points element-wise.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
+        x: The IEEE 754 binary16 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f64_to_f32(x._data))
+    cdef _Kernel k
+    return _batch(_f16_to_f128_loop, &k, (x,), 2, out, Float128Array, 16, flags, context)
 
 
-cpdef Float128 f64_to_f128(Float64 x):
-    """Converts the IEEE 754 binary64 floating point to a binary128 floating point.
+cpdef f32_to_bf16_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary32 floating points to 16-bit brain floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be converted.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary128 floating point.
+        The 16-bit brain floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f64_to_f128(x._data))
+    cdef _Kernel k
+    return _batch(_f32_to_bf16_loop, &k, (x,), 4, out, BFloat16Array, 2, flags, context)
 
 
-cpdef Float64 f64_round_to_int(
-    Float64 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Rounds the number expressed as an IEEE 754 binary64 floating point.
+cpdef f32_to_f16_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary32 floating points to binary16 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The IEEE 754 binary64 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary64 floating point.
+        The IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f64_roundToInt(x._data, rounding_mode, exact))
+    cdef _Kernel k
+    return _batch(_f32_to_f16_loop, &k, (x,), 4, out, Float16Array, 2, flags, context)
 
 
-cpdef Float64 f64_neg(Float64 x):
-    """Negates the IEEE 754 binary64 floating point.
+cpdef f32_to_f64_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary32 floating points to binary64 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be negated.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``-x``).
+        The IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    cdef Float64 f = Float64()
-    f._data.v = x._data.v ^ <uint64_t>0x80000000_00000000
-    return f
+    cdef _Kernel k
+    return _batch(_f32_to_f64_loop, &k, (x,), 4, out, Float64Array, 8, flags, context)
 
 
-cpdef Float64 f64_add(Float64 x, Float64 y):
-    """Adds the IEEE 754 binary64 floating points.
+cpdef f32_to_f128_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary32 floating points to binary128 floating points element-wise.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be added.
-        y: The floating point to add.
+        x: The IEEE 754 binary32 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x + y``).
+        The IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f64_add(x._data, y._data))
+    cdef _Kernel k
+    return _batch(_f32_to_f128_loop, &k, (x,), 4, out, Float128Array, 16, flags, context)
 
 
-cpdef Float64 f64_sub(Float64 x, Float64 y):
-    """Subtracts the IEEE 754 binary64 floating points.
+cpdef f64_to_f16_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary64 floating points to binary16 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
+        x: The IEEE 754 binary64 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x - y``).
+        The IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f64_sub(x._data, y._data))
+    cdef _Kernel k
+    return _batch(_f64_to_f16_loop, &k, (x,), 8, out, Float16Array, 2, flags, context)
 
 
-cpdef Float64 f64_mul(Float64 x, Float64 y):
-    """Multiplies the IEEE 754 binary64 floating points.
+cpdef f64_to_f32_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary64 floating points to binary32 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The IEEE 754 binary64 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y``).
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f64_mul(x._data, y._data))
+    cdef _Kernel k
+    return _batch(_f64_to_f32_loop, &k, (x,), 8, out, Float32Array, 4, flags, context)
 
 
-cpdef Float64 f64_mul_add(Float64 x, Float64 y, Float64 z):
-    """Multiplies and Adds the IEEE 754 binary64 floating points.
+cpdef f64_to_f128_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary64 floating points to binary128 floating points element-wise.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
+        x: The IEEE 754 binary64 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x * y + z``).
+        The IEEE 754 binary128 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f64_mulAdd(x._data, y._data, z._data))
+    cdef _Kernel k
+    return _batch(_f64_to_f128_loop, &k, (x,), 8, out, Float128Array, 16, flags, context)
 
 
-cpdef Float64 f64_div(Float64 x, Float64 y):
-    """Divides the IEEE 754 binary64 floating points.
+cpdef f128_to_f16_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary128 floating points to binary16 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The IEEE 754 binary128 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x / y``).
+        The IEEE 754 binary16 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f64_div(x._data, y._data))
+    cdef _Kernel k
+    return _batch(_f128_to_f16_loop, &k, (x,), 16, out, Float16Array, 2, flags, context)
 
 
-cpdef Float64 f64_rem(Float64 x, Float64 y):
-    """Calculates a remainder by dividing the IEEE 754 binary64 floating points.
+cpdef f128_to_f32_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary128 floating points to binary32 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The IEEE 754 binary128 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``x % y``).
+        The IEEE 754 binary32 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f64_rem(x._data, y._data))
+    cdef _Kernel k
+    return _batch(_f128_to_f32_loop, &k, (x,), 16, out, Float32Array, 4, flags, context)
 
 
-cpdef Float64 f64_sqrt(Float64 x):
-    """Calculates a square root of the IEEE 754 binary64 floating point.
+cpdef f128_to_f64_array(x, out=None, flags=None, context=None):
+    """Converts the IEEE 754 binary128 floating points to binary64 floating points element-wise.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
 
     Args:
-        x: The floating point whose square root is to be calculated.
+        x: The IEEE 754 binary128 floating points to be converted.
+        out: The buffer to store the results. If ``None`` is specified, a new array is created.
+        flags: The buffer to store the floating-point exception flags raised by each element.
+               If ``None`` is specified, they are not stored. In either case, the flags raised
+               by all the elements are accumulated into the current floating-point exception flags
+               or those of the context.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary64 floating point (``sqrt(x)``).
+        The IEEE 754 binary64 floating points.
+
+    Raises:
+        ValueError: If the lengths of the operand and the results are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
+
+    """
+    cdef _Kernel k
+    return _batch(_f128_to_f64_loop, &k, (x,), 16, out, Float64Array, 8, flags, context)
+
+
+# The pairwise summation sums sequentially the blocks of up to _PAIRWISE_BLOCK elements.
+cdef enum:
+    _PAIRWISE_BLOCK = 8
+
+
+cdef inline bint _bf16_signbit(sf.bfloat16_t a) noexcept nogil:
+    return (a.v >> 15) != 0
+
+
+cdef inline bint _bf16_is_nan(sf.bfloat16_t a) noexcept nogil:
+    return (a.v & 0x7FFF) > 0x7F80
+
+
+cdef inline bint _bf16_is_finite(sf.bfloat16_t a) noexcept nogil:
+    return (a.v & 0x7F80) != 0x7F80
+
+
+cdef inline sf.bfloat16_t _bf16_negate(sf.bfloat16_t a) noexcept nogil:
+    a.v ^= 0x8000
+    return a
+
+
+cdef sf.bfloat16_t _bf16_sequential_sum(const sf.bfloat16_t* x, const sf.bfloat16_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, from the first to the last.
+    cdef sf.bfloat16_t s
+    cdef Py_ssize_t i
+    if y == NULL:
+        s = x[0]
+        for i in range(1, n):
+            s = _bf16_add(s, x[i])
+    elif fused:
+        s = _bf16_mul(x[0], y[0])
+        for i in range(1, n):
+            s = _bf16_mulAdd(x[i], y[i], s)
+    else:
+        s = _bf16_mul(x[0], y[0])
+        for i in range(1, n):
+            s = _bf16_add(s, _bf16_mul(x[i], y[i]))
+    return s
+
+
+cdef sf.bfloat16_t _bf16_pairwise_sum(const sf.bfloat16_t* x, const sf.bfloat16_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    cdef Py_ssize_t m = n // 2
+    cdef sf.bfloat16_t s, t
+    if n <= _PAIRWISE_BLOCK:
+        return _bf16_sequential_sum(x, y, n, fused)
+    s = _bf16_pairwise_sum(x, y, m, fused)
+    t = _bf16_pairwise_sum(x + m, y + m if y != NULL else NULL, n - m, fused)
+    return _bf16_add(s, t)
+
+
+cdef sf.bfloat16_t _bf16_compensated_sum(const sf.bfloat16_t* x, const sf.bfloat16_t* y, Py_ssize_t n) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, by Sum2 and Dot2
+    # of Ogita, Rump, and Oishi. The rounding errors of the additions (TwoSum) and the multiplications
+    # (TwoProduct by FMA) are accumulated into c, which is added last. Once the sum is not finite,
+    # the errors are no longer computed, lest they raise the invalid exception.
+    cdef sf.bfloat16_t s, c, a, e, t, u
+    cdef bint finite = True
+    cdef Py_ssize_t i
+    for i in range(n):
+        if y == NULL:
+            a = x[i]
+            e = sf.f32_to_bf16(sf.ui32_to_f32(0))
+        else:
+            a = _bf16_mul(x[i], y[i])
+            e = _bf16_mulAdd(x[i], y[i], _bf16_negate(a)) if _bf16_is_finite(a) else sf.f32_to_bf16(sf.ui32_to_f32(0))
+        if i == 0:
+            s = a
+            c = e
+            finite = _bf16_is_finite(s)
+        elif finite:
+            t = _bf16_add(s, a)
+            if _bf16_is_finite(t):
+                u = _bf16_sub(t, s)
+                c = _bf16_add(c, _bf16_add(e, _bf16_add(_bf16_sub(s, _bf16_sub(t, u)), _bf16_sub(a, u))))
+            else:
+                finite = False
+            s = t
+        else:
+            s = _bf16_add(s, a)
+    if not finite or _bf16_eq(c, sf.f32_to_bf16(sf.ui32_to_f32(0))):  # keeps the sign of a zero sum
+        return s
+    return _bf16_add(s, c)
+
+
+cdef void _bf16_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x + start
+    cdef const sf.bfloat16_t* y = <const sf.bfloat16_t*>k.y + start if k.y != NULL else NULL
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef Py_ssize_t n = stop - start
+    if n == 0:
+        z[0] = sf.f32_to_bf16(sf.ui32_to_f32(0))
+    elif k.method == SummationMethod.PAIRWISE:
+        z[0] = _bf16_pairwise_sum(x, y, n, k.fused)
+    elif k.method == SummationMethod.COMPENSATED:
+        z[0] = _bf16_compensated_sum(x, y, n)
+    else:
+        z[0] = _bf16_sequential_sum(x, y, n, k.fused)
+
+
+cdef void _bf16_prod_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef sf.bfloat16_t r
+    cdef Py_ssize_t i
+    if start == stop:
+        z[0] = sf.f32_to_bf16(sf.ui32_to_f32(1))
+        return
+    r = x[start]
+    for i in range(start + 1, stop):
+        r = _bf16_mul(r, x[i])
+    z[0] = r
+
+
+cdef void _bf16_min_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef sf.bfloat16_t r = x[start]
+    cdef sf.bfloat16_t a
+    cdef bint nan = _bf16_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = _bf16_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _bf16_is_nan(a):
+            a = _bf16_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (_bf16_lt(a, r) or (_bf16_eq(a, r) and _bf16_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef void _bf16_max_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef sf.bfloat16_t r = x[start]
+    cdef sf.bfloat16_t a
+    cdef bint nan = _bf16_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = _bf16_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _bf16_is_nan(a):
+            a = _bf16_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (_bf16_lt(r, a) or (_bf16_eq(a, r) and not _bf16_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef sf.bfloat16_t _bf16_round_exact(bint negative, Py_ssize_t e, uint64_t hi, uint64_t lo) noexcept nogil:
+    # Rounds (hi:lo) * 2^e to odd in binary32 and then to bfloat16. It is zero or has its most significant bit at the bit 127 of hi:lo.
+    cdef uint_fast8_t mode, flags
+    cdef sf.float32_t z
+    _bf16_enter(&mode, &flags)
+    if hi == 0:
+        z = softfloat_normRoundPackToF32(negative, 0x9C, 0)
+    else:
+        z = softfloat_normRoundPackToF32(
+        negative, e + 253, <uint32_t>(hi >> 33) | <uint32_t>(((hi & <uint64_t>0x1_FFFFFFFF) | lo) != 0)
+    )
+    return _bf16_exit(z, mode, flags)
+
+
+cdef void _bf16_exact_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint16_t a
+    cdef uint64_t sig[1]
+    cdef Py_ssize_t exp, i
+    cdef bint negative, nonzero
+    for i in range(start, stop):
+        a = x[i].v
+        negative = (a >> 15) != 0
+        exp = (a >> 7) & 0xFF
+        sig[0] = a & ((<uint16_t>1 << 7) - 1)
+        nonzero = sig[0] != 0
+        if exp == 0xFF:
+            if nonzero:
+                if (sig[0] & 0x40) == 0:
+                    sf.softfloat_exceptionFlags |= sf.softfloat_flag_invalid
+                if acc.nan < 0:
+                    acc.nan = i
+            elif negative:
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if not negative or exp != 0 or nonzero:
+            acc.negative_zero = False
+        if exp != 0:
+            sig[0] |= <uint64_t>1 << 7
+            nonzero = True
+            exp -= 1
+        if nonzero:
+            _acc_add(acc, sig, 1, exp, negative)
+
+
+cdef void _bf16_exact_sum_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = _bf16_add(x[acc.nan], x[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        z[0] = _bf16_sub(x[acc.pos_inf], x[acc.pos_inf])
+    elif acc.pos_inf >= 0:
+        z[0] = x[acc.pos_inf]
+    elif acc.neg_inf >= 0:
+        z[0] = x[acc.neg_inf]
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _bf16_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _bf16_round_exact(negative, top - 260, hi, lo)
+
+
+cdef void _bf16_exact_dot_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef const sf.bfloat16_t* y = <const sf.bfloat16_t*>k.y
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint16_t a, b
+    cdef uint64_t siga, sigb
+    cdef uint64_t sig[1]
+    cdef sf.bfloat16_t r
+    cdef Py_ssize_t expa, expb, i
+    cdef bint negative
+    for i in range(start, stop):
+        a = x[i].v
+        b = y[i].v
+        negative = ((a ^ b) >> 15) != 0
+        expa = (a >> 7) & 0xFF
+        expb = (b >> 7) & 0xFF
+        siga = a & ((<uint16_t>1 << 7) - 1)
+        sigb = b & ((<uint16_t>1 << 7) - 1)
+        if expa == 0xFF or expb == 0xFF:
+            # The infinities and the NaNs, including the invalid products, are left to the multiplication.
+            r = _bf16_mul(x[i], y[i])
+            if _bf16_is_nan(r):
+                if acc.nan < 0:
+                    acc.nan = i
+            elif _bf16_signbit(r):
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if (expa == 0 and siga == 0) or (expb == 0 and sigb == 0):
+            if not negative:
+                acc.negative_zero = False
+            continue
+        acc.negative_zero = False
+        if expa != 0:
+            siga |= <uint64_t>1 << 7
+            expa -= 1
+        if expb != 0:
+            sigb |= <uint64_t>1 << 7
+            expb -= 1
+        sig[0] = siga * sigb
+        _acc_add(acc, sig, 1, expa + expb, negative)
+
+
+cdef void _bf16_exact_dot_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef const sf.bfloat16_t* y = <const sf.bfloat16_t*>k.y
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef sf.bfloat16_t r
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = _bf16_mul(x[acc.nan], y[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        r = _bf16_mul(x[acc.pos_inf], y[acc.pos_inf])
+        z[0] = _bf16_sub(r, r)
+    elif acc.pos_inf >= 0:
+        z[0] = _bf16_mul(x[acc.pos_inf], y[acc.pos_inf])
+    elif acc.neg_inf >= 0:
+        z[0] = _bf16_mul(x[acc.neg_inf], y[acc.neg_inf])
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _bf16_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _bf16_round_exact(negative, top - 393, hi, lo)
+
+
+cdef inline bint _f16_signbit(sf.float16_t a) noexcept nogil:
+    return (a.v >> 15) != 0
+
+
+cdef inline bint _f16_is_nan(sf.float16_t a) noexcept nogil:
+    return (a.v & 0x7FFF) > 0x7C00
+
+
+cdef inline sf.float16_t _f16_negate(sf.float16_t a) noexcept nogil:
+    a.v ^= 0x8000
+    return a
+
+
+cdef sf.float16_t _f16_sequential_sum(const sf.float16_t* x, const sf.float16_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, from the first to the last.
+    cdef sf.float16_t s
+    cdef Py_ssize_t i
+    if y == NULL:
+        s = x[0]
+        for i in range(1, n):
+            s = sf.f16_add(s, x[i])
+    elif fused:
+        s = sf.f16_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f16_mulAdd(x[i], y[i], s)
+    else:
+        s = sf.f16_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f16_add(s, sf.f16_mul(x[i], y[i]))
+    return s
+
+
+cdef sf.float16_t _f16_pairwise_sum(const sf.float16_t* x, const sf.float16_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    cdef Py_ssize_t m = n // 2
+    cdef sf.float16_t s, t
+    if n <= _PAIRWISE_BLOCK:
+        return _f16_sequential_sum(x, y, n, fused)
+    s = _f16_pairwise_sum(x, y, m, fused)
+    t = _f16_pairwise_sum(x + m, y + m if y != NULL else NULL, n - m, fused)
+    return sf.f16_add(s, t)
+
+
+cdef sf.float16_t _f16_compensated_sum(const sf.float16_t* x, const sf.float16_t* y, Py_ssize_t n) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, by Sum2 and Dot2
+    # of Ogita, Rump, and Oishi. The rounding errors of the additions (TwoSum) and the multiplications
+    # (TwoProduct by FMA) are accumulated into c, which is added last. Once the sum is not finite,
+    # the errors are no longer computed, lest they raise the invalid exception.
+    cdef sf.float16_t s, c, a, e, t, u
+    cdef bint finite = True
+    cdef Py_ssize_t i
+    for i in range(n):
+        if y == NULL:
+            a = x[i]
+            e = sf.ui32_to_f16(0)
+        else:
+            a = sf.f16_mul(x[i], y[i])
+            e = sf.f16_mulAdd(x[i], y[i], _f16_negate(a)) if _f16_is_finite(a) else sf.ui32_to_f16(0)
+        if i == 0:
+            s = a
+            c = e
+            finite = _f16_is_finite(s)
+        elif finite:
+            t = sf.f16_add(s, a)
+            if _f16_is_finite(t):
+                u = sf.f16_sub(t, s)
+                c = sf.f16_add(c, sf.f16_add(e, sf.f16_add(sf.f16_sub(s, sf.f16_sub(t, u)), sf.f16_sub(a, u))))
+            else:
+                finite = False
+            s = t
+        else:
+            s = sf.f16_add(s, a)
+    if not finite or sf.f16_eq(c, sf.ui32_to_f16(0)):  # keeps the sign of a zero sum
+        return s
+    return sf.f16_add(s, c)
+
+
+cdef void _f16_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x + start
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y + start if k.y != NULL else NULL
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef Py_ssize_t n = stop - start
+    if n == 0:
+        z[0] = sf.ui32_to_f16(0)
+    elif k.method == SummationMethod.PAIRWISE:
+        z[0] = _f16_pairwise_sum(x, y, n, k.fused)
+    elif k.method == SummationMethod.COMPENSATED:
+        z[0] = _f16_compensated_sum(x, y, n)
+    else:
+        z[0] = _f16_sequential_sum(x, y, n, k.fused)
+
+
+cdef void _f16_prod_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef sf.float16_t r
+    cdef Py_ssize_t i
+    if start == stop:
+        z[0] = sf.ui32_to_f16(1)
+        return
+    r = x[start]
+    for i in range(start + 1, stop):
+        r = sf.f16_mul(r, x[i])
+    z[0] = r
+
+
+cdef void _f16_min_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef sf.float16_t r = x[start]
+    cdef sf.float16_t a
+    cdef bint nan = _f16_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f16_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f16_is_nan(a):
+            a = sf.f16_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f16_lt(a, r) or (sf.f16_eq(a, r) and _f16_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef void _f16_max_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef sf.float16_t r = x[start]
+    cdef sf.float16_t a
+    cdef bint nan = _f16_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f16_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f16_is_nan(a):
+            a = sf.f16_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f16_lt(r, a) or (sf.f16_eq(a, r) and not _f16_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef sf.float16_t _f16_round_exact(bint negative, Py_ssize_t e, uint64_t hi, uint64_t lo) noexcept nogil:
+    # Rounds (hi:lo) * 2^e, which is zero or has its most significant bit at the bit 127 of hi:lo.
+    if hi == 0:
+        return softfloat_normRoundPackToF16(negative, 0x1C, 0)
+    return softfloat_normRoundPackToF16(
+        negative, e + 141, <uint16_t>(hi >> 49) | <uint16_t>(((hi & <uint64_t>0x1FFFF_FFFFFFFF) | lo) != 0)
+    )
+
+
+cdef void _f16_exact_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint16_t a
+    cdef uint64_t sig[1]
+    cdef Py_ssize_t exp, i
+    cdef bint negative, nonzero
+    for i in range(start, stop):
+        a = x[i].v
+        negative = (a >> 15) != 0
+        exp = (a >> 10) & 0x1F
+        sig[0] = a & ((<uint16_t>1 << 10) - 1)
+        nonzero = sig[0] != 0
+        if exp == 0x1F:
+            if nonzero:
+                if (sig[0] & 0x200) == 0:
+                    sf.softfloat_exceptionFlags |= sf.softfloat_flag_invalid
+                if acc.nan < 0:
+                    acc.nan = i
+            elif negative:
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if not negative or exp != 0 or nonzero:
+            acc.negative_zero = False
+        if exp != 0:
+            sig[0] |= <uint64_t>1 << 10
+            nonzero = True
+            exp -= 1
+        if nonzero:
+            _acc_add(acc, sig, 1, exp, negative)
+
+
+cdef void _f16_exact_sum_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f16_add(x[acc.nan], x[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        z[0] = sf.f16_sub(x[acc.pos_inf], x[acc.pos_inf])
+    elif acc.pos_inf >= 0:
+        z[0] = x[acc.pos_inf]
+    elif acc.neg_inf >= 0:
+        z[0] = x[acc.neg_inf]
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f16_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f16_round_exact(negative, top - 151, hi, lo)
+
+
+cdef void _f16_exact_dot_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint16_t a, b
+    cdef uint64_t siga, sigb
+    cdef uint64_t sig[1]
+    cdef sf.float16_t r
+    cdef Py_ssize_t expa, expb, i
+    cdef bint negative
+    for i in range(start, stop):
+        a = x[i].v
+        b = y[i].v
+        negative = ((a ^ b) >> 15) != 0
+        expa = (a >> 10) & 0x1F
+        expb = (b >> 10) & 0x1F
+        siga = a & ((<uint16_t>1 << 10) - 1)
+        sigb = b & ((<uint16_t>1 << 10) - 1)
+        if expa == 0x1F or expb == 0x1F:
+            # The infinities and the NaNs, including the invalid products, are left to the multiplication.
+            r = sf.f16_mul(x[i], y[i])
+            if _f16_is_nan(r):
+                if acc.nan < 0:
+                    acc.nan = i
+            elif _f16_signbit(r):
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if (expa == 0 and siga == 0) or (expb == 0 and sigb == 0):
+            if not negative:
+                acc.negative_zero = False
+            continue
+        acc.negative_zero = False
+        if expa != 0:
+            siga |= <uint64_t>1 << 10
+            expa -= 1
+        if expb != 0:
+            sigb |= <uint64_t>1 << 10
+            expb -= 1
+        sig[0] = siga * sigb
+        _acc_add(acc, sig, 1, expa + expb, negative)
+
+
+cdef void _f16_exact_dot_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef sf.float16_t r
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f16_mul(x[acc.nan], y[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        r = sf.f16_mul(x[acc.pos_inf], y[acc.pos_inf])
+        z[0] = sf.f16_sub(r, r)
+    elif acc.pos_inf >= 0:
+        z[0] = sf.f16_mul(x[acc.pos_inf], y[acc.pos_inf])
+    elif acc.neg_inf >= 0:
+        z[0] = sf.f16_mul(x[acc.neg_inf], y[acc.neg_inf])
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f16_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f16_round_exact(negative, top - 175, hi, lo)
+
+
+cdef inline bint _f32_signbit(sf.float32_t a) noexcept nogil:
+    return (a.v >> 31) != 0
+
+
+cdef inline bint _f32_is_nan(sf.float32_t a) noexcept nogil:
+    return (a.v & 0x7FFFFFFF) > 0x7F800000
+
+
+cdef inline sf.float32_t _f32_negate(sf.float32_t a) noexcept nogil:
+    a.v ^= <uint32_t>0x80000000
+    return a
+
+
+cdef sf.float32_t _f32_sequential_sum(const sf.float32_t* x, const sf.float32_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, from the first to the last.
+    cdef sf.float32_t s
+    cdef Py_ssize_t i
+    if y == NULL:
+        s = x[0]
+        for i in range(1, n):
+            s = sf.f32_add(s, x[i])
+    elif fused:
+        s = sf.f32_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f32_mulAdd(x[i], y[i], s)
+    else:
+        s = sf.f32_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f32_add(s, sf.f32_mul(x[i], y[i]))
+    return s
+
+
+cdef sf.float32_t _f32_pairwise_sum(const sf.float32_t* x, const sf.float32_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    cdef Py_ssize_t m = n // 2
+    cdef sf.float32_t s, t
+    if n <= _PAIRWISE_BLOCK:
+        return _f32_sequential_sum(x, y, n, fused)
+    s = _f32_pairwise_sum(x, y, m, fused)
+    t = _f32_pairwise_sum(x + m, y + m if y != NULL else NULL, n - m, fused)
+    return sf.f32_add(s, t)
+
+
+cdef sf.float32_t _f32_compensated_sum(const sf.float32_t* x, const sf.float32_t* y, Py_ssize_t n) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, by Sum2 and Dot2
+    # of Ogita, Rump, and Oishi. The rounding errors of the additions (TwoSum) and the multiplications
+    # (TwoProduct by FMA) are accumulated into c, which is added last. Once the sum is not finite,
+    # the errors are no longer computed, lest they raise the invalid exception.
+    cdef sf.float32_t s, c, a, e, t, u
+    cdef bint finite = True
+    cdef Py_ssize_t i
+    for i in range(n):
+        if y == NULL:
+            a = x[i]
+            e = sf.ui32_to_f32(0)
+        else:
+            a = sf.f32_mul(x[i], y[i])
+            e = sf.f32_mulAdd(x[i], y[i], _f32_negate(a)) if _f32_is_finite(a) else sf.ui32_to_f32(0)
+        if i == 0:
+            s = a
+            c = e
+            finite = _f32_is_finite(s)
+        elif finite:
+            t = sf.f32_add(s, a)
+            if _f32_is_finite(t):
+                u = sf.f32_sub(t, s)
+                c = sf.f32_add(c, sf.f32_add(e, sf.f32_add(sf.f32_sub(s, sf.f32_sub(t, u)), sf.f32_sub(a, u))))
+            else:
+                finite = False
+            s = t
+        else:
+            s = sf.f32_add(s, a)
+    if not finite or sf.f32_eq(c, sf.ui32_to_f32(0)):  # keeps the sign of a zero sum
+        return s
+    return sf.f32_add(s, c)
+
+
+cdef void _f32_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x + start
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y + start if k.y != NULL else NULL
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef Py_ssize_t n = stop - start
+    if n == 0:
+        z[0] = sf.ui32_to_f32(0)
+    elif k.method == SummationMethod.PAIRWISE:
+        z[0] = _f32_pairwise_sum(x, y, n, k.fused)
+    elif k.method == SummationMethod.COMPENSATED:
+        z[0] = _f32_compensated_sum(x, y, n)
+    else:
+        z[0] = _f32_sequential_sum(x, y, n, k.fused)
+
+
+cdef void _f32_prod_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef sf.float32_t r
+    cdef Py_ssize_t i
+    if start == stop:
+        z[0] = sf.ui32_to_f32(1)
+        return
+    r = x[start]
+    for i in range(start + 1, stop):
+        r = sf.f32_mul(r, x[i])
+    z[0] = r
+
+
+cdef void _f32_min_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef sf.float32_t r = x[start]
+    cdef sf.float32_t a
+    cdef bint nan = _f32_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f32_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f32_is_nan(a):
+            a = sf.f32_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f32_lt(a, r) or (sf.f32_eq(a, r) and _f32_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef void _f32_max_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef sf.float32_t r = x[start]
+    cdef sf.float32_t a
+    cdef bint nan = _f32_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f32_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f32_is_nan(a):
+            a = sf.f32_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f32_lt(r, a) or (sf.f32_eq(a, r) and not _f32_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef sf.float32_t _f32_round_exact(bint negative, Py_ssize_t e, uint64_t hi, uint64_t lo) noexcept nogil:
+    # Rounds (hi:lo) * 2^e, which is zero or has its most significant bit at the bit 127 of hi:lo.
+    if hi == 0:
+        return softfloat_normRoundPackToF32(negative, 0x9C, 0)
+    return softfloat_normRoundPackToF32(
+        negative, e + 253, <uint32_t>(hi >> 33) | <uint32_t>(((hi & <uint64_t>0x1_FFFFFFFF) | lo) != 0)
+    )
+
+
+cdef void _f32_exact_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint32_t a
+    cdef uint64_t sig[1]
+    cdef Py_ssize_t exp, i
+    cdef bint negative, nonzero
+    for i in range(start, stop):
+        a = x[i].v
+        negative = (a >> 31) != 0
+        exp = (a >> 23) & 0xFF
+        sig[0] = a & ((<uint32_t>1 << 23) - 1)
+        nonzero = sig[0] != 0
+        if exp == 0xFF:
+            if nonzero:
+                if (sig[0] & 0x400000) == 0:
+                    sf.softfloat_exceptionFlags |= sf.softfloat_flag_invalid
+                if acc.nan < 0:
+                    acc.nan = i
+            elif negative:
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if not negative or exp != 0 or nonzero:
+            acc.negative_zero = False
+        if exp != 0:
+            sig[0] |= <uint64_t>1 << 23
+            nonzero = True
+            exp -= 1
+        if nonzero:
+            _acc_add(acc, sig, 1, exp, negative)
+
+
+cdef void _f32_exact_sum_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f32_add(x[acc.nan], x[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        z[0] = sf.f32_sub(x[acc.pos_inf], x[acc.pos_inf])
+    elif acc.pos_inf >= 0:
+        z[0] = x[acc.pos_inf]
+    elif acc.neg_inf >= 0:
+        z[0] = x[acc.neg_inf]
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f32_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f32_round_exact(negative, top - 276, hi, lo)
+
+
+cdef void _f32_exact_dot_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint32_t a, b
+    cdef uint64_t siga, sigb
+    cdef uint64_t sig[1]
+    cdef sf.float32_t r
+    cdef Py_ssize_t expa, expb, i
+    cdef bint negative
+    for i in range(start, stop):
+        a = x[i].v
+        b = y[i].v
+        negative = ((a ^ b) >> 31) != 0
+        expa = (a >> 23) & 0xFF
+        expb = (b >> 23) & 0xFF
+        siga = a & ((<uint32_t>1 << 23) - 1)
+        sigb = b & ((<uint32_t>1 << 23) - 1)
+        if expa == 0xFF or expb == 0xFF:
+            # The infinities and the NaNs, including the invalid products, are left to the multiplication.
+            r = sf.f32_mul(x[i], y[i])
+            if _f32_is_nan(r):
+                if acc.nan < 0:
+                    acc.nan = i
+            elif _f32_signbit(r):
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if (expa == 0 and siga == 0) or (expb == 0 and sigb == 0):
+            if not negative:
+                acc.negative_zero = False
+            continue
+        acc.negative_zero = False
+        if expa != 0:
+            siga |= <uint64_t>1 << 23
+            expa -= 1
+        if expb != 0:
+            sigb |= <uint64_t>1 << 23
+            expb -= 1
+        sig[0] = siga * sigb
+        _acc_add(acc, sig, 1, expa + expb, negative)
+
+
+cdef void _f32_exact_dot_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef sf.float32_t r
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f32_mul(x[acc.nan], y[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        r = sf.f32_mul(x[acc.pos_inf], y[acc.pos_inf])
+        z[0] = sf.f32_sub(r, r)
+    elif acc.pos_inf >= 0:
+        z[0] = sf.f32_mul(x[acc.pos_inf], y[acc.pos_inf])
+    elif acc.neg_inf >= 0:
+        z[0] = sf.f32_mul(x[acc.neg_inf], y[acc.neg_inf])
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f32_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f32_round_exact(negative, top - 425, hi, lo)
+
+
+cdef inline bint _f64_signbit(sf.float64_t a) noexcept nogil:
+    return (a.v >> 63) != 0
+
+
+cdef inline bint _f64_is_nan(sf.float64_t a) noexcept nogil:
+    return (a.v & <uint64_t>0x7FFFFFFF_FFFFFFFF) > <uint64_t>0x7FF00000_00000000
+
+
+cdef inline bint _f64_is_finite(sf.float64_t a) noexcept nogil:
+    return (a.v & <uint64_t>0x7FF00000_00000000) != <uint64_t>0x7FF00000_00000000
+
+
+cdef inline sf.float64_t _f64_negate(sf.float64_t a) noexcept nogil:
+    a.v ^= <uint64_t>0x80000000_00000000
+    return a
+
+
+cdef sf.float64_t _f64_sequential_sum(const sf.float64_t* x, const sf.float64_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, from the first to the last.
+    cdef sf.float64_t s
+    cdef Py_ssize_t i
+    if y == NULL:
+        s = x[0]
+        for i in range(1, n):
+            s = sf.f64_add(s, x[i])
+    elif fused:
+        s = sf.f64_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f64_mulAdd(x[i], y[i], s)
+    else:
+        s = sf.f64_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f64_add(s, sf.f64_mul(x[i], y[i]))
+    return s
+
+
+cdef sf.float64_t _f64_pairwise_sum(const sf.float64_t* x, const sf.float64_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    cdef Py_ssize_t m = n // 2
+    cdef sf.float64_t s, t
+    if n <= _PAIRWISE_BLOCK:
+        return _f64_sequential_sum(x, y, n, fused)
+    s = _f64_pairwise_sum(x, y, m, fused)
+    t = _f64_pairwise_sum(x + m, y + m if y != NULL else NULL, n - m, fused)
+    return sf.f64_add(s, t)
+
+
+cdef sf.float64_t _f64_compensated_sum(const sf.float64_t* x, const sf.float64_t* y, Py_ssize_t n) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, by Sum2 and Dot2
+    # of Ogita, Rump, and Oishi. The rounding errors of the additions (TwoSum) and the multiplications
+    # (TwoProduct by FMA) are accumulated into c, which is added last. Once the sum is not finite,
+    # the errors are no longer computed, lest they raise the invalid exception.
+    cdef sf.float64_t s, c, a, e, t, u
+    cdef bint finite = True
+    cdef Py_ssize_t i
+    for i in range(n):
+        if y == NULL:
+            a = x[i]
+            e = sf.ui32_to_f64(0)
+        else:
+            a = sf.f64_mul(x[i], y[i])
+            e = sf.f64_mulAdd(x[i], y[i], _f64_negate(a)) if _f64_is_finite(a) else sf.ui32_to_f64(0)
+        if i == 0:
+            s = a
+            c = e
+            finite = _f64_is_finite(s)
+        elif finite:
+            t = sf.f64_add(s, a)
+            if _f64_is_finite(t):
+                u = sf.f64_sub(t, s)
+                c = sf.f64_add(c, sf.f64_add(e, sf.f64_add(sf.f64_sub(s, sf.f64_sub(t, u)), sf.f64_sub(a, u))))
+            else:
+                finite = False
+            s = t
+        else:
+            s = sf.f64_add(s, a)
+    if not finite or sf.f64_eq(c, sf.ui32_to_f64(0)):  # keeps the sign of a zero sum
+        return s
+    return sf.f64_add(s, c)
+
+
+cdef void _f64_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x + start
+    cdef const sf.float64_t* y = <const sf.float64_t*>k.y + start if k.y != NULL else NULL
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef Py_ssize_t n = stop - start
+    if n == 0:
+        z[0] = sf.ui32_to_f64(0)
+    elif k.method == SummationMethod.PAIRWISE:
+        z[0] = _f64_pairwise_sum(x, y, n, k.fused)
+    elif k.method == SummationMethod.COMPENSATED:
+        z[0] = _f64_compensated_sum(x, y, n)
+    else:
+        z[0] = _f64_sequential_sum(x, y, n, k.fused)
+
+
+cdef void _f64_prod_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef sf.float64_t r
+    cdef Py_ssize_t i
+    if start == stop:
+        z[0] = sf.ui32_to_f64(1)
+        return
+    r = x[start]
+    for i in range(start + 1, stop):
+        r = sf.f64_mul(r, x[i])
+    z[0] = r
+
+
+cdef void _f64_min_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef sf.float64_t r = x[start]
+    cdef sf.float64_t a
+    cdef bint nan = _f64_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f64_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f64_is_nan(a):
+            a = sf.f64_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f64_lt(a, r) or (sf.f64_eq(a, r) and _f64_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef void _f64_max_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef sf.float64_t r = x[start]
+    cdef sf.float64_t a
+    cdef bint nan = _f64_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f64_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f64_is_nan(a):
+            a = sf.f64_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f64_lt(r, a) or (sf.f64_eq(a, r) and not _f64_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef sf.float64_t _f64_round_exact(bint negative, Py_ssize_t e, uint64_t hi, uint64_t lo) noexcept nogil:
+    # Rounds (hi:lo) * 2^e, which is zero or has its most significant bit at the bit 127 of hi:lo.
+    if hi == 0:
+        return softfloat_normRoundPackToF64(negative, 0x43C, 0)
+    return softfloat_normRoundPackToF64(negative, e + 1149, (hi >> 1) | <uint64_t>(((hi & 1) | lo) != 0))
+
+
+cdef void _f64_exact_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint64_t a
+    cdef uint64_t sig[1]
+    cdef Py_ssize_t exp, i
+    cdef bint negative, nonzero
+    for i in range(start, stop):
+        a = x[i].v
+        negative = (a >> 63) != 0
+        exp = (a >> 52) & 0x7FF
+        sig[0] = a & ((<uint64_t>1 << 52) - 1)
+        nonzero = sig[0] != 0
+        if exp == 0x7FF:
+            if nonzero:
+                if (sig[0] & <uint64_t>0x8_00000000_0000) == 0:
+                    sf.softfloat_exceptionFlags |= sf.softfloat_flag_invalid
+                if acc.nan < 0:
+                    acc.nan = i
+            elif negative:
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if not negative or exp != 0 or nonzero:
+            acc.negative_zero = False
+        if exp != 0:
+            sig[0] |= <uint64_t>1 << 52
+            nonzero = True
+            exp -= 1
+        if nonzero:
+            _acc_add(acc, sig, 1, exp, negative)
+
+
+cdef void _f64_exact_sum_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f64_add(x[acc.nan], x[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        z[0] = sf.f64_sub(x[acc.pos_inf], x[acc.pos_inf])
+    elif acc.pos_inf >= 0:
+        z[0] = x[acc.pos_inf]
+    elif acc.neg_inf >= 0:
+        z[0] = x[acc.neg_inf]
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f64_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f64_round_exact(negative, top - 1201, hi, lo)
+
+
+cdef void _f64_exact_dot_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef const sf.float64_t* y = <const sf.float64_t*>k.y
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef uint64_t a, b
+    cdef uint64_t siga, sigb
+    cdef uint128 t
+    cdef uint64_t sig[2]
+    cdef sf.float64_t r
+    cdef Py_ssize_t expa, expb, i
+    cdef bint negative
+    for i in range(start, stop):
+        a = x[i].v
+        b = y[i].v
+        negative = ((a ^ b) >> 63) != 0
+        expa = (a >> 52) & 0x7FF
+        expb = (b >> 52) & 0x7FF
+        siga = a & ((<uint64_t>1 << 52) - 1)
+        sigb = b & ((<uint64_t>1 << 52) - 1)
+        if expa == 0x7FF or expb == 0x7FF:
+            # The infinities and the NaNs, including the invalid products, are left to the multiplication.
+            r = sf.f64_mul(x[i], y[i])
+            if _f64_is_nan(r):
+                if acc.nan < 0:
+                    acc.nan = i
+            elif _f64_signbit(r):
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if (expa == 0 and siga == 0) or (expb == 0 and sigb == 0):
+            if not negative:
+                acc.negative_zero = False
+            continue
+        acc.negative_zero = False
+        if expa != 0:
+            siga |= <uint64_t>1 << 52
+            expa -= 1
+        if expb != 0:
+            sigb |= <uint64_t>1 << 52
+            expb -= 1
+        t = softfloat_mul64To128(siga, sigb)
+        sig[0] = t.v0
+        sig[1] = t.v64
+        _acc_add(acc, sig, 2, expa + expb, negative)
+
+
+cdef void _f64_exact_dot_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef const sf.float64_t* y = <const sf.float64_t*>k.y
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef sf.float64_t r
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f64_mul(x[acc.nan], y[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        r = sf.f64_mul(x[acc.pos_inf], y[acc.pos_inf])
+        z[0] = sf.f64_sub(r, r)
+    elif acc.pos_inf >= 0:
+        z[0] = sf.f64_mul(x[acc.pos_inf], y[acc.pos_inf])
+    elif acc.neg_inf >= 0:
+        z[0] = sf.f64_mul(x[acc.neg_inf], y[acc.neg_inf])
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f64_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f64_round_exact(negative, top - 2275, hi, lo)
+
+
+cdef inline bint _f128_signbit(sf.float128_t a) noexcept nogil:
+    cdef ui128_f128 t
+    t.f = a
+    return (t.ui.v64 >> 63) != 0
 
-    """
-    return _make_float64(sf.f64_sqrt(x._data))
 
+cdef inline bint _f128_is_nan(sf.float128_t a) noexcept nogil:
+    cdef ui128_f128 t
+    t.f = a
+    return ((t.ui.v64 & <uint64_t>0x7FFFFFFF_FFFFFFFF) | <uint64_t>(t.ui.v0 != 0)) > <uint64_t>0x7FFF0000_00000000
+
+
+cdef inline bint _f128_is_finite(sf.float128_t a) noexcept nogil:
+    cdef ui128_f128 t
+    t.f = a
+    return (t.ui.v64 & <uint64_t>0x7FFF0000_00000000) != <uint64_t>0x7FFF0000_00000000
 
-cpdef bool f64_eq(Float64 x, Float64 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+
+cdef inline sf.float128_t _f128_negate(sf.float128_t a) noexcept nogil:
+    cdef ui128_f128 t
+    t.f = a
+    t.ui.v64 ^= <uint64_t>0x80000000_00000000
+    return t.f
+
+
+cdef sf.float128_t _f128_sequential_sum(const sf.float128_t* x, const sf.float128_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, from the first to the last.
+    cdef sf.float128_t s
+    cdef Py_ssize_t i
+    if y == NULL:
+        s = x[0]
+        for i in range(1, n):
+            s = sf.f128_add(s, x[i])
+    elif fused:
+        s = sf.f128_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f128_mulAdd(x[i], y[i], s)
+    else:
+        s = sf.f128_mul(x[0], y[0])
+        for i in range(1, n):
+            s = sf.f128_add(s, sf.f128_mul(x[i], y[i]))
+    return s
+
+
+cdef sf.float128_t _f128_pairwise_sum(const sf.float128_t* x, const sf.float128_t* y, Py_ssize_t n, bint fused) noexcept nogil:
+    cdef Py_ssize_t m = n // 2
+    cdef sf.float128_t s, t
+    if n <= _PAIRWISE_BLOCK:
+        return _f128_sequential_sum(x, y, n, fused)
+    s = _f128_pairwise_sum(x, y, m, fused)
+    t = _f128_pairwise_sum(x + m, y + m if y != NULL else NULL, n - m, fused)
+    return sf.f128_add(s, t)
+
+
+cdef sf.float128_t _f128_compensated_sum(const sf.float128_t* x, const sf.float128_t* y, Py_ssize_t n) noexcept nogil:
+    # Sums the n > 0 elements of x, or the products of the elements of x and y, by Sum2 and Dot2
+    # of Ogita, Rump, and Oishi. The rounding errors of the additions (TwoSum) and the multiplications
+    # (TwoProduct by FMA) are accumulated into c, which is added last. Once the sum is not finite,
+    # the errors are no longer computed, lest they raise the invalid exception.
+    cdef sf.float128_t s, c, a, e, t, u
+    cdef bint finite = True
+    cdef Py_ssize_t i
+    for i in range(n):
+        if y == NULL:
+            a = x[i]
+            e = sf.ui32_to_f128(0)
+        else:
+            a = sf.f128_mul(x[i], y[i])
+            e = sf.f128_mulAdd(x[i], y[i], _f128_negate(a)) if _f128_is_finite(a) else sf.ui32_to_f128(0)
+        if i == 0:
+            s = a
+            c = e
+            finite = _f128_is_finite(s)
+        elif finite:
+            t = sf.f128_add(s, a)
+            if _f128_is_finite(t):
+                u = sf.f128_sub(t, s)
+                c = sf.f128_add(c, sf.f128_add(e, sf.f128_add(sf.f128_sub(s, sf.f128_sub(t, u)), sf.f128_sub(a, u))))
+            else:
+                finite = False
+            s = t
+        else:
+            s = sf.f128_add(s, a)
+    if not finite or sf.f128_eq(c, sf.ui32_to_f128(0)):  # keeps the sign of a zero sum
+        return s
+    return sf.f128_add(s, c)
+
+
+cdef void _f128_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x + start
+    cdef const sf.float128_t* y = <const sf.float128_t*>k.y + start if k.y != NULL else NULL
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef Py_ssize_t n = stop - start
+    if n == 0:
+        z[0] = sf.ui32_to_f128(0)
+    elif k.method == SummationMethod.PAIRWISE:
+        z[0] = _f128_pairwise_sum(x, y, n, k.fused)
+    elif k.method == SummationMethod.COMPENSATED:
+        z[0] = _f128_compensated_sum(x, y, n)
+    else:
+        z[0] = _f128_sequential_sum(x, y, n, k.fused)
+
+
+cdef void _f128_prod_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef sf.float128_t r
+    cdef Py_ssize_t i
+    if start == stop:
+        z[0] = sf.ui32_to_f128(1)
+        return
+    r = x[start]
+    for i in range(start + 1, stop):
+        r = sf.f128_mul(r, x[i])
+    z[0] = r
+
+
+cdef void _f128_min_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef sf.float128_t r = x[start]
+    cdef sf.float128_t a
+    cdef bint nan = _f128_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f128_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f128_is_nan(a):
+            a = sf.f128_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f128_lt(a, r) or (sf.f128_eq(a, r) and _f128_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef void _f128_max_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # The first NaN is returned quieted, and every signaling NaN raises the invalid exception.
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef sf.float128_t r = x[start]
+    cdef sf.float128_t a
+    cdef bint nan = _f128_is_nan(r)
+    cdef Py_ssize_t i
+    if nan:
+        r = sf.f128_add(r, r)
+    for i in range(start + 1, stop):
+        a = x[i]
+        if _f128_is_nan(a):
+            a = sf.f128_add(a, a)
+            if not nan:
+                r = a
+                nan = True
+        elif not nan and (sf.f128_lt(r, a) or (sf.f128_eq(a, r) and not _f128_signbit(a))):
+            r = a
+    z[0] = r
+
+
+cdef sf.float128_t _f128_round_exact(bint negative, Py_ssize_t e, uint64_t hi, uint64_t lo) noexcept nogil:
+    # Rounds (hi:lo) * 2^e, which is zero or has its most significant bit at the bit 127 of hi:lo.
+    if hi == 0:
+        return softfloat_normRoundPackToF128(negative, 0x406F, 0, 0)
+    return softfloat_normRoundPackToF128(negative, e + 16494, hi, lo)
+
+
+cdef void _f128_exact_sum_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef ui128_f128 t
+    cdef uint64_t sig[2]
+    cdef Py_ssize_t exp, i
+    cdef bint negative, nonzero
+    for i in range(start, stop):
+        t.f = x[i]
+        negative = (t.ui.v64 >> 63) != 0
+        exp = (t.ui.v64 >> 48) & 0x7FFF
+        sig[0] = t.ui.v0
+        sig[1] = t.ui.v64 & <uint64_t>0xFFFF_FFFFFFFF
+        nonzero = (sig[0] | sig[1]) != 0
+        if exp == 0x7FFF:
+            if nonzero:
+                if (sig[1] & <uint64_t>0x8000_00000000) == 0:
+                    sf.softfloat_exceptionFlags |= sf.softfloat_flag_invalid
+                if acc.nan < 0:
+                    acc.nan = i
+            elif negative:
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if not negative or exp != 0 or nonzero:
+            acc.negative_zero = False
+        if exp != 0:
+            sig[1] |= <uint64_t>1 << 48
+            nonzero = True
+            exp -= 1
+        if nonzero:
+            _acc_add(acc, sig, 2, exp, negative)
+
+
+cdef void _f128_exact_sum_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f128_add(x[acc.nan], x[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        z[0] = sf.f128_sub(x[acc.pos_inf], x[acc.pos_inf])
+    elif acc.pos_inf >= 0:
+        z[0] = x[acc.pos_inf]
+    elif acc.neg_inf >= 0:
+        z[0] = x[acc.neg_inf]
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f128_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f128_round_exact(negative, top - 16621, hi, lo)
+
+
+cdef void _f128_exact_dot_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef const sf.float128_t* y = <const sf.float128_t*>k.y
+    cdef _Accumulator* acc = <_Accumulator*>k.z
+    cdef ui128_f128 a, b
+    cdef uint64_t sig[4]
+    cdef sf.float128_t r
+    cdef Py_ssize_t expa, expb, i
+    cdef bint negative
+    for i in range(start, stop):
+        a.f = x[i]
+        b.f = y[i]
+        negative = ((a.ui.v64 ^ b.ui.v64) >> 63) != 0
+        expa = (a.ui.v64 >> 48) & 0x7FFF
+        expb = (b.ui.v64 >> 48) & 0x7FFF
+        a.ui.v64 &= <uint64_t>0xFFFF_FFFFFFFF
+        b.ui.v64 &= <uint64_t>0xFFFF_FFFFFFFF
+        if expa == 0x7FFF or expb == 0x7FFF:
+            # The infinities and the NaNs, including the invalid products, are left to the multiplication.
+            r = sf.f128_mul(x[i], y[i])
+            if _f128_is_nan(r):
+                if acc.nan < 0:
+                    acc.nan = i
+            elif _f128_signbit(r):
+                if acc.neg_inf < 0:
+                    acc.neg_inf = i
+            elif acc.pos_inf < 0:
+                acc.pos_inf = i
+            continue
+        if (expa == 0 and (a.ui.v64 | a.ui.v0) == 0) or (expb == 0 and (b.ui.v64 | b.ui.v0) == 0):
+            if not negative:
+                acc.negative_zero = False
+            continue
+        acc.negative_zero = False
+        if expa != 0:
+            a.ui.v64 |= <uint64_t>1 << 48
+            expa -= 1
+        if expb != 0:
+            b.ui.v64 |= <uint64_t>1 << 48
+            expb -= 1
+        softfloat_mul128To256M(a.ui.v64, a.ui.v0, b.ui.v64, b.ui.v0, sig)
+        _acc_add(acc, sig, 4, expa + expb, negative)
+
+
+cdef void _f128_exact_dot_finish(const _Kernel* k, _Accumulator* acc) noexcept nogil:
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef const sf.float128_t* y = <const sf.float128_t*>k.y
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef sf.float128_t r
+    cdef bint negative
+    cdef uint64_t hi, lo
+    cdef Py_ssize_t top
+    if acc.nan >= 0:
+        z[0] = sf.f128_mul(x[acc.nan], y[acc.nan])
+    elif acc.pos_inf >= 0 and acc.neg_inf >= 0:
+        r = sf.f128_mul(x[acc.pos_inf], y[acc.pos_inf])
+        z[0] = sf.f128_sub(r, r)
+    elif acc.pos_inf >= 0:
+        z[0] = sf.f128_mul(x[acc.pos_inf], y[acc.pos_inf])
+    elif acc.neg_inf >= 0:
+        z[0] = sf.f128_mul(x[acc.neg_inf], y[acc.neg_inf])
+    else:
+        top = _acc_top(acc, &negative, &hi, &lo)
+        if top < 0:
+            z[0] = _f128_round_exact(acc.negative_zero or sf.softfloat_roundingMode == sf.softfloat_round_min, 0, 0, 0)
+        else:
+            z[0] = _f128_round_exact(negative, top - 33115, hi, lo)
+
+
+cpdef BFloat16 bf16_sum(x, SummationMethod method=SummationMethod.SEQUENTIAL, FloatContext context=None):
+    """Sums the 16-bit brain floating points.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The resulted number expressed as a 16-bit brain floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f64_eq(x._data, y._data)
+    cdef sf.bfloat16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    if method == SummationMethod.EXACT:
+        _reduce(_bf16_exact_sum_loop, &k, (x,), 2, True, context, _bf16_exact_sum_finish, 7)
+    else:
+        _reduce(_bf16_sum_loop, &k, (x,), 2, True, context)
+    return _make_bfloat16(r)
 
 
-cpdef bool f64_le(Float64 x, Float64 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+cpdef BFloat16 bf16_dot(x, y, SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, FloatContext context=None):
+    """Calculates the dot product of the 16-bit brain floating points.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted number expressed as a 16-bit brain floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f64_le(x._data, y._data)
+    cdef sf.bfloat16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    k.fused = fused
+    if method == SummationMethod.EXACT:
+        _reduce(_bf16_exact_dot_loop, &k, (x, y), 2, True, context, _bf16_exact_dot_finish, 11)
+    else:
+        _reduce(_bf16_sum_loop, &k, (x, y), 2, True, context)
+    return _make_bfloat16(r)
 
 
-cpdef bool f64_lt(Float64 x, Float64 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+cpdef BFloat16 bf16_prod(x, FloatContext context=None):
+    """Multiplies the 16-bit brain floating points from the first to the last.
+
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted number expressed as a 16-bit brain floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f64_lt(x._data, y._data)
+    cdef sf.bfloat16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_bf16_prod_loop, &k, (x,), 2, True, context)
+    return _make_bfloat16(r)
 
 
-cpdef bool f64_eq_signaling(Float64 x, Float64 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary64 floating points.
+cpdef BFloat16 bf16_min(x, FloatContext context=None):
+    """Returns the minimum of the 16-bit brain floating points.
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The minimum expressed as a 16-bit brain floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f64_eq_signaling(x._data, y._data)
+    cdef sf.bfloat16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_bf16_min_loop, &k, (x,), 2, False, context)
+    return _make_bfloat16(r)
 
 
-cpdef bool f64_le_quiet(Float64 x, Float64 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary64 floating points.
+cpdef BFloat16 bf16_max(x, FloatContext context=None):
+    """Returns the maximum of the 16-bit brain floating points.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operand is a :class:`BFloat16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The maximum expressed as a 16-bit brain floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f64_le_quiet(x._data, y._data)
+    cdef sf.bfloat16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_bf16_max_loop, &k, (x,), 2, False, context)
+    return _make_bfloat16(r)
 
 
-cpdef bool f64_lt_quiet(Float64 x, Float64 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary64 floating points.
+cpdef Float16 f16_sum(x, SummationMethod method=SummationMethod.SEQUENTIAL, FloatContext context=None):
+    """Sums the IEEE 754 binary16 floating points.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted number expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f64_lt_quiet(x._data, y._data)
+    cdef sf.float16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    if method == SummationMethod.EXACT:
+        _reduce(_f16_exact_sum_loop, &k, (x,), 2, True, context, _f16_exact_sum_finish, 3)
+    else:
+        _reduce(_f16_sum_loop, &k, (x,), 2, True, context)
+    return _make_float16(r)
 
 
-cpdef bool f64_is_signaling_nan(Float64 x):
-    """Tests if the IEEE 754 binary64 floating point is a signaling NaN.
+cpdef Float16 f16_dot(x, y, SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, FloatContext context=None):
+    """Calculates the dot product of the IEEE 754 binary16 floating points.
+
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The floating point to be tested.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The resulted number expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f64_isSignalingNaN(x._data)
+    cdef sf.float16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    k.fused = fused
+    if method == SummationMethod.EXACT:
+        _reduce(_f16_exact_dot_loop, &k, (x, y), 2, True, context, _f16_exact_dot_finish, 4)
+    else:
+        _reduce(_f16_sum_loop, &k, (x, y), 2, True, context)
+    return _make_float16(r)
 
 
-cpdef UInt32 f128_to_ui32(
-    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary128 floating point to a 32-bit unsigned integer.
+cpdef Float16 f16_prod(x, FloatContext context=None):
+    """Multiplies the IEEE 754 binary16 floating points from the first to the last.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit unsigned integer.
+        The resulted number expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint32(sf.f128_to_ui32(x._data, rounding_mode, exact))
+    cdef sf.float16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f16_prod_loop, &k, (x,), 2, True, context)
+    return _make_float16(r)
 
 
-cpdef UInt64 f128_to_ui64(
-    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary128 floating point to a 64-bit unsigned integer.
+cpdef Float16 f16_min(x, FloatContext context=None):
+    """Returns the minimum of the IEEE 754 binary16 floating points.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit unsigned integer.
+        The minimum expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_uint64(sf.f128_to_ui64(x._data, rounding_mode, exact))
+    cdef sf.float16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f16_min_loop, &k, (x,), 2, False, context)
+    return _make_float16(r)
 
 
-cpdef Int32 f128_to_i32(
-    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary128 floating point to a 32-bit signed integer.
+cpdef Float16 f16_max(x, FloatContext context=None):
+    """Returns the maximum of the IEEE 754 binary16 floating points.
+
+    The operand is a :class:`Float16Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 32-bit signed integer.
+        The maximum expressed as an IEEE 754 binary16 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int32(sf.f128_to_i32(x._data, rounding_mode, exact))
+    cdef sf.float16_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f16_max_loop, &k, (x,), 2, False, context)
+    return _make_float16(r)
 
 
-cpdef Int64 f128_to_i64(
-    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Converts the IEEE 754 binary128 floating point to a 64-bit signed integer.
+cpdef Float32 f32_sum(x, SummationMethod method=SummationMethod.SEQUENTIAL, FloatContext context=None):
+    """Sums the IEEE 754 binary32 floating points.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact conversion is unable.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The 64-bit signed integer.
+        The resulted number expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_int64(sf.f128_to_i64(x._data, rounding_mode, exact))
+    cdef sf.float32_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    if method == SummationMethod.EXACT:
+        _reduce(_f32_exact_sum_loop, &k, (x,), 4, True, context, _f32_exact_sum_finish, 7)
+    else:
+        _reduce(_f32_sum_loop, &k, (x,), 4, True, context)
+    return _make_float32(r)
 
 
-cpdef Float16 f128_to_f16(Float128 x):
-    """Converts the IEEE 754 binary128 floating point to a binary16 floating point.
+cpdef Float32 f32_dot(x, y, SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, FloatContext context=None):
+    """Calculates the dot product of the IEEE 754 binary32 floating points.
+
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary16 floating point.
+        The resulted number expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float16(sf.f128_to_f16(x._data))
+    cdef sf.float32_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    k.fused = fused
+    if method == SummationMethod.EXACT:
+        _reduce(_f32_exact_dot_loop, &k, (x, y), 4, True, context, _f32_exact_dot_finish, 11)
+    else:
+        _reduce(_f32_sum_loop, &k, (x, y), 4, True, context)
+    return _make_float32(r)
 
 
-cpdef Float32 f128_to_f32(Float128 x):
-    """Converts the IEEE 754 binary128 floating point to a binary32 floating point.
+cpdef Float32 f32_prod(x, FloatContext context=None):
+    """Multiplies the IEEE 754 binary32 floating points from the first to the last.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary32 floating point.
+        The resulted number expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float32(sf.f128_to_f32(x._data))
+    cdef sf.float32_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f32_prod_loop, &k, (x,), 4, True, context)
+    return _make_float32(r)
 
 
-cpdef Float64 f128_to_f64(Float128 x):
-    """Converts the IEEE 754 binary128 floating point to a binary64 floating point.
+cpdef Float32 f32_min(x, FloatContext context=None):
+    """Returns the minimum of the IEEE 754 binary32 floating points.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be converted.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The IEEE 754 binary64 floating point.
+        The minimum expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float64(sf.f128_to_f64(x._data))
+    cdef sf.float32_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f32_min_loop, &k, (x,), 4, False, context)
+    return _make_float32(r)
 
 
-cpdef Float128 f128_round_to_int(
-    Float128 x, RoundingMode rounding_mode = get_rounding_mode(), bool exact = True
-):
-    """Rounds the number expressed as an IEEE 754 binary128 floating point.
+cpdef Float32 f32_max(x, FloatContext context=None):
+    """Returns the maximum of the IEEE 754 binary32 floating points.
+
+    The operand is a :class:`Float32Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The IEEE 754 binary128 floating point to be rounded.
-        rounding_mode: The rounding mode.
-        exact: If ``True`` is specified, the floating-point exception flags are to be set
-               when exact rounding is unable.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted integer expressed as an IEEE 754 binary128 floating point.
+        The maximum expressed as an IEEE 754 binary32 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_roundToInt(x._data, rounding_mode, exact))
+    cdef sf.float32_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f32_max_loop, &k, (x,), 4, False, context)
+    return _make_float32(r)
 
 
-cpdef Float128 f128_neg(Float128 x):
-    """Negates the IEEE 754 binary128 floating point.
+cpdef Float64 f64_sum(x, SummationMethod method=SummationMethod.SEQUENTIAL, FloatContext context=None):
+    """Sums the IEEE 754 binary64 floating points.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The floating point to be negated.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``-x``).
+        The resulted number expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    cdef ui128_f128 t
-    t.f = x._data
-    t.ui.v0 ^= <uint64_t>0x80000000_00000000
-    cdef Float128 o = Float128()
-    o._data = t.f
-    return o
+    cdef sf.float64_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    if method == SummationMethod.EXACT:
+        _reduce(_f64_exact_sum_loop, &k, (x,), 8, True, context, _f64_exact_sum_finish, 35)
+    else:
+        _reduce(_f64_sum_loop, &k, (x,), 8, True, context)
+    return _make_float64(r)
 
 
-cpdef Float128 f128_add(Float128 x, Float128 y):
-    """Adds the IEEE 754 binary128 floating points.
+cpdef Float64 f64_dot(x, y, SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, FloatContext context=None):
+    """Calculates the dot product of the IEEE 754 binary64 floating points.
+
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The floating point to be added.
-        y: The floating point to add.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x + y``).
+        The resulted number expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_add(x._data, y._data))
+    cdef sf.float64_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    k.fused = fused
+    if method == SummationMethod.EXACT:
+        _reduce(_f64_exact_dot_loop, &k, (x, y), 8, True, context, _f64_exact_dot_finish, 68)
+    else:
+        _reduce(_f64_sum_loop, &k, (x, y), 8, True, context)
+    return _make_float64(r)
 
 
-cpdef Float128 f128_sub(Float128 x, Float128 y):
-    """Subtracts the IEEE 754 binary128 floating points.
+cpdef Float64 f64_prod(x, FloatContext context=None):
+    """Multiplies the IEEE 754 binary64 floating points from the first to the last.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The floating point to be subtracted.
-        y: The floating point to subtract.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x - y``).
+        The resulted number expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_sub(x._data, y._data))
+    cdef sf.float64_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f64_prod_loop, &k, (x,), 8, True, context)
+    return _make_float64(r)
 
 
-cpdef Float128 f128_mul(Float128 x, Float128 y):
-    """Multiplies the IEEE 754 binary128 floating points.
+cpdef Float64 f64_min(x, FloatContext context=None):
+    """Returns the minimum of the IEEE 754 binary64 floating points.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y``).
+        The minimum expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_mul(x._data, y._data))
+    cdef sf.float64_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f64_min_loop, &k, (x,), 8, False, context)
+    return _make_float64(r)
 
 
-cpdef Float128 f128_mul_add(Float128 x, Float128 y, Float128 z):
-    """Multiplies and Adds the IEEE 754 binary128 floating points.
+cpdef Float64 f64_max(x, FloatContext context=None):
+    """Returns the maximum of the IEEE 754 binary64 floating points.
+
+    The operand is a :class:`Float64Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The floating point to be multiplied.
-        y: The floating point to multiply.
-        z: The floating point to add.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x * y + z``).
+        The maximum expressed as an IEEE 754 binary64 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_mulAdd(x._data, y._data, z._data))
+    cdef sf.float64_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f64_max_loop, &k, (x,), 8, False, context)
+    return _make_float64(r)
 
 
-cpdef Float128 f128_div(Float128 x, Float128 y):
-    """Divides the IEEE 754 binary128 floating points.
+cpdef Float128 f128_sum(x, SummationMethod method=SummationMethod.SEQUENTIAL, FloatContext context=None):
+    """Sums the IEEE 754 binary128 floating points.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    The sum of no elements is +0.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The floating points to be summed.
+        method: The summation method.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x / y``).
+        The resulted number expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_div(x._data, y._data))
+    cdef sf.float128_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    if method == SummationMethod.EXACT:
+        _reduce(_f128_exact_sum_loop, &k, (x,), 16, True, context, _f128_exact_sum_finish, 516)
+    else:
+        _reduce(_f128_sum_loop, &k, (x,), 16, True, context)
+    return _make_float128(r)
 
 
-cpdef Float128 f128_rem(Float128 x, Float128 y):
-    """Calculates a remainder by dividing the IEEE 754 binary128 floating points.
+cpdef Float128 f128_dot(x, y, SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, FloatContext context=None):
+    """Calculates the dot product of the IEEE 754 binary128 floating points.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data.
+    The dot product of no elements is +0.
 
     Args:
-        x: The floating point to be divided.
-        y: The floating point to divide.
+        x: The first floating points to be multiplied.
+        y: The second floating points to be multiplied.
+        method: The summation method.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``x % y``).
+        The resulted number expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        ValueError: If the lengths of the operands are different.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_rem(x._data, y._data))
+    cdef sf.float128_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    k.method = <uint_fast8_t>method
+    k.fused = fused
+    if method == SummationMethod.EXACT:
+        _reduce(_f128_exact_dot_loop, &k, (x, y), 16, True, context, _f128_exact_dot_finish, 1030)
+    else:
+        _reduce(_f128_sum_loop, &k, (x, y), 16, True, context)
+    return _make_float128(r)
 
 
-cpdef Float128 f128_sqrt(Float128 x):
-    """Calculates a square root of the IEEE 754 binary128 floating point.
+cpdef Float128 f128_prod(x, FloatContext context=None):
+    """Multiplies the IEEE 754 binary128 floating points from the first to the last.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    The product of no elements is 1.
 
     Args:
-        x: The floating point whose square root is to be calculated.
+        x: The floating points to be multiplied.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        The resulted number expressed as an IEEE 754 binary128 floating point (``sqrt(x)``).
+        The resulted number expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return _make_float128(sf.f128_sqrt(x._data))
+    cdef sf.float128_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f128_prod_loop, &k, (x,), 16, True, context)
+    return _make_float128(r)
 
 
-cpdef bool f128_eq(Float128 x, Float128 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+cpdef Float128 f128_min(x, FloatContext context=None):
+    """Returns the minimum of the IEEE 754 binary128 floating points.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. -0 is less than +0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The minimum expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f128_eq(x._data, y._data)
+    cdef sf.float128_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f128_min_loop, &k, (x,), 16, False, context)
+    return _make_float128(r)
 
 
-cpdef bool f128_le(Float128 x, Float128 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+cpdef Float128 f128_max(x, FloatContext context=None):
+    """Returns the maximum of the IEEE 754 binary128 floating points.
+
+    The operand is a :class:`Float128Array` instance or any other C-contiguous buffer
+    of the native data.
+    If any of the elements is a NaN, the result is a NaN. +0 is greater than -0.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The floating points to be compared.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The maximum expressed as an IEEE 754 binary128 floating point.
+
+    Raises:
+        ValueError: If the operand is empty.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f128_le(x._data, y._data)
+    cdef sf.float128_t r
+    cdef _Kernel k
+    k.z = <char*>&r
+    _reduce(_f128_max_loop, &k, (x,), 16, False, context)
+    return _make_float128(r)
 
 
-cpdef bool f128_lt(Float128 x, Float128 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+# The matrix products are calculated in the blocks of _MATMUL_BLOCK x _MATMUL_BLOCK elements.
+cdef enum:
+    _MATMUL_BLOCK = 16
+
+
+cdef void _bf16_to_bf16_element(const char* a, char* b) noexcept nogil:
+    (<sf.bfloat16_t*>b)[0] = (<const sf.bfloat16_t*>a)[0]
+
+
+cdef void _bf16_to_f16_element(const char* a, char* b) noexcept nogil:
+    (<sf.float16_t*>b)[0] = sf.f32_to_f16(sf.bf16_to_f32((<const sf.bfloat16_t*>a)[0]))
+
+
+cdef void _bf16_to_f32_element(const char* a, char* b) noexcept nogil:
+    (<sf.float32_t*>b)[0] = sf.bf16_to_f32((<const sf.bfloat16_t*>a)[0])
+
+
+cdef void _bf16_to_f64_element(const char* a, char* b) noexcept nogil:
+    (<sf.float64_t*>b)[0] = sf.f32_to_f64(sf.bf16_to_f32((<const sf.bfloat16_t*>a)[0]))
+
+
+cdef void _bf16_to_f128_element(const char* a, char* b) noexcept nogil:
+    (<sf.float128_t*>b)[0] = sf.f32_to_f128(sf.bf16_to_f32((<const sf.bfloat16_t*>a)[0]))
+
+
+cdef void _f16_to_bf16_element(const char* a, char* b) noexcept nogil:
+    (<sf.bfloat16_t*>b)[0] = sf.f32_to_bf16(sf.f16_to_f32((<const sf.float16_t*>a)[0]))
+
+
+cdef void _f16_to_f16_element(const char* a, char* b) noexcept nogil:
+    (<sf.float16_t*>b)[0] = (<const sf.float16_t*>a)[0]
+
+
+cdef void _f16_to_f32_element(const char* a, char* b) noexcept nogil:
+    (<sf.float32_t*>b)[0] = sf.f16_to_f32((<const sf.float16_t*>a)[0])
+
+
+cdef void _f16_to_f64_element(const char* a, char* b) noexcept nogil:
+    (<sf.float64_t*>b)[0] = sf.f16_to_f64((<const sf.float16_t*>a)[0])
+
+
+cdef void _f16_to_f128_element(const char* a, char* b) noexcept nogil:
+    (<sf.float128_t*>b)[0] = sf.f16_to_f128((<const sf.float16_t*>a)[0])
+
+
+cdef void _f32_to_bf16_element(const char* a, char* b) noexcept nogil:
+    (<sf.bfloat16_t*>b)[0] = sf.f32_to_bf16((<const sf.float32_t*>a)[0])
+
+
+cdef void _f32_to_f16_element(const char* a, char* b) noexcept nogil:
+    (<sf.float16_t*>b)[0] = sf.f32_to_f16((<const sf.float32_t*>a)[0])
+
+
+cdef void _f32_to_f32_element(const char* a, char* b) noexcept nogil:
+    (<sf.float32_t*>b)[0] = (<const sf.float32_t*>a)[0]
+
+
+cdef void _f32_to_f64_element(const char* a, char* b) noexcept nogil:
+    (<sf.float64_t*>b)[0] = sf.f32_to_f64((<const sf.float32_t*>a)[0])
+
+
+cdef void _f32_to_f128_element(const char* a, char* b) noexcept nogil:
+    (<sf.float128_t*>b)[0] = sf.f32_to_f128((<const sf.float32_t*>a)[0])
+
+
+cdef void _f64_to_bf16_element(const char* a, char* b) noexcept nogil:
+    # Rounds to odd in binary32 and then to bfloat16, lest the result be rounded twice.
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    (<sf.bfloat16_t*>b)[0] = _bf16_exit(sf.f64_to_f32((<const sf.float64_t*>a)[0]), mode, flags)
+
+
+cdef void _f64_to_f16_element(const char* a, char* b) noexcept nogil:
+    (<sf.float16_t*>b)[0] = sf.f64_to_f16((<const sf.float64_t*>a)[0])
+
+
+cdef void _f64_to_f32_element(const char* a, char* b) noexcept nogil:
+    (<sf.float32_t*>b)[0] = sf.f64_to_f32((<const sf.float64_t*>a)[0])
+
+
+cdef void _f64_to_f64_element(const char* a, char* b) noexcept nogil:
+    (<sf.float64_t*>b)[0] = (<const sf.float64_t*>a)[0]
+
+
+cdef void _f64_to_f128_element(const char* a, char* b) noexcept nogil:
+    (<sf.float128_t*>b)[0] = sf.f64_to_f128((<const sf.float64_t*>a)[0])
+
+
+cdef void _f128_to_bf16_element(const char* a, char* b) noexcept nogil:
+    # Rounds to odd in binary32 and then to bfloat16, lest the result be rounded twice.
+    cdef uint_fast8_t mode, flags
+    _bf16_enter(&mode, &flags)
+    (<sf.bfloat16_t*>b)[0] = _bf16_exit(sf.f128_to_f32((<const sf.float128_t*>a)[0]), mode, flags)
+
+
+cdef void _f128_to_f16_element(const char* a, char* b) noexcept nogil:
+    (<sf.float16_t*>b)[0] = sf.f128_to_f16((<const sf.float128_t*>a)[0])
+
+
+cdef void _f128_to_f32_element(const char* a, char* b) noexcept nogil:
+    (<sf.float32_t*>b)[0] = sf.f128_to_f32((<const sf.float128_t*>a)[0])
+
+
+cdef void _f128_to_f64_element(const char* a, char* b) noexcept nogil:
+    (<sf.float64_t*>b)[0] = sf.f128_to_f64((<const sf.float128_t*>a)[0])
+
+
+cdef void _f128_to_f128_element(const char* a, char* b) noexcept nogil:
+    (<sf.float128_t*>b)[0] = (<const sf.float128_t*>a)[0]
+
+
+cdef sf.bfloat16_t _bf16_matmul_element(const _Kernel* k, const sf.bfloat16_t* x, const sf.bfloat16_t* y) noexcept nogil:
+    # Computes the dot product of a row of x and a row of the transposed y in the same way as bf16_dot().
+    cdef _Kernel e
+    cdef sf.bfloat16_t r
+    if k.depth == 0:
+        return sf.f32_to_bf16(sf.ui32_to_f32(0))
+    if k.method == SummationMethod.PAIRWISE:
+        return _bf16_pairwise_sum(x, y, k.depth, k.fused)
+    if k.method == SummationMethod.COMPENSATED:
+        return _bf16_compensated_sum(x, y, k.depth)
+    if k.method == SummationMethod.EXACT:
+        _acc_clear(k.acc)
+        e.x = <const char*>x
+        e.y = <const char*>y
+        e.z = <char*>k.acc
+        _bf16_exact_dot_loop(&e, 0, k.depth)
+        e.z = <char*>&r
+        _bf16_exact_dot_finish(&e, k.acc)
+        return r
+    return _bf16_sequential_sum(x, y, k.depth, k.fused)
+
+
+cdef void _bf16_matmul_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # Computes the rows in [start, stop) of the matrix product, in the blocks of _MATMUL_BLOCK rows
+    # and _MATMUL_BLOCK columns, so that the operands of a block stay in the cache.
+    cdef const sf.bfloat16_t* x = <const sf.bfloat16_t*>k.x
+    cdef const sf.bfloat16_t* y = <const sf.bfloat16_t*>k.y
+    cdef sf.bfloat16_t* z = <sf.bfloat16_t*>k.z
+    cdef Py_ssize_t n = k.columns
+    cdef Py_ssize_t d = k.depth
+    cdef Py_ssize_t i0 = start
+    cdef Py_ssize_t j0, i, j
+    while i0 < stop:
+        j0 = 0
+        while j0 < n:
+            for i in range(i0, min(i0 + _MATMUL_BLOCK, stop)):
+                for j in range(j0, min(j0 + _MATMUL_BLOCK, n)):
+                    z[i * n + j] = _bf16_matmul_element(k, x + i * d, y + j * d)
+            j0 += _MATMUL_BLOCK
+        i0 += _MATMUL_BLOCK
+
+
+cdef sf.float16_t _f16_matmul_element(const _Kernel* k, const sf.float16_t* x, const sf.float16_t* y) noexcept nogil:
+    # Computes the dot product of a row of x and a row of the transposed y in the same way as f16_dot().
+    cdef _Kernel e
+    cdef sf.float16_t r
+    if k.depth == 0:
+        return sf.ui32_to_f16(0)
+    if k.method == SummationMethod.PAIRWISE:
+        return _f16_pairwise_sum(x, y, k.depth, k.fused)
+    if k.method == SummationMethod.COMPENSATED:
+        return _f16_compensated_sum(x, y, k.depth)
+    if k.method == SummationMethod.EXACT:
+        _acc_clear(k.acc)
+        e.x = <const char*>x
+        e.y = <const char*>y
+        e.z = <char*>k.acc
+        _f16_exact_dot_loop(&e, 0, k.depth)
+        e.z = <char*>&r
+        _f16_exact_dot_finish(&e, k.acc)
+        return r
+    return _f16_sequential_sum(x, y, k.depth, k.fused)
+
+
+cdef void _f16_matmul_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # Computes the rows in [start, stop) of the matrix product, in the blocks of _MATMUL_BLOCK rows
+    # and _MATMUL_BLOCK columns, so that the operands of a block stay in the cache.
+    cdef const sf.float16_t* x = <const sf.float16_t*>k.x
+    cdef const sf.float16_t* y = <const sf.float16_t*>k.y
+    cdef sf.float16_t* z = <sf.float16_t*>k.z
+    cdef Py_ssize_t n = k.columns
+    cdef Py_ssize_t d = k.depth
+    cdef Py_ssize_t i0 = start
+    cdef Py_ssize_t j0, i, j
+    while i0 < stop:
+        j0 = 0
+        while j0 < n:
+            for i in range(i0, min(i0 + _MATMUL_BLOCK, stop)):
+                for j in range(j0, min(j0 + _MATMUL_BLOCK, n)):
+                    z[i * n + j] = _f16_matmul_element(k, x + i * d, y + j * d)
+            j0 += _MATMUL_BLOCK
+        i0 += _MATMUL_BLOCK
+
+
+cdef sf.float32_t _f32_matmul_element(const _Kernel* k, const sf.float32_t* x, const sf.float32_t* y) noexcept nogil:
+    # Computes the dot product of a row of x and a row of the transposed y in the same way as f32_dot().
+    cdef _Kernel e
+    cdef sf.float32_t r
+    if k.depth == 0:
+        return sf.ui32_to_f32(0)
+    if k.method == SummationMethod.PAIRWISE:
+        return _f32_pairwise_sum(x, y, k.depth, k.fused)
+    if k.method == SummationMethod.COMPENSATED:
+        return _f32_compensated_sum(x, y, k.depth)
+    if k.method == SummationMethod.EXACT:
+        _acc_clear(k.acc)
+        e.x = <const char*>x
+        e.y = <const char*>y
+        e.z = <char*>k.acc
+        _f32_exact_dot_loop(&e, 0, k.depth)
+        e.z = <char*>&r
+        _f32_exact_dot_finish(&e, k.acc)
+        return r
+    return _f32_sequential_sum(x, y, k.depth, k.fused)
+
+
+cdef void _f32_matmul_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # Computes the rows in [start, stop) of the matrix product, in the blocks of _MATMUL_BLOCK rows
+    # and _MATMUL_BLOCK columns, so that the operands of a block stay in the cache.
+    cdef const sf.float32_t* x = <const sf.float32_t*>k.x
+    cdef const sf.float32_t* y = <const sf.float32_t*>k.y
+    cdef sf.float32_t* z = <sf.float32_t*>k.z
+    cdef Py_ssize_t n = k.columns
+    cdef Py_ssize_t d = k.depth
+    cdef Py_ssize_t i0 = start
+    cdef Py_ssize_t j0, i, j
+    while i0 < stop:
+        j0 = 0
+        while j0 < n:
+            for i in range(i0, min(i0 + _MATMUL_BLOCK, stop)):
+                for j in range(j0, min(j0 + _MATMUL_BLOCK, n)):
+                    z[i * n + j] = _f32_matmul_element(k, x + i * d, y + j * d)
+            j0 += _MATMUL_BLOCK
+        i0 += _MATMUL_BLOCK
+
+
+cdef sf.float64_t _f64_matmul_element(const _Kernel* k, const sf.float64_t* x, const sf.float64_t* y) noexcept nogil:
+    # Computes the dot product of a row of x and a row of the transposed y in the same way as f64_dot().
+    cdef _Kernel e
+    cdef sf.float64_t r
+    if k.depth == 0:
+        return sf.ui32_to_f64(0)
+    if k.method == SummationMethod.PAIRWISE:
+        return _f64_pairwise_sum(x, y, k.depth, k.fused)
+    if k.method == SummationMethod.COMPENSATED:
+        return _f64_compensated_sum(x, y, k.depth)
+    if k.method == SummationMethod.EXACT:
+        _acc_clear(k.acc)
+        e.x = <const char*>x
+        e.y = <const char*>y
+        e.z = <char*>k.acc
+        _f64_exact_dot_loop(&e, 0, k.depth)
+        e.z = <char*>&r
+        _f64_exact_dot_finish(&e, k.acc)
+        return r
+    return _f64_sequential_sum(x, y, k.depth, k.fused)
+
+
+cdef void _f64_matmul_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # Computes the rows in [start, stop) of the matrix product, in the blocks of _MATMUL_BLOCK rows
+    # and _MATMUL_BLOCK columns, so that the operands of a block stay in the cache.
+    cdef const sf.float64_t* x = <const sf.float64_t*>k.x
+    cdef const sf.float64_t* y = <const sf.float64_t*>k.y
+    cdef sf.float64_t* z = <sf.float64_t*>k.z
+    cdef Py_ssize_t n = k.columns
+    cdef Py_ssize_t d = k.depth
+    cdef Py_ssize_t i0 = start
+    cdef Py_ssize_t j0, i, j
+    while i0 < stop:
+        j0 = 0
+        while j0 < n:
+            for i in range(i0, min(i0 + _MATMUL_BLOCK, stop)):
+                for j in range(j0, min(j0 + _MATMUL_BLOCK, n)):
+                    z[i * n + j] = _f64_matmul_element(k, x + i * d, y + j * d)
+            j0 += _MATMUL_BLOCK
+        i0 += _MATMUL_BLOCK
+
+
+cdef sf.float128_t _f128_matmul_element(const _Kernel* k, const sf.float128_t* x, const sf.float128_t* y) noexcept nogil:
+    # Computes the dot product of a row of x and a row of the transposed y in the same way as f128_dot().
+    cdef _Kernel e
+    cdef sf.float128_t r
+    if k.depth == 0:
+        return sf.ui32_to_f128(0)
+    if k.method == SummationMethod.PAIRWISE:
+        return _f128_pairwise_sum(x, y, k.depth, k.fused)
+    if k.method == SummationMethod.COMPENSATED:
+        return _f128_compensated_sum(x, y, k.depth)
+    if k.method == SummationMethod.EXACT:
+        _acc_clear(k.acc)
+        e.x = <const char*>x
+        e.y = <const char*>y
+        e.z = <char*>k.acc
+        _f128_exact_dot_loop(&e, 0, k.depth)
+        e.z = <char*>&r
+        _f128_exact_dot_finish(&e, k.acc)
+        return r
+    return _f128_sequential_sum(x, y, k.depth, k.fused)
+
+
+cdef void _f128_matmul_loop(const _Kernel* k, Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    # Computes the rows in [start, stop) of the matrix product, in the blocks of _MATMUL_BLOCK rows
+    # and _MATMUL_BLOCK columns, so that the operands of a block stay in the cache.
+    cdef const sf.float128_t* x = <const sf.float128_t*>k.x
+    cdef const sf.float128_t* y = <const sf.float128_t*>k.y
+    cdef sf.float128_t* z = <sf.float128_t*>k.z
+    cdef Py_ssize_t n = k.columns
+    cdef Py_ssize_t d = k.depth
+    cdef Py_ssize_t i0 = start
+    cdef Py_ssize_t j0, i, j
+    while i0 < stop:
+        j0 = 0
+        while j0 < n:
+            for i in range(i0, min(i0 + _MATMUL_BLOCK, stop)):
+                for j in range(j0, min(j0 + _MATMUL_BLOCK, n)):
+                    z[i * n + j] = _f128_matmul_element(k, x + i * d, y + j * d)
+            j0 += _MATMUL_BLOCK
+        i0 += _MATMUL_BLOCK
+
+
+cpdef bf16_matmul(
+    x, y, Py_ssize_t m, Py_ssize_t n, Py_ssize_t k, accumulator=None,
+    SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, out=None, FloatContext context=None
+):
+    """Multiplies the matrices of the 16-bit brain floating points.
+
+    The operands are :class:`BFloat16Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`BFloat16` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f128_lt(x._data, y._data)
+    if accumulator is None or accumulator is BFloat16:
+        return _matmul(
+            _bf16_to_bf16_element, _bf16_matmul_loop, x, y, m, n, k, 2, 2, 11,
+            BFloat16Array, method, fused, out, context
+        )
+    if accumulator is Float16:
+        return _matmul(
+            _bf16_to_f16_element, _f16_matmul_loop, x, y, m, n, k, 2, 2, 4,
+            Float16Array, method, fused, out, context
+        )
+    if accumulator is Float32:
+        return _matmul(
+            _bf16_to_f32_element, _f32_matmul_loop, x, y, m, n, k, 2, 4, 11,
+            Float32Array, method, fused, out, context
+        )
+    if accumulator is Float64:
+        return _matmul(
+            _bf16_to_f64_element, _f64_matmul_loop, x, y, m, n, k, 2, 8, 68,
+            Float64Array, method, fused, out, context
+        )
+    if accumulator is Float128:
+        return _matmul(
+            _bf16_to_f128_element, _f128_matmul_loop, x, y, m, n, k, 2, 16, 1030,
+            Float128Array, method, fused, out, context
+        )
+    raise TypeError('accumulator must be a floating-point class')
 
 
-cpdef bool f128_eq_signaling(Float128 x, Float128 y):
-    """Tests if the first one is equal to the second one expressed as IEEE 754 binary128 floating points.
+cpdef f16_matmul(
+    x, y, Py_ssize_t m, Py_ssize_t n, Py_ssize_t k, accumulator=None,
+    SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, out=None, FloatContext context=None
+):
+    """Multiplies the matrices of the IEEE 754 binary16 floating points.
 
-    The invalid exception flag is set for any NaN input, not just for signaling NaNs.
+    The operands are :class:`Float16Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float16` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is equal to the second one, ``False`` otherwise (``x == y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f128_eq_signaling(x._data, y._data)
+    if accumulator is BFloat16:
+        return _matmul(
+            _f16_to_bf16_element, _bf16_matmul_loop, x, y, m, n, k, 2, 2, 11,
+            BFloat16Array, method, fused, out, context
+        )
+    if accumulator is None or accumulator is Float16:
+        return _matmul(
+            _f16_to_f16_element, _f16_matmul_loop, x, y, m, n, k, 2, 2, 4,
+            Float16Array, method, fused, out, context
+        )
+    if accumulator is Float32:
+        return _matmul(
+            _f16_to_f32_element, _f32_matmul_loop, x, y, m, n, k, 2, 4, 11,
+            Float32Array, method, fused, out, context
+        )
+    if accumulator is Float64:
+        return _matmul(
+            _f16_to_f64_element, _f64_matmul_loop, x, y, m, n, k, 2, 8, 68,
+            Float64Array, method, fused, out, context
+        )
+    if accumulator is Float128:
+        return _matmul(
+            _f16_to_f128_element, _f128_matmul_loop, x, y, m, n, k, 2, 16, 1030,
+            Float128Array, method, fused, out, context
+        )
+    raise TypeError('accumulator must be a floating-point class')
 
 
-cpdef bool f128_le_quiet(Float128 x, Float128 y):
-    """Tests if the first one is less than or equal to the second one expressed as IEEE 754 binary128 floating points.
+cpdef f32_matmul(
+    x, y, Py_ssize_t m, Py_ssize_t n, Py_ssize_t k, accumulator=None,
+    SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, out=None, FloatContext context=None
+):
+    """Multiplies the matrices of the IEEE 754 binary32 floating points.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operands are :class:`Float32Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float32` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than or equal to the second one, ``False`` otherwise (``x <= y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f128_le_quiet(x._data, y._data)
+    if accumulator is BFloat16:
+        return _matmul(
+            _f32_to_bf16_element, _bf16_matmul_loop, x, y, m, n, k, 4, 2, 11,
+            BFloat16Array, method, fused, out, context
+        )
+    if accumulator is Float16:
+        return _matmul(
+            _f32_to_f16_element, _f16_matmul_loop, x, y, m, n, k, 4, 2, 4,
+            Float16Array, method, fused, out, context
+        )
+    if accumulator is None or accumulator is Float32:
+        return _matmul(
+            _f32_to_f32_element, _f32_matmul_loop, x, y, m, n, k, 4, 4, 11,
+            Float32Array, method, fused, out, context
+        )
+    if accumulator is Float64:
+        return _matmul(
+            _f32_to_f64_element, _f64_matmul_loop, x, y, m, n, k, 4, 8, 68,
+            Float64Array, method, fused, out, context
+        )
+    if accumulator is Float128:
+        return _matmul(
+            _f32_to_f128_element, _f128_matmul_loop, x, y, m, n, k, 4, 16, 1030,
+            Float128Array, method, fused, out, context
+        )
+    raise TypeError('accumulator must be a floating-point class')
 
 
-cpdef bool f128_lt_quiet(Float128 x, Float128 y):
-    """Tests if the first one is less than the second one expressed as IEEE 754 binary128 floating points.
+cpdef f64_matmul(
+    x, y, Py_ssize_t m, Py_ssize_t n, Py_ssize_t k, accumulator=None,
+    SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, out=None, FloatContext context=None
+):
+    """Multiplies the matrices of the IEEE 754 binary64 floating points.
 
-    The invalid exception flag is not set for quiet NaNs.
+    The operands are :class:`Float64Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The first floating point to be compared.
-        y: The second floating point to be compared.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float64` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the first one is less than the second one, ``False`` otherwise (``x < y``).
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f128_lt_quiet(x._data, y._data)
+    if accumulator is BFloat16:
+        return _matmul(
+            _f64_to_bf16_element, _bf16_matmul_loop, x, y, m, n, k, 8, 2, 11,
+            BFloat16Array, method, fused, out, context
+        )
+    if accumulator is Float16:
+        return _matmul(
+            _f64_to_f16_element, _f16_matmul_loop, x, y, m, n, k, 8, 2, 4,
+            Float16Array, method, fused, out, context
+        )
+    if accumulator is Float32:
+        return _matmul(
+            _f64_to_f32_element, _f32_matmul_loop, x, y, m, n, k, 8, 4, 11,
+            Float32Array, method, fused, out, context
+        )
+    if accumulator is None or accumulator is Float64:
+        return _matmul(
+            _f64_to_f64_element, _f64_matmul_loop, x, y, m, n, k, 8, 8, 68,
+            Float64Array, method, fused, out, context
+        )
+    if accumulator is Float128:
+        return _matmul(
+            _f64_to_f128_element, _f128_matmul_loop, x, y, m, n, k, 8, 16, 1030,
+            Float128Array, method, fused, out, context
+        )
+    raise TypeError('accumulator must be a floating-point class')
 
 
-cpdef bool f128_is_signaling_nan(Float128 x):
-    """Tests if the IEEE 754 binary128 floating point is a signaling NaN.
+cpdef f128_matmul(
+    x, y, Py_ssize_t m, Py_ssize_t n, Py_ssize_t k, accumulator=None,
+    SummationMethod method=SummationMethod.SEQUENTIAL, bint fused=False, out=None, FloatContext context=None
+):
+    """Multiplies the matrices of the IEEE 754 binary128 floating points.
+
+    The operands are :class:`Float128Array` instances or any other C-contiguous buffers
+    of the native data, which hold the matrices in row-major order. The first operand is
+    an ``m`` by ``k`` matrix, and the second operand is a ``k`` by ``n`` matrix.
+
+    The elements are converted to the format of the accumulator, in which each element of the result
+    is calculated as the dot product of a row of the first operand and a column of the second operand,
+    in the same way as the dot product of the format, such as :func:`f32_dot()`.
+    The rows of the result are calculated in parallel by the threads set by :func:`set_num_threads()`.
 
     Args:
-        x: The floating point to be tested.
+        x: The first matrix.
+        y: The second matrix.
+        m: The number of the rows of the first matrix.
+        n: The number of the columns of the second matrix.
+        k: The number of the columns of the first matrix, which is that of the rows of the second matrix.
+        accumulator: The floating-point class of the accumulator, such as :class:`Float32`.
+                     If ``None`` is specified, :class:`Float128` is used.
+        method: The summation method of the dot products.
+        fused: If ``True`` is specified, the products are added by the fused multiply-add
+               without being rounded. It is ignored by ``SummationMethod.COMPENSATED``
+               and ``SummationMethod.EXACT``, which take the rounding errors of the products
+               into account as well.
+        out: The buffer to store the results in the format of the accumulator.
+             If ``None`` is specified, a new array is created.
+        context: The floating-point context in which the operation is performed.
+                 If ``None`` is specified, the current rounding and tininess detection modes are used.
 
     Returns:
-        ``True`` if the floating point is a signaling NaN, ``False`` otherwise.
+        The resulted ``m`` by ``n`` matrix in row-major order, whose elements are expressed
+        in the format of the accumulator.
+
+    Raises:
+        TypeError: If the accumulator is not a floating-point class.
+        ValueError: If the dimensions are negative, or the lengths of the operands are different from them.
+        FloatingPointError: If any of the floating-point exceptions trapped by the context is raised.
 
     """
-    return sf.f128_isSignalingNaN(x._data)
+    if accumulator is BFloat16:
+        return _matmul(
+            _f128_to_bf16_element, _bf16_matmul_loop, x, y, m, n, k, 16, 2, 11,
+            BFloat16Array, method, fused, out, context
+        )
+    if accumulator is Float16:
+        return _matmul(
+            _f128_to_f16_element, _f16_matmul_loop, x, y, m, n, k, 16, 2, 4,
+            Float16Array, method, fused, out, context
+        )
+    if accumulator is Float32:
+        return _matmul(
+            _f128_to_f32_element, _f32_matmul_loop, x, y, m, n, k, 16, 4, 11,
+            Float32Array, method, fused, out, context
+        )
+    if accumulator is Float64:
+        return _matmul(
+            _f128_to_f64_element, _f64_matmul_loop, x, y, m, n, k, 16, 8, 68,
+            Float64Array, method, fused, out, context
+        )
+    if accumulator is None or accumulator is Float128:
+        return _matmul(
+            _f128_to_f128_element, _f128_matmul_loop, x, y, m, n, k, 16, 16, 1030,
+            Float128Array, method, fused, out, context
+        )
+    raise TypeError('accumulator must be a floating-point class')
+
+
+_ARRAY_UFUNCS = {
+    BFloat16Array: {
+        'add': (bf16_add_array, False, False),
+        'subtract': (bf16_sub_array, False, False),
+        'multiply': (bf16_mul_array, False, False),
+        'divide': (bf16_div_array, False, False),
+        'sqrt': (bf16_sqrt_array, False, False),
+        'equal': (bf16_eq_array, False, False),
+        'not_equal': (bf16_eq_array, False, True),
+        'less': (bf16_lt_array, False, False),
+        'less_equal': (bf16_le_array, False, False),
+        'greater': (bf16_lt_array, True, False),
+        'greater_equal': (bf16_le_array, True, False)
+    },
+    Float16Array: {
+        'add': (f16_add_array, False, False),
+        'subtract': (f16_sub_array, False, False),
+        'multiply': (f16_mul_array, False, False),
+        'divide': (f16_div_array, False, False),
+        'sqrt': (f16_sqrt_array, False, False),
+        'equal': (f16_eq_array, False, False),
+        'not_equal': (f16_eq_array, False, True),
+        'less': (f16_lt_array, False, False),
+        'less_equal': (f16_le_array, False, False),
+        'greater': (f16_lt_array, True, False),
+        'greater_equal': (f16_le_array, True, False)
+    },
+    Float32Array: {
+        'add': (f32_add_array, False, False),
+        'subtract': (f32_sub_array, False, False),
+        'multiply': (f32_mul_array, False, False),
+        'divide': (f32_div_array, False, False),
+        'sqrt': (f32_sqrt_array, False, False),
+        'equal': (f32_eq_array, False, False),
+        'not_equal': (f32_eq_array, False, True),
+        'less': (f32_lt_array, False, False),
+        'less_equal': (f32_le_array, False, False),
+        'greater': (f32_lt_array, True, False),
+        'greater_equal': (f32_le_array, True, False)
+    },
+    Float64Array: {
+        'add': (f64_add_array, False, False),
+        'subtract': (f64_sub_array, False, False),
+        'multiply': (f64_mul_array, False, False),
+        'divide': (f64_div_array, False, False),
+        'sqrt': (f64_sqrt_array, False, False),
+        'equal': (f64_eq_array, False, False),
+        'not_equal': (f64_eq_array, False, True),
+        'less': (f64_lt_array, False, False),
+        'less_equal': (f64_le_array, False, False),
+        'greater': (f64_lt_array, True, False),
+        'greater_equal': (f64_le_array, True, False)
+    },
+    Float128Array: {
+        'add': (f128_add_array, False, False),
+        'subtract': (f128_sub_array, False, False),
+        'multiply': (f128_mul_array, False, False),
+        'divide': (f128_div_array, False, False),
+        'sqrt': (f128_sqrt_array, False, False),
+        'equal': (f128_eq_array, False, False),
+        'not_equal': (f128_eq_array, False, True),
+        'less': (f128_lt_array, False, False),
+        'less_equal': (f128_le_array, False, False),
+        'greater': (f128_lt_array, True, False),
+        'greater_equal': (f128_le_array, True, False)
+    }
+}
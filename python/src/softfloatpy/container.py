@@ -0,0 +1,402 @@
+# SoftFloatPy: A Python binding of Berkeley SoftFloat.
+#
+# Copyright (c) 2024-2025 Arihiro Yoshida. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""A chunked container file format for the packed floating-point arrays.
+
+A container file stores the elements of one floating-point format in chunks, together with the byte order,
+the rounding mode and the tininess detection mode in which they were computed, and the floating-point exception
+flags raised while computing each chunk. Each chunk is optionally compressed with ``zlib`` or ``lzma``.
+
+The file consists of a header, the chunks, a chunk index, and a footer, all of which are in little-endian.
+
+- Header (16 bytes): the magic ``b'SFPC'``, the version (16 bits), the floating-point format, the byte order,
+  the rounding mode, and the tininess detection mode (8 bits each), and 6 reserved bytes.
+- Chunks: the elements of each chunk, compressed or not, starting at a multiple of 16 bytes.
+- Chunk index (32 bytes per chunk): the offset and the size of the stored chunk and the number of the elements
+  (64 bits each), the compression method and the exception flags (8 bits each), and 6 reserved bytes.
+- Footer (24 bytes): the offset of the chunk index and the number of the chunks (64 bits each),
+  the exception flags of all the chunks (8 bits), 3 reserved bytes, and the magic ``b'SFPC'``.
+
+Since the chunk index is located from the footer, a range of the elements is read without scanning the file.
+The uncompressed chunks in the byte order of the host are mapped into the arrays without copying them.
+
+"""
+
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_right
+from types import TracebackType
+from typing import IO, Self
+
+from ._core import (
+    TininessMode, RoundingMode,
+    BFloat16Array, Float16Array, Float32Array, Float64Array, Float128Array,
+    get_tininess_mode, get_rounding_mode,
+    FloatContext
+)
+
+__all__ = [
+    "FloatArray",
+    "ContainerWriter",
+    "ContainerReader"
+]
+
+FloatArray = BFloat16Array | Float16Array | Float32Array | Float64Array | Float128Array
+"""Any of the packed floating-point array classes."""
+
+_MAGIC: bytes = b'SFPC'
+_VERSION: int = 1
+
+_HEADER: struct.Struct = struct.Struct('<4sHBBBB6x')
+_INDEX_ENTRY: struct.Struct = struct.Struct('<QQQBB6x')
+_FOOTER: struct.Struct = struct.Struct('<QQB3x4s')
+
+_ALIGNMENT: int = 16
+
+_ARRAY_TYPES: tuple[type[FloatArray], ...] = (BFloat16Array, Float16Array, Float32Array, Float64Array, Float128Array)
+_ITEMSIZES: tuple[int, ...] = (2, 2, 4, 8, 16)
+
+_BYTEORDERS: tuple[str, ...] = ('little', 'big')
+
+_COMPRESSIONS: tuple[str | None, ...] = (None, 'zlib', 'lzma')
+
+
+def _compress(data: bytes | memoryview, compression: int) -> bytes | memoryview:
+    if compression == 1:
+        import zlib
+        return zlib.compress(data)
+    if compression == 2:
+        import lzma
+        return lzma.compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: int) -> bytes:
+    if compression == 1:
+        import zlib
+        return zlib.decompress(data)
+    if compression == 2:
+        import lzma
+        return lzma.decompress(data)
+    raise ValueError('unknown compression method')
+
+
+class ContainerWriter:
+    """A writer that appends the packed arrays to a new container file as chunks.
+
+    The chunk index is written when the writer is closed. The writer can be used in a ``with`` statement,
+    which closes it on exit.
+
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], array_type: type[FloatArray], byteorder: str = 'little',
+        compression: str | None = None, rounding_mode: RoundingMode | None = None,
+        tininess_mode: TininessMode | None = None
+    ) -> None:
+        """Creates a new container file.
+
+        Args:
+            path: The path of the file.
+            array_type: The packed array class of the elements.
+            byteorder: The byte order of the elements stored in the file, which is ``'little'`` or ``'big'``.
+            compression: The compression method of the chunks, which is ``'zlib'``, ``'lzma'``, or ``None``.
+            rounding_mode: The rounding mode recorded in the file.
+                           If ``None`` is specified, that of the current thread is recorded.
+            tininess_mode: The tininess detection mode recorded in the file.
+                           If ``None`` is specified, that of the current thread is recorded.
+
+        Raises:
+            ValueError: If the array class, the byte order, or the compression method is unknown.
+
+        """
+        if array_type not in _ARRAY_TYPES:
+            raise ValueError('array_type must be a packed floating-point array class')
+        if byteorder not in _BYTEORDERS:
+            raise ValueError("byteorder must be 'little' or 'big'")
+        if compression not in _COMPRESSIONS:
+            raise ValueError("compression must be 'zlib', 'lzma', or None")
+        self._array_type: type[FloatArray] = array_type
+        self._byteorder: str = byteorder
+        self._compression: int = _COMPRESSIONS.index(compression)
+        self._index: list[bytes] = []
+        self._flags: int = 0
+        self._file: IO[bytes] | None = open(path, 'wb')
+        self._file.write(_HEADER.pack(
+            _MAGIC, _VERSION, _ARRAY_TYPES.index(array_type), _BYTEORDERS.index(byteorder),
+            get_rounding_mode() if rounding_mode is None else rounding_mode,
+            get_tininess_mode() if tininess_mode is None else tininess_mode
+        ))
+
+    def write(self, array: FloatArray, flags: int = 0) -> None:
+        """Appends the elements as a new chunk.
+
+        Args:
+            array: The elements.
+            flags: The floating-point exception flags raised while computing the elements.
+
+        Raises:
+            TypeError: If the array is not an instance of the array class of the file.
+            ValueError: If the writer is closed.
+
+        """
+        if self._file is None:
+            raise ValueError('writer is closed')
+        if type(array) is not self._array_type:
+            raise TypeError(f'array must be {self._array_type.__name__}')
+        data: bytes | memoryview = (
+            memoryview(array).cast('B') if self._byteorder == sys.byteorder else array.to_bytes(self._byteorder)
+        )
+        data = _compress(data, self._compression)
+        offset: int = self._file.tell()
+        self._file.write(data)
+        self._file.write(bytes(-self._file.tell() % _ALIGNMENT))
+        self._index.append(_INDEX_ENTRY.pack(offset, len(data), len(array), self._compression, flags))
+        self._flags |= flags
+
+    def close(self) -> None:
+        """Writes the chunk index and closes the file. Nothing is done if the writer is already closed."""
+        if self._file is None:
+            return
+        offset: int = self._file.tell()
+        self._file.write(b''.join(self._index))
+        self._file.write(_FOOTER.pack(offset, len(self._index), self._flags, _MAGIC))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+class ContainerReader:
+    """A reader that reads the elements from a container file at random.
+
+    The file is mapped into memory, and only the chunks that hold the requested elements are read.
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Opens a container file.
+
+        Args:
+            path: The path of the file.
+
+        Raises:
+            ValueError: If the file is not a container file, its version is unsupported, or it is corrupted.
+
+        """
+        with open(path, 'rb') as f:
+            if f.seek(0, 2) < _HEADER.size + _FOOTER.size:
+                raise ValueError('not a container file')
+            self._map: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_index()
+        except BaseException:
+            self._map.close()
+            raise
+
+    def _read_index(self) -> None:
+        magic, version, array_type, byteorder, rounding_mode, tininess_mode = _HEADER.unpack_from(self._map, 0)
+        index_offset, count, flags, footer_magic = _FOOTER.unpack_from(self._map, len(self._map) - _FOOTER.size)
+        if magic != _MAGIC or footer_magic != _MAGIC:
+            raise ValueError('not a container file')
+        if version != _VERSION:
+            raise ValueError(f'unsupported container version {version}')
+        if array_type >= len(_ARRAY_TYPES):
+            raise ValueError(f'unknown floating-point format {array_type}')
+        if byteorder >= len(_BYTEORDERS):
+            raise ValueError(f'unknown byte order {byteorder}')
+        if index_offset < _HEADER.size or index_offset + count * _INDEX_ENTRY.size > len(self._map) - _FOOTER.size:
+            raise ValueError('chunk index is corrupted')
+        self._array_type: type[FloatArray] = _ARRAY_TYPES[array_type]
+        self._itemsize: int = _ITEMSIZES[array_type]
+        self._byteorder: str = _BYTEORDERS[byteorder]
+        self._rounding_mode: RoundingMode = RoundingMode(rounding_mode)
+        self._tininess_mode: TininessMode = TininessMode(tininess_mode)
+        self._flags: int = flags
+        self._chunks: list[tuple[int, int, int, int, int]] = [
+            _INDEX_ENTRY.unpack_from(self._map, index_offset + i * _INDEX_ENTRY.size) for i in range(count)
+        ]
+        self._ends: list[int] = []
+        end: int = 0
+        for i, (offset, size, length, compression, _) in enumerate(self._chunks):
+            if (
+                offset < _HEADER.size or offset + size > index_offset or compression >= len(_COMPRESSIONS) or
+                (compression == 0 and size != length * self._itemsize)
+            ):
+                raise ValueError(f'chunk {i} is corrupted')
+            end += length
+            self._ends.append(end)
+
+    @property
+    def array_type(self) -> type[FloatArray]:
+        """The packed array class of the elements."""
+        return self._array_type
+
+    @property
+    def byteorder(self) -> str:
+        """The byte order of the elements stored in the file."""
+        return self._byteorder
+
+    @property
+    def rounding_mode(self) -> RoundingMode:
+        """The rounding mode recorded in the file."""
+        return self._rounding_mode
+
+    @property
+    def tininess_mode(self) -> TininessMode:
+        """The tininess detection mode recorded in the file."""
+        return self._tininess_mode
+
+    @property
+    def flags(self) -> int:
+        """The floating-point exception flags raised while computing all the chunks."""
+        return self._flags
+
+    @property
+    def chunk_count(self) -> int:
+        """The number of the chunks."""
+        return len(self._chunks)
+
+    def context(self) -> FloatContext:
+        """Creates a floating-point context with the modes recorded in the file.
+
+        Returns:
+            A new floating-point context to reproduce the computation.
+
+        """
+        return FloatContext(self._rounding_mode, self._tininess_mode)
+
+    def chunk_length(self, i: int) -> int:
+        """Returns the number of the elements in the specified chunk.
+
+        Args:
+            i: The index of the chunk.
+
+        Returns:
+            The number of the elements.
+
+        """
+        return self._chunks[i][2]
+
+    def chunk_flags(self, i: int) -> int:
+        """Returns the floating-point exception flags raised while computing the specified chunk.
+
+        Args:
+            i: The index of the chunk.
+
+        Returns:
+            The floating-point exception flags.
+
+        """
+        return self._chunks[i][4]
+
+    def read_chunk(self, i: int) -> FloatArray:
+        """Reads the elements of the specified chunk.
+
+        If the chunk is uncompressed and in the byte order of the host, the returned array shares
+        the memory of the file, and is read-only.
+
+        Args:
+            i: The index of the chunk.
+
+        Returns:
+            The elements of the chunk.
+
+        """
+        offset, size, count, compression, _ = self._chunks[i]
+        if compression == 0:
+            return self._array_type.from_buffer(self._map, self._byteorder, count, offset)
+        return self._array_type.from_buffer(self._load(i), self._byteorder, count)
+
+    def read(self, start: int = 0, stop: int | None = None) -> FloatArray:
+        """Reads the elements in the specified range.
+
+        Only the chunks that hold the elements in the range are read. If the range lies in an uncompressed
+        chunk in the byte order of the host, the returned array shares the memory of the file, and is read-only.
+
+        Args:
+            start: The index of the first element. A negative index counts from the end.
+            stop: The index after the last element, or ``None`` to read up to the end.
+                  A negative index counts from the end.
+
+        Returns:
+            The elements in the range.
+
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        i: int = bisect_right(self._ends, start)
+        if i < len(self._chunks) and stop <= self._ends[i] and self._chunks[i][3] == 0:
+            return self._array_type.from_buffer(
+                self._map, self._byteorder, stop - start,
+                self._chunks[i][0] + (start - self._ends[i] + self._chunks[i][2]) * self._itemsize
+            )
+        parts: list[bytes] = []
+        while i < len(self._chunks) and start < stop:
+            base: int = self._ends[i] - self._chunks[i][2]
+            lo: int = (start - base) * self._itemsize
+            hi: int = (min(stop, self._ends[i]) - base) * self._itemsize
+            if self._chunks[i][3] == 0:
+                parts.append(self._map[self._chunks[i][0] + lo:self._chunks[i][0] + hi])
+            else:
+                parts.append(self._load(i)[lo:hi])
+            start = self._ends[i]
+            i += 1
+        return self._array_type.from_buffer(b''.join(parts), self._byteorder)
+
+    def _load(self, i: int) -> bytes:
+        offset, size, count, compression, _ = self._chunks[i]
+        data: bytes = _decompress(self._map[offset:offset + size], compression)
+        if len(data) != count * self._itemsize:
+            raise ValueError(f'chunk {i} is corrupted')
+        return data
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def close(self) -> None:
+        """Closes the file.
+
+        If any arrays share the memory of the file, it is unmapped after they are released.
+
+        """
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
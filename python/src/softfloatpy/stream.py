@@ -0,0 +1,170 @@
+# SoftFloatPy: A Python binding of Berkeley SoftFloat.
+#
+# Copyright (c) 2024-2025 Arihiro Yoshida. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Streaming of the batch operations over the chunks of unbounded inputs.
+
+The functions in this module pull the elements from files or iterables chunk by chunk, and apply the batch
+operations to each chunk lazily, so that inputs larger than the memory can be processed with bounded memory.
+The results of :func:`map()` can be passed to another :func:`map()` to chain the operations without buffering
+the whole intermediate results.
+
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+from ._core import (
+    get_exception_flags, set_exception_flags,
+    FloatContext
+)
+from .container import FloatArray
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+__all__ = [
+    "chunks",
+    "map"
+]
+
+_T = TypeVar('_T')
+
+
+def chunks(
+    source: 'IO[bytes] | Iterable[Buffer]', array_type: type[FloatArray], chunk_size: int = 65536,
+    byteorder: str = 'native'
+) -> Iterator[FloatArray]:
+    """Splits the elements pulled from the specified source into packed arrays.
+
+    The source is a binary file object, or an iterable of buffers such as ``bytes`` and the packed arrays.
+    The elements are read from the file or concatenated from the buffers, and yielded as writable arrays
+    of the specified number of the elements. Only the last array can be shorter.
+
+    Args:
+        source: The binary file object, or the iterable of the buffers, that provides the elements.
+        array_type: The packed array class of the elements.
+        chunk_size: The number of the elements in each array.
+        byteorder: The byte order of the elements, which is ``'little'``, ``'big'``, or ``'native'``.
+
+    Returns:
+        An iterator of the packed arrays.
+
+    Raises:
+        ValueError: If the chunk size is not positive. While iterating, if the source ends with
+                    an incomplete element.
+
+    """
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    itemsize: int = memoryview(array_type(1)).nbytes
+    if hasattr(source, 'readinto'):
+        return _read_chunks(source, array_type, itemsize, chunk_size * itemsize, byteorder)
+    return _join_chunks(source, array_type, itemsize, chunk_size * itemsize, byteorder)
+
+
+def _read_chunks(
+    source: Any, array_type: type[FloatArray], itemsize: int, size: int, byteorder: str
+) -> Iterator[FloatArray]:
+    while True:
+        buffer: bytearray = bytearray(size)
+        n: int = 0
+        while n < size:
+            with memoryview(buffer)[n:] as view:
+                k: int | None = source.readinto(view)
+            if not k:
+                break
+            n += k
+        if n == 0:
+            return
+        if n % itemsize != 0:
+            raise ValueError('stream ends with an incomplete element')
+        del buffer[n:]
+        yield array_type.from_buffer(buffer, byteorder)
+        if n < size:
+            return
+
+
+def _join_chunks(
+    source: 'Iterable[Buffer]', array_type: type[FloatArray], itemsize: int, size: int, byteorder: str
+) -> Iterator[FloatArray]:
+    pending: bytearray = bytearray()
+    for data in source:
+        pending += data
+        while len(pending) >= size:
+            buffer: bytearray = pending[:size]
+            del pending[:size]
+            yield array_type.from_buffer(buffer, byteorder)
+    if len(pending) % itemsize != 0:
+        raise ValueError('stream ends with an incomplete element')
+    if pending:
+        yield array_type.from_buffer(pending, byteorder)
+
+
+def map(
+    op: Callable[..., _T], source: Iterable[Any], /, *sources: Iterable[Any], array_type: type[FloatArray] | None = None,
+    chunk_size: int = 65536, byteorder: str = 'native', context: FloatContext | None = None
+) -> Iterator[_T]:
+    """Applies the specified operation to the chunks of the sources lazily.
+
+    Like the built-in :func:`map()`, the operation is called with the chunks at the same position of
+    all the sources, and its results are yielded one by one. If the array class is specified, the sources
+    are split into the chunks by :func:`chunks()`. Otherwise, the sources must yield the chunks themselves,
+    such as the packed arrays yielded by another :func:`map()`.
+
+    Each call of the operation is performed inside the floating-point context. If no context is specified,
+    the calls are performed in the modes of the current thread, and the exception flags raised by them
+    are accumulated into those of the current thread when the iteration ends. Otherwise, the flags are
+    accumulated into :attr:`FloatContext.flags` of the specified context.
+
+    Args:
+        op: The operation, such as a batch operation, that is called with a chunk of each source.
+        source: The first source.
+        sources: The other sources.
+        array_type: The packed array class of the elements of the sources, or ``None`` if the sources
+                    yield the chunks.
+        chunk_size: The number of the elements in each chunk if the array class is specified.
+        byteorder: The byte order of the elements if the array class is specified.
+        context: The floating-point context.
+
+    Returns:
+        An iterator of the results of the operation.
+
+    Raises:
+        ValueError: If the chunk size is not positive. While iterating, if the sources have different lengths.
+
+    """
+    iterators: list[Iterator[Any]] = [
+        iter(s) if array_type is None else chunks(s, array_type, chunk_size, byteorder) for s in (source, *sources)
+    ]
+    return _map(op, iterators, FloatContext() if context is None else context, context is None)
+
+
+def _map(op: Callable[..., _T], iterators: list[Iterator[Any]], context: FloatContext, propagates: bool) -> Iterator[_T]:
+    try:
+        for args in zip(*iterators, strict=True):
+            with context:
+                r: _T = op(*args)
+            yield r
+    finally:
+        if propagates:
+            set_exception_flags(get_exception_flags() | context.flags)
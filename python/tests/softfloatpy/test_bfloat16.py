@@ -20,8 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import math
+import pathlib
+
+import pytest
+
 import softfloatpy as sf
 
+_XS: list[float] = [-12.5, 3.25, 1.0, 0.0]
+_YS: list[float] = [3.25, 0.5, -4.0, 0.0]
 _SIGNALING_NAN: bytes = b'\xff\x81'
 
 
@@ -40,6 +47,19 @@ def test_bf16_float() -> None:
     assert str(sf.BFloat16.from_float(f)) == str(f)
 
 
+def test_bf16_str() -> None:
+    assert str(sf.BFloat16.from_bytes(bytes.fromhex('3f80'))) == '1.0'
+    assert str(sf.BFloat16.from_bytes(bytes.fromhex('3dcd'))) == '0.1'
+    assert str(sf.BFloat16.from_bytes(bytes.fromhex('7f7f'))) == '3.39e+38'
+    assert str(sf.BFloat16.from_bytes(bytes.fromhex('0001'))) == '9e-41'
+    assert str(sf.BFloat16.from_bytes(bytes.fromhex('8000'))) == '-0.0'
+    assert str(sf.BFloat16.from_bytes(bytes.fromhex('ff80'))) == '-inf'
+    assert str(sf.BFloat16.from_bytes(bytes.fromhex('7fc0'))) == 'nan'
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    assert x.to_str() == ', '.join([str(o) for o in x])
+    assert x.to_str('\n') == '\n'.join([str(o) for o in x])
+
+
 def test_bf16_to_f32() -> None:
     f: float = -12.5
     o: sf.BFloat16 = sf.BFloat16.from_float(f)
@@ -47,7 +67,462 @@ def test_bf16_to_f32() -> None:
     assert sf.bf16_to_f32(o).to_bytes() == o.to_f32().to_bytes()
 
 
+def test_bf16_round_to_int() -> None:
+    f: float = -12.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(f)
+    assert sf.bf16_round_to_int(o, sf.RoundingMode.MIN).to_float() == math.floor(f)
+    assert sf.bf16_round_to_int(o, sf.RoundingMode.MIN).to_bytes() == o.round_to_int(sf.RoundingMode.MIN).to_bytes()
+
+
+def test_bf16_neg() -> None:
+    x: float = -12.5
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    assert sf.bf16_neg(o).to_float() == -x
+    assert sf.bf16_neg(o).to_bytes() == sf.BFloat16.neg(o).to_bytes()
+
+
+def test_bf16_add() -> None:
+    x: float = -12.5
+    y: float = 3.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_float(y)
+    assert sf.bf16_add(o, p).to_float() == x + y
+    assert sf.bf16_add(o, p).to_bytes() == sf.BFloat16.add(o, p).to_bytes()
+
+
+def test_bf16_sub() -> None:
+    x: float = -12.5
+    y: float = 3.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_float(y)
+    assert sf.bf16_sub(o, p).to_float() == x - y
+    assert sf.bf16_sub(o, p).to_bytes() == sf.BFloat16.sub(o, p).to_bytes()
+
+
+def test_bf16_mul() -> None:
+    x: float = -12.5
+    y: float = 3.5
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_float(y)
+    assert sf.bf16_mul(o, p).to_float() == x * y
+    assert sf.bf16_mul(o, p).to_bytes() == sf.BFloat16.mul(o, p).to_bytes()
+
+
+def test_bf16_mul_add() -> None:
+    x: float = -12.5
+    y: float = 3.5
+    z: float = -0.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_float(y)
+    q: sf.BFloat16 = sf.BFloat16.from_float(z)
+    assert sf.bf16_mul_add(o, p, q).to_float() == x * y + z
+    assert sf.bf16_mul_add(o, p, q).to_bytes() == sf.BFloat16.mul_add(o, p, q).to_bytes()
+
+
+def test_bf16_div() -> None:
+    for x, y in [(8.75, 3.5), (-8.75, 3.5), (8.75, -3.5), (-8.75, -3.5)]:
+        o: sf.BFloat16 = sf.BFloat16.from_float(x)
+        p: sf.BFloat16 = sf.BFloat16.from_float(y)
+        assert sf.bf16_div(o, p).to_float() == x / y
+        assert sf.bf16_div(o, p).to_bytes() == sf.BFloat16.div(o, p).to_bytes()
+
+
+def test_bf16_rem() -> None:
+    for x, y in [(8.75, 3.5), (-8.75, 3.5), (8.75, -3.5), (-8.75, -3.5)]:
+        z: float = x / y
+        o: sf.BFloat16 = sf.BFloat16.from_float(x)
+        p: sf.BFloat16 = sf.BFloat16.from_float(y)
+        assert sf.bf16_rem(o, p).to_float() == x - y * (math.floor(z) if z >= 0 else math.ceil(z))
+        assert sf.bf16_rem(o, p).to_bytes() == sf.BFloat16.rem(o, p).to_bytes()
+
+
+def test_bf16_sqrt() -> None:
+    x: float = 2.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    assert sf.bf16_sqrt(o).to_float() == math.sqrt(x)
+    assert sf.bf16_sqrt(o).to_bytes() == sf.BFloat16.sqrt(o).to_bytes()
+
+
+def test_bf16_single_rounding() -> None:
+    # 1 - 2**-30 rounds to 1.0 in binary32, but must be truncated directly to 1 - 2**-8.
+    o: sf.BFloat16 = sf.BFloat16.from_float(1.0)
+    p: sf.BFloat16 = sf.BFloat16.from_float(-2.0 ** -30)
+    sf.set_rounding_mode(sf.RoundingMode.MIN_MAG)
+    sf.set_exception_flags(0)
+    try:
+        assert sf.bf16_add(o, p).to_float() == 1.0 - 2.0 ** -8
+        assert sf.get_exception_flags() == sf.ExceptionFlag.INEXACT
+    finally:
+        sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+        sf.set_exception_flags(0)
+    # The largest finite value times 2 overflows in every rounding mode.
+    q: sf.BFloat16 = sf.BFloat16.from_bytes(b'\x7f\x7f')
+    for m in sf.RoundingMode:
+        sf.set_rounding_mode(m)
+        sf.set_exception_flags(0)
+        z: sf.BFloat16 = sf.bf16_add(q, q)
+        assert sf.test_exception_flags(sf.ExceptionFlag.OVERFLOW)
+        assert z.to_bytes() == (b'\x7f\x80' if m in (sf.RoundingMode.NEAR_EVEN, sf.RoundingMode.MAX, sf.RoundingMode.NEAR_MAX_MAG) else b'\x7f\x7f')
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    sf.set_exception_flags(0)
+
+
+def test_bf16_eq() -> None:
+    x: float = -12.5
+    y: float = 3.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_float(y)
+    assert sf.bf16_eq(o, o)
+    assert not sf.bf16_eq(o, p)
+    assert sf.BFloat16.eq(o, o)
+    assert not sf.BFloat16.eq(o, p)
+
+
+def test_bf16_le() -> None:
+    x: float = -12.5
+    y: float = 3.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_float(y)
+    assert sf.bf16_le(o, o)
+    assert sf.bf16_le(o, p)
+    assert not sf.bf16_le(p, o)
+    assert sf.BFloat16.le(o, o)
+    assert sf.BFloat16.le(o, p)
+    assert not sf.BFloat16.le(p, o)
+
+
+def test_bf16_lt() -> None:
+    x: float = -12.5
+    y: float = 3.25
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_float(y)
+    assert not sf.bf16_lt(o, o)
+    assert sf.bf16_lt(o, p)
+    assert not sf.bf16_lt(p, o)
+    assert not sf.BFloat16.lt(o, o)
+    assert sf.BFloat16.lt(o, p)
+    assert not sf.BFloat16.lt(p, o)
+
+
+def test_bf16_eq_signaling() -> None:
+    x: float = -12.5
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_bytes(_SIGNALING_NAN)
+    sf.set_exception_flags(0)
+    assert sf.bf16_eq_signaling(o, o)
+    assert not sf.test_exception_flags(sf.ExceptionFlag.INVALID)
+    sf.set_exception_flags(0)
+    assert not sf.bf16_eq_signaling(o, p)
+    assert sf.test_exception_flags(sf.ExceptionFlag.INVALID)
+    sf.set_exception_flags(0)
+
+
+def test_bf16_le_quiet() -> None:
+    x: float = -12.5
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_bytes(_SIGNALING_NAN)
+    sf.set_exception_flags(0)
+    assert sf.bf16_le_quiet(o, o)
+    assert not sf.test_exception_flags(sf.ExceptionFlag.INVALID)
+    sf.set_exception_flags(0)
+    assert not sf.bf16_le_quiet(o, p)
+    assert sf.test_exception_flags(sf.ExceptionFlag.INVALID)
+    sf.set_exception_flags(0)
+
+
+def test_bf16_lt_quiet() -> None:
+    x: float = -12.5
+    o: sf.BFloat16 = sf.BFloat16.from_float(x)
+    p: sf.BFloat16 = sf.BFloat16.from_bytes(_SIGNALING_NAN)
+    sf.set_exception_flags(0)
+    assert not sf.bf16_lt_quiet(o, o)
+    assert not sf.test_exception_flags(sf.ExceptionFlag.INVALID)
+    sf.set_exception_flags(0)
+    assert not sf.bf16_lt_quiet(o, p)
+    assert sf.test_exception_flags(sf.ExceptionFlag.INVALID)
+    sf.set_exception_flags(0)
+
+
 def test_bf16_is_signaling_nan() -> None:
     o: sf.BFloat16 = sf.BFloat16.from_bytes(_SIGNALING_NAN)
     assert sf.bf16_is_signaling_nan(o)
     assert o.is_signaling_nan()
+
+
+def test_operators() -> None:
+    ix: sf.BFloat16
+    iy: sf.BFloat16
+    iz: sf.BFloat16
+    for x in [8.75, -8.75]:
+        ix = sf.BFloat16.from_float(x)
+        assert +ix is not ix
+        assert (+ix).to_float() == +x
+        assert (-ix).to_float() == -x
+    for x, y in [(8.75, 3.5), (-8.75, 3.5), (8.75, -3.5), (-8.75, -3.5)]:
+        ix = sf.BFloat16.from_float(x)
+        iy = sf.BFloat16.from_float(y)
+        assert (ix + iy).to_float() == x + y
+        assert (ix - iy).to_float() == x - y
+        assert (ix * iy).to_float() == x * y
+        assert (ix / iy).to_float() == x / y
+        assert (ix // iy).to_float() == x // y
+        assert (ix % iy).to_float() == x % y
+        assert (ix < iy) == (x < y)
+        assert (ix <= iy) == (x <= y)
+        assert (ix > iy) == (x > y)
+        assert (ix >= iy) == (x >= y)
+        assert (ix == iy) == (x == y)
+        assert (ix != iy) == (x != y)
+        iz = ix
+        iz += iy
+        assert iz is not ix
+        assert iz.to_float() == x + y
+        iz = ix
+        iz *= iy
+        assert iz is not ix
+        assert iz.to_float() == x * y
+
+
+def test_bf16_interning() -> None:
+    sf.set_interning(True)
+    try:
+        x: sf.BFloat16 = sf.BFloat16.from_float(1.5)
+        assert sf.BFloat16.from_bytes(b'\x3f\xc0') is x
+        assert sf.f32_to_bf16(sf.Float32.from_float(1.5)) is x
+        assert sf.BFloat16Array.from_floats([1.5])[0] is x
+    finally:
+        sf.set_interning(False)
+    assert sf.BFloat16.from_float(1.5) is not x
+
+
+def test_bf16_array() -> None:
+    a: sf.BFloat16Array = sf.BFloat16Array.from_floats([-12.5, 3.25, 0.0])
+    assert len(a) == 3
+    assert a.to_floats() == [-12.5, 3.25, 0.0]
+    assert a[0].to_bytes() == sf.BFloat16.from_float(-12.5).to_bytes()
+    assert a[-1].to_float() == 0.0
+    assert [o.to_float() for o in a] == [-12.5, 3.25, 0.0]
+    assert a[::2].to_floats() == [-12.5, 0.0]
+    a[2] = sf.BFloat16.from_float(1.5)
+    a[:2] = sf.BFloat16Array([a[1], a[0]])
+    assert a.to_floats() == [3.25, -12.5, 1.5]
+    assert str(a) == '[3.25, -12.5, 1.5]'
+    assert sf.BFloat16Array(2).to_floats() == [0.0, 0.0]
+
+
+def test_bf16_array_buffer() -> None:
+    a: sf.BFloat16Array = sf.BFloat16Array.from_floats([-12.5, 3.25])
+    m: memoryview = memoryview(a)
+    assert m.format == 'H'
+    assert m.itemsize == 2
+    assert m.nbytes == 4
+    assert m.tobytes()[2:] == bytes(reversed(sf.BFloat16.from_float(3.25).to_bytes()))
+
+
+def test_bf16_to_f32_array() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    z: sf.Float32Array = sf.bf16_to_f32_array(x)
+    assert [o.to_bytes() for o in z] == [sf.bf16_to_f32(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f32()] == [o.to_bytes() for o in z]
+
+
+def test_bf16_arithmetic_arrays() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    y: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS)
+    assert [o.to_bytes() for o in sf.bf16_add_array(x, y)] == [sf.bf16_add(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in sf.bf16_sub_array(x, y)] == [sf.bf16_sub(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in sf.bf16_mul_array(x, y)] == [sf.bf16_mul(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in sf.bf16_mul_add_array(x, y, x)] == [sf.bf16_mul_add(o, p, o).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in sf.bf16_rem_array(x, y)] == [sf.bf16_rem(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in sf.bf16_sqrt_array(x)] == [sf.bf16_sqrt(o).to_bytes() for o in x]
+    z: sf.BFloat16Array = sf.bf16_round_to_int_array(x, sf.RoundingMode.MIN)
+    assert [o.to_bytes() for o in z] == [sf.bf16_round_to_int(o, sf.RoundingMode.MIN).to_bytes() for o in x]
+    sf.set_exception_flags(0)
+
+
+def test_bf16_array_bytes() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    big: bytes = b''.join([o.to_bytes() for o in x])
+    assert x.to_bytes('big') == big
+    assert x.to_bytes('little') == b''.join([o.to_bytes()[::-1] for o in x])
+    assert [o.to_bytes() for o in sf.BFloat16Array.from_buffer(big, 'big')] == [o.to_bytes() for o in x]
+    y: sf.BFloat16Array = sf.BFloat16Array.from_buffer(b'\x00' + x.to_bytes('little'), 'little', count=2, offset=1)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    b: bytearray = bytearray(x.to_bytes())
+    z: sf.BFloat16Array = sf.BFloat16Array.from_buffer(b)
+    z[0] = sf.BFloat16.from_float(2.0)
+    assert bytes(b) == z.to_bytes()
+    with pytest.raises(TypeError):
+        sf.BFloat16Array.from_buffer(bytes(b))[0] = z[1]
+    with pytest.raises(ValueError):
+        sf.BFloat16Array.from_buffer(b, count=len(x) + 1)
+    with pytest.raises(ValueError):
+        x.to_bytes('middle')
+
+
+def test_bf16_array_file(tmp_path: pathlib.Path) -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    path: pathlib.Path = tmp_path / 'x.bin'
+    path.write_bytes(b'\x00' * 16 + x.to_bytes('big'))
+    y: sf.BFloat16Array = sf.BFloat16Array.from_file(path, 'big', offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x]
+    path.write_bytes(b'\x00' * 16 + x.to_bytes())
+    y = sf.BFloat16Array.from_file(path, count=2, offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    with pytest.raises(TypeError):
+        y += y
+    y = sf.BFloat16Array.from_file(path, offset=16, mode='c')
+    y += y
+    assert path.read_bytes()[16:] == x.to_bytes()
+    with pytest.raises(ValueError):
+        sf.BFloat16Array.from_file(path, mode='w')
+
+
+def test_bf16_array_subclass() -> None:
+    class Sub(sf.BFloat16Array):
+        pass
+
+    x: Sub = Sub.from_floats(_XS)
+    assert type(x) is Sub
+    assert [o.to_bytes() for o in x] == [o.to_bytes() for o in sf.BFloat16Array.from_floats(_XS)]
+    x[0] = x[1]
+    assert x[0].to_bytes() == x[1].to_bytes()
+    assert str(x) == str(sf.BFloat16Array(list(x)))
+
+
+def test_bf16_array_operators() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    y: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS)
+    a: sf.BFloat16 = sf.BFloat16.from_float(1.5)
+    assert [o.to_bytes() for o in x + y] == [sf.bf16_add(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x - a] == [sf.bf16_sub(o, a).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x * y] == [sf.bf16_mul(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x / a] == [sf.bf16_div(o, a).to_bytes() for o in x]
+    z: sf.BFloat16Array = x[:]
+    w: sf.BFloat16Array = z
+    z += y
+    z *= a
+    z -= x
+    z /= a
+    assert z is w
+    assert [o.to_bytes() for o in z] == [
+        sf.bf16_div(sf.bf16_sub(sf.bf16_mul(sf.bf16_add(o, p), a), o), a).to_bytes() for o, p in zip(x, y)
+    ]
+    with pytest.raises(ValueError):
+        z += y[1:]
+
+
+def test_bf16_array_reflected_operators() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    a: sf.BFloat16 = sf.BFloat16.from_float(1.5)
+    assert [o.to_bytes() for o in a + x] == [sf.bf16_add(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a - x] == [sf.bf16_sub(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a * x] == [sf.bf16_mul(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a / x] == [sf.bf16_div(a, o).to_bytes() for o in x]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + 1  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x - 'a'  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        1 - x  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x / sf.Float64.from_float(1.5)  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + sf.Float64Array(len(x))
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x += 1  # type: ignore[arg-type]
+    assert bytearray() + x == x.to_bytes()
+
+
+def test_bf16_broadcast_arrays() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    y: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS)
+    a: sf.BFloat16 = sf.BFloat16.from_float(1.5)
+    z: sf.BFloat16Array = sf.bf16_mul_add_array(a, x, y)
+    assert [o.to_bytes() for o in z] == [sf.bf16_mul_add(a, o, p).to_bytes() for o, p in zip(x, y)]
+    z = sf.bf16_mul_add_array(x, y, a)
+    assert [o.to_bytes() for o in z] == [sf.bf16_mul_add(o, p, a).to_bytes() for o, p in zip(x, y)]
+    z = sf.bf16_add_array(x, a)
+    assert [o.to_bytes() for o in z] == [sf.bf16_add(o, a).to_bytes() for o in x]
+    assert list(sf.bf16_lt_array(a, x)) == [int(sf.bf16_lt(a, o)) for o in x]
+    assert [o.to_bytes() for o in sf.bf16_mul_array(a, a)] == [sf.bf16_mul(a, a).to_bytes()]
+    with pytest.raises(ValueError):
+        sf.bf16_mul_add_array(a, x, y[1:])
+
+
+def test_bf16_comparison_arrays() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    y: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS)
+    assert list(sf.bf16_eq_array(x, y)) == [int(sf.bf16_eq(o, p)) for o, p in zip(x, y)]
+    assert list(sf.bf16_le_array(x, y)) == [int(sf.bf16_le(o, p)) for o, p in zip(x, y)]
+    assert list(sf.bf16_lt_array(x, y)) == [int(sf.bf16_lt(o, p)) for o, p in zip(x, y)]
+    assert list(sf.bf16_eq_signaling_array(x, y)) == [int(sf.bf16_eq_signaling(o, p)) for o, p in zip(x, y)]
+    assert list(sf.bf16_le_quiet_array(x, y)) == [int(sf.bf16_le_quiet(o, p)) for o, p in zip(x, y)]
+    assert list(sf.bf16_lt_quiet_array(x, y)) == [int(sf.bf16_lt_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_bf16_div_array_flags() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    y: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS)
+    expected: list[int] = []
+    for o, p in zip(x, y):
+        sf.set_exception_flags(0)
+        sf.bf16_div(o, p)
+        expected.append(sf.get_exception_flags())
+    flags: bytearray = bytearray(len(x))
+    sf.set_exception_flags(0)
+    z: sf.BFloat16Array = sf.bf16_div_array(x, y, flags=flags)
+    assert [o.to_bytes() for o in z] == [sf.bf16_div(o, p).to_bytes() for o, p in zip(x, y)]
+    assert list(flags) == expected
+    sf.set_exception_flags(0)
+
+
+def test_bf16_sum() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    s: sf.BFloat16 = x[0]
+    for o in x[1:]:
+        s = sf.bf16_add(s, o)
+    assert sf.bf16_sum(x).to_bytes() == s.to_bytes()
+    assert sf.bf16_sum(x, sf.SummationMethod.PAIRWISE).to_bytes() == s.to_bytes()
+    assert sf.bf16_sum(x, sf.SummationMethod.COMPENSATED).to_bytes() == s.to_bytes()
+    assert sf.bf16_sum(sf.BFloat16Array()).to_float() == 0.0
+    x = sf.BFloat16Array.from_floats([1.0, 2.0 ** -8, 2.0 ** -30])
+    assert sf.bf16_sum(x).to_float() == 1.0
+    assert sf.bf16_sum(x, sf.SummationMethod.EXACT).to_float() == 1.0 + 2.0 ** -7
+
+
+def test_bf16_dot() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    y: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS)
+    assert sf.bf16_dot(x, y).to_bytes() == sf.bf16_sum(sf.bf16_mul_array(x, y)).to_bytes()
+    assert sf.bf16_dot(x, y, fused=True).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.bf16_dot(x, y, sf.SummationMethod.COMPENSATED).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.bf16_dot(x, y, sf.SummationMethod.EXACT).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    with pytest.raises(ValueError):
+        sf.bf16_dot(x, y[1:])
+
+
+def test_bf16_prod() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS[:3])
+    assert sf.bf16_prod(x).to_float() == math.prod(_YS[:3])
+    assert sf.bf16_prod(sf.BFloat16Array()).to_float() == 1.0
+
+
+def test_bf16_min_max() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    assert sf.bf16_min(x).to_float() == min(_XS)
+    assert sf.bf16_max(x).to_float() == max(_XS)
+    with pytest.raises(ValueError):
+        sf.bf16_min(sf.BFloat16Array())
+
+
+def test_bf16_matmul() -> None:
+    x: sf.BFloat16Array = sf.BFloat16Array.from_floats(_XS)
+    y: sf.BFloat16Array = sf.BFloat16Array.from_floats(_YS)
+    z: sf.Float32Array = sf.bf16_matmul(x, y, 2, 2, 2, sf.Float32)
+    assert [o.to_float() for o in z] == [-53.625, -6.25, 3.25, 0.5]
+    assert [o.to_float() for o in sf.bf16_matmul(x, y, 2, 2, 2)] == [-53.5, -6.25, 3.25, 0.5]  # -40.625 is rounded to -40.5
+    assert sf.bf16_matmul(x, y, 1, 1, 4)[0].to_bytes() == sf.bf16_dot(x, y).to_bytes()
+    assert [o.to_float() for o in sf.bf16_matmul(x, y, 4, 4, 1, sf.Float64)] == [a * b for a in _XS for b in _YS]
+    with pytest.raises(ValueError):
+        sf.bf16_matmul(x, y, 2, 2, 3)
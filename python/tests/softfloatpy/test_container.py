@@ -0,0 +1,125 @@
+# SoftFloatPy: A Python binding of Berkeley SoftFloat.
+#
+# Copyright (c) 2024-2025 Arihiro Yoshida. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mmap
+import pathlib
+import struct
+
+import pytest
+
+import softfloatpy as sf
+from softfloatpy.container import ContainerReader, ContainerWriter
+
+
+_CHUNKS: list[list[float]] = [[1.0, -2.5, 3.25], [], [4.0, 0.5], [-8.0, 16.0, 0.125, 7.0]]
+
+
+def _write(path: pathlib.Path, byteorder: str, compression: str | None) -> None:
+    with ContainerWriter(path, sf.Float32Array, byteorder=byteorder, compression=compression) as w:
+        for i, c in enumerate(_CHUNKS):
+            w.write(sf.Float32Array.from_floats(c), flags=i)
+
+
+@pytest.mark.parametrize('byteorder', ['little', 'big'])
+@pytest.mark.parametrize('compression', [None, 'zlib', 'lzma'])
+def test_container(tmp_path: pathlib.Path, byteorder: str, compression: str | None) -> None:
+    path: pathlib.Path = tmp_path / 'x.sfc'
+    _write(path, byteorder, compression)
+    floats: list[float] = [f for c in _CHUNKS for f in c]
+    with ContainerReader(path) as r:
+        assert r.array_type is sf.Float32Array
+        assert r.byteorder == byteorder
+        assert r.chunk_count == len(_CHUNKS)
+        assert len(r) == len(floats)
+        assert r.flags == 3
+        for i, c in enumerate(_CHUNKS):
+            assert r.chunk_length(i) == len(c)
+            assert r.chunk_flags(i) == i
+            assert r.read_chunk(i).to_floats() == c
+        assert r.read().to_floats() == floats
+        assert r.read(1, 2).to_floats() == floats[1:2]
+        assert r.read(2, -1).to_floats() == floats[2:-1]
+        assert r.read(-3).to_floats() == floats[-3:]
+        assert r.read(5, 3).to_floats() == []
+
+
+def test_container_float128(tmp_path: pathlib.Path) -> None:
+    path: pathlib.Path = tmp_path / 'x.sfc'
+    x: sf.Float128Array = sf.Float128Array.from_floats([1.0, -3.5, 0.1])
+    with ContainerWriter(path, sf.Float128Array, byteorder='big') as w:
+        w.write(x)
+    with ContainerReader(path) as r:
+        assert [o.to_bytes() for o in r.read_chunk(0)] == [o.to_bytes() for o in x]
+
+
+def test_container_modes(tmp_path: pathlib.Path) -> None:
+    path: pathlib.Path = tmp_path / 'x.sfc'
+    with ContainerWriter(path, sf.Float16Array, rounding_mode=sf.RoundingMode.MIN) as w:
+        w.write(sf.Float16Array.from_floats([1.0]))
+        with pytest.raises(TypeError):
+            w.write(sf.Float32Array.from_floats([1.0]))
+    with ContainerReader(path) as r:
+        assert r.rounding_mode == sf.RoundingMode.MIN
+        assert r.tininess_mode == sf.get_tininess_mode()
+        context: sf.FloatContext = r.context()
+        assert context.rounding_mode == sf.RoundingMode.MIN
+
+
+def test_container_errors(tmp_path: pathlib.Path) -> None:
+    path: pathlib.Path = tmp_path / 'x.sfc'
+    with pytest.raises(ValueError):
+        ContainerWriter(path, sf.Float32Array, byteorder='native')
+    with pytest.raises(ValueError):
+        ContainerWriter(path, sf.Float32Array, compression='gzip')
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        ContainerReader(path)
+    w: ContainerWriter = ContainerWriter(path, sf.Float32Array)
+    w.close()
+    with pytest.raises(ValueError):
+        w.write(sf.Float32Array())
+
+
+@pytest.mark.parametrize('position, value', [
+    (6, b'\x05'),  # floating-point format
+    (7, b'\x02'),  # byte order
+    (-24, struct.pack('<Q', 1 << 40)),  # offset of the chunk index
+    (-16, struct.pack('<Q', 1000)),  # number of the chunks
+    (-24 - 32 * 4, struct.pack('<Q', 1 << 40)),  # offset of the first chunk
+    (-24 - 32 * 4 + 24, b'\x03')  # compression method of the first chunk
+])
+def test_container_corrupted(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, position: int, value: bytes) -> None:
+    path: pathlib.Path = tmp_path / 'x.sfc'
+    _write(path, 'little', None)
+    data: bytearray = bytearray(path.read_bytes())
+    data[position:position + len(value) or None] = value
+    path.write_bytes(data)
+    maps: list[mmap.mmap] = []
+
+    def open_map(*args: int, **kwargs: int) -> mmap.mmap:
+        maps.append(map_type(*args, **kwargs))
+        return maps[-1]
+
+    map_type: type[mmap.mmap] = mmap.mmap
+    monkeypatch.setattr(mmap, 'mmap', open_map)
+    with pytest.raises(ValueError):
+        ContainerReader(path)
+    assert len(maps) == 1 and maps[0].closed
@@ -21,9 +21,14 @@
 # SOFTWARE.
 
 import math
+import pathlib
+
+import pytest
 
 import softfloatpy as sf
 
+_XS: list[float] = [-12.5, 3.25, 1.0, 0.0]
+_YS: list[float] = [3.25, 0.5, -4.0, 0.0]
 _SIGNALING_NAN: bytes = b'\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'
 
 
@@ -43,6 +48,20 @@ def test_f128_float() -> None:
     assert str(o) == str(f)
 
 
+def test_f128_str() -> None:
+    assert str(sf.Float128.from_bytes(bytes.fromhex('3fff0000000000000000000000000000'))) == '1.0'
+    assert str(sf.Float128.from_bytes(bytes.fromhex('3ffb999999999999999999999999999a'))) == '0.1'
+    assert str(sf.Float128.from_bytes(bytes.fromhex('7ffeffffffffffffffffffffffffffff'))) == '1.189731495357231765085759326628007e+4932'
+    assert str(sf.Float128.from_bytes(bytes.fromhex('00000000000000000000000000000001'))) == '6e-4966'
+    assert str(sf.Float128.from_bytes(bytes.fromhex('80000000000000000000000000000000'))) == '-0.0'
+    assert str(sf.Float128.from_bytes(bytes.fromhex('ffff0000000000000000000000000000'))) == '-inf'
+    assert str(sf.Float128.from_bytes(bytes.fromhex('7fff8000000000000000000000000000'))) == 'nan'
+    assert str(sf.f128_div(sf.Float128.from_float(1.0), sf.Float128.from_float(3.0))) == '0.3333333333333333333333333333333333'
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    assert x.to_str() == ', '.join([str(o) for o in x])
+    assert x.to_str('\n') == '\n'.join([str(o) for o in x])
+
+
 def test_f128_to_ui32() -> None:
     f: float = 12.3
     o: sf.Float128 = sf.Float128.from_float(f)
@@ -313,3 +332,326 @@ def test_operators() -> None:
         iz %= iy
         assert iz is not ix
         assert iz.to_float() == x % y
+
+
+def test_f128_array() -> None:
+    a: sf.Float128Array = sf.Float128Array.from_floats([-12.5, 3.25, 0.0])
+    assert len(a) == 3
+    assert a.to_floats() == [-12.5, 3.25, 0.0]
+    assert a[0].to_bytes() == sf.Float128.from_float(-12.5).to_bytes()
+    assert a[-1].to_float() == 0.0
+    assert [o.to_float() for o in a] == [-12.5, 3.25, 0.0]
+    assert a[::2].to_floats() == [-12.5, 0.0]
+    a[2] = sf.Float128.from_float(1.5)
+    a[:2] = sf.Float128Array([a[1], a[0]])
+    assert a.to_floats() == [3.25, -12.5, 1.5]
+    assert str(a) == '[3.25, -12.5, 1.5]'
+    assert sf.Float128Array(2).to_floats() == [0.0, 0.0]
+
+
+def test_f128_array_buffer() -> None:
+    a: sf.Float128Array = sf.Float128Array.from_floats([-12.5, 3.25])
+    m: memoryview = memoryview(a)
+    assert m.format == '2Q'
+    assert m.itemsize == 16
+    assert m.nbytes == 32
+    assert m.tobytes()[16:] == bytes(reversed(sf.Float128.from_float(3.25).to_bytes()))
+
+
+def test_f128_round_to_int_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    z: sf.Float128Array = sf.f128_round_to_int_array(x, sf.RoundingMode.MIN)
+    assert [o.to_bytes() for o in z] == [sf.f128_round_to_int(o, sf.RoundingMode.MIN).to_bytes() for o in x]
+
+
+def test_f128_add_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    z: sf.Float128Array = sf.f128_add_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f128_add(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f128_sub_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    z: sf.Float128Array = sf.f128_sub_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f128_sub(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f128_mul_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    z: sf.Float128Array = sf.f128_mul_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f128_mul(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f128_mul_add_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    w: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    z: sf.Float128Array = sf.Float128Array(len(x))
+    assert sf.f128_mul_add_array(x, y, w, out=z) is z
+    assert [o.to_bytes() for o in z] == [sf.f128_mul_add(o, p, q).to_bytes() for o, p, q in zip(x, y, w)]
+
+
+def test_f128_array_bytes() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    big: bytes = b''.join([o.to_bytes() for o in x])
+    assert x.to_bytes('big') == big
+    assert x.to_bytes('little') == b''.join([o.to_bytes()[::-1] for o in x])
+    assert [o.to_bytes() for o in sf.Float128Array.from_buffer(big, 'big')] == [o.to_bytes() for o in x]
+    y: sf.Float128Array = sf.Float128Array.from_buffer(b'\x00' + x.to_bytes('little'), 'little', count=2, offset=1)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    b: bytearray = bytearray(x.to_bytes())
+    z: sf.Float128Array = sf.Float128Array.from_buffer(b)
+    z[0] = sf.Float128.from_float(2.0)
+    assert bytes(b) == z.to_bytes()
+    with pytest.raises(TypeError):
+        sf.Float128Array.from_buffer(bytes(b))[0] = z[1]
+    with pytest.raises(ValueError):
+        sf.Float128Array.from_buffer(b, count=len(x) + 1)
+    with pytest.raises(ValueError):
+        x.to_bytes('middle')
+
+
+def test_f128_array_file(tmp_path: pathlib.Path) -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    path: pathlib.Path = tmp_path / 'x.bin'
+    path.write_bytes(b'\x00' * 16 + x.to_bytes('big'))
+    y: sf.Float128Array = sf.Float128Array.from_file(path, 'big', offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x]
+    path.write_bytes(b'\x00' * 16 + x.to_bytes())
+    y = sf.Float128Array.from_file(path, count=2, offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    with pytest.raises(TypeError):
+        y += y
+    y = sf.Float128Array.from_file(path, offset=16, mode='c')
+    y += y
+    assert path.read_bytes()[16:] == x.to_bytes()
+    with pytest.raises(ValueError):
+        sf.Float128Array.from_file(path, mode='w')
+
+
+def test_f128_array_subclass() -> None:
+    class Sub(sf.Float128Array):
+        pass
+
+    x: Sub = Sub.from_floats(_XS)
+    assert type(x) is Sub
+    assert [o.to_bytes() for o in x] == [o.to_bytes() for o in sf.Float128Array.from_floats(_XS)]
+    x[0] = x[1]
+    assert x[0].to_bytes() == x[1].to_bytes()
+    assert str(x) == str(sf.Float128Array(list(x)))
+
+
+def test_f128_array_operators() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    a: sf.Float128 = sf.Float128.from_float(1.5)
+    assert [o.to_bytes() for o in x + y] == [sf.f128_add(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x - a] == [sf.f128_sub(o, a).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x * y] == [sf.f128_mul(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x / a] == [sf.f128_div(o, a).to_bytes() for o in x]
+    z: sf.Float128Array = x[:]
+    w: sf.Float128Array = z
+    z += y
+    z *= a
+    z -= x
+    z /= a
+    assert z is w
+    assert [o.to_bytes() for o in z] == [
+        sf.f128_div(sf.f128_sub(sf.f128_mul(sf.f128_add(o, p), a), o), a).to_bytes() for o, p in zip(x, y)
+    ]
+    with pytest.raises(ValueError):
+        z += y[1:]
+
+
+def test_f128_array_reflected_operators() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    a: sf.Float128 = sf.Float128.from_float(1.5)
+    assert [o.to_bytes() for o in a + x] == [sf.f128_add(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a - x] == [sf.f128_sub(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a * x] == [sf.f128_mul(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a / x] == [sf.f128_div(a, o).to_bytes() for o in x]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + 1  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x - 'a'  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        1 - x  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x / sf.Float64.from_float(1.5)  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + sf.Float64Array(len(x))
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x += 1  # type: ignore[arg-type]
+    assert bytearray() + x == x.to_bytes()
+
+
+def test_f128_broadcast_arrays() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    a: sf.Float128 = sf.Float128.from_float(1.5)
+    z: sf.Float128Array = sf.f128_mul_add_array(a, x, y)
+    assert [o.to_bytes() for o in z] == [sf.f128_mul_add(a, o, p).to_bytes() for o, p in zip(x, y)]
+    z = sf.f128_mul_add_array(x, y, a)
+    assert [o.to_bytes() for o in z] == [sf.f128_mul_add(o, p, a).to_bytes() for o, p in zip(x, y)]
+    z = sf.f128_add_array(x, a)
+    assert [o.to_bytes() for o in z] == [sf.f128_add(o, a).to_bytes() for o in x]
+    assert list(sf.f128_lt_array(a, x)) == [int(sf.f128_lt(a, o)) for o in x]
+    assert [o.to_bytes() for o in sf.f128_mul_array(a, a)] == [sf.f128_mul(a, a).to_bytes()]
+    with pytest.raises(ValueError):
+        sf.f128_mul_add_array(a, x, y[1:])
+
+
+def test_f128_div_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    z: sf.Float128Array = sf.f128_div_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f128_div(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f128_rem_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    z: sf.Float128Array = sf.f128_rem_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f128_rem(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f128_sqrt_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    z: sf.Float128Array = sf.f128_sqrt_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f128_sqrt(o).to_bytes() for o in x]
+
+
+def test_f128_eq_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    assert list(sf.f128_eq_array(x, y)) == [int(sf.f128_eq(o, p)) for o, p in zip(x, y)]
+
+
+def test_f128_le_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    assert list(sf.f128_le_array(x, y)) == [int(sf.f128_le(o, p)) for o, p in zip(x, y)]
+
+
+def test_f128_lt_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    assert list(sf.f128_lt_array(x, y)) == [int(sf.f128_lt(o, p)) for o, p in zip(x, y)]
+
+
+def test_f128_eq_signaling_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    assert list(sf.f128_eq_signaling_array(x, y)) == [int(sf.f128_eq_signaling(o, p)) for o, p in zip(x, y)]
+
+
+def test_f128_le_quiet_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    assert list(sf.f128_le_quiet_array(x, y)) == [int(sf.f128_le_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_f128_lt_quiet_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    assert list(sf.f128_lt_quiet_array(x, y)) == [int(sf.f128_lt_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_f128_array_length_mismatch() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    with pytest.raises(ValueError):
+        sf.f128_add_array(x, x[1:])
+
+
+def test_f128_div_array_flags() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    expected: list[int] = []
+    summary: int = sf.ExceptionFlag.UNDERFLOW
+    for o, p in zip(x, y):
+        sf.set_exception_flags(0)
+        sf.f128_div(o, p)
+        expected.append(sf.get_exception_flags())
+        summary |= sf.get_exception_flags()
+    flags: bytearray = bytearray(len(x))
+    sf.set_exception_flags(sf.ExceptionFlag.UNDERFLOW)
+    sf.f128_div_array(x, y, flags=flags)
+    assert list(flags) == expected
+    assert sf.get_exception_flags() == summary
+    sf.set_exception_flags(0)
+    with pytest.raises(ValueError):
+        sf.f128_div_array(x, y, flags=bytearray(len(x) - 1))
+
+
+def test_f128_to_f16_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    z: sf.Float16Array = sf.f128_to_f16_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f128_to_f16(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f16()] == [o.to_bytes() for o in z]
+
+
+def test_f128_to_f32_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    z: sf.Float32Array = sf.f128_to_f32_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f128_to_f32(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f32()] == [o.to_bytes() for o in z]
+
+
+def test_f128_to_f64_array() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    z: sf.Float64Array = sf.f128_to_f64_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f128_to_f64(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f64()] == [o.to_bytes() for o in z]
+
+
+def test_f128_sum() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    s: sf.Float128 = x[0]
+    for o in x[1:]:
+        s = sf.f128_add(s, o)
+    assert sf.f128_sum(x).to_bytes() == s.to_bytes()
+    assert sf.f128_sum(x, sf.SummationMethod.PAIRWISE).to_bytes() == s.to_bytes()
+    assert sf.f128_sum(x, sf.SummationMethod.COMPENSATED).to_bytes() == s.to_bytes()
+    assert sf.f128_sum(sf.Float128Array()).to_float() == 0.0
+    x = sf.Float128Array.from_floats([1.0, 2.0 ** -113, 2.0 ** -1074])
+    assert sf.f128_sum(x).to_bytes() == sf.Float128.from_float(1.0).to_bytes()
+    assert sf.f128_sum(x, sf.SummationMethod.EXACT).to_bytes() == sf.f128_add(x[0], sf.Float128.from_float(2.0 ** -112)).to_bytes()
+
+
+def test_f128_dot() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    assert sf.f128_dot(x, y).to_bytes() == sf.f128_sum(sf.f128_mul_array(x, y)).to_bytes()
+    assert sf.f128_dot(x, y, fused=True).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f128_dot(x, y, sf.SummationMethod.COMPENSATED).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f128_dot(x, y, sf.SummationMethod.EXACT).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    with pytest.raises(ValueError):
+        sf.f128_dot(x, y[1:])
+
+
+def test_f128_prod() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_YS[:3])
+    assert sf.f128_prod(x).to_float() == math.prod(_YS[:3])
+    assert sf.f128_prod(sf.Float128Array()).to_float() == 1.0
+
+
+def test_f128_min_max() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    assert sf.f128_min(x).to_float() == min(_XS)
+    assert sf.f128_max(x).to_float() == max(_XS)
+    with pytest.raises(ValueError):
+        sf.f128_min(sf.Float128Array())
+
+
+def test_f128_matmul() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats(_XS)
+    y: sf.Float128Array = sf.Float128Array.from_floats(_YS)
+    z: sf.Float128Array = sf.f128_matmul(x, y, 2, 2, 2)
+    assert [o.to_float() for o in z] == [-53.625, -6.25, 3.25, 0.5]
+    assert sf.f128_matmul(x, y, 1, 1, 4)[0].to_bytes() == sf.f128_dot(x, y).to_bytes()
+    assert [o.to_float() for o in sf.f128_matmul(x, y, 4, 4, 1, sf.Float64)] == [a * b for a in _XS for b in _YS]
+    with pytest.raises(ValueError):
+        sf.f128_matmul(x, y, 2, 2, 3)
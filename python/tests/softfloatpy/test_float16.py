@@ -20,10 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import functools
 import math
+import operator
+import pathlib
+import random
+from collections.abc import Callable
+
+import pytest
 
 import softfloatpy as sf
 
+_XS: list[float] = [-12.5, 3.25, 1.0, 0.0]
+_YS: list[float] = [3.25, 0.5, -4.0, 0.0]
 _SIGNALING_NAN: bytes = b'\xfc\x01'
 
 
@@ -43,6 +52,19 @@ def test_f16_float() -> None:
     assert str(o) == str(f)
 
 
+def test_f16_str() -> None:
+    assert str(sf.Float16.from_bytes(bytes.fromhex('3c00'))) == '1.0'
+    assert str(sf.Float16.from_bytes(bytes.fromhex('2e66'))) == '0.1'
+    assert str(sf.Float16.from_bytes(bytes.fromhex('7bff'))) == '65500.0'
+    assert str(sf.Float16.from_bytes(bytes.fromhex('0001'))) == '6e-08'
+    assert str(sf.Float16.from_bytes(bytes.fromhex('8000'))) == '-0.0'
+    assert str(sf.Float16.from_bytes(bytes.fromhex('fc00'))) == '-inf'
+    assert str(sf.Float16.from_bytes(bytes.fromhex('7e00'))) == 'nan'
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    assert x.to_str() == ', '.join([str(o) for o in x])
+    assert x.to_str('\n') == '\n'.join([str(o) for o in x])
+
+
 def test_f16_to_ui32() -> None:
     f: float = 12.3
     o: sf.Float16 = sf.Float16.from_float(f)
@@ -313,3 +335,408 @@ def test_operators() -> None:
         iz %= iy
         assert iz is not ix
         assert iz.to_float() == x % y
+
+
+def test_f16_interning() -> None:
+    assert not sf.get_interning()
+    assert sf.Float16.from_float(1.5) is not sf.Float16.from_float(1.5)
+    sf.set_interning(True)
+    try:
+        assert sf.get_interning()
+        x: sf.Float16 = sf.Float16.from_float(1.5)
+        assert sf.Float16.from_bytes(b'\x3e\x00') is x
+        assert sf.f16_add(sf.Float16.from_float(1.0), sf.Float16.from_float(0.5)) is x
+        assert -(-x) is x
+        assert sf.Float16Array.from_floats([1.5])[0] is x
+    finally:
+        sf.set_interning(False)
+    assert sf.Float16.from_float(1.5) is not x
+
+
+def test_f16_array() -> None:
+    a: sf.Float16Array = sf.Float16Array.from_floats([-12.5, 3.25, 0.0])
+    assert len(a) == 3
+    assert a.to_floats() == [-12.5, 3.25, 0.0]
+    assert a[0].to_bytes() == sf.Float16.from_float(-12.5).to_bytes()
+    assert a[-1].to_float() == 0.0
+    assert [o.to_float() for o in a] == [-12.5, 3.25, 0.0]
+    assert a[::2].to_floats() == [-12.5, 0.0]
+    a[2] = sf.Float16.from_float(1.5)
+    a[:2] = sf.Float16Array([a[1], a[0]])
+    assert a.to_floats() == [3.25, -12.5, 1.5]
+    assert str(a) == '[3.25, -12.5, 1.5]'
+    assert sf.Float16Array(2).to_floats() == [0.0, 0.0]
+
+
+def test_f16_array_buffer() -> None:
+    a: sf.Float16Array = sf.Float16Array.from_floats([-12.5, 3.25])
+    m: memoryview = memoryview(a)
+    assert m.format == 'H'
+    assert m.itemsize == 2
+    assert m.nbytes == 4
+    assert m.tobytes()[2:] == bytes(reversed(sf.Float16.from_float(3.25).to_bytes()))
+
+
+def test_f16_round_to_int_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    z: sf.Float16Array = sf.f16_round_to_int_array(x, sf.RoundingMode.MIN)
+    assert [o.to_bytes() for o in z] == [sf.f16_round_to_int(o, sf.RoundingMode.MIN).to_bytes() for o in x]
+
+
+def test_f16_add_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    z: sf.Float16Array = sf.f16_add_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f16_add(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f16_sub_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    z: sf.Float16Array = sf.f16_sub_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f16_sub(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f16_mul_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    z: sf.Float16Array = sf.f16_mul_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f16_mul(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f16_mul_add_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    w: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    z: sf.Float16Array = sf.Float16Array(len(x))
+    assert sf.f16_mul_add_array(x, y, w, out=z) is z
+    assert [o.to_bytes() for o in z] == [sf.f16_mul_add(o, p, q).to_bytes() for o, p, q in zip(x, y, w)]
+
+
+def test_f16_array_bytes() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    big: bytes = b''.join([o.to_bytes() for o in x])
+    assert x.to_bytes('big') == big
+    assert x.to_bytes('little') == b''.join([o.to_bytes()[::-1] for o in x])
+    assert [o.to_bytes() for o in sf.Float16Array.from_buffer(big, 'big')] == [o.to_bytes() for o in x]
+    y: sf.Float16Array = sf.Float16Array.from_buffer(b'\x00' + x.to_bytes('little'), 'little', count=2, offset=1)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    b: bytearray = bytearray(x.to_bytes())
+    z: sf.Float16Array = sf.Float16Array.from_buffer(b)
+    z[0] = sf.Float16.from_float(2.0)
+    assert bytes(b) == z.to_bytes()
+    with pytest.raises(TypeError):
+        sf.Float16Array.from_buffer(bytes(b))[0] = z[1]
+    with pytest.raises(ValueError):
+        sf.Float16Array.from_buffer(b, count=len(x) + 1)
+    with pytest.raises(ValueError):
+        x.to_bytes('middle')
+
+
+def test_f16_array_file(tmp_path: pathlib.Path) -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    path: pathlib.Path = tmp_path / 'x.bin'
+    path.write_bytes(b'\x00' * 16 + x.to_bytes('big'))
+    y: sf.Float16Array = sf.Float16Array.from_file(path, 'big', offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x]
+    path.write_bytes(b'\x00' * 16 + x.to_bytes())
+    y = sf.Float16Array.from_file(path, count=2, offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    with pytest.raises(TypeError):
+        y += y
+    y = sf.Float16Array.from_file(path, offset=16, mode='c')
+    y += y
+    assert path.read_bytes()[16:] == x.to_bytes()
+    with pytest.raises(ValueError):
+        sf.Float16Array.from_file(path, mode='w')
+
+
+def test_f16_array_subclass() -> None:
+    class Sub(sf.Float16Array):
+        pass
+
+    x: Sub = Sub.from_floats(_XS)
+    assert type(x) is Sub
+    assert [o.to_bytes() for o in x] == [o.to_bytes() for o in sf.Float16Array.from_floats(_XS)]
+    x[0] = x[1]
+    assert x[0].to_bytes() == x[1].to_bytes()
+    assert str(x) == str(sf.Float16Array(list(x)))
+
+
+def test_f16_array_operators() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    a: sf.Float16 = sf.Float16.from_float(1.5)
+    assert [o.to_bytes() for o in x + y] == [sf.f16_add(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x - a] == [sf.f16_sub(o, a).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x * y] == [sf.f16_mul(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x / a] == [sf.f16_div(o, a).to_bytes() for o in x]
+    z: sf.Float16Array = x[:]
+    w: sf.Float16Array = z
+    z += y
+    z *= a
+    z -= x
+    z /= a
+    assert z is w
+    assert [o.to_bytes() for o in z] == [
+        sf.f16_div(sf.f16_sub(sf.f16_mul(sf.f16_add(o, p), a), o), a).to_bytes() for o, p in zip(x, y)
+    ]
+    with pytest.raises(ValueError):
+        z += y[1:]
+
+
+def test_f16_array_reflected_operators() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    a: sf.Float16 = sf.Float16.from_float(1.5)
+    assert [o.to_bytes() for o in a + x] == [sf.f16_add(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a - x] == [sf.f16_sub(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a * x] == [sf.f16_mul(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a / x] == [sf.f16_div(a, o).to_bytes() for o in x]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + 1  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x - 'a'  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        1 - x  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x / sf.Float64.from_float(1.5)  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + sf.Float64Array(len(x))
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x += 1  # type: ignore[arg-type]
+    assert bytearray() + x == x.to_bytes()
+
+
+def test_f16_broadcast_arrays() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    a: sf.Float16 = sf.Float16.from_float(1.5)
+    z: sf.Float16Array = sf.f16_mul_add_array(a, x, y)
+    assert [o.to_bytes() for o in z] == [sf.f16_mul_add(a, o, p).to_bytes() for o, p in zip(x, y)]
+    z = sf.f16_mul_add_array(x, y, a)
+    assert [o.to_bytes() for o in z] == [sf.f16_mul_add(o, p, a).to_bytes() for o, p in zip(x, y)]
+    z = sf.f16_add_array(x, a)
+    assert [o.to_bytes() for o in z] == [sf.f16_add(o, a).to_bytes() for o in x]
+    assert list(sf.f16_lt_array(a, x)) == [int(sf.f16_lt(a, o)) for o in x]
+    assert [o.to_bytes() for o in sf.f16_mul_array(a, a)] == [sf.f16_mul(a, a).to_bytes()]
+    with pytest.raises(ValueError):
+        sf.f16_mul_add_array(a, x, y[1:])
+
+
+def test_f16_div_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    z: sf.Float16Array = sf.f16_div_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f16_div(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f16_rem_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    z: sf.Float16Array = sf.f16_rem_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f16_rem(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f16_sqrt_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    z: sf.Float16Array = sf.f16_sqrt_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f16_sqrt(o).to_bytes() for o in x]
+
+
+def test_f16_eq_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    assert list(sf.f16_eq_array(x, y)) == [int(sf.f16_eq(o, p)) for o, p in zip(x, y)]
+
+
+def test_f16_le_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    assert list(sf.f16_le_array(x, y)) == [int(sf.f16_le(o, p)) for o, p in zip(x, y)]
+
+
+def test_f16_lt_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    assert list(sf.f16_lt_array(x, y)) == [int(sf.f16_lt(o, p)) for o, p in zip(x, y)]
+
+
+def test_f16_eq_signaling_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    assert list(sf.f16_eq_signaling_array(x, y)) == [int(sf.f16_eq_signaling(o, p)) for o, p in zip(x, y)]
+
+
+def test_f16_le_quiet_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    assert list(sf.f16_le_quiet_array(x, y)) == [int(sf.f16_le_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_f16_lt_quiet_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    assert list(sf.f16_lt_quiet_array(x, y)) == [int(sf.f16_lt_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def _or_flags(*flags: bytearray) -> bytearray:
+    return bytearray(functools.reduce(operator.or_, f) for f in zip(*flags))
+
+
+def test_f16_lookup_tables() -> None:
+    x: sf.Float16Array = sf.Float16Array(list(sf.Float16.from_bytes(i.to_bytes(2, 'big')) for i in range(65536)))
+    n: int = len(x)
+    f1: bytearray = bytearray(n)
+    w: sf.Float64Array = sf.f16_to_f64_array(x, flags=f1)
+    for m in sf.RoundingMode:
+        sf.set_rounding_mode(m)
+        f2, f3, f4 = bytearray(n), bytearray(n), bytearray(n)
+        z: sf.Float16Array = sf.f16_sqrt_array(x, flags=f2)
+        e: sf.Float16Array = sf.f64_to_f16_array(sf.f64_sqrt_array(w, flags=f3), flags=f4)
+        assert bytes(z) == bytes(e)
+        assert f2 == _or_flags(f1, f3, f4)
+        for exact in [False, True]:
+            f2, f3 = bytearray(n), bytearray(n)
+            z = sf.f16_round_to_int_array(x, exact=exact, flags=f2)
+            e = sf.f64_to_f16_array(sf.f64_round_to_int_array(w, exact=exact, flags=f3))
+            assert bytes(z) == bytes(e)
+            assert f2 == _or_flags(f1, f3)
+            assert sf.f16_round_to_int(x[0x3e00], m, exact).to_bytes() == z[0x3e00].to_bytes()
+            assert sf.f16_to_i32(x[0xc500], m, exact).to_int() == sf.f64_to_i32(w[0xc500], m, exact).to_int()
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    f2 = bytearray(n)
+    assert bytes(sf.f16_to_f32_array(x, flags=f2)) == bytes(sf.f64_to_f32_array(w))
+    assert f2 == f1
+    sf.set_exception_flags(0)
+
+
+def test_f16_hardware_acceleration() -> None:
+    r: random.Random = random.Random(16)
+    bits: list[int] = [r.getrandbits(16) for _ in range(20000)]
+    bits += [b ^ r.getrandbits(2) for b in bits]  # near cancellation
+    bits += [0x0000, 0x8000, 0x0001, 0x03ff, 0x0400, 0x7bff, 0x7c00, 0xfc00, 0x7e00, 0x7c01] * 2
+    x: sf.Float16Array = sf.Float16Array(list(sf.Float16.from_bytes(b.to_bytes(2, 'big')) for b in bits[0::2]))
+    y: sf.Float16Array = sf.Float16Array(list(sf.Float16.from_bytes(b.to_bytes(2, 'big')) for b in bits[1::2]))
+    n: int = len(x)
+    ops: list[Callable[..., sf.Float16Array]] = [
+        sf.f16_add_array, sf.f16_sub_array, sf.f16_mul_array,
+        lambda x, y, flags: sf.f16_mul_add_array(x, y, y[::-1], flags=flags),
+        sf.f16_div_array,
+    ]
+    for t in sf.TininessMode:
+        sf.set_tininess_mode(t)
+        for m in sf.RoundingMode:
+            sf.set_rounding_mode(m)
+            for op in ops:
+                f1, f2 = bytearray(n), bytearray(n)
+                e: sf.Float16Array = op(x, y, flags=f1)
+                sf.set_hardware_acceleration(True)
+                z: sf.Float16Array = op(x, y, flags=f2)
+                sf.set_hardware_acceleration(False)
+                assert bytes(z) == bytes(e)
+                assert f2 == f1
+    sf.set_hardware_acceleration(True)
+    assert sf.get_hardware_acceleration()
+    assert (x[0] / y[0]).to_bytes() == e[0].to_bytes()
+    sf.set_hardware_acceleration(False)
+    assert not sf.get_hardware_acceleration()
+    sf.set_tininess_mode(sf.TininessMode.AFTER_ROUNDING)
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    sf.set_exception_flags(0)
+
+
+def test_f16_array_length_mismatch() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    with pytest.raises(ValueError):
+        sf.f16_add_array(x, x[1:])
+
+
+def test_f16_div_array_flags() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    expected: list[int] = []
+    summary: int = sf.ExceptionFlag.UNDERFLOW
+    for o, p in zip(x, y):
+        sf.set_exception_flags(0)
+        sf.f16_div(o, p)
+        expected.append(sf.get_exception_flags())
+        summary |= sf.get_exception_flags()
+    flags: bytearray = bytearray(len(x))
+    sf.set_exception_flags(sf.ExceptionFlag.UNDERFLOW)
+    sf.f16_div_array(x, y, flags=flags)
+    assert list(flags) == expected
+    assert sf.get_exception_flags() == summary
+    sf.set_exception_flags(0)
+    with pytest.raises(ValueError):
+        sf.f16_div_array(x, y, flags=bytearray(len(x) - 1))
+
+
+def test_f16_to_f32_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    z: sf.Float32Array = sf.f16_to_f32_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f16_to_f32(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f32()] == [o.to_bytes() for o in z]
+
+
+def test_f16_to_f64_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    z: sf.Float64Array = sf.f16_to_f64_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f16_to_f64(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f64()] == [o.to_bytes() for o in z]
+
+
+def test_f16_to_f128_array() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    z: sf.Float128Array = sf.f16_to_f128_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f16_to_f128(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f128()] == [o.to_bytes() for o in z]
+
+
+def test_f16_sum() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    s: sf.Float16 = x[0]
+    for o in x[1:]:
+        s = sf.f16_add(s, o)
+    assert sf.f16_sum(x).to_bytes() == s.to_bytes()
+    assert sf.f16_sum(x, sf.SummationMethod.PAIRWISE).to_bytes() == s.to_bytes()
+    assert sf.f16_sum(x, sf.SummationMethod.COMPENSATED).to_bytes() == s.to_bytes()
+    assert sf.f16_sum(sf.Float16Array()).to_float() == 0.0
+    x = sf.Float16Array.from_floats([1.0, 2.0 ** -11, 2.0 ** -24])
+    assert sf.f16_sum(x).to_float() == 1.0
+    assert sf.f16_sum(x, sf.SummationMethod.EXACT).to_float() == 1.0 + 2.0 ** -10
+
+
+def test_f16_dot() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    assert sf.f16_dot(x, y).to_bytes() == sf.f16_sum(sf.f16_mul_array(x, y)).to_bytes()
+    assert sf.f16_dot(x, y, fused=True).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f16_dot(x, y, sf.SummationMethod.COMPENSATED).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f16_dot(x, y, sf.SummationMethod.EXACT).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    with pytest.raises(ValueError):
+        sf.f16_dot(x, y[1:])
+
+
+def test_f16_prod() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_YS[:3])
+    assert sf.f16_prod(x).to_float() == math.prod(_YS[:3])
+    assert sf.f16_prod(sf.Float16Array()).to_float() == 1.0
+
+
+def test_f16_min_max() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    assert sf.f16_min(x).to_float() == min(_XS)
+    assert sf.f16_max(x).to_float() == max(_XS)
+    with pytest.raises(ValueError):
+        sf.f16_min(sf.Float16Array())
+
+
+def test_f16_matmul() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float16Array = sf.Float16Array.from_floats(_YS)
+    z: sf.Float16Array = sf.f16_matmul(x, y, 2, 2, 2)
+    assert [o.to_float() for o in z] == [-53.625, -6.25, 3.25, 0.5]
+    assert sf.f16_matmul(x, y, 1, 1, 4)[0].to_bytes() == sf.f16_dot(x, y).to_bytes()
+    assert [o.to_float() for o in sf.f16_matmul(x, y, 4, 4, 1, sf.Float64)] == [a * b for a in _XS for b in _YS]
+    with pytest.raises(ValueError):
+        sf.f16_matmul(x, y, 2, 2, 3)
@@ -21,9 +21,17 @@
 # SOFTWARE.
 
 import math
+import pathlib
+import random
+import threading
+from collections.abc import Callable
+
+import pytest
 
 import softfloatpy as sf
 
+_XS: list[float] = [-12.5, 3.25, 1.0, 0.0]
+_YS: list[float] = [3.25, 0.5, -4.0, 0.0]
 _SIGNALING_NAN: bytes = b'\xff\x80\x00\x01'
 
 
@@ -43,6 +51,19 @@ def test_f32_float() -> None:
     assert str(o) == str(f)
 
 
+def test_f32_str() -> None:
+    assert str(sf.Float32.from_bytes(bytes.fromhex('3f800000'))) == '1.0'
+    assert str(sf.Float32.from_bytes(bytes.fromhex('3dcccccd'))) == '0.1'
+    assert str(sf.Float32.from_bytes(bytes.fromhex('7f7fffff'))) == '3.4028235e+38'
+    assert str(sf.Float32.from_bytes(bytes.fromhex('00000001'))) == '1e-45'
+    assert str(sf.Float32.from_bytes(bytes.fromhex('80000000'))) == '-0.0'
+    assert str(sf.Float32.from_bytes(bytes.fromhex('ff800000'))) == '-inf'
+    assert str(sf.Float32.from_bytes(bytes.fromhex('7fc00000'))) == 'nan'
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    assert x.to_str() == ', '.join([str(o) for o in x])
+    assert x.to_str('\n') == '\n'.join([str(o) for o in x])
+
+
 def test_f32_to_bf16() -> None:
     f: float = -12.5
     o: sf.Float32 = sf.Float32.from_float(f)
@@ -319,3 +340,437 @@ def test_operators() -> None:
         iz %= iy
         assert iz is not ix
         assert iz.to_float() == x % y
+
+
+def test_f32_array() -> None:
+    a: sf.Float32Array = sf.Float32Array.from_floats([-12.5, 3.25, 0.0])
+    assert len(a) == 3
+    assert a.to_floats() == [-12.5, 3.25, 0.0]
+    assert a[0].to_bytes() == sf.Float32.from_float(-12.5).to_bytes()
+    assert a[-1].to_float() == 0.0
+    assert [o.to_float() for o in a] == [-12.5, 3.25, 0.0]
+    assert a[::2].to_floats() == [-12.5, 0.0]
+    a[2] = sf.Float32.from_float(1.5)
+    a[:2] = sf.Float32Array([a[1], a[0]])
+    assert a.to_floats() == [3.25, -12.5, 1.5]
+    assert str(a) == '[3.25, -12.5, 1.5]'
+    assert sf.Float32Array(2).to_floats() == [0.0, 0.0]
+
+
+def test_f32_array_buffer() -> None:
+    a: sf.Float32Array = sf.Float32Array.from_floats([-12.5, 3.25])
+    m: memoryview = memoryview(a)
+    assert m.format == 'I'
+    assert m.itemsize == 4
+    assert m.nbytes == 8
+    assert m.tobytes()[4:] == bytes(reversed(sf.Float32.from_float(3.25).to_bytes()))
+
+
+def test_f32_round_to_int_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    z: sf.Float32Array = sf.f32_round_to_int_array(x, sf.RoundingMode.MIN)
+    assert [o.to_bytes() for o in z] == [sf.f32_round_to_int(o, sf.RoundingMode.MIN).to_bytes() for o in x]
+
+
+def test_f32_add_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    z: sf.Float32Array = sf.f32_add_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f32_add(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f32_sub_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    z: sf.Float32Array = sf.f32_sub_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f32_sub(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f32_mul_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    z: sf.Float32Array = sf.f32_mul_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f32_mul(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f32_mul_add_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    w: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    z: sf.Float32Array = sf.Float32Array(len(x))
+    assert sf.f32_mul_add_array(x, y, w, out=z) is z
+    assert [o.to_bytes() for o in z] == [sf.f32_mul_add(o, p, q).to_bytes() for o, p, q in zip(x, y, w)]
+
+
+def test_f32_array_bytes() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    big: bytes = b''.join([o.to_bytes() for o in x])
+    assert x.to_bytes('big') == big
+    assert x.to_bytes('little') == b''.join([o.to_bytes()[::-1] for o in x])
+    assert [o.to_bytes() for o in sf.Float32Array.from_buffer(big, 'big')] == [o.to_bytes() for o in x]
+    y: sf.Float32Array = sf.Float32Array.from_buffer(b'\x00' + x.to_bytes('little'), 'little', count=2, offset=1)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    b: bytearray = bytearray(x.to_bytes())
+    z: sf.Float32Array = sf.Float32Array.from_buffer(b)
+    z[0] = sf.Float32.from_float(2.0)
+    assert bytes(b) == z.to_bytes()
+    with pytest.raises(TypeError):
+        sf.Float32Array.from_buffer(bytes(b))[0] = z[1]
+    with pytest.raises(ValueError):
+        sf.Float32Array.from_buffer(b, count=len(x) + 1)
+    with pytest.raises(ValueError):
+        x.to_bytes('middle')
+
+
+def test_f32_array_file(tmp_path: pathlib.Path) -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    path: pathlib.Path = tmp_path / 'x.bin'
+    path.write_bytes(b'\x00' * 16 + x.to_bytes('big'))
+    y: sf.Float32Array = sf.Float32Array.from_file(path, 'big', offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x]
+    path.write_bytes(b'\x00' * 16 + x.to_bytes())
+    y = sf.Float32Array.from_file(path, count=2, offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    with pytest.raises(TypeError):
+        y += y
+    y = sf.Float32Array.from_file(path, offset=16, mode='c')
+    y += y
+    assert path.read_bytes()[16:] == x.to_bytes()
+    with pytest.raises(ValueError):
+        sf.Float32Array.from_file(path, mode='w')
+
+
+def test_f32_array_subclass() -> None:
+    class Sub(sf.Float32Array):
+        pass
+
+    x: Sub = Sub.from_floats(_XS)
+    assert type(x) is Sub
+    assert [o.to_bytes() for o in x] == [o.to_bytes() for o in sf.Float32Array.from_floats(_XS)]
+    x[0] = x[1]
+    assert x[0].to_bytes() == x[1].to_bytes()
+    assert str(x) == str(sf.Float32Array(list(x)))
+
+
+def test_f32_array_operators() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    a: sf.Float32 = sf.Float32.from_float(1.5)
+    assert [o.to_bytes() for o in x + y] == [sf.f32_add(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x - a] == [sf.f32_sub(o, a).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x * y] == [sf.f32_mul(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x / a] == [sf.f32_div(o, a).to_bytes() for o in x]
+    z: sf.Float32Array = x[:]
+    w: sf.Float32Array = z
+    z += y
+    z *= a
+    z -= x
+    z /= a
+    assert z is w
+    assert [o.to_bytes() for o in z] == [
+        sf.f32_div(sf.f32_sub(sf.f32_mul(sf.f32_add(o, p), a), o), a).to_bytes() for o, p in zip(x, y)
+    ]
+    with pytest.raises(ValueError):
+        z += y[1:]
+
+
+def test_f32_array_reflected_operators() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    a: sf.Float32 = sf.Float32.from_float(1.5)
+    assert [o.to_bytes() for o in a + x] == [sf.f32_add(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a - x] == [sf.f32_sub(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a * x] == [sf.f32_mul(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a / x] == [sf.f32_div(a, o).to_bytes() for o in x]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + 1  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x - 'a'  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        1 - x  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x / sf.Float64.from_float(1.5)  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + sf.Float64Array(len(x))
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x += 1  # type: ignore[arg-type]
+    assert bytearray() + x == x.to_bytes()
+
+
+def test_f32_broadcast_arrays() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    a: sf.Float32 = sf.Float32.from_float(1.5)
+    z: sf.Float32Array = sf.f32_mul_add_array(a, x, y)
+    assert [o.to_bytes() for o in z] == [sf.f32_mul_add(a, o, p).to_bytes() for o, p in zip(x, y)]
+    z = sf.f32_mul_add_array(x, y, a)
+    assert [o.to_bytes() for o in z] == [sf.f32_mul_add(o, p, a).to_bytes() for o, p in zip(x, y)]
+    z = sf.f32_add_array(x, a)
+    assert [o.to_bytes() for o in z] == [sf.f32_add(o, a).to_bytes() for o in x]
+    assert list(sf.f32_lt_array(a, x)) == [int(sf.f32_lt(a, o)) for o in x]
+    assert [o.to_bytes() for o in sf.f32_mul_array(a, a)] == [sf.f32_mul(a, a).to_bytes()]
+    with pytest.raises(ValueError):
+        sf.f32_mul_add_array(a, x, y[1:])
+
+
+def test_f32_div_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    z: sf.Float32Array = sf.f32_div_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f32_div(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f32_rem_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    z: sf.Float32Array = sf.f32_rem_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f32_rem(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f32_sqrt_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    z: sf.Float32Array = sf.f32_sqrt_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f32_sqrt(o).to_bytes() for o in x]
+
+
+def test_f32_eq_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    assert list(sf.f32_eq_array(x, y)) == [int(sf.f32_eq(o, p)) for o, p in zip(x, y)]
+
+
+def test_f32_le_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    assert list(sf.f32_le_array(x, y)) == [int(sf.f32_le(o, p)) for o, p in zip(x, y)]
+
+
+def test_f32_lt_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    assert list(sf.f32_lt_array(x, y)) == [int(sf.f32_lt(o, p)) for o, p in zip(x, y)]
+
+
+def test_f32_eq_signaling_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    assert list(sf.f32_eq_signaling_array(x, y)) == [int(sf.f32_eq_signaling(o, p)) for o, p in zip(x, y)]
+
+
+def test_f32_le_quiet_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    assert list(sf.f32_le_quiet_array(x, y)) == [int(sf.f32_le_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_f32_lt_quiet_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    assert list(sf.f32_lt_quiet_array(x, y)) == [int(sf.f32_lt_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_f32_div_array_threads() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS * 50000)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS * 50000)
+    sf.set_rounding_mode(sf.RoundingMode.MIN)
+    sf.set_exception_flags(0)
+    flags: bytearray = bytearray(len(x))
+    z: sf.Float32Array = sf.f32_div_array(x, y, flags=flags)
+    expected: int = sf.get_exception_flags()
+    sf.set_num_threads(3)
+    try:
+        sf.set_exception_flags(0)
+        parallel_flags: bytearray = bytearray(len(x))
+        parallel_z: sf.Float32Array = sf.f32_div_array(x, y, flags=parallel_flags)
+        assert bytes(parallel_z) == bytes(z)
+        assert parallel_flags == flags
+        assert sf.get_exception_flags() == expected
+    finally:
+        sf.set_num_threads(1)
+        sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+        sf.set_exception_flags(0)
+
+
+def test_f32_array_concurrent_num_threads() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS * 20000)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS * 20000)
+    z: bytes = bytes(sf.f32_add_array(x, y))
+    s: bytes = sf.f32_sum(x, sf.SummationMethod.EXACT).to_bytes()
+    stop: threading.Event = threading.Event()
+
+    def toggle() -> None:
+        while not stop.is_set():
+            sf.set_num_threads(3)
+            sf.set_num_threads(1)
+
+    t: threading.Thread = threading.Thread(target=toggle)
+    t.start()
+    try:
+        for _ in range(50):
+            assert bytes(sf.f32_add_array(x, y)) == z
+            assert sf.f32_sum(x, sf.SummationMethod.EXACT).to_bytes() == s
+    finally:
+        stop.set()
+        t.join()
+        sf.set_num_threads(1)
+
+
+def test_f32_array_concurrent_reallocation() -> None:
+    x: sf.Float32Array = sf.Float32Array(1000)
+    stop: threading.Event = threading.Event()
+
+    def reallocate() -> None:
+        while not stop.is_set():
+            x.__init__(1000)  # type: ignore[misc]
+            x.__init__(10)  # type: ignore[misc]
+
+    t: threading.Thread = threading.Thread(target=reallocate)
+    t.start()
+    try:
+        for _ in range(2000):
+            assert set(x[5:].to_floats()) <= {0.0}
+            assert set(x.to_floats()) <= {0.0}
+            assert all(o.to_float() == 0.0 for o in x)
+            x[:5] = sf.Float32Array(5)
+            x[1] = sf.Float32.from_float(0.0)
+    finally:
+        stop.set()
+        t.join()
+
+
+def test_f32_array_length_mismatch() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    with pytest.raises(ValueError):
+        sf.f32_add_array(x, x[1:])
+
+
+def test_f32_hardware_acceleration() -> None:
+    r: random.Random = random.Random(32)
+    bits: list[int] = [r.getrandbits(32) for _ in range(20000)]
+    bits += [b ^ r.getrandbits(2) for b in bits]  # near cancellation
+    bits += [b & 0x807fffff | r.choice([0x00800000, 0x3f000000, 0x3f800000, 0x7f000000]) for b in bits[:10000]]
+    bits += [0x00000000, 0x80000000, 0x00000001, 0x007fffff, 0x00800000, 0x7f7fffff, 0x7f800000, 0xff800000, 0x7fc00000, 0x7f800001] * 2
+    x: sf.Float32Array = sf.Float32Array(list(sf.Float32.from_bytes(b.to_bytes(4, 'big')) for b in bits[0::2]))
+    y: sf.Float32Array = sf.Float32Array(list(sf.Float32.from_bytes(b.to_bytes(4, 'big')) for b in bits[1::2]))
+    n: int = len(x)
+    ops: list[Callable[..., sf.Float32Array]] = [
+        sf.f32_add_array, sf.f32_sub_array, sf.f32_mul_array,
+        lambda x, y, flags: sf.f32_mul_add_array(x, y, y[::-1], flags=flags),
+        sf.f32_div_array,
+        lambda x, y, flags: sf.f32_sqrt_array(x, flags=flags),
+    ]
+    for t in sf.TininessMode:
+        sf.set_tininess_mode(t)
+        for m in sf.RoundingMode:
+            sf.set_rounding_mode(m)
+            for op in ops:
+                f1, f2 = bytearray(n), bytearray(n)
+                e: sf.Float32Array = op(x, y, flags=f1)
+                sf.set_hardware_acceleration(True)
+                z: sf.Float32Array = op(x, y, flags=f2)
+                sf.set_hardware_acceleration(False)
+                assert bytes(z) == bytes(e)
+                assert f2 == f1
+    sf.set_hardware_acceleration(True)
+    assert sf.f32_sqrt(x[0]).to_bytes() == e[0].to_bytes()
+    sf.set_hardware_acceleration(False)
+    sf.set_tininess_mode(sf.TininessMode.AFTER_ROUNDING)
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    sf.set_exception_flags(0)
+
+
+def test_f32_div_array_flags() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    expected: list[int] = []
+    summary: int = sf.ExceptionFlag.UNDERFLOW
+    for o, p in zip(x, y):
+        sf.set_exception_flags(0)
+        sf.f32_div(o, p)
+        expected.append(sf.get_exception_flags())
+        summary |= sf.get_exception_flags()
+    flags: bytearray = bytearray(len(x))
+    sf.set_exception_flags(sf.ExceptionFlag.UNDERFLOW)
+    sf.f32_div_array(x, y, flags=flags)
+    assert list(flags) == expected
+    assert sf.get_exception_flags() == summary
+    sf.set_exception_flags(0)
+    with pytest.raises(ValueError):
+        sf.f32_div_array(x, y, flags=bytearray(len(x) - 1))
+
+
+def test_f32_to_bf16_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    z: sf.BFloat16Array = sf.f32_to_bf16_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f32_to_bf16(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_bf16()] == [o.to_bytes() for o in z]
+
+
+def test_f32_to_f16_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    z: sf.Float16Array = sf.f32_to_f16_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f32_to_f16(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f16()] == [o.to_bytes() for o in z]
+
+
+def test_f32_to_f64_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    z: sf.Float64Array = sf.f32_to_f64_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f32_to_f64(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f64()] == [o.to_bytes() for o in z]
+
+
+def test_f32_to_f128_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    z: sf.Float128Array = sf.f32_to_f128_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f32_to_f128(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f128()] == [o.to_bytes() for o in z]
+
+
+def test_f32_sum() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    s: sf.Float32 = x[0]
+    for o in x[1:]:
+        s = sf.f32_add(s, o)
+    assert sf.f32_sum(x).to_bytes() == s.to_bytes()
+    assert sf.f32_sum(x, sf.SummationMethod.PAIRWISE).to_bytes() == s.to_bytes()
+    assert sf.f32_sum(x, sf.SummationMethod.COMPENSATED).to_bytes() == s.to_bytes()
+    assert sf.f32_sum(sf.Float32Array()).to_float() == 0.0
+    x = sf.Float32Array.from_floats([1.0, 2.0 ** -24, 2.0 ** -149])
+    assert sf.f32_sum(x).to_float() == 1.0
+    assert sf.f32_sum(x, sf.SummationMethod.EXACT).to_float() == 1.0 + 2.0 ** -23
+
+
+def test_f32_dot() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    assert sf.f32_dot(x, y).to_bytes() == sf.f32_sum(sf.f32_mul_array(x, y)).to_bytes()
+    assert sf.f32_dot(x, y, fused=True).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f32_dot(x, y, sf.SummationMethod.COMPENSATED).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f32_dot(x, y, sf.SummationMethod.EXACT).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    with pytest.raises(ValueError):
+        sf.f32_dot(x, y[1:])
+
+
+def test_f32_prod() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_YS[:3])
+    assert sf.f32_prod(x).to_float() == math.prod(_YS[:3])
+    assert sf.f32_prod(sf.Float32Array()).to_float() == 1.0
+
+
+def test_f32_min_max() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    assert sf.f32_min(x).to_float() == min(_XS)
+    assert sf.f32_max(x).to_float() == max(_XS)
+    with pytest.raises(ValueError):
+        sf.f32_min(sf.Float32Array())
+
+
+def test_f32_matmul() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_YS)
+    z: sf.Float32Array = sf.f32_matmul(x, y, 2, 2, 2)
+    assert [o.to_float() for o in z] == [-53.625, -6.25, 3.25, 0.5]
+    assert sf.f32_matmul(x, y, 1, 1, 4)[0].to_bytes() == sf.f32_dot(x, y).to_bytes()
+    assert [o.to_float() for o in sf.f32_matmul(x, y, 4, 4, 1, sf.Float64)] == [a * b for a in _XS for b in _YS]
+    with pytest.raises(ValueError):
+        sf.f32_matmul(x, y, 2, 2, 3)
@@ -21,9 +21,16 @@
 # SOFTWARE.
 
 import math
+import pathlib
+import random
+from fractions import Fraction
+
+import pytest
 
 import softfloatpy as sf
 
+_XS: list[float] = [-12.5, 3.25, 1.0, 0.0]
+_YS: list[float] = [3.25, 0.5, -4.0, 0.0]
 _SIGNALING_NAN: bytes = b'\xff\xf0\x00\x00\x00\x00\x00\x01'
 
 
@@ -43,6 +50,21 @@ def test_f64_float() -> None:
     assert str(o) == str(f)
 
 
+def test_f64_str() -> None:
+    assert str(sf.Float64.from_bytes(bytes.fromhex('3ff0000000000000'))) == '1.0'
+    assert str(sf.Float64.from_bytes(bytes.fromhex('3fb999999999999a'))) == '0.1'
+    assert str(sf.Float64.from_bytes(bytes.fromhex('7fefffffffffffff'))) == '1.7976931348623157e+308'
+    assert str(sf.Float64.from_bytes(bytes.fromhex('0000000000000001'))) == '5e-324'
+    assert str(sf.Float64.from_bytes(bytes.fromhex('8000000000000000'))) == '-0.0'
+    assert str(sf.Float64.from_bytes(bytes.fromhex('fff0000000000000'))) == '-inf'
+    assert str(sf.Float64.from_bytes(bytes.fromhex('7ff8000000000000'))) == 'nan'
+    for f in [1e16, 1e15, 1e-4, 1e-5, 123.456, -2.5e-300, random.uniform(-1e9, 1e9)]:
+        assert str(sf.Float64.from_float(f)) == repr(f)
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    assert x.to_str() == ', '.join([str(o) for o in x])
+    assert x.to_str('\n') == '\n'.join([str(o) for o in x])
+
+
 def test_f64_to_ui32() -> None:
     f: float = 12.3
     o: sf.Float64 = sf.Float64.from_float(f)
@@ -313,3 +335,463 @@ def test_operators() -> None:
         iz %= iy
         assert iz is not ix
         assert iz.to_float() == x % y
+
+
+def test_f64_array() -> None:
+    a: sf.Float64Array = sf.Float64Array.from_floats([-12.5, 3.25, 0.0])
+    assert len(a) == 3
+    assert a.to_floats() == [-12.5, 3.25, 0.0]
+    assert a[0].to_bytes() == sf.Float64.from_float(-12.5).to_bytes()
+    assert a[-1].to_float() == 0.0
+    assert [o.to_float() for o in a] == [-12.5, 3.25, 0.0]
+    assert a[::2].to_floats() == [-12.5, 0.0]
+    a[2] = sf.Float64.from_float(1.5)
+    a[:2] = sf.Float64Array([a[1], a[0]])
+    assert a.to_floats() == [3.25, -12.5, 1.5]
+    assert str(a) == '[3.25, -12.5, 1.5]'
+    assert sf.Float64Array(2).to_floats() == [0.0, 0.0]
+
+
+def test_f64_array_buffer() -> None:
+    a: sf.Float64Array = sf.Float64Array.from_floats([-12.5, 3.25])
+    m: memoryview = memoryview(a)
+    assert m.format == 'Q'
+    assert m.itemsize == 8
+    assert m.nbytes == 16
+    assert m.tobytes()[8:] == bytes(reversed(sf.Float64.from_float(3.25).to_bytes()))
+
+
+def test_f64_round_to_int_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    z: sf.Float64Array = sf.f64_round_to_int_array(x, sf.RoundingMode.MIN)
+    assert [o.to_bytes() for o in z] == [sf.f64_round_to_int(o, sf.RoundingMode.MIN).to_bytes() for o in x]
+
+
+def test_f64_add_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    z: sf.Float64Array = sf.f64_add_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f64_add(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f64_sub_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    z: sf.Float64Array = sf.f64_sub_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f64_sub(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f64_mul_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    z: sf.Float64Array = sf.f64_mul_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f64_mul(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f64_mul_add_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    w: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    z: sf.Float64Array = sf.Float64Array(len(x))
+    assert sf.f64_mul_add_array(x, y, w, out=z) is z
+    assert [o.to_bytes() for o in z] == [sf.f64_mul_add(o, p, q).to_bytes() for o, p, q in zip(x, y, w)]
+
+
+def test_f64_array_bytes() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    big: bytes = b''.join([o.to_bytes() for o in x])
+    assert x.to_bytes('big') == big
+    assert x.to_bytes('little') == b''.join([o.to_bytes()[::-1] for o in x])
+    assert [o.to_bytes() for o in sf.Float64Array.from_buffer(big, 'big')] == [o.to_bytes() for o in x]
+    y: sf.Float64Array = sf.Float64Array.from_buffer(b'\x00' + x.to_bytes('little'), 'little', count=2, offset=1)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    b: bytearray = bytearray(x.to_bytes())
+    z: sf.Float64Array = sf.Float64Array.from_buffer(b)
+    z[0] = sf.Float64.from_float(2.0)
+    assert bytes(b) == z.to_bytes()
+    with pytest.raises(TypeError):
+        sf.Float64Array.from_buffer(bytes(b))[0] = z[1]
+    with pytest.raises(ValueError):
+        sf.Float64Array.from_buffer(b, count=len(x) + 1)
+    with pytest.raises(ValueError):
+        x.to_bytes('middle')
+
+
+def test_f64_array_file(tmp_path: pathlib.Path) -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    path: pathlib.Path = tmp_path / 'x.bin'
+    path.write_bytes(b'\x00' * 16 + x.to_bytes('big'))
+    y: sf.Float64Array = sf.Float64Array.from_file(path, 'big', offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x]
+    path.write_bytes(b'\x00' * 16 + x.to_bytes())
+    y = sf.Float64Array.from_file(path, count=2, offset=16)
+    assert [o.to_bytes() for o in y] == [o.to_bytes() for o in x[:2]]
+    with pytest.raises(TypeError):
+        y += y
+    y = sf.Float64Array.from_file(path, offset=16, mode='c')
+    y += y
+    assert path.read_bytes()[16:] == x.to_bytes()
+    with pytest.raises(ValueError):
+        sf.Float64Array.from_file(path, mode='w')
+
+
+def test_f64_array_subclass() -> None:
+    class Sub(sf.Float64Array):
+        pass
+
+    x: Sub = Sub.from_floats(_XS)
+    assert type(x) is Sub
+    assert [o.to_bytes() for o in x] == [o.to_bytes() for o in sf.Float64Array.from_floats(_XS)]
+    x[0] = x[1]
+    assert x[0].to_bytes() == x[1].to_bytes()
+    assert str(x) == str(sf.Float64Array(list(x)))
+
+
+def test_f64_array_operators() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    a: sf.Float64 = sf.Float64.from_float(1.5)
+    assert [o.to_bytes() for o in x + y] == [sf.f64_add(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x - a] == [sf.f64_sub(o, a).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x * y] == [sf.f64_mul(o, p).to_bytes() for o, p in zip(x, y)]
+    assert [o.to_bytes() for o in x / a] == [sf.f64_div(o, a).to_bytes() for o in x]
+    z: sf.Float64Array = x[:]
+    w: sf.Float64Array = z
+    z += y
+    z *= a
+    z -= x
+    z /= a
+    assert z is w
+    assert [o.to_bytes() for o in z] == [
+        sf.f64_div(sf.f64_sub(sf.f64_mul(sf.f64_add(o, p), a), o), a).to_bytes() for o, p in zip(x, y)
+    ]
+    with pytest.raises(ValueError):
+        z += y[1:]
+
+
+def test_f64_array_reflected_operators() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    a: sf.Float64 = sf.Float64.from_float(1.5)
+    assert [o.to_bytes() for o in a + x] == [sf.f64_add(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a - x] == [sf.f64_sub(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a * x] == [sf.f64_mul(a, o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in a / x] == [sf.f64_div(a, o).to_bytes() for o in x]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + 1  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x - 'a'  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        1 - x  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x / sf.Float32.from_float(1.5)  # type: ignore[operator]
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x + sf.Float32Array(len(x))
+    with pytest.raises(TypeError, match='unsupported operand'):
+        x += 1  # type: ignore[arg-type]
+    assert bytearray() + x == x.to_bytes()
+
+
+def test_f64_broadcast_arrays() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    a: sf.Float64 = sf.Float64.from_float(1.5)
+    z: sf.Float64Array = sf.f64_mul_add_array(a, x, y)
+    assert [o.to_bytes() for o in z] == [sf.f64_mul_add(a, o, p).to_bytes() for o, p in zip(x, y)]
+    z = sf.f64_mul_add_array(x, y, a)
+    assert [o.to_bytes() for o in z] == [sf.f64_mul_add(o, p, a).to_bytes() for o, p in zip(x, y)]
+    z = sf.f64_add_array(x, a)
+    assert [o.to_bytes() for o in z] == [sf.f64_add(o, a).to_bytes() for o in x]
+    assert list(sf.f64_lt_array(a, x)) == [int(sf.f64_lt(a, o)) for o in x]
+    assert [o.to_bytes() for o in sf.f64_mul_array(a, a)] == [sf.f64_mul(a, a).to_bytes()]
+    with pytest.raises(ValueError):
+        sf.f64_mul_add_array(a, x, y[1:])
+
+
+def test_f64_div_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    z: sf.Float64Array = sf.f64_div_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f64_div(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f64_rem_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    z: sf.Float64Array = sf.f64_rem_array(x, y)
+    assert [o.to_bytes() for o in z] == [sf.f64_rem(o, p).to_bytes() for o, p in zip(x, y)]
+
+
+def test_f64_sqrt_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    z: sf.Float64Array = sf.f64_sqrt_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f64_sqrt(o).to_bytes() for o in x]
+
+
+def test_f64_eq_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    assert list(sf.f64_eq_array(x, y)) == [int(sf.f64_eq(o, p)) for o, p in zip(x, y)]
+
+
+def test_f64_le_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    assert list(sf.f64_le_array(x, y)) == [int(sf.f64_le(o, p)) for o, p in zip(x, y)]
+
+
+def test_f64_lt_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    assert list(sf.f64_lt_array(x, y)) == [int(sf.f64_lt(o, p)) for o, p in zip(x, y)]
+
+
+def test_f64_eq_signaling_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    assert list(sf.f64_eq_signaling_array(x, y)) == [int(sf.f64_eq_signaling(o, p)) for o, p in zip(x, y)]
+
+
+def test_f64_le_quiet_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    assert list(sf.f64_le_quiet_array(x, y)) == [int(sf.f64_le_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_f64_lt_quiet_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    assert list(sf.f64_lt_quiet_array(x, y)) == [int(sf.f64_lt_quiet(o, p)) for o, p in zip(x, y)]
+
+
+def test_f64_array_length_mismatch() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    with pytest.raises(ValueError):
+        sf.f64_add_array(x, x[1:])
+
+
+def test_f64_div_array_flags() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    expected: list[int] = []
+    summary: int = sf.ExceptionFlag.UNDERFLOW
+    for o, p in zip(x, y):
+        sf.set_exception_flags(0)
+        sf.f64_div(o, p)
+        expected.append(sf.get_exception_flags())
+        summary |= sf.get_exception_flags()
+    flags: bytearray = bytearray(len(x))
+    sf.set_exception_flags(sf.ExceptionFlag.UNDERFLOW)
+    sf.f64_div_array(x, y, flags=flags)
+    assert list(flags) == expected
+    assert sf.get_exception_flags() == summary
+    sf.set_exception_flags(0)
+    with pytest.raises(ValueError):
+        sf.f64_div_array(x, y, flags=bytearray(len(x) - 1))
+
+
+def test_f64_to_f16_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    z: sf.Float16Array = sf.f64_to_f16_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f64_to_f16(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f16()] == [o.to_bytes() for o in z]
+
+
+def test_f64_to_f32_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    z: sf.Float32Array = sf.f64_to_f32_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f64_to_f32(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f32()] == [o.to_bytes() for o in z]
+
+
+def test_f64_to_f128_array() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    z: sf.Float128Array = sf.f64_to_f128_array(x)
+    assert [o.to_bytes() for o in z] == [sf.f64_to_f128(o).to_bytes() for o in x]
+    assert [o.to_bytes() for o in x.to_f128()] == [o.to_bytes() for o in z]
+
+
+def test_f64_sum() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    s: sf.Float64 = x[0]
+    for o in x[1:]:
+        s = sf.f64_add(s, o)
+    assert sf.f64_sum(x).to_bytes() == s.to_bytes()
+    assert sf.f64_sum(x, sf.SummationMethod.PAIRWISE).to_bytes() == s.to_bytes()
+    assert sf.f64_sum(x, sf.SummationMethod.COMPENSATED).to_bytes() == s.to_bytes()
+    assert sf.f64_sum(sf.Float64Array()).to_float() == 0.0
+
+
+def test_f64_dot() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    assert sf.f64_dot(x, y).to_bytes() == sf.f64_sum(sf.f64_mul_array(x, y)).to_bytes()
+    assert sf.f64_dot(x, y, fused=True).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f64_dot(x, y, sf.SummationMethod.COMPENSATED).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    assert sf.f64_dot(x, y, sf.SummationMethod.EXACT).to_float() == sum(a * b for a, b in zip(_XS, _YS))
+    with pytest.raises(ValueError):
+        sf.f64_dot(x, y[1:])
+
+
+def test_f64_prod() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_YS[:3])
+    assert sf.f64_prod(x).to_float() == math.prod(_YS[:3])
+    assert sf.f64_prod(sf.Float64Array()).to_float() == 1.0
+
+
+def test_f64_min_max() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    assert sf.f64_min(x).to_float() == min(_XS)
+    assert sf.f64_max(x).to_float() == max(_XS)
+    with pytest.raises(ValueError):
+        sf.f64_min(sf.Float64Array())
+
+
+def test_f64_matmul() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats(_XS)
+    y: sf.Float64Array = sf.Float64Array.from_floats(_YS)
+    z: sf.Float64Array = sf.f64_matmul(x, y, 2, 2, 2)
+    assert [o.to_float() for o in z] == [-53.625, -6.25, 3.25, 0.5]
+    assert sf.f64_matmul(x, y, 1, 1, 4)[0].to_bytes() == sf.f64_dot(x, y).to_bytes()
+    assert [o.to_float() for o in sf.f64_matmul(x, y, 4, 4, 1, sf.Float128)] == [a * b for a in _XS for b in _YS]
+    with pytest.raises(ValueError):
+        sf.f64_matmul(x, y, 2, 2, 3)
+
+
+def test_f64_summation_methods() -> None:
+    xs: list[float] = [1.0] + [2.0 ** -53] * 16
+    x: sf.Float64Array = sf.Float64Array.from_floats(xs)
+    assert sf.f64_sum(x).to_float() == 1.0
+    assert sf.f64_sum(x, sf.SummationMethod.PAIRWISE).to_float() == 1.0 + 2.0 ** -50
+    assert sf.f64_sum(x, sf.SummationMethod.COMPENSATED).to_float() == math.fsum(xs)
+    x = sf.Float64Array.from_floats([0.1] * 10)
+    assert sf.f64_sum(x, sf.SummationMethod.COMPENSATED).to_float() == math.fsum([0.1] * 10)
+    assert sf.f64_dot(x, x, sf.SummationMethod.COMPENSATED).to_float() == 0.1  # correctly rounded, unlike 0.1 * 0.1 * 10
+    assert sf.f64_sum(sf.Float64Array.from_floats([-0.0, -0.0]), sf.SummationMethod.COMPENSATED).to_bytes() == b'\x80' + bytes(7)
+    sf.set_exception_flags(0)
+    x = sf.Float64Array.from_floats([1e308, 1e308, -1e308])
+    assert sf.f64_sum(x, sf.SummationMethod.COMPENSATED).to_float() == math.inf
+    assert sf.get_exception_flags() == sf.ExceptionFlag.OVERFLOW | sf.ExceptionFlag.INEXACT
+    sf.set_exception_flags(0)
+
+
+def test_f64_min_max_special() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats([0.0, -0.0, 0.0])
+    assert sf.f64_min(x).to_bytes() == b'\x80' + bytes(7)
+    assert sf.f64_max(x).to_bytes() == bytes(8)
+    sf.set_exception_flags(0)
+    x = sf.Float64Array.from_floats([1.0, math.nan, -3.0])
+    assert math.isnan(sf.f64_min(x).to_float())
+    assert math.isnan(sf.f64_max(x).to_float())
+    assert sf.get_exception_flags() == 0
+    x = sf.Float64Array([sf.Float64.from_float(1.0), sf.Float64.from_bytes(_SIGNALING_NAN)])
+    assert not sf.f64_min(x).is_signaling_nan()
+    assert sf.get_exception_flags() == sf.ExceptionFlag.INVALID
+    sf.set_exception_flags(0)
+
+
+def test_f64_sum_context() -> None:
+    x: sf.Float64Array = sf.Float64Array.from_floats([1.0, 2.0 ** -60])
+    context: sf.FloatContext = sf.FloatContext(rounding_mode=sf.RoundingMode.MAX)
+    assert sf.f64_sum(x, context=context).to_float() == 1.0 + 2.0 ** -52
+    assert context.flags == sf.ExceptionFlag.INEXACT
+    with pytest.raises(FloatingPointError):
+        sf.f64_sum(x, context=sf.FloatContext(traps=sf.ExceptionFlag.INEXACT))
+
+
+def test_f64_exact_sum() -> None:
+    xs: list[float] = [1e100, 1.0, -1e100, 2.0 ** -60, -0.5, 3.0 * 2.0 ** -1074]
+    x: sf.Float64Array = sf.Float64Array.from_floats(xs)
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT).to_float() == math.fsum(xs)
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT, sf.FloatContext(sf.RoundingMode.MAX)).to_float() == 0.5 + 2.0 ** -53
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT, sf.FloatContext(sf.RoundingMode.MIN)).to_float() == 0.5
+    x = sf.Float64Array.from_floats([1.0, -1.0])
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT).to_bytes() == bytes(8)
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT, sf.FloatContext(sf.RoundingMode.MIN)).to_bytes() == b'\x80' + bytes(7)
+    x = sf.Float64Array.from_floats([-0.0, -0.0])
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT).to_bytes() == b'\x80' + bytes(7)
+    assert sf.f64_sum(sf.Float64Array(), sf.SummationMethod.EXACT).to_bytes() == bytes(8)
+    context: sf.FloatContext = sf.FloatContext()
+    x = sf.Float64Array.from_floats([1e308, 1e308, -1e308])
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT, context).to_float() == 1e308
+    assert context.flags == 0
+    x = sf.Float64Array.from_floats([1e308, 1e308])
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT, context).to_float() == math.inf
+    assert context.flags == sf.ExceptionFlag.OVERFLOW | sf.ExceptionFlag.INEXACT
+    context = sf.FloatContext()
+    x = sf.Float64Array.from_floats([math.inf, 1.0, -math.inf])
+    assert math.isnan(sf.f64_sum(x, sf.SummationMethod.EXACT, context).to_float())
+    assert context.flags == sf.ExceptionFlag.INVALID
+    x = sf.Float64Array.from_floats([-math.inf, 1.0])
+    assert sf.f64_sum(x, sf.SummationMethod.EXACT).to_float() == -math.inf
+
+
+def test_f64_exact_sum_threads() -> None:
+    rng: random.Random = random.Random(0)
+    xs: list[float] = [rng.uniform(-1.0, 1.0) * 2.0 ** rng.randint(-40, 40) for _ in range(200000)]
+    x: sf.Float64Array = sf.Float64Array.from_floats(xs)
+    y: sf.Float64Array = sf.Float64Array.from_floats(xs[::-1])
+    n: int = sf.get_num_threads()
+    try:
+        for m in (1, 2, 4):
+            sf.set_num_threads(m)
+            assert sf.f64_sum(x, sf.SummationMethod.EXACT).to_float() == math.fsum(xs)
+            assert sf.f64_sum(y, sf.SummationMethod.EXACT).to_float() == math.fsum(xs)
+    finally:
+        sf.set_num_threads(n)
+
+
+def test_f64_exact_dot() -> None:
+    rng: random.Random = random.Random(0)
+    xs: list[float] = [rng.uniform(-1.0, 1.0) * 2.0 ** rng.randint(-500, 500) for _ in range(1000)]
+    ys: list[float] = [rng.uniform(-1.0, 1.0) * 2.0 ** rng.randint(-500, 500) for _ in range(1000)]
+    x: sf.Float64Array = sf.Float64Array.from_floats(xs)
+    y: sf.Float64Array = sf.Float64Array.from_floats(ys)
+    assert sf.f64_dot(x, y, sf.SummationMethod.EXACT).to_float() == float(sum(Fraction(a) * Fraction(b) for a, b in zip(xs, ys)))
+    x = sf.Float64Array.from_floats([1.0, 1.0 + 2.0 ** -30, -1.0])
+    y = sf.Float64Array.from_floats([2.0 ** -60, 1.0 - 2.0 ** -30, 1.0])
+    assert sf.f64_dot(x, y, sf.SummationMethod.EXACT).to_bytes() == bytes(8)
+    assert sf.f64_dot(x, y, sf.SummationMethod.EXACT, context=sf.FloatContext(sf.RoundingMode.MIN)).to_bytes() == b'\x80' + bytes(7)
+    x = sf.Float64Array.from_floats([1e-200, 1.0])
+    y = sf.Float64Array.from_floats([1e-200, 2.0 ** -53])
+    assert sf.f64_dot(x, y, sf.SummationMethod.EXACT).to_float() == 2.0 ** -53
+    assert sf.f64_dot(x, y, sf.SummationMethod.EXACT, context=sf.FloatContext(sf.RoundingMode.MAX)).to_float() == 2.0 ** -53 + 2.0 ** -105
+    context: sf.FloatContext = sf.FloatContext()
+    x = sf.Float64Array.from_floats([math.inf, 1.0])
+    y = sf.Float64Array.from_floats([0.0, 1.0])
+    assert math.isnan(sf.f64_dot(x, y, sf.SummationMethod.EXACT, context=context).to_float())
+    assert context.flags == sf.ExceptionFlag.INVALID
+    x = sf.Float64Array.from_floats([math.inf, 1e308])
+    y = sf.Float64Array.from_floats([-1.0, 10.0])
+    assert sf.f64_dot(x, y, sf.SummationMethod.EXACT).to_float() == -math.inf
+
+
+def test_f64_matmul_accumulation() -> None:
+    rng: random.Random = random.Random(0)
+    x16: sf.Float16Array = sf.Float16Array.from_floats([rng.uniform(-1.0, 1.0) for _ in range(6 * 40)])
+    y16: sf.Float16Array = sf.Float16Array.from_floats([rng.uniform(-1.0, 1.0) for _ in range(40 * 5)])
+    x: sf.Float32Array = sf.f16_to_f32_array(x16)
+    y: sf.Float32Array = sf.f16_to_f32_array(y16)
+    for method in sf.SummationMethod:
+        for fused in (False, True):
+            z: sf.Float32Array = sf.f16_matmul(x16, y16, 6, 5, 40, sf.Float32, method, fused)
+            assert bytes(z) == bytes(sf.f32_matmul(x, y, 6, 5, 40, None, method, fused))
+            for i in range(6):
+                for j in range(5):
+                    column: sf.Float32Array = sf.Float32Array([y[t * 5 + j] for t in range(40)])
+                    assert z[i * 5 + j].to_bytes() == sf.f32_dot(x[i * 40:(i + 1) * 40], column, method, fused).to_bytes()
+    out: sf.Float64Array = sf.Float64Array(30)
+    assert sf.f16_matmul(x16, y16, 6, 5, 40, sf.Float64, sf.SummationMethod.EXACT, out=out) is out
+    assert [o.to_float() for o in out] == [
+        float(sum(Fraction(x16[i * 40 + t].to_float()) * Fraction(y16[t * 5 + j].to_float()) for t in range(40)))
+        for i in range(6) for j in range(5)
+    ]
+    assert len(sf.f64_matmul(sf.Float64Array(), sf.Float64Array(), 0, 0, 0)) == 0
+    assert [o.to_float() for o in sf.f64_matmul(sf.Float64Array(), sf.Float64Array(), 1, 2, 0)] == [0.0, 0.0]
+    context: sf.FloatContext = sf.FloatContext()
+    x64: sf.Float64Array = sf.Float64Array.from_floats([math.inf])
+    assert math.isnan(sf.f64_matmul(x64, sf.Float64Array.from_floats([0.0]), 1, 1, 1, context=context)[0].to_float())
+    assert context.flags == sf.ExceptionFlag.INVALID
+    with pytest.raises(ValueError):
+        sf.f64_matmul(x64, x64, -1, -1, -1)
+    with pytest.raises(TypeError):
+        sf.f64_matmul(x64, x64, 1, 1, 1, float)  # type: ignore[arg-type]
@@ -0,0 +1,86 @@
+# SoftFloatPy: A Python binding of Berkeley SoftFloat.
+#
+# Copyright (c) 2024-2025 Arihiro Yoshida. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from typing import Any
+
+import pytest
+
+import softfloatpy as sf
+
+np: Any = pytest.importorskip('numpy')
+
+
+def test_numpy_view() -> None:
+    a: sf.Float16Array = sf.Float16Array.from_floats([1.0, -2.0])
+    assert np.asarray(a).dtype == np.uint16
+    assert np.asarray(a).tolist() == [0x3c00, 0xc000]
+    assert np.asarray(sf.Float32Array(3)).dtype == np.uint32
+    assert np.asarray(sf.Float64Array(3)).dtype == np.uint64
+    assert np.asarray(sf.Float128Array(3)).shape == (3, 2)
+
+
+def test_numpy_arithmetic() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats([-12.5, 3.25, 1.0])
+    y: sf.Float32Array = sf.Float32Array.from_floats([3.25, 0.5, -4.0])
+    z: Any = np.add(x, y)
+    assert isinstance(z, sf.Float32Array)
+    assert z.to_floats() == [-9.25, 3.75, -3.0]
+    assert np.multiply(x, np.asarray(y)).to_floats() == [-40.625, 1.625, -4.0]
+    o: sf.Float32Array = sf.Float32Array(3)
+    assert np.subtract(x, y, out=o) is o
+    assert o.to_floats() == [-15.75, 2.75, 5.0]
+    assert np.sqrt(sf.Float64Array.from_floats([4.0, 2.25])).to_floats() == [2.0, 1.5]
+
+
+def test_numpy_float128() -> None:
+    x: sf.Float128Array = sf.Float128Array.from_floats([1.0, 2.0])
+    y: Any = np.asarray(sf.Float128Array.from_floats([0.5, 0.25]))
+    assert np.divide(x, y).to_floats() == [2.0, 8.0]
+
+
+def test_numpy_comparison() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats([1.0, 2.0, 3.0])
+    y: sf.Float16Array = sf.Float16Array.from_floats([2.0, 2.0, 2.0])
+    assert np.less(x, y).tolist() == [True, False, False]
+    assert np.less_equal(x, y).tolist() == [True, True, False]
+    assert np.greater(x, y).tolist() == [False, False, True]
+    assert np.greater_equal(x, y).tolist() == [False, True, True]
+    assert np.equal(x, y).tolist() == [False, True, False]
+    assert np.not_equal(x, y).tolist() == [True, False, True]
+
+
+def test_numpy_unsupported() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats([1.0])
+    with pytest.raises(TypeError):
+        np.power(x, x)
+
+
+def test_numpy_scalar_unsupported() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats([1.0, 2.0, 3.0])
+    for a in [np.float32(1.0), np.uint32(0x3f800000), np.array(0x3f800000, dtype=np.uint32)]:
+        with pytest.raises(TypeError):
+            np.add(x, a)
+        with pytest.raises(TypeError):
+            np.multiply(a, x)
+        with pytest.raises(TypeError):
+            x + a
@@ -20,6 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
+import sysconfig
+import threading
+
+import pytest
+
 import softfloatpy as sf
 
 
@@ -69,3 +75,132 @@ def test_exception_flags_invalid() -> None:
     sf.set_exception_flags(0)
     sf.f32_div(sf.Float32.from_float(0.0), sf.Float32.from_float(0.0))
     assert sf.test_exception_flags(sf.ExceptionFlag.INVALID)
+
+
+def test_thread_local_state() -> None:
+    barrier: threading.Barrier = threading.Barrier(2)
+    results: dict[sf.RoundingMode, tuple[sf.RoundingMode, int]] = {}
+
+    def run(m: sf.RoundingMode, f: int) -> None:
+        sf.set_rounding_mode(m)
+        sf.set_exception_flags(f)
+        barrier.wait()
+        results[m] = (sf.get_rounding_mode(), sf.get_exception_flags())
+
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    sf.set_exception_flags(0)
+    threads: list[threading.Thread] = [
+        threading.Thread(target=run, args=(sf.RoundingMode.MIN, sf.ExceptionFlag.INEXACT)),
+        threading.Thread(target=run, args=(sf.RoundingMode.MAX, sf.ExceptionFlag.INVALID))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results[sf.RoundingMode.MIN] == (sf.RoundingMode.MIN, sf.ExceptionFlag.INEXACT)
+    assert results[sf.RoundingMode.MAX] == (sf.RoundingMode.MAX, sf.ExceptionFlag.INVALID)
+    assert sf.get_rounding_mode() == sf.RoundingMode.NEAR_EVEN
+    assert sf.get_exception_flags() == 0
+
+
+def test_thread_local_state_initial() -> None:
+    results: list[tuple[sf.RoundingMode, int]] = []
+    sf.set_rounding_mode(sf.RoundingMode.MIN)
+    sf.set_exception_flags(sf.ExceptionFlag.INEXACT)
+    t: threading.Thread = threading.Thread(target=lambda: results.append((sf.get_rounding_mode(), sf.get_exception_flags())))
+    t.start()
+    t.join()
+    assert results == [(sf.RoundingMode.NEAR_EVEN, 0)]
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    sf.set_exception_flags(0)
+
+
+def test_num_threads() -> None:
+    for n in [4, 1]:
+        sf.set_num_threads(n)
+        assert sf.get_num_threads() == n
+    with pytest.raises(ValueError):
+        sf.set_num_threads(0)
+
+
+def test_threads_scalar_operations() -> None:
+    x: sf.Float64 = sf.Float64.from_float(1.0)
+    y: sf.Float64 = sf.Float64.from_float(1e-20)
+    results: dict[sf.RoundingMode, set[bytes]] = {}
+
+    def run(m: sf.RoundingMode) -> None:
+        sf.set_rounding_mode(m)
+        results[m] = {sf.f64_add(x, y).to_bytes() for _ in range(10000)}
+
+    threads: list[threading.Thread] = [threading.Thread(target=run, args=(m,)) for m in sf.RoundingMode]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for m in sf.RoundingMode:
+        sf.set_rounding_mode(m)
+        assert results[m] == {sf.f64_add(x, y).to_bytes()}
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    sf.set_exception_flags(0)
+
+
+@pytest.mark.skipif(not sysconfig.get_config_var('Py_GIL_DISABLED'), reason='requires free-threaded build')
+def test_free_threading() -> None:
+    assert not getattr(sys, '_is_gil_enabled')()
+
+
+def test_float_context() -> None:
+    sf.set_rounding_mode(sf.RoundingMode.NEAR_EVEN)
+    sf.set_tininess_mode(sf.TininessMode.AFTER_ROUNDING)
+    sf.set_exception_flags(sf.ExceptionFlag.UNDERFLOW)
+    x: sf.Float32 = sf.Float32.from_float(1.0)
+    y: sf.Float32 = sf.Float32.from_float(3.0)
+    context: sf.FloatContext = sf.FloatContext(sf.RoundingMode.MIN, sf.TininessMode.BEFORE_ROUNDING)
+    assert context.rounding_mode == sf.RoundingMode.MIN
+    assert context.tininess_mode == sf.TininessMode.BEFORE_ROUNDING
+    with context:
+        assert sf.get_rounding_mode() == sf.RoundingMode.MIN
+        assert sf.get_tininess_mode() == sf.TininessMode.BEFORE_ROUNDING
+        assert sf.get_exception_flags() == 0
+        z: sf.Float32 = sf.f32_div(x, y)
+    assert context.flags == sf.ExceptionFlag.INEXACT
+    assert sf.get_rounding_mode() == sf.RoundingMode.NEAR_EVEN
+    assert sf.get_tininess_mode() == sf.TininessMode.AFTER_ROUNDING
+    assert sf.get_exception_flags() == sf.ExceptionFlag.UNDERFLOW
+    assert z.to_bytes() != sf.f32_div(x, y).to_bytes()
+    with context:
+        with sf.FloatContext() as inner:
+            assert sf.get_rounding_mode() == sf.RoundingMode.MIN
+            sf.f32_div(x, sf.Float32.from_float(0.0))
+        assert sf.get_exception_flags() == 0
+    assert inner.flags == sf.ExceptionFlag.INFINITE
+    assert context.flags == sf.ExceptionFlag.INEXACT
+    sf.set_exception_flags(0)
+
+
+def test_float_context_traps() -> None:
+    x: sf.Float32 = sf.Float32.from_float(1.0)
+    context: sf.FloatContext = sf.FloatContext(traps=sf.ExceptionFlag.INFINITE | sf.ExceptionFlag.INVALID)
+    with context:
+        sf.f32_div(x, sf.Float32.from_float(3.0))
+    with pytest.raises(FloatingPointError):
+        with context:
+            sf.f32_div(x, sf.Float32.from_float(0.0))
+    assert context.flags == sf.ExceptionFlag.INEXACT | sf.ExceptionFlag.INFINITE
+    context.flags = 0
+    assert context.flags == 0
+    assert sf.get_exception_flags() == 0
+
+
+def test_float_context_array() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats([1.0, 1.0])
+    y: sf.Float32Array = sf.Float32Array.from_floats([3.0, 0.0])
+    sf.set_exception_flags(0)
+    context: sf.FloatContext = sf.FloatContext(sf.RoundingMode.MIN)
+    z: sf.Float32Array = sf.f32_div_array(x, y, context=context)
+    with context:
+        assert z[0].to_bytes() == sf.f32_div(x[0], y[0]).to_bytes()
+    assert sf.get_exception_flags() == 0
+    assert context.flags == sf.ExceptionFlag.INEXACT | sf.ExceptionFlag.INFINITE
+    with pytest.raises(FloatingPointError):
+        sf.f32_div_array(x, y, context=sf.FloatContext(traps=sf.ExceptionFlag.INFINITE))
@@ -0,0 +1,80 @@
+# SoftFloatPy: A Python binding of Berkeley SoftFloat.
+#
+# Copyright (c) 2024-2025 Arihiro Yoshida. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import io
+from collections.abc import Iterator
+
+import pytest
+
+import softfloatpy as sf
+from softfloatpy import stream
+
+
+_XS: list[float] = [1.0, -2.5, 3.25, 0.0, 4.0, 0.5, -8.0]
+
+
+def test_chunks() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    for source in (io.BytesIO(x.to_bytes('big')), [x.to_bytes('big')[i:i + 3] for i in range(0, len(_XS) * 4, 3)]):
+        a: list[sf.Float32Array] = list(stream.chunks(source, sf.Float32Array, 3, 'big'))  # type: ignore[arg-type]
+        assert [len(o) for o in a] == [3, 3, 1]
+        assert [f for o in a for f in o.to_floats()] == _XS
+        a[0][0] = x[1]
+    with pytest.raises(ValueError):
+        list(stream.chunks(io.BytesIO(x.to_bytes()[:-1]), sf.Float32Array))
+    with pytest.raises(ValueError):
+        stream.chunks([x], sf.Float32Array, 0)
+
+
+def test_map() -> None:
+    x: sf.Float16Array = sf.Float16Array.from_floats(_XS)
+    y: sf.Float32Array = sf.Float32Array.from_floats(_XS[::-1])
+    a: sf.Float32 = sf.Float32.from_float(0.1)
+    converted: Iterator[sf.Float32Array] = stream.map(
+        sf.f16_to_f32_array, io.BytesIO(x.to_bytes()), array_type=sf.Float16Array, chunk_size=2
+    )
+    fused: Iterator[sf.Float32Array] = stream.map(
+        lambda p, q: sf.f32_mul_add_array(a, p, q, out=p), converted, stream.chunks([y], sf.Float32Array, 2)
+    )
+    rounded: Iterator[sf.Float32Array] = stream.map(
+        lambda p: sf.f32_round_to_int_array(p, sf.RoundingMode.MIN, out=p), fused
+    )
+    sf.set_exception_flags(0)
+    z: list[sf.Float32] = [o for c in rounded for o in c]
+    assert [o.to_bytes() for o in z] == [
+        sf.f32_round_to_int(sf.f32_mul_add(a, sf.f16_to_f32(p), q), sf.RoundingMode.MIN).to_bytes() for p, q in zip(x, y)
+    ]
+    assert sf.get_exception_flags() == sf.ExceptionFlag.INEXACT
+    sf.set_exception_flags(0)
+
+
+def test_map_context() -> None:
+    x: sf.Float32Array = sf.Float32Array.from_floats(_XS)
+    context: sf.FloatContext = sf.FloatContext(sf.RoundingMode.MAX)
+    with sf.FloatContext(sf.RoundingMode.MAX):
+        expected: list[bytes] = [sf.f32_div(o, p).to_bytes() for o, p in zip(x, x[::-1])]
+    sf.set_exception_flags(0)
+    z: list[sf.Float32Array] = list(stream.map(sf.f32_div_array, [x], [x[::-1]], context=context))
+    assert [o.to_bytes() for o in z[0]] == expected
+    assert context.flags == sf.ExceptionFlag.INEXACT | sf.ExceptionFlag.INVALID
+    assert sf.get_exception_flags() == 0
+    with pytest.raises(ValueError):
+        list(stream.map(sf.f32_add_array, [x], [x, x]))
@@ -213,7 +213,8 @@ setup(
                 f'{_SOFTFLOAT_SRCDIR}/include'
             ],
             extra_compile_args=[
-                '-DSOFTFLOAT_FAST_INT64=1'
+                '-DSOFTFLOAT_FAST_INT64=1',
+                '-DSOFTFLOAT_ROUND_ODD=1'  # Used to round the 16-bit brain floating points correctly.
             ]
         )
     ]),